@@ -16,11 +16,17 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from dart_template_engine import TemplateEngine, TemplateError
+from generation_graph import GRAPH_NAME, GenerationGraph, field_hash
+from pub_dependency_planner import PORTFOLIO_DEPENDENCIES
+
 class NotificationSystemApplier:
     def __init__(self):
         self.base_path = Path("E:/Projects/app-factory-complete")
         self.flutter_apps_path = self.base_path / "flutter_apps"
-        self.template_path = self.base_path / "templates" / "notification_service_template.dart"
+        self.template_path = self.base_path / "templates" / "notification_service_template.dart.template"
+        self.template_engine = TemplateEngine([self.template_path.parent])
+        self.graph = GenerationGraph(self.flutter_apps_path / GRAPH_NAME)
 
         # 앱별 설정
         self.app_configs = {
@@ -108,19 +114,17 @@ class NotificationSystemApplier:
         if not self.create_services_directory(app_path):
             return False
 
-        # 템플릿 파일 읽기
+        # 템플릿 렌더링 (컴파일된 템플릿은 앱 간 재사용)
         try:
-            with open(self.template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-        except Exception as e:
-            print(f"  ❌ 템플릿 파일 읽기 실패: {e}")
+            content = self.template_engine.render(self.template_path.name, {
+                "APP_NAME": config["app_name"],
+                "APP_TITLE": config["app_title"],
+                "CHANNEL_NAME": config["channel_name"]
+            })
+        except (OSError, TemplateError) as e:
+            print(f"  ❌ 템플릿 렌더링 실패: {e}")
             return False
 
-        # 템플릿 변수 치환
-        content = template_content.replace("{{APP_NAME}}", config["app_name"])
-        content = content.replace("{{APP_TITLE}}", config["app_title"])
-        content = content.replace("{{CHANNEL_NAME}}", config["channel_name"])
-
         # notification_service.dart 파일 생성/업데이트
         notification_path = app_path / "lib" / "services" / "notification_service.dart"
 
@@ -135,6 +139,16 @@ class NotificationSystemApplier:
             with open(notification_path, 'w', encoding='utf-8') as f:
                 f.write(content)
 
+            # 템플릿 → 앱 의존성 기록 (템플릿 변경 시 영향받는 앱 추적)
+            self.graph.record_app(app_name, "notification_system", {
+                f"notification.{key}": field_hash(config[key]) for key in ("app_name", "app_title", "channel_name")
+            }, {
+                "lib/services/notification_service.dart": {
+                    "templates": {self.template_path.name: self.template_engine.template_hash(self.template_path.name)},
+                    "fields": ["notification.app_name", "notification.app_title", "notification.channel_name"]
+                }
+            })
+
             print(f"  ✅ notification_service.dart 적용 완료")
             return True
 
@@ -154,10 +168,10 @@ class NotificationSystemApplier:
             return False
 
         required_deps = [
-            "flutter_local_notifications:",
-            "permission_handler:",
-            "shared_preferences:",
-            "timezone:"
+            "flutter_local_notifications",
+            "permission_handler",
+            "shared_preferences",
+            "timezone"
         ]
 
         try:
@@ -166,16 +180,14 @@ class NotificationSystemApplier:
 
             needs_update = False
             for dep in required_deps:
-                if dep not in content:
+                if f"{dep}:" not in content:
                     needs_update = True
-                    print(f"  ⚠️ 누락된 의존성: {dep}")
+                    print(f"  ⚠️ 누락된 의존성: {dep}:")
 
             if needs_update:
                 print(f"  💡 {app_name}의 pubspec.yaml을 수동으로 업데이트해주세요:")
-                print(f"     - flutter_local_notifications: ^17.2.4")
-                print(f"     - permission_handler: ^11.4.0")
-                print(f"     - shared_preferences: ^2.4.10")
-                print(f"     - timezone: ^0.9.4")
+                for dep in required_deps:
+                    print(f"     - {dep}: {PORTFOLIO_DEPENDENCIES[dep]}")
             else:
                 print(f"  ✅ 모든 의존성이 이미 존재합니다")
 
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⚙️ 비동기 명령 실행기
+asyncio.create_subprocess_exec 기반 flutter/git 명령 실행 공용 레이어
+명령 종류별 동시 실행 제한, stdout/stderr 회전 로그 스트리밍,
+타임아웃 시 프로세스 그룹 종료, 구조화된 실행 결과 제공
+"""
+
+import os
+import time
+import shutil
+import signal
+import asyncio
+import logging
+import weakref
+from pathlib import Path
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from typing import Dict, List, Optional
+
+# 명령 종류별 동시 실행 수 (Gradle 빌드는 무겁고, git 은 가벼움)
+DEFAULT_CLASS_LIMITS = {
+    "build": 2,
+    "analyze": 4,
+    "pub": 3,
+    "git": 8,
+    "default": 4
+}
+
+DEFAULT_TIMEOUT = 600
+STREAM_LIMIT = 1024 * 1024
+
+
+@dataclass
+class CommandResult:
+    """명령 실행 결과"""
+    command: List[str]
+    cwd: Optional[str]
+    command_class: str
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    duration: float
+    timed_out: bool = False
+    log_file: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    def to_dict(self) -> Dict:
+        return {
+            "command": " ".join(self.command),
+            "cwd": self.cwd,
+            "class": self.command_class,
+            "returncode": self.returncode,
+            "duration": self.duration,
+            "timed_out": self.timed_out,
+            "log_file": self.log_file
+        }
+
+
+def classify_command(command: List[str]) -> str:
+    """명령 종류 판별 (동시 실행 제한 그룹)"""
+    program = Path(command[0]).stem.lower() if command else ""
+    subcommand = command[1] if len(command) > 1 else ""
+
+    if program == "git":
+        return "git"
+    if program in ("flutter", "dart"):
+        if subcommand in ("build", "create"):
+            return "build"
+        if subcommand in ("analyze", "test"):
+            return "analyze"
+        if subcommand in ("pub", "clean"):
+            return "pub"
+    return "default"
+
+
+class AsyncCommandRunner:
+    """공용 비동기 명령 실행기"""
+
+    def __init__(self, log_dir: str = "command_logs", limits: Dict[str, int] = None,
+                 max_log_bytes: int = 5 * 1024 * 1024, backup_count: int = 3):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.limits = {**DEFAULT_CLASS_LIMITS, **(limits or {})}
+        self.max_log_bytes = max_log_bytes
+        self.backup_count = backup_count
+
+        # 세마포어는 이벤트 루프마다 따로 (run_sync 는 매번 새 루프)
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._loggers: Dict[str, logging.Logger] = {}
+
+    def _semaphore(self, command_class: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+        if command_class not in per_loop:
+            per_loop[command_class] = asyncio.Semaphore(self.limits.get(command_class, self.limits["default"]))
+        return per_loop[command_class]
+
+    def _command_logger(self, command_class: str) -> logging.Logger:
+        """명령 종류별 회전 로그 파일 (command_logs/<class>.log)"""
+        if command_class not in self._loggers:
+            logger = logging.getLogger(f"{__name__}.{id(self)}.{command_class}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = RotatingFileHandler(self.log_dir / f"{command_class}.log", maxBytes=self.max_log_bytes,
+                                          backupCount=self.backup_count, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger.addHandler(handler)
+            self._loggers[command_class] = logger
+        return self._loggers[command_class]
+
+    @staticmethod
+    async def _pump(stream: asyncio.StreamReader, lines: List[str], logger: logging.Logger, prefix: str):
+        """스트림을 줄 단위로 읽어 결과 버퍼와 로그 파일에 동시에 기록
+
+        STREAM_LIMIT 보다 긴 줄은 버퍼에 쌓인 만큼 잘라서 읽음 (readline 은 ValueError 를 내고 데이터를 버림)
+        """
+        while True:
+            try:
+                line = await stream.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                # EOF - 개행 없는 마지막 줄
+                line = e.partial
+            except asyncio.LimitOverrunError as e:
+                line = await stream.readexactly(e.consumed)
+            if not line:
+                break
+            text = line.decode("utf-8", errors="replace")
+            lines.append(text)
+            logger.info("%s %s", prefix, text.rstrip("\n"))
+
+    @staticmethod
+    def _kill_process_group(process: asyncio.subprocess.Process):
+        """자식 프로세스(Gradle 데몬 등)까지 프로세스 그룹 전체 종료"""
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    async def run(self, command: List[str], cwd: Path = None, timeout: float = DEFAULT_TIMEOUT,
+                  command_class: str = None, env: Dict[str, str] = None) -> CommandResult:
+        """명령 실행 (실행 파일이 없으면 FileNotFoundError)"""
+        command = [str(part) for part in command]
+        command_class = command_class or classify_command(command)
+        logger = self._command_logger(command_class)
+        label = Path(cwd).name if cwd else "-"
+
+        # Windows 의 flutter.bat 등 PATH 상 실제 실행 파일로 변환
+        executable = shutil.which(command[0]) or command[0]
+
+        popen_kwargs = {}
+        if os.name == "posix":
+            popen_kwargs["start_new_session"] = True
+
+        async with self._semaphore(command_class):
+            logger.info("[%s] $ %s", label, " ".join(command))
+            start = time.time()
+            process = await asyncio.create_subprocess_exec(
+                executable, *command[1:],
+                cwd=str(cwd) if cwd else None,
+                env={**os.environ, **env} if env else None,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT,
+                **popen_kwargs
+            )
+
+            stdout_lines: List[str] = []
+            stderr_lines: List[str] = []
+
+            async def communicate() -> int:
+                await asyncio.gather(
+                    self._pump(process.stdout, stdout_lines, logger, f"[{label}][out]"),
+                    self._pump(process.stderr, stderr_lines, logger, f"[{label}][err]")
+                )
+                return await process.wait()
+
+            timed_out = False
+            try:
+                returncode = await asyncio.wait_for(communicate(), timeout=timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                returncode = None
+                self._kill_process_group(process)
+                await process.wait()
+                logger.info("[%s] ⏰ 타임아웃 (%s초) - 프로세스 그룹 종료", label, timeout)
+            except asyncio.CancelledError:
+                # 종료된 프로세스를 회수해야 좀비/닫히지 않은 transport 가 남지 않음 (재취소돼도 회수는 계속)
+                self._kill_process_group(process)
+                await asyncio.shield(process.wait())
+                raise
+
+            duration = round(time.time() - start, 2)
+            logger.info("[%s] 종료 코드 %s (%s초)", label, returncode, duration)
+
+        return CommandResult(
+            command=command,
+            cwd=str(cwd) if cwd else None,
+            command_class=command_class,
+            returncode=returncode,
+            stdout="".join(stdout_lines),
+            stderr="".join(stderr_lines),
+            duration=duration,
+            timed_out=timed_out,
+            log_file=str(self.log_dir / f"{command_class}.log"),
+            started_at=start
+        )
+
+    async def run_many(self, commands: List[Dict]) -> List[CommandResult]:
+        """여러 명령 동시 실행 (종류별 제한 안에서) - commands: [{"command": [...], "cwd": ...}]"""
+        return await asyncio.gather(*(self.run(**spec) for spec in commands))
+
+    def run_sync(self, command: List[str], **kwargs) -> CommandResult:
+        """동기 코드용 진입점 (이벤트 루프 밖에서만 호출)"""
+        return asyncio.run(self.run(command, **kwargs))
+
+
+_default_runner: Optional[AsyncCommandRunner] = None
+
+
+def get_command_runner() -> AsyncCommandRunner:
+    """프로세스 공용 실행기 (동시 실행 제한을 모든 호출부가 공유)"""
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = AsyncCommandRunner()
+    return _default_runner
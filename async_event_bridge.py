@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌉 watchdog → asyncio 이벤트 브리지
+watchdog 옵저버 스레드에서 받은 파일 이벤트를 call_soon_threadsafe 로 이벤트 루프에 넘기고,
+경로별로 debounce_seconds 동안 조용해질 때까지 모아서 버스트당 한 번만 처리
+처리 대기열이 차면 디스패처가 멈춰 (그동안 들어온 이벤트는 계속 합쳐짐) 빌드 폭주 시에도 작업 수가 제한됨
+"""
+
+import heapq
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+DEBOUNCE_SECONDS = 2.0
+# 합쳐 두는 경로 수 상한 (넘으면 새 경로 이벤트는 버림)
+MAX_PENDING_PATHS = 1000
+WORKERS = 2
+
+
+class AsyncEventBridge:
+    """경로별 디바운스 + 제한된 동시 처리"""
+
+    def __init__(self, handler: Callable[[str], Awaitable[None]], debounce_seconds: float = DEBOUNCE_SECONDS,
+                 max_pending: int = MAX_PENDING_PATHS, workers: int = WORKERS):
+        self.handler = handler
+        self.debounce_seconds = debounce_seconds
+        self.max_pending = max_pending
+        self.workers = workers
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # 아래 상태는 모두 이벤트 루프 스레드에서만 변경
+        self._deadlines: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+        self.stats = {"events": 0, "coalesced": 0, "dropped": 0, "processed": 0, "failed": 0}
+
+    def start(self):
+        """실행 중인 이벤트 루프에서 호출"""
+        self.loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        # 대기열이 작아야 처리 속도보다 빨리 들어오는 이벤트가 루프 안에서 합쳐짐
+        self._ready = asyncio.Queue(maxsize=self.workers * 2)
+        self._tasks = [self.loop.create_task(self._dispatch())]
+        self._tasks += [self.loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, path: str):
+        """아무 스레드에서나 호출 가능 (watchdog 핸들러용)"""
+        if self.loop is None or self.loop.is_closed():
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._on_event, path)
+        except RuntimeError:
+            # 종료 중인 루프
+            pass
+
+    def _on_event(self, path: str):
+        self.stats["events"] += 1
+        if path in self._deadlines:
+            self.stats["coalesced"] += 1
+        elif len(self._deadlines) >= self.max_pending:
+            self.stats["dropped"] += 1
+            if self.stats["dropped"] == 1:
+                print(f"⚠️ 이벤트 폭주 - 대기 경로 {self.max_pending}개 초과분은 무시")
+            return
+
+        deadline = self.loop.time() + self.debounce_seconds
+        self._deadlines[path] = deadline
+        heapq.heappush(self._heap, (deadline, path))
+        self._wakeup.set()
+
+    async def _dispatch(self):
+        """조용해진 경로를 처리 대기열로 이동"""
+        while True:
+            # 이후 이벤트로 마감이 늘어난 항목은 건너뜀
+            while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            deadline, path = self._heap[0]
+            delay = deadline - self.loop.time()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            del self._deadlines[path]
+            # 워커가 밀려 있으면 여기서 대기 (backpressure)
+            await self._ready.put(path)
+
+    async def _worker(self):
+        while True:
+            path = await self._ready.get()
+            try:
+                await self.handler(path)
+                self.stats["processed"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f"❌ 이벤트 처리 실패 ({path}): {e}")
+            finally:
+                self._ready.task_done()
+
+    def pending_count(self) -> int:
+        return len(self._deadlines) + (self._ready.qsize() if self._ready else 0)
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "pending": self.pending_count()}
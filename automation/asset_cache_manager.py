@@ -42,7 +42,9 @@ class AssetCacheManager:
 
         # 메타데이터 로드
         self.metadata = self._load_metadata()
+        self.metadata.setdefault("variants", {})
         self.stats = self._load_stats()
+        self.stats.setdefault("variant_hits", 0)
 
         self.logger.info(f"🗂️ 에셋 캐시 초기화: {self.cache_dir}")
         self.logger.info(f"📊 캐시된 에셋: {len(self.metadata)}개")
@@ -58,6 +60,7 @@ class AssetCacheManager:
 
         return {
             "assets": {},
+            "variants": {},
             "created": datetime.now().isoformat(),
             "last_cleanup": datetime.now().isoformat()
         }
@@ -286,6 +289,94 @@ class AssetCacheManager:
             self.logger.info(f"❌ 캐시 미스 - 새 에셋 생성 필요")
             return None, False
 
+    def cache_variants(self, images: List[bytes], cache_key: str, prompt: str, category: str) -> List[str]:
+        """멀티 샘플 생성의 남은 후보들을 순위별 변형(variant) 풀에 저장
+
+        images는 순위순(0 = 최상위)으로 정렬된 PNG 바이트 목록
+        """
+
+        stored = []
+        for rank, image_bytes in enumerate(images, start=1):
+            variant_key = f"{cache_key}_v{rank}"
+            filename = f"{variant_key}.png"
+            cached_file = self.cache_dir / filename
+
+            try:
+                cached_file.write_bytes(image_bytes)
+            except Exception as e:
+                self.logger.warning(f"변형 저장 실패 {variant_key}: {e}")
+                continue
+
+            self.metadata["variants"][variant_key] = {
+                "filename": filename,
+                "variant_of": cache_key,
+                "rank": rank,
+                "category": category,
+                "original_prompt": prompt,
+                "normalized_prompt": self._normalize_prompt(prompt),
+                "created_at": datetime.now().isoformat(),
+                "served": False,
+                "file_size": len(image_bytes)
+            }
+            stored.append(str(cached_file))
+
+        if stored:
+            self._save_metadata()
+            self.logger.info(f"🎲 변형 풀 저장: {cache_key} +{len(stored)}개")
+
+        return stored
+
+    def take_variant(self, prompt: str, category: str) -> Optional[str]:
+        """유사 프롬프트용 미사용 변형을 풀에서 꺼내기 (꺼낸 변형은 served 처리)"""
+
+        normalized_prompt = self._normalize_prompt(prompt)
+
+        best_key = None
+        best_score = (0.0, 0)
+
+        for variant_key, variant_info in self.metadata["variants"].items():
+            if variant_info["served"] or variant_info["category"] != category:
+                continue
+            if self._is_expired(variant_info):
+                continue
+
+            similarity = self._calculate_similarity(normalized_prompt, variant_info["normalized_prompt"])
+            if similarity < self.cache_config["similarity_threshold"]:
+                continue
+
+            # 유사도가 높고 순위가 앞선 변형 우선
+            score = (similarity, -variant_info["rank"])
+            if best_key is None or score > best_score:
+                cached_file = self.cache_dir / variant_info["filename"]
+                if cached_file.exists():
+                    best_key, best_score = variant_key, score
+
+        if not best_key:
+            return None
+
+        variant_info = self.metadata["variants"][best_key]
+        variant_info["served"] = True
+        variant_info["served_at"] = datetime.now().isoformat()
+
+        self.stats["total_requests"] += 1
+        self.stats["variant_hits"] += 1
+        self.stats["total_saved_cost"] += 0.039
+        self._save_metadata()
+        self._save_stats()
+
+        self.logger.info(f"🎲 변형 풀 히트: {best_key} ({best_score[0]:.2%} 유사도)")
+        return str(self.cache_dir / variant_info["filename"])
+
+    def get_variant_pool(self, cache_key: str) -> List[Dict]:
+        """원본 키에 연결된 변형 목록 (A/B 스토어 리스팅 실험용)"""
+
+        variants = [
+            {"variant_key": key, "file_path": str(self.cache_dir / info["filename"]), **info}
+            for key, info in self.metadata["variants"].items()
+            if info["variant_of"] == cache_key
+        ]
+        return sorted(variants, key=lambda v: v["rank"])
+
     def cleanup_cache(self, force: bool = False):
         """캐시 정리"""
 
@@ -344,6 +435,19 @@ class AssetCacheManager:
             except Exception as e:
                 self.logger.warning(f"파일 삭제 실패 {cached_file}: {e}")
 
+        # 만료되었거나 이미 사용된 변형 정리
+        for variant_key, variant_info in list(self.metadata["variants"].items()):
+            if variant_info["served"] or self._is_expired(variant_info):
+                cached_file = self.cache_dir / variant_info["filename"]
+                try:
+                    if cached_file.exists():
+                        freed_space += cached_file.stat().st_size
+                        cached_file.unlink()
+                    del self.metadata["variants"][variant_key]
+                    removed_count += 1
+                except Exception as e:
+                    self.logger.warning(f"변형 삭제 실패 {cached_file}: {e}")
+
         # 메타데이터 업데이트
         self.metadata["last_cleanup"] = datetime.now().isoformat()
         self._save_metadata()
@@ -376,11 +480,13 @@ class AssetCacheManager:
                 "total_requests": total_requests,
                 "cache_hits": self.stats["cache_hits"],
                 "cache_misses": self.stats["cache_misses"],
+                "variant_hits": self.stats.get("variant_hits", 0),
                 "hit_rate": f"{hit_rate:.1f}%",
                 "total_cost_saved": f"${self.stats['total_saved_cost']:.2f}"
             },
             "cache_storage": {
                 "total_assets": asset_count,
+                "pooled_variants": sum(1 for v in self.metadata["variants"].values() if not v["served"]),
                 "cache_size_mb": f"{cache_size:.1f}MB",
                 "max_size_mb": f"{self.cache_config['max_cache_size_mb']}MB",
                 "usage_percentage": f"{(cache_size / self.cache_config['max_cache_size_mb'] * 100):.1f}%"
@@ -11,7 +11,8 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
-import logging
+
+from .logging_setup import setup_logging
 
 @dataclass
 class BudgetConfig:
@@ -56,15 +57,8 @@ class BudgetGuardian:
 
     def _setup_logging(self):
         """로깅 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [BUDGET-GUARDIAN] %(levelname)s: %(message)s',
-            handlers=[
-                logging.FileHandler('budget_guardian.log'),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(__name__)
+        # 파일/콘솔 쓰기는 공용 큐 리스너 스레드에서 (파일은 JSON 줄)
+        return setup_logging(__name__, "BUDGET-GUARDIAN", 'budget_guardian.log')
 
     def _load_config(self):
         """설정 로드"""
@@ -9,26 +9,41 @@ import os
 import json
 import asyncio
 import base64
+import shutil
 import aiohttp
 import requests
 from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageStat
 import io
 from dotenv import load_dotenv
+from .asset_cache_manager import AssetCacheManager
+from .store_package_builder import StorePackageBuilder
+from .palette_recolor import DEFAULT_PALETTE, LayoutBaseRegistry, palette_from_spec, parse_hex_color
+from .localized_asset_pipeline import LocalizedAssetPipeline, build_overlay_spec, draw_screenshot_overlay
 
 # .env 파일 로드
 load_dotenv()
 
+# Imagen API sampleCount 허용 범위
+MAX_SAMPLES_PER_PROMPT = 4
+
 class GeminiStoreAssetGenerator:
     """Gemini를 활용한 Play Store 에셋 자동 생성기"""
 
-    def __init__(self, gemini_api_key: str = None):
+    def __init__(self, gemini_api_key: str = None, asset_cache: AssetCacheManager = None,
+                 samples_per_prompt: int = None):
         self.logger = logging.getLogger(__name__)
         self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
 
+        # 에셋 캐시 (변형 풀) 및 프롬프트당 샘플 수 (1이면 기존 단일 샘플 요청)
+        self.asset_cache = asset_cache
+        self.samples_per_prompt = self._resolve_samples_per_prompt(samples_per_prompt)
+        if self.asset_cache is None and self.samples_per_prompt > 1:
+            self.asset_cache = AssetCacheManager()
+
         if not self.gemini_api_key:
             self.logger.warning("⚠️ GEMINI_API_KEY가 설정되지 않음. 환경변수 설정 필요")
 
@@ -64,8 +79,29 @@ class GeminiStoreAssetGenerator:
             }
         }
 
+        # 로케일별 스크린샷 오버레이 파이프라인 (렌더 캐시 포함)
+        self.localized_pipeline = LocalizedAssetPipeline()
+
+        # 시리즈 앱 공용 레이아웃 베이스 (팔레트 스왑으로 유료 렌더 재사용)
+        self.layout_registry = LayoutBaseRegistry()
+
         self.logger.info("🎨 Gemini Store Asset Generator 초기화 완료")
 
+    def _resolve_samples_per_prompt(self, samples_per_prompt: Optional[int]) -> int:
+        """프롬프트당 샘플 수 (잘못된 환경변수 값은 1, Imagen API 범위 1~4로 제한)"""
+        if not samples_per_prompt:
+            raw_value = os.getenv('IMAGEN_SAMPLES_PER_PROMPT', '1')
+            try:
+                samples_per_prompt = int(raw_value)
+            except ValueError:
+                self.logger.warning(f"⚠️ IMAGEN_SAMPLES_PER_PROMPT 값이 잘못됨 ({raw_value!r}) - 1 사용")
+                return 1
+
+        clamped = min(max(1, samples_per_prompt), MAX_SAMPLES_PER_PROMPT)
+        if clamped != samples_per_prompt:
+            self.logger.warning(f"⚠️ 프롬프트당 샘플 수 {samples_per_prompt} → {clamped} (허용 범위 1~{MAX_SAMPLES_PER_PROMPT})")
+        return clamped
+
     async def generate_all_assets_for_app(self, app_spec: Dict) -> Dict:
         """앱의 모든 Play Store 에셋 생성"""
 
@@ -205,154 +241,12 @@ class GeminiStoreAssetGenerator:
     def add_korean_screenshot_overlay(self, image_path: Path, screen_type: str, screen_title: str):
         """스크린샷에 한글 텍스트 오버레이 추가"""
         try:
-            from PIL import Image, ImageDraw, ImageFont
-
             # 이미지 로드
             img = Image.open(image_path)
-            draw = ImageDraw.Draw(img)
-
-            # 폰트 로드
-            font_dir = Path("fonts")
-            try:
-                title_font = ImageFont.truetype(str(font_dir / "BlackHanSans.ttf"), 48)
-                text_font = ImageFont.truetype(str(font_dir / "BlackHanSans.ttf"), 32)
-                small_font = ImageFont.truetype(str(font_dir / "BlackHanSans.ttf"), 24)
-            except:
-                title_font = ImageFont.load_default()
-                text_font = ImageFont.load_default()
-                small_font = ImageFont.load_default()
-
-            img_width, img_height = img.size
 
-            # 화면별 텍스트 정의 (일관된 디자인)
-            screen_texts = {
-                "main_screen": {
-                    "title": "기가차드 러너",
-                    "elements": [
-                        {"text": "오늘의 목표", "pos": (80, 250), "size": "normal"},
-                        {"text": "75%", "pos": (img_width//2, 450), "size": "large", "center": True},
-                        {"text": "완료", "pos": (img_width//2, 520), "center": True},
-                        {"text": "거리: 2.3km", "pos": (80, 650), "size": "small"},
-                        {"text": "시간: 15분", "pos": (280, 650), "size": "small"},
-                        {"text": "칼로리: 120", "pos": (480, 650), "size": "small"},
-                        {"text": "달리기 시작", "pos": (img_width//2, img_height-180), "center": True, "color": "button"}
-                    ]
-                },
-                "workout_screen": {
-                    "title": "달리기 중",
-                    "elements": [
-                        {"text": "00:15:42", "pos": (img_width//2, 400), "size": "large", "center": True},
-                        {"text": "거리", "pos": (100, 600)},
-                        {"text": "2.3km", "pos": (100, 640), "size": "large"},
-                        {"text": "속도", "pos": (300, 600)},
-                        {"text": "5.2km/h", "pos": (300, 640), "size": "large"},
-                        {"text": "페이스", "pos": (500, 600)},
-                        {"text": "11:30", "pos": (500, 640), "size": "large"},
-                        {"text": "일시정지", "pos": (200, img_height-120), "center": True, "color": "button"},
-                        {"text": "정지", "pos": (img_width-200, img_height-120), "center": True, "color": "red"}
-                    ]
-                },
-                "progress_screen": {
-                    "title": "진행률",
-                    "elements": [
-                        {"text": "레벨 5", "pos": (img_width//2, 300), "center": True, "size": "large"},
-                        {"text": "기가차드로 진화 중...", "pos": (img_width//2, 350), "center": True, "size": "small"},
-                        {"text": "업적", "pos": (80, 500)},
-                        {"text": "첫 달리기 완료", "pos": (100, 550), "size": "small"},
-                        {"text": "10km 달성", "pos": (100, 590), "size": "small"},
-                        {"text": "연속 7일", "pos": (100, 630), "size": "small"},
-                        {"text": "다음 레벨까지", "pos": (img_width//2, img_height-200), "center": True},
-                        {"text": "3,200 XP", "pos": (img_width//2, img_height-160), "center": True, "size": "large"}
-                    ]
-                },
-                "stats_screen": {
-                    "title": "통계",
-                    "elements": [
-                        {"text": "이번 주", "pos": (100, 250)},
-                        {"text": "총 거리", "pos": (80, 350)},
-                        {"text": "15.2km", "pos": (80, 380), "size": "large"},
-                        {"text": "총 시간", "pos": (300, 350)},
-                        {"text": "2시간 30분", "pos": (300, 380), "size": "large"},
-                        {"text": "평균 속도", "pos": (80, 480)},
-                        {"text": "6.1km/h", "pos": (80, 510), "size": "large"},
-                        {"text": "칼로리", "pos": (300, 480)},
-                        {"text": "890 kcal", "pos": (300, 510), "size": "large"},
-                        {"text": "주간 목표", "pos": (img_width//2, img_height-200), "center": True},
-                        {"text": "85% 달성", "pos": (img_width//2, img_height-160), "center": True, "size": "large"}
-                    ]
-                },
-                "settings_screen": {
-                    "title": "설정",
-                    "elements": [
-                        {"text": "기가차드", "pos": (150, 280), "size": "large"},
-                        {"text": "레벨 5 러너", "pos": (150, 320), "size": "small"},
-                        {"text": "계정", "pos": (80, 420)},
-                        {"text": "알림", "pos": (80, 480)},
-                        {"text": "개인정보 보호", "pos": (80, 540)},
-                        {"text": "앱 정보", "pos": (80, 600)},
-                        {"text": "로그아웃", "pos": (80, 660), "color": "red"}
-                    ]
-                }
-            }
-
-            screen_data = screen_texts.get(screen_type, {"title": screen_title, "elements": []})
-
-            # 타이틀 추가 (상단)
-            title_text = screen_data.get("title", screen_title)
-            title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
-            title_width = title_bbox[2] - title_bbox[0]
-            title_x = (img_width - title_width) // 2
-            title_y = 100
-
-            # 타이틀 그림자
-            for dx in range(-2, 3):
-                for dy in range(-2, 3):
-                    if dx != 0 or dy != 0:
-                        draw.text((title_x + dx, title_y + dy), title_text,
-                                 fill=(0, 0, 0, 200), font=title_font)
-
-            # 타이틀 메인
-            draw.text((title_x, title_y), title_text, fill=(255, 225, 50), font=title_font)
-
-            # 각 요소별 텍스트 추가
-            for element in screen_data.get("elements", []):
-                text = element["text"]
-                pos = element["pos"]
-                center = element.get("center", False)
-                size = element.get("size", "normal")
-
-                # 폰트 선택
-                if size == "large":
-                    font = title_font
-                elif size == "small":
-                    font = small_font
-                else:
-                    font = text_font
-
-                # 중앙 정렬 처리
-                if center:
-                    bbox = draw.textbbox((0, 0), text, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    pos = (pos[0] - text_width//2, pos[1])
-
-                # 그림자
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        if dx != 0 or dy != 0:
-                            draw.text((pos[0] + dx, pos[1] + dy), text,
-                                     fill=(0, 0, 0, 150), font=font)
-
-                # 색상 선택
-                color = element.get("color", "white")
-                if color == "button":
-                    text_color = (255, 225, 50)  # 골드
-                elif color == "red":
-                    text_color = (255, 0, 0)  # 빨강
-                else:
-                    text_color = (255, 255, 255)  # 흰색
-
-                # 메인 텍스트
-                draw.text(pos, text, fill=text_color, font=font)
+            # 로케일 테이블의 한국어 스펙으로 오버레이
+            spec = build_overlay_spec("ko", screen_type, screen_title, img.size)
+            draw_screenshot_overlay(img, spec)
 
             # 이미지 저장
             img.save(image_path, 'PNG', optimize=True)
@@ -565,7 +459,26 @@ The icon should instantly communicate "running app"!
             }
         ]
 
+        # 스토어 로케일 (기본: 한국어)
+        locales = app_spec.get("store_locales", ["ko"])
+
+        # 앱 테마 팔레트 (같은 레이아웃의 다른 테마 렌더를 리컬러링해 재사용)
+        palette = palette_from_spec(app_spec)
+        try:
+            primary_rgb, secondary_rgb = parse_hex_color(palette[0]), parse_hex_color(palette[1])
+        except (ValueError, AttributeError) as e:
+            # 테마 색상 하나가 잘못돼도 스크린샷 전체를 포기하지 않고 기본 팔레트 사용
+            self.logger.warning(f"⚠️ 앱 테마 색상 오류 ({e}) - 기본 팔레트 사용")
+            palette = list(DEFAULT_PALETTE)
+            primary_rgb, secondary_rgb = parse_hex_color(palette[0]), parse_hex_color(palette[1])
+        primary_hex = "#" + "%02X%02X%02X" % primary_rgb
+        secondary_hex = "#" + "%02X%02X%02X" % secondary_rgb
+
+        base_dir = screenshots_dir / "base"
+        base_dir.mkdir(exist_ok=True)
+
         generated_screenshots = []
+        localize_jobs = []
 
         for i, concept in enumerate(screenshot_concepts[:5]):  # 최대 5개
             prompt = f"""
@@ -575,7 +488,7 @@ Screen: {concept['title']} ({concept['name']})
 
 Design Requirements:
 - Size: 1080x1920 pixels (mobile phone ratio)
-- Consistent dark UI theme: black background (#1A1A1A), gold accents (#FFD700), red highlights (#FF0000)
+- Consistent dark UI theme: black background (#1A1A1A), primary accents ({primary_hex}), secondary highlights ({secondary_hex})
 - Modern Material Design with rounded corners
 - App title "GigaChad Runner" at top
 - Status bar: 9:41 AM, battery, signal icons
@@ -591,20 +504,38 @@ Ensure all screens follow the same design patterns and spacing
 
             try:
                 screenshot_path = screenshots_dir / f"screenshot_{i+1}_{concept['name']}.png"
+                base_path = base_dir / screenshot_path.name
 
-                # 실제 스크린샷 이미지 생성 (1080x1920)
-                screenshot_info = await self._generate_real_image(
-                    prompt, 1080, 1920, screenshot_path
-                )
+                # 같은 레이아웃의 기존 렌더가 있으면 팔레트만 바꿔 재사용, 없으면 실제 생성
+                layout_key = self.layout_registry.layout_key(concept['name'], 1080, 1920)
+                screenshot_info = self.layout_registry.recolor_from_base(layout_key, palette, base_path)
 
-                # 이미지 생성 성공 시 한글 텍스트 오버레이 추가
-                if screenshot_info.get("status") == "success" and screenshot_path.exists():
-                    self.add_korean_screenshot_overlay(
-                        screenshot_path,
-                        concept['name'],
-                        concept['title']
+                if not screenshot_info:
+                    # 실제 스크린샷 이미지 생성 (1080x1920, 텍스트 오버레이 전 베이스)
+                    screenshot_info = await self._generate_real_image(
+                        prompt, 1080, 1920, base_path
                     )
 
+                    # 유료 렌더는 다른 테마 앱이 재사용할 수 있도록 레이아웃 베이스로 등록
+                    if screenshot_info.get("method") == "nano_banana" and base_path.exists():
+                        self.layout_registry.register(layout_key, base_path, palette)
+
+                # 이미지 생성 성공 시 로케일별 텍스트 오버레이 대상에 추가
+                if screenshot_info.get("status") == "success" and base_path.exists():
+                    localize_jobs.append({
+                        "index": len(generated_screenshots),
+                        "base_image": base_path,
+                        "screen_type": concept['name'],
+                        "screen_title": concept['title'],
+                        "outputs": {
+                            locale: screenshot_path if locale == "ko"
+                            else screenshots_dir / locale / screenshot_path.name
+                            for locale in locales
+                        }
+                    })
+                elif base_path.exists():
+                    os.replace(base_path, screenshot_path)
+
                 generated_screenshots.append({
                     "name": concept['name'],
                     "title": concept['title'],
@@ -620,6 +551,12 @@ Ensure all screens follow the same design patterns and spacing
             except Exception as e:
                 self.logger.error(f"스크린샷 {concept['name']} 생성 실패: {e}")
 
+        # 베이스 이미지는 한 번만 디코딩하고 로케일 오버레이는 병렬 렌더링
+        if localize_jobs:
+            localized = self.localized_pipeline.render_batch(localize_jobs)
+            for job, locale_results in zip(localize_jobs, localized):
+                generated_screenshots[job["index"]]["localized"] = locale_results
+
         return {
             "type": "screenshots",
             "count": len(generated_screenshots),
@@ -685,9 +622,16 @@ Ensure all screens follow the same design patterns and spacing
         """실제 이미지 생성 (Nano Banana/Gemini Imagen 사용)"""
 
         try:
+            # 이전 멀티 샘플 요청에서 남은 변형이 있으면 API 호출 없이 재사용
+            pooled = self._take_pooled_variant(prompt, width, height, output_path)
+            if pooled:
+                return pooled
+
             # Gemini API Key 확인
             if self.gemini_api_key:
-                return await self._generate_with_nano_banana(prompt, width, height, output_path)
+                return await self._generate_with_nano_banana(
+                    prompt, width, height, output_path, sample_count=self.samples_per_prompt
+                )
 
             # Gemini API가 없으면 임시 이미지 생성
             self.logger.warning("Gemini API 키가 없어 임시 이미지 생성")
@@ -697,8 +641,49 @@ Ensure all screens follow the same design patterns and spacing
             self.logger.error(f"이미지 생성 실패: {e}")
             return await self._create_temporary_image(prompt, width, height, output_path)
 
-    async def _generate_with_nano_banana(self, prompt: str, width: int, height: int, output_path: Path) -> Dict:
-        """Nano Banana (Gemini Imagen) API로 실제 이미지 생성"""
+    def _variant_category(self, width: int, height: int) -> str:
+        """변형 풀 카테고리 (같은 크기끼리만 재사용)"""
+        return f"imagen_{width}x{height}"
+
+    def _take_pooled_variant(self, prompt: str, width: int, height: int, output_path: Path) -> Optional[Dict]:
+        """변형 풀에서 유사 프롬프트용 이미지 꺼내기"""
+
+        if not self.asset_cache:
+            return None
+
+        variant_file = self.asset_cache.take_variant(prompt, self._variant_category(width, height))
+        if not variant_file:
+            return None
+
+        shutil.copyfile(variant_file, output_path)
+        self.logger.info(f"🎲 변형 풀 재사용: {output_path}")
+
+        return {
+            "status": "success",
+            "file_path": str(output_path),
+            "size_kb": output_path.stat().st_size // 1024,
+            "method": "variant_pool",
+            "cost": 0,
+            "api_response": "variant_pool"
+        }
+
+    def _rank_samples(self, images: List[Image.Image]) -> List[Image.Image]:
+        """샘플 순위 매기기 (썸네일 대비/디테일이 높은 순)"""
+
+        def score(image: Image.Image) -> float:
+            thumb = image.convert('L')
+            thumb.thumbnail((128, 128))
+            return ImageStat.Stat(thumb).stddev[0]
+
+        return sorted(images, key=score, reverse=True)
+
+    async def _generate_with_nano_banana(self, prompt: str, width: int, height: int, output_path: Path,
+                                         sample_count: int = 1) -> Dict:
+        """Nano Banana (Gemini Imagen) API로 실제 이미지 생성
+
+        sample_count > 1이면 한 번의 호출로 K개 샘플을 받아 최상위 샘플을 저장하고
+        나머지는 순위별 변형으로 에셋 캐시에 보관
+        """
 
         # Gemini Imagen API 엔드포인트
         api_url = "https://generativelanguage.googleapis.com/v1beta/models/imagen-4.0-generate-001:predict"
@@ -717,13 +702,13 @@ Ensure all screens follow the same design patterns and spacing
                 }
             ],
             "parameters": {
-                "sampleCount": 1,
+                "sampleCount": sample_count,
                 "aspectRatio": self._get_aspect_ratio(width, height)
             }
         }
 
         try:
-            self.logger.info(f"🍌 Nano Banana로 이미지 생성 중: {width}x{height}")
+            self.logger.info(f"🍌 Nano Banana로 이미지 생성 중: {width}x{height} (샘플 {sample_count}개)")
 
             async with aiohttp.ClientSession() as session:
                 async with session.post(api_url, headers=headers, json=request_data) as response:
@@ -735,25 +720,34 @@ Ensure all screens follow the same design patterns and spacing
                         self.logger.info(f"API 응답 키: {result.keys()}")
 
                         # 생성된 이미지 데이터 추출 (Imagen 4 응답 형식)
-                        if "predictions" in result and len(result["predictions"]) > 0:
+                        predictions = [
+                            p for p in result.get("predictions", []) if p.get("bytesBase64Encoded")
+                        ]
+                        if predictions:
                             # 디버깅: predictions 내용 확인
-                            self.logger.info(f"Predictions 키: {result['predictions'][0].keys()}")
-                            image_data_b64 = result["predictions"][0].get("bytesBase64Encoded")
+                            self.logger.info(f"Predictions 키: {predictions[0].keys()}")
 
-                            # Base64 디코딩
-                            image_data = base64.b64decode(image_data_b64)
+                            images = []
+                            for prediction in predictions:
+                                # Base64 디코딩 후 PIL로 이미지 처리
+                                image_data = base64.b64decode(prediction["bytesBase64Encoded"])
+                                image = Image.open(io.BytesIO(image_data))
 
-                            # PIL로 이미지 처리
-                            image = Image.open(io.BytesIO(image_data))
+                                # 정확한 크기로 리사이즈
+                                if image.size != (width, height):
+                                    image = image.resize((width, height), Image.Resampling.LANCZOS)
+                                images.append(image)
 
-                            # 정확한 크기로 리사이즈
-                            if image.size != (width, height):
-                                image = image.resize((width, height), Image.Resampling.LANCZOS)
+                            if len(images) > 1:
+                                images = self._rank_samples(images)
 
-                            # PNG로 저장
-                            image.save(output_path, 'PNG', optimize=True)
+                            # 최상위 샘플을 PNG로 저장
+                            images[0].save(output_path, 'PNG', optimize=True)
 
-                            cost = 0.039  # Nano Banana 비용 ($0.039/이미지)
+                            # 나머지 샘플은 변형 풀로
+                            variants_cached = self._pool_extra_samples(images[1:], prompt, width, height)
+
+                            cost = 0.039 * len(images)  # Nano Banana 비용 ($0.039/이미지)
 
                             self.logger.info(f"✅ Nano Banana 이미지 생성 성공: {output_path}")
 
@@ -763,6 +757,8 @@ Ensure all screens follow the same design patterns and spacing
                                 "size_kb": output_path.stat().st_size // 1024,
                                 "method": "nano_banana",
                                 "cost": cost,
+                                "samples": len(images),
+                                "variants_cached": variants_cached,
                                 "api_response": "success"
                             }
                         else:
@@ -778,6 +774,23 @@ Ensure all screens follow the same design patterns and spacing
             self.logger.error(f"Nano Banana API 실패: {e}")
             return await self._create_temporary_image(prompt, width, height, output_path)
 
+    def _pool_extra_samples(self, images: List[Image.Image], prompt: str, width: int, height: int) -> int:
+        """남은 샘플을 순위 순서대로 에셋 캐시 변형 풀에 저장"""
+
+        if not images or not self.asset_cache:
+            return 0
+
+        category = self._variant_category(width, height)
+        cache_key = self.asset_cache.generate_cache_key(prompt, category)
+
+        encoded = []
+        for image in images:
+            buffer = io.BytesIO()
+            image.save(buffer, 'PNG', optimize=True)
+            encoded.append(buffer.getvalue())
+
+        return len(self.asset_cache.cache_variants(encoded, cache_key, prompt, category))
+
     def _get_aspect_ratio(self, width: int, height: int) -> str:
         """이미지 크기에 따른 Imagen 4 aspect ratio 반환"""
 
@@ -934,11 +947,17 @@ Ensure all screens follow the same design patterns and spacing
 
         return placeholder_data
 
-    def create_store_listing_package(self, app_spec: Dict, assets_result: Dict) -> Dict:
-        """Play Store 업로드용 패키지 생성"""
+    def create_store_listing_package(self, app_spec: Dict, assets_result: Dict,
+                                     archive_format: str = None) -> Dict:
+        """Play Store 업로드용 패키지 생성
+
+        archive_format ('zip', 'tar', 'tar.gz')을 지정하면 에셋과 리스팅 정보를
+        결정적 아카이브로 바로 스트리밍 (변경 없으면 재빌드 생략)
+        """
 
         app_name = app_spec.get("app_name", "App")
-        package_dir = Path(f"store_packages/{app_name.lower().replace(' ', '_')}")
+        package_slug = app_name.lower().replace(' ', '_')
+        package_dir = Path(f"store_packages/{package_slug}")
         package_dir.mkdir(parents=True, exist_ok=True)
 
         # 스토어 리스팅 정보 생성
@@ -964,6 +983,14 @@ Ensure all screens follow the same design patterns and spacing
         with open(package_info_path, 'w', encoding='utf-8') as f:
             json.dump(store_listing, f, ensure_ascii=False, indent=2)
 
+        if archive_format:
+            builder = StorePackageBuilder(archive_format=archive_format)
+            store_listing["archive"] = builder.build_package(
+                package_slug,
+                builder.collect_asset_files(assets_result),
+                {"store_listing.json": package_info_path.read_bytes()}
+            )
+
         self.logger.info(f"📦 Store Listing 패키지 생성: {package_dir}")
         return store_listing
 
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Launcher Icon Pipeline
+소스 아이콘을 한 번만 디코딩해 mipmap-* 밀도별 런처 아이콘, 어댑티브 아이콘 전경/배경,
+Play Store 512 아이콘을 리샘플링 피라미드로 한 번에 생성
+내용 해시가 같은 파일은 다시 쓰지 않음
+"""
+
+import io
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import logging
+
+from PIL import Image
+
+# 레거시 런처 아이콘 (48dp 기준)
+LAUNCHER_SIZES = {
+    "mdpi": 48,
+    "hdpi": 72,
+    "xhdpi": 96,
+    "xxhdpi": 144,
+    "xxxhdpi": 192
+}
+
+# 어댑티브 아이콘 레이어 (108dp 기준, 내용은 중앙 72dp 안전 영역)
+ADAPTIVE_SIZES = {
+    "mdpi": 108,
+    "hdpi": 162,
+    "xhdpi": 216,
+    "xxhdpi": 324,
+    "xxxhdpi": 432
+}
+ADAPTIVE_SAFE_ZONE = 72 / 108
+
+PLAY_STORE_SIZE = 512
+
+ADAPTIVE_ICON_XML = """<?xml version="1.0" encoding="utf-8"?>
+<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">
+    <background android:drawable="@color/ic_launcher_background"/>
+    <foreground android:drawable="@mipmap/{icon_name}_foreground"/>
+</adaptive-icon>
+"""
+
+BACKGROUND_COLOR_XML = """<?xml version="1.0" encoding="utf-8"?>
+<resources>
+    <color name="ic_launcher_background">{color}</color>
+</resources>
+"""
+
+
+class IconPipeline:
+    """원패스 안드로이드 런처/어댑티브 아이콘 생성기"""
+
+    MANIFEST_NAME = ".app_factory_icons.json"
+
+    def __init__(self, icon_name: str = "ic_launcher"):
+        self.logger = logging.getLogger(__name__)
+        self.icon_name = icon_name
+
+    def _plan_outputs(self, res_dir: Path, store_icon_path: Optional[Path]) -> List[Tuple[Path, int, str]]:
+        """(출력 경로, 픽셀 크기, 종류) 목록"""
+        outputs = []
+        for density, size in LAUNCHER_SIZES.items():
+            outputs.append((res_dir / f"mipmap-{density}" / f"{self.icon_name}.png", size, "legacy"))
+        for density, size in ADAPTIVE_SIZES.items():
+            outputs.append((res_dir / f"mipmap-{density}" / f"{self.icon_name}_foreground.png", size, "foreground"))
+        if store_icon_path:
+            outputs.append((store_icon_path, PLAY_STORE_SIZE, "store"))
+        return outputs
+
+    @staticmethod
+    def _build_pyramid(source: Image.Image, sizes: List[int]) -> Dict[int, Image.Image]:
+        """큰 크기부터 순서대로, 가장 가까운 상위 레벨에서 축소하는 리샘플링 피라미드"""
+        levels = {}
+        current = source
+        for size in sorted(set(sizes), reverse=True):
+            if current.size == (size, size):
+                levels[size] = current
+                continue
+            # 정수배 축소는 reduce()(박스 평균)로, 나머지는 LANCZOS
+            factor = current.width // size
+            if factor >= 2 and current.width == size * factor and current.height == size * factor:
+                levels[size] = current.reduce(factor)
+            else:
+                levels[size] = current.resize((size, size), Image.Resampling.LANCZOS)
+            current = levels[size]
+        return levels
+
+    @staticmethod
+    def _foreground(levels: Dict[int, Image.Image], size: int) -> Image.Image:
+        """안전 영역에 맞춘 어댑티브 전경 레이어 (투명 캔버스 중앙 배치)"""
+        inner = round(size * ADAPTIVE_SAFE_ZONE)
+        canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        art = levels[inner]
+        offset = (size - inner) // 2
+        canvas.paste(art, (offset, offset), art)
+        return canvas
+
+    @staticmethod
+    def _encode(image: Image.Image) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _background_color(source: Image.Image) -> str:
+        """소스 아이콘 모서리 픽셀에서 어댑티브 배경색 추출"""
+        r, g, b, _ = source.getpixel((0, 0))
+        return f"#FF{r:02X}{g:02X}{b:02X}"
+
+    def _write_if_changed(self, path: Path, data: bytes) -> bool:
+        """내용이 다를 때만 쓰기"""
+        if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        return True
+
+    def generate(self, source_icon: Path, res_dir: Path, store_icon_path: Path = None,
+                 background_color: str = None, force: bool = False) -> Dict:
+        """소스 아이콘 하나로 res/ 아래 모든 런처 아이콘 생성
+
+        background_color: '#AARRGGBB' (없으면 소스 모서리 색)
+        """
+        source_icon = Path(source_icon)
+        res_dir = Path(res_dir)
+        store_icon_path = Path(store_icon_path) if store_icon_path else None
+
+        source_bytes = source_icon.read_bytes()
+        source_hash = hashlib.sha256(source_bytes).hexdigest()
+        outputs = self._plan_outputs(res_dir, store_icon_path)
+        manifest_path = res_dir / self.MANIFEST_NAME
+
+        # 소스/설정이 같고 출력이 모두 있으면 디코딩 없이 건너뜀
+        params = {"source": source_hash, "background": background_color, "icon_name": self.icon_name,
+                  "store": str(store_icon_path) if store_icon_path else None}
+        if not force and manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if manifest.get("params") == params and all(path.exists() for path, _, _ in outputs):
+                    self.logger.info(f"⏭️ 아이콘 변경 없음: {res_dir}")
+                    return {"success": True, "written": [], "unchanged": len(outputs), "skipped": True}
+            except Exception as e:
+                self.logger.warning(f"아이콘 매니페스트 로드 실패: {e}")
+
+        # 1회 디코딩
+        with Image.open(io.BytesIO(source_bytes)) as image:
+            source = image.convert("RGBA")
+        if source.width != source.height:
+            side = min(source.size)
+            left = (source.width - side) // 2
+            top = (source.height - side) // 2
+            source = source.crop((left, top, left + side, top + side))
+
+        # 피라미드에 필요한 모든 크기 (전경 레이어의 안전 영역 크기 포함)
+        sizes = [size for _, size, kind in outputs if kind != "foreground"]
+        sizes += [round(size * ADAPTIVE_SAFE_ZONE) for size in ADAPTIVE_SIZES.values()]
+        levels = self._build_pyramid(source, sizes)
+
+        written = []
+        unchanged = 0
+        output_hashes = {}
+        for path, size, kind in outputs:
+            image = self._foreground(levels, size) if kind == "foreground" else levels[size]
+            data = self._encode(image)
+            output_hashes[str(path)] = hashlib.sha256(data).hexdigest()
+            if self._write_if_changed(path, data):
+                written.append(str(path))
+            else:
+                unchanged += 1
+
+        # 어댑티브 아이콘 XML + 배경색 리소스
+        color = background_color or self._background_color(source)
+        xml_outputs = {
+            res_dir / "mipmap-anydpi-v26" / f"{self.icon_name}.xml": ADAPTIVE_ICON_XML.format(icon_name=self.icon_name),
+            res_dir / "values" / "ic_launcher_background.xml": BACKGROUND_COLOR_XML.format(color=color)
+        }
+        for path, content in xml_outputs.items():
+            if self._write_if_changed(path, content.encode("utf-8")):
+                written.append(str(path))
+            else:
+                unchanged += 1
+
+        manifest_path.write_text(json.dumps({
+            "params": params,
+            "generated_at": datetime.now().isoformat(),
+            "outputs": output_hashes
+        }, indent=2, ensure_ascii=False), encoding="utf-8")
+
+        self.logger.info(f"🎯 런처 아이콘 생성: {len(written)}개 작성, {unchanged}개 변경 없음")
+        return {"success": True, "written": written, "unchanged": unchanged, "skipped": False}
+
+    def generate_for_app(self, app_dir: Path, source_icon: Path = None, **kwargs) -> Dict:
+        """Flutter 앱 디렉토리의 android/app/src/main/res 에 직접 생성"""
+        app_dir = Path(app_dir)
+        if source_icon is None:
+            icons = sorted((app_dir / "assets" / "icon").glob("*.png"))
+            if not icons:
+                return {"success": False, "error": "Source icon not found"}
+            source_icon = icons[0]
+
+        res_dir = app_dir / "android" / "app" / "src" / "main" / "res"
+        store_icon = app_dir / "store_assets" / "app_icon_512.png"
+        return self.generate(source_icon, res_dir, store_icon_path=store_icon, **kwargs)
+
+
+def main():
+    """flutter_apps/ 전체 앱 아이콘 생성"""
+
+    logging.basicConfig(level=logging.INFO)
+    pipeline = IconPipeline()
+
+    print("🎯 런처 아이콘 파이프라인")
+    print("=" * 50)
+
+    for app_dir in sorted(Path("flutter_apps").iterdir()):
+        if not (app_dir / "android").exists():
+            continue
+        result = pipeline.generate_for_app(app_dir)
+        if result["success"]:
+            print(f"  {app_dir.name}: {len(result['written'])}개 작성, {result['unchanged']}개 유지")
+        else:
+            print(f"  {app_dir.name}: ⚠️ {result['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Localized Asset Pipeline
+베이스 스크린샷을 한 번만 디코딩하고 N개 로케일 오버레이를 병렬로 렌더링/인코딩
+(베이스 이미지 해시, 로케일, 오버레이 스펙) 키로 렌더 캐시하여 변경 없는 조합은 재렌더링하지 않음
+"""
+
+import os
+import io
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from PIL import Image, ImageDraw, ImageFont
+
+# 화면별 공통 레이아웃 (로케일과 무관)
+# pos: x가 "c"이면 가로 중앙, 음수면 오른쪽 기준 / y가 음수면 아래쪽 기준
+SCREENSHOT_LAYOUTS = {
+    "main_screen": [
+        {"id": "goal_label", "pos": (80, 250), "size": "normal"},
+        {"id": "goal_percent", "pos": ("c", 450), "size": "large", "center": True},
+        {"id": "goal_done", "pos": ("c", 520), "center": True},
+        {"id": "distance", "pos": (80, 650), "size": "small"},
+        {"id": "time", "pos": (280, 650), "size": "small"},
+        {"id": "calories", "pos": (480, 650), "size": "small"},
+        {"id": "start_button", "pos": ("c", -180), "center": True, "color": "button"}
+    ],
+    "workout_screen": [
+        {"id": "timer", "pos": ("c", 400), "size": "large", "center": True},
+        {"id": "distance_label", "pos": (100, 600)},
+        {"id": "distance_value", "pos": (100, 640), "size": "large"},
+        {"id": "speed_label", "pos": (300, 600)},
+        {"id": "speed_value", "pos": (300, 640), "size": "large"},
+        {"id": "pace_label", "pos": (500, 600)},
+        {"id": "pace_value", "pos": (500, 640), "size": "large"},
+        {"id": "pause_button", "pos": (200, -120), "center": True, "color": "button"},
+        {"id": "stop_button", "pos": (-200, -120), "center": True, "color": "red"}
+    ],
+    "progress_screen": [
+        {"id": "level", "pos": ("c", 300), "center": True, "size": "large"},
+        {"id": "evolving", "pos": ("c", 350), "center": True, "size": "small"},
+        {"id": "achievements", "pos": (80, 500)},
+        {"id": "achievement_1", "pos": (100, 550), "size": "small"},
+        {"id": "achievement_2", "pos": (100, 590), "size": "small"},
+        {"id": "achievement_3", "pos": (100, 630), "size": "small"},
+        {"id": "next_level", "pos": ("c", -200), "center": True},
+        {"id": "next_level_xp", "pos": ("c", -160), "center": True, "size": "large"}
+    ],
+    "stats_screen": [
+        {"id": "this_week", "pos": (100, 250)},
+        {"id": "total_distance_label", "pos": (80, 350)},
+        {"id": "total_distance_value", "pos": (80, 380), "size": "large"},
+        {"id": "total_time_label", "pos": (300, 350)},
+        {"id": "total_time_value", "pos": (300, 380), "size": "large"},
+        {"id": "avg_speed_label", "pos": (80, 480)},
+        {"id": "avg_speed_value", "pos": (80, 510), "size": "large"},
+        {"id": "calories_label", "pos": (300, 480)},
+        {"id": "calories_value", "pos": (300, 510), "size": "large"},
+        {"id": "weekly_goal", "pos": ("c", -200), "center": True},
+        {"id": "weekly_goal_value", "pos": ("c", -160), "center": True, "size": "large"}
+    ],
+    "settings_screen": [
+        {"id": "profile_name", "pos": (150, 280), "size": "large"},
+        {"id": "profile_level", "pos": (150, 320), "size": "small"},
+        {"id": "account", "pos": (80, 420)},
+        {"id": "notifications", "pos": (80, 480)},
+        {"id": "privacy", "pos": (80, 540)},
+        {"id": "about", "pos": (80, 600)},
+        {"id": "logout", "pos": (80, 660), "color": "red"}
+    ]
+}
+
+# 로케일 테이블: 로케일별 폰트 후보와 화면 텍스트
+SCREENSHOT_LOCALE_TABLE = {
+    "ko": {
+        "fonts": ["BlackHanSans.ttf", "GmarketSansBold.ttf", "NanumGothicBold.ttf"],
+        "screens": {
+            "main_screen": {
+                "title": "기가차드 러너", "goal_label": "오늘의 목표", "goal_percent": "75%",
+                "goal_done": "완료", "distance": "거리: 2.3km", "time": "시간: 15분",
+                "calories": "칼로리: 120", "start_button": "달리기 시작"
+            },
+            "workout_screen": {
+                "title": "달리기 중", "timer": "00:15:42", "distance_label": "거리",
+                "distance_value": "2.3km", "speed_label": "속도", "speed_value": "5.2km/h",
+                "pace_label": "페이스", "pace_value": "11:30", "pause_button": "일시정지",
+                "stop_button": "정지"
+            },
+            "progress_screen": {
+                "title": "진행률", "level": "레벨 5", "evolving": "기가차드로 진화 중...",
+                "achievements": "업적", "achievement_1": "첫 달리기 완료",
+                "achievement_2": "10km 달성", "achievement_3": "연속 7일",
+                "next_level": "다음 레벨까지", "next_level_xp": "3,200 XP"
+            },
+            "stats_screen": {
+                "title": "통계", "this_week": "이번 주", "total_distance_label": "총 거리",
+                "total_distance_value": "15.2km", "total_time_label": "총 시간",
+                "total_time_value": "2시간 30분", "avg_speed_label": "평균 속도",
+                "avg_speed_value": "6.1km/h", "calories_label": "칼로리",
+                "calories_value": "890 kcal", "weekly_goal": "주간 목표",
+                "weekly_goal_value": "85% 달성"
+            },
+            "settings_screen": {
+                "title": "설정", "profile_name": "기가차드", "profile_level": "레벨 5 러너",
+                "account": "계정", "notifications": "알림", "privacy": "개인정보 보호",
+                "about": "앱 정보", "logout": "로그아웃"
+            }
+        }
+    },
+    "en": {
+        "fonts": ["Pretendard-ExtraBold.ttf", "GmarketSansBold.ttf", "BlackHanSans.ttf"],
+        "screens": {
+            "main_screen": {
+                "title": "GigaChad Runner", "goal_label": "Today's Goal", "goal_percent": "75%",
+                "goal_done": "Done", "distance": "Dist: 2.3km", "time": "Time: 15m",
+                "calories": "Cal: 120", "start_button": "START RUN"
+            },
+            "workout_screen": {
+                "title": "Running", "timer": "00:15:42", "distance_label": "Distance",
+                "distance_value": "2.3km", "speed_label": "Speed", "speed_value": "5.2km/h",
+                "pace_label": "Pace", "pace_value": "11:30", "pause_button": "PAUSE",
+                "stop_button": "STOP"
+            },
+            "progress_screen": {
+                "title": "Progress", "level": "Level 5", "evolving": "Evolving into GigaChad...",
+                "achievements": "Achievements", "achievement_1": "First run complete",
+                "achievement_2": "10km reached", "achievement_3": "7-day streak",
+                "next_level": "To next level", "next_level_xp": "3,200 XP"
+            },
+            "stats_screen": {
+                "title": "Stats", "this_week": "This Week", "total_distance_label": "Distance",
+                "total_distance_value": "15.2km", "total_time_label": "Time",
+                "total_time_value": "2h 30m", "avg_speed_label": "Avg Speed",
+                "avg_speed_value": "6.1km/h", "calories_label": "Calories",
+                "calories_value": "890 kcal", "weekly_goal": "Weekly Goal",
+                "weekly_goal_value": "85% done"
+            },
+            "settings_screen": {
+                "title": "Settings", "profile_name": "GigaChad", "profile_level": "Level 5 Runner",
+                "account": "Account", "notifications": "Notifications", "privacy": "Privacy",
+                "about": "About", "logout": "Log out"
+            }
+        }
+    },
+    "ja": {
+        "fonts": ["NotoSansJP-Bold.ttf", "Pretendard-ExtraBold.ttf"],
+        "screens": {
+            "main_screen": {
+                "title": "ギガチャド ランナー", "goal_label": "今日の目標", "goal_percent": "75%",
+                "goal_done": "完了", "distance": "距離: 2.3km", "time": "時間: 15分",
+                "calories": "カロリー: 120", "start_button": "ランニング開始"
+            },
+            "workout_screen": {
+                "title": "ランニング中", "timer": "00:15:42", "distance_label": "距離",
+                "distance_value": "2.3km", "speed_label": "速度", "speed_value": "5.2km/h",
+                "pace_label": "ペース", "pace_value": "11:30", "pause_button": "一時停止",
+                "stop_button": "停止"
+            },
+            "progress_screen": {
+                "title": "進捗", "level": "レベル 5", "evolving": "ギガチャドに進化中...",
+                "achievements": "実績", "achievement_1": "初ランニング完了",
+                "achievement_2": "10km 達成", "achievement_3": "7日連続",
+                "next_level": "次のレベルまで", "next_level_xp": "3,200 XP"
+            },
+            "stats_screen": {
+                "title": "統計", "this_week": "今週", "total_distance_label": "総距離",
+                "total_distance_value": "15.2km", "total_time_label": "総時間",
+                "total_time_value": "2時間30分", "avg_speed_label": "平均速度",
+                "avg_speed_value": "6.1km/h", "calories_label": "カロリー",
+                "calories_value": "890 kcal", "weekly_goal": "週間目標",
+                "weekly_goal_value": "85% 達成"
+            },
+            "settings_screen": {
+                "title": "設定", "profile_name": "ギガチャド", "profile_level": "レベル 5 ランナー",
+                "account": "アカウント", "notifications": "通知", "privacy": "プライバシー",
+                "about": "アプリ情報", "logout": "ログアウト"
+            }
+        }
+    }
+}
+
+FONT_SIZES = {"large": 48, "normal": 32, "small": 24}
+
+TEXT_COLORS = {
+    "button": (255, 225, 50),  # 골드
+    "red": (255, 0, 0),        # 빨강
+    "white": (255, 255, 255)   # 흰색
+}
+
+
+def _resolve_pos(pos, img_width: int, img_height: int) -> List[int]:
+    """레이아웃 좌표를 실제 픽셀 좌표로 변환"""
+    x, y = pos
+    if x == "c":
+        x = img_width // 2
+    elif x < 0:
+        x = img_width + x
+    if y < 0:
+        y = img_height + y
+    return [x, y]
+
+
+def build_overlay_spec(locale: str, screen_type: str, screen_title: str,
+                       image_size, font_dir: Path = Path("fonts")) -> Dict:
+    """로케일/화면별 오버레이 스펙 생성 (JSON 직렬화 가능, 캐시 키에 사용)"""
+
+    img_width, img_height = image_size
+    locale_data = SCREENSHOT_LOCALE_TABLE.get(locale, SCREENSHOT_LOCALE_TABLE["ko"])
+    texts = locale_data["screens"].get(screen_type, {})
+
+    font_file = None
+    for candidate in locale_data["fonts"]:
+        if (font_dir / candidate).exists():
+            font_file = str(font_dir / candidate)
+            break
+
+    elements = []
+    for element in SCREENSHOT_LAYOUTS.get(screen_type, []):
+        text = texts.get(element["id"])
+        if not text:
+            continue
+        elements.append({
+            "text": text,
+            "pos": _resolve_pos(element["pos"], img_width, img_height),
+            "size": element.get("size", "normal"),
+            "center": element.get("center", False),
+            "color": element.get("color", "white")
+        })
+
+    return {
+        "locale": locale,
+        "screen_type": screen_type,
+        "font": font_file,
+        "title": texts.get("title", screen_title),
+        "elements": elements
+    }
+
+
+_font_local = threading.local()
+
+
+def _load_font(font_file: Optional[str], size: int):
+    """스레드별 폰트 캐시 (FreeType 핸들은 스레드 간 공유하지 않음)"""
+    cache = getattr(_font_local, "fonts", None)
+    if cache is None:
+        cache = _font_local.fonts = {}
+
+    key = (font_file, size)
+    if key not in cache:
+        try:
+            cache[key] = ImageFont.truetype(font_file, size) if font_file else ImageFont.load_default()
+        except Exception:
+            cache[key] = ImageFont.load_default()
+    return cache[key]
+
+
+def draw_screenshot_overlay(img: Image.Image, spec: Dict) -> Image.Image:
+    """오버레이 스펙을 이미지에 그리기 (이미지를 직접 수정)"""
+
+    draw = ImageDraw.Draw(img)
+    img_width, _ = img.size
+    fonts = {size: _load_font(spec["font"], px) for size, px in FONT_SIZES.items()}
+    title_font = fonts["large"]
+
+    # 타이틀 추가 (상단)
+    title_text = spec["title"]
+    title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
+    title_width = title_bbox[2] - title_bbox[0]
+    title_x = (img_width - title_width) // 2
+    title_y = 100
+
+    # 타이틀 그림자
+    for dx in range(-2, 3):
+        for dy in range(-2, 3):
+            if dx != 0 or dy != 0:
+                draw.text((title_x + dx, title_y + dy), title_text,
+                          fill=(0, 0, 0, 200), font=title_font)
+
+    # 타이틀 메인
+    draw.text((title_x, title_y), title_text, fill=(255, 225, 50), font=title_font)
+
+    # 각 요소별 텍스트 추가
+    for element in spec["elements"]:
+        text = element["text"]
+        pos = tuple(element["pos"])
+        font = fonts.get(element["size"], fonts["normal"])
+
+        # 중앙 정렬 처리
+        if element["center"]:
+            bbox = draw.textbbox((0, 0), text, font=font)
+            text_width = bbox[2] - bbox[0]
+            pos = (pos[0] - text_width // 2, pos[1])
+
+        # 그림자
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                if dx != 0 or dy != 0:
+                    draw.text((pos[0] + dx, pos[1] + dy), text,
+                              fill=(0, 0, 0, 150), font=font)
+
+        # 메인 텍스트
+        draw.text(pos, text, fill=TEXT_COLORS.get(element["color"], TEXT_COLORS["white"]), font=font)
+
+    return img
+
+
+class LocalizedAssetPipeline:
+    """베이스 이미지 1회 디코딩 → N개 로케일 오버레이 → 병렬 인코딩 파이프라인"""
+
+    def __init__(self, cache_dir: str = None, font_dir: str = "fonts", max_workers: int = None):
+        self.logger = logging.getLogger(__name__)
+
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / ".cache" / "app-factory" / "localized"
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / "render_cache.json"
+        self.font_dir = Path(font_dir)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+        self.stats = {"rendered": 0, "cache_hits": 0, "base_decodes": 0}
+
+    def _load_index(self) -> Dict:
+        """렌더 캐시 인덱스 로드"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.warning(f"렌더 캐시 인덱스 로드 실패: {e}")
+        return {}
+
+    def _save_index(self):
+        """렌더 캐시 인덱스 저장"""
+        try:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.logger.error(f"렌더 캐시 인덱스 저장 실패: {e}")
+
+    @staticmethod
+    def render_key(base_hash: str, locale: str, spec: Dict) -> str:
+        """(베이스 해시, 로케일, 오버레이 스펙) 렌더 캐시 키"""
+        spec_str = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(f"{base_hash}|{locale}|{spec_str}".encode()).hexdigest()[:24]
+
+    def _is_cached(self, key: str, output_path: Path) -> bool:
+        """캐시 항목이 있고 출력 파일이 그대로인지 확인"""
+        entry = self.index.get(key)
+        if not entry or entry.get("output_path") != str(output_path):
+            return False
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+    def _render_and_encode(self, base: Image.Image, spec: Dict, output_path: Path) -> Dict:
+        """베이스 복사본에 오버레이를 그리고 PNG로 인코딩 (워커 스레드)"""
+        img = draw_screenshot_overlay(base.copy(), spec)
+
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG', optimize=True)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        tmp_path.write_bytes(buffer.getvalue())
+        os.replace(tmp_path, output_path)
+
+        stat = output_path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def render_locales(self, base_image_path: Path, screen_type: str, screen_title: str,
+                       outputs: Dict[str, Path]) -> Dict[str, Dict]:
+        """베이스 이미지 하나에 대해 로케일별 오버레이 출력 생성
+
+        outputs: {locale: 출력 경로}
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return self._render_locales(executor, Path(base_image_path), screen_type,
+                                        screen_title, outputs)
+
+    def render_batch(self, jobs: List[Dict]) -> List[Dict[str, Dict]]:
+        """여러 베이스 이미지를 하나의 워커 풀로 처리
+
+        jobs: [{"base_image": 경로, "screen_type": ..., "screen_title": ..., "outputs": {locale: 경로}}]
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return [
+                self._render_locales(executor, Path(job["base_image"]), job["screen_type"],
+                                     job.get("screen_title", ""), job["outputs"])
+                for job in jobs
+            ]
+
+    def _render_locales(self, executor: ThreadPoolExecutor, base_image_path: Path,
+                        screen_type: str, screen_title: str, outputs: Dict[str, Path]) -> Dict[str, Dict]:
+        data = base_image_path.read_bytes()
+        base_hash = hashlib.sha256(data).hexdigest()
+
+        # 헤더만 읽어 크기 확인 (픽셀 디코딩은 캐시 미스가 있을 때만)
+        base = Image.open(io.BytesIO(data))
+
+        results = {}
+        pending = []
+        for locale, output_path in outputs.items():
+            output_path = Path(output_path)
+            spec = build_overlay_spec(locale, screen_type, screen_title, base.size, self.font_dir)
+            key = self.render_key(base_hash, locale, spec)
+
+            if self._is_cached(key, output_path):
+                self.stats["cache_hits"] += 1
+                results[locale] = {"file_path": str(output_path), "status": "cached", "cache_key": key}
+            else:
+                pending.append((locale, output_path, spec, key))
+
+        if pending:
+            base.load()
+            self.stats["base_decodes"] += 1
+
+            futures = [
+                (locale, output_path, key, executor.submit(self._render_and_encode, base, spec, output_path))
+                for locale, output_path, spec, key in pending
+            ]
+
+            for locale, output_path, key, future in futures:
+                try:
+                    file_info = future.result()
+                    with self._lock:
+                        self.index[key] = {
+                            "output_path": str(output_path),
+                            "locale": locale,
+                            "base_hash": base_hash,
+                            "rendered_at": datetime.now().isoformat(),
+                            **file_info
+                        }
+                    self.stats["rendered"] += 1
+                    results[locale] = {"file_path": str(output_path), "status": "rendered", "cache_key": key}
+                except Exception as e:
+                    self.logger.error(f"로케일 오버레이 렌더링 실패 ({locale}): {e}")
+                    results[locale] = {"file_path": str(output_path), "status": "failed", "error": str(e)}
+
+            self._save_index()
+
+        self.logger.info(
+            f"🌐 {base_image_path.name}: {len(pending)}개 렌더링, "
+            f"{len(outputs) - len(pending)}개 캐시 재사용"
+        )
+        return results
+
+
+def main():
+    """테스트 실행"""
+
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        base_path = tmp_dir / "base_main_screen.png"
+        Image.new('RGB', (1080, 1920), color='#1A1A1A').save(base_path, 'PNG')
+
+        pipeline = LocalizedAssetPipeline(cache_dir=str(tmp_dir / "cache"))
+        outputs = {locale: tmp_dir / locale / "main_screen.png" for locale in SCREENSHOT_LOCALE_TABLE}
+
+        print("🌐 로컬라이즈 파이프라인 테스트")
+        print("=" * 50)
+        print(pipeline.render_locales(base_path, "main_screen", "메인 화면", outputs))
+        print(pipeline.render_locales(base_path, "main_screen", "메인 화면", outputs))
+        print(f"📊 통계: {pipeline.stats}")
+
+
+if __name__ == "__main__":
+    main()
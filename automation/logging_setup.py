@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared Logging Setup
+QueueHandler/QueueListener 로 파일/콘솔 I/O 를 백그라운드 스레드로 옮기고,
+파일에는 실행(run)/앱(app)/단계(stage) ID 가 포함된 JSON 한 줄씩 기록
+- 호출 스레드는 레코드를 큐에 넣기만 함 (포맷/디스크 쓰기 없음)
+- 억제된 레벨은 %-스타일 인자를 포맷하지 않음 (logger.info("... %s", value))
+"""
+
+import sys
+import json
+import time
+import uuid
+import atexit
+import logging
+import threading
+import contextvars
+from queue import SimpleQueue
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+run_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("run_id", default=None)
+app_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("app_id", default=None)
+stage_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("stage", default=None)
+
+CONSOLE_FORMAT = "%(asctime)s [%(component)s] %(levelname)s: %(message)s"
+
+_lock = threading.Lock()
+_queue: SimpleQueue = SimpleQueue()
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_handlers: Dict[str, logging.Handler] = {}
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+@contextmanager
+def log_context(run_id: str = None, app_id: str = None, stage: str = None):
+    """with 블록 안의 로그(같은 태스크/스레드)에 ID 부여 - None 인 값은 바깥 값 유지"""
+    tokens = []
+    for var, value in ((run_id_var, run_id), (app_id_var, app_id), (stage_var, stage)):
+        if value is not None:
+            tokens.append((var, var.set(value)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def set_log_stage(stage: str):
+    """현재 단계 변경 (바깥 log_context 가 끝나면 이전 값으로 복원됨)"""
+    stage_var.set(stage)
+
+
+class ContextQueueHandler(QueueHandler):
+    """호출 시점의 컨텍스트 ID 만 붙여 큐에 넣음 (JSON 변환/쓰기는 리스너 스레드에서)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.run_id = run_id_var.get()
+        record.app_id = app_id_var.get()
+        record.stage = stage_var.get()
+        # 인자가 나중에 바뀌지 않도록 메시지만 여기서 확정 (%-포맷은 출력되는 레벨에서만 실행됨)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JsonLineFormatter(logging.Formatter):
+    """한 줄 JSON (grep/jq 로 run_id, app_id, stage 별 추적)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "component": getattr(record, "component", record.name),
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        for field in ("run_id", "app_id", "stage"):
+            value = getattr(record, field, None)
+            if value:
+                entry[field] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+class _ComponentFilter(logging.Filter):
+    def __init__(self, component: str):
+        super().__init__()
+        self.component = component
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "component"):
+            record.component = self.component
+        return True
+
+
+class _DefaultComponent(logging.Filter):
+    """다른 모듈 로거에서 온 레코드의 component 기본값"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "component"):
+            record.component = record.name
+        return True
+
+
+class _LoggerTreeFilter(logging.Filter):
+    """파일 핸들러용 - 이 파일에 연결된 로거(와 하위 로거)의 레코드만 통과 (콘솔은 전체)"""
+
+    def __init__(self, logger_name: str):
+        super().__init__()
+        self.names = {logger_name}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        while True:
+            if name in self.names:
+                return True
+            if "." not in name:
+                return False
+            name = name.rsplit(".", 1)[0]
+
+
+def _restart_listener():
+    global _listener
+    if _listener:
+        _listener.stop()
+    _listener = QueueListener(_queue, *_handlers.values(), respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 쓰고 리스너 종료"""
+    global _listener
+    with _lock:
+        if _listener:
+            _listener.stop()
+            _listener = None
+        for handler in _handlers.values():
+            handler.flush()
+
+
+def setup_logging(logger_name: str, component: str, log_file: Optional[str] = None,
+                  level: int = logging.INFO, console: bool = True) -> logging.Logger:
+    """공용 로깅 설정 후 logger_name 로거 반환 (여러 번 호출해도 핸들러 중복 없음)
+
+    log_file 은 JSON 줄 형식이며 logger_name (하위 로거 포함) 의 로그만 기록
+    콘솔은 기존과 같은 사람이 읽는 형식으로 모든 로그 출력
+    """
+    global _queue_handler
+    with _lock:
+        changed = False
+        if console and "<console>" not in _handlers:
+            stream_handler = logging.StreamHandler(sys.stderr)
+            stream_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+            stream_handler.addFilter(_DefaultComponent())
+            _handlers["<console>"] = stream_handler
+            changed = True
+        if log_file and log_file not in _handlers:
+            file_handler = logging.FileHandler(log_file, encoding="utf-8")
+            file_handler.setFormatter(JsonLineFormatter())
+            file_handler.addFilter(_LoggerTreeFilter(logger_name))
+            _handlers[log_file] = file_handler
+            changed = True
+        elif log_file:
+            # 같은 파일을 여러 컴포넌트가 쓰면 각자의 로거를 추가
+            for log_filter in _handlers[log_file].filters:
+                if isinstance(log_filter, _LoggerTreeFilter):
+                    log_filter.names.add(logger_name)
+
+        root = logging.getLogger()
+        if _queue_handler is None:
+            _queue_handler = ContextQueueHandler(_queue)
+            root.addHandler(_queue_handler)
+            atexit.register(shutdown_logging)
+        if root.level > level:
+            root.setLevel(level)
+
+        if changed or _listener is None:
+            _restart_listener()
+
+    logger = logging.getLogger(logger_name)
+    if not any(isinstance(f, _ComponentFilter) for f in logger.filters):
+        logger.addFilter(_ComponentFilter(component))
+    return logger
+
+
+def benchmark_logging(apps: int = 200, messages_per_app: int = 30, log_dir: str = None) -> Dict:
+    """앱 하나 생성 동안의 로그 호출 비용 비교 (동기 FileHandler+StreamHandler vs 큐)"""
+    import os
+    import tempfile
+
+    log_dir = log_dir or tempfile.mkdtemp(prefix="logbench_")
+    devnull = open(os.devnull, "w")
+    results = {}
+
+    def run(logger: logging.Logger, lazy: bool) -> float:
+        started = time.perf_counter()
+        for app in range(apps):
+            with log_context(app_id=f"app_{app:04d}", stage="generate"):
+                for step in range(messages_per_app):
+                    if lazy:
+                        logger.info("📋 단계 %d 완료: %s ($%.3f)", step, "serverless_spec", 0.012)
+                        logger.debug("세부 정보: %s", {"step": step, "app": app})
+                    else:
+                        logger.info(f"📋 단계 {step} 완료: {'serverless_spec'} (${0.012:.3f})")
+                        logger.debug(f"세부 정보: {({'step': step, 'app': app})}")
+        return (time.perf_counter() - started) / apps * 1000
+
+    # 기존 방식: 호출 스레드에서 포맷 + 디스크/콘솔 쓰기
+    sync_logger = logging.getLogger("logbench.sync")
+    sync_logger.propagate = False
+    sync_logger.setLevel(logging.INFO)
+    file_handler = logging.FileHandler(os.path.join(log_dir, "sync.log"), encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT.replace("%(component)s", "BENCH")))
+    stream_handler = logging.StreamHandler(devnull)
+    stream_handler.setFormatter(file_handler.formatter)
+    sync_logger.addHandler(file_handler)
+    sync_logger.addHandler(stream_handler)
+    results["sync_fstring_ms_per_app"] = round(run(sync_logger, lazy=False), 3)
+    file_handler.close()
+
+    # 큐 방식: 호출 스레드는 큐에 넣기만, 리스너가 JSON 으로 쓰기
+    bench_queue: SimpleQueue = SimpleQueue()
+    queue_logger = logging.getLogger("logbench.queue")
+    queue_logger.propagate = False
+    queue_logger.setLevel(logging.INFO)
+    queue_logger.addHandler(ContextQueueHandler(bench_queue))
+    queue_logger.addFilter(_ComponentFilter("BENCH"))
+    json_handler = logging.FileHandler(os.path.join(log_dir, "queue.log"), encoding="utf-8")
+    json_handler.setFormatter(JsonLineFormatter())
+    console_handler = logging.StreamHandler(devnull)
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    listener = QueueListener(bench_queue, json_handler, console_handler)
+    listener.start()
+    with log_context(run_id=new_run_id()):
+        results["queue_lazy_ms_per_app"] = round(run(queue_logger, lazy=True), 3)
+    drain_started = time.perf_counter()
+    listener.stop()
+    results["queue_drain_ms"] = round((time.perf_counter() - drain_started) * 1000, 1)
+    json_handler.close()
+    devnull.close()
+
+    results["apps"] = apps
+    results["messages_per_app"] = messages_per_app
+    results["speedup"] = round(results["sync_fstring_ms_per_app"] / max(results["queue_lazy_ms_per_app"], 1e-9), 2)
+    return results
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="공용 로깅 설정")
+    parser.add_argument("--benchmark", action="store_true", help="앱당 로깅 오버헤드 측정")
+    parser.add_argument("--apps", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        results = benchmark_logging(apps=args.apps)
+        print(f"📊 로깅 오버헤드 (앱 {results['apps']}개 × 메시지 {results['messages_per_app']}개)")
+        print(f"  동기 FileHandler + f-string: {results['sync_fstring_ms_per_app']:.3f} ms/앱")
+        print(f"  QueueHandler + %-포맷:       {results['queue_lazy_ms_per_app']:.3f} ms/앱 "
+              f"({results['speedup']:.1f}배, 리스너 정리 {results['queue_drain_ms']:.0f} ms)")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
+from .icon_pipeline import IconPipeline
+
 class Mission100AssetAdapter:
     """Mission: 100 에셋을 다른 운동 앱에 재활용하는 어댑터"""
 
@@ -326,6 +328,11 @@ class Mission100AssetAdapter:
                 copied_files.append(str(target_icon))
                 self.logger.info(f"🎯 아이콘 복사됨: {target_icon}")
 
+                # 밀도별 런처/어댑티브 아이콘을 android res 에 한 번에 생성
+                if (target_app_dir / "android").exists():
+                    icon_result = IconPipeline().generate_for_app(target_app_dir, source_icon=target_icon)
+                    self.logger.info(f"📐 런처 아이콘: {len(icon_result.get('written', []))}개 갱신")
+
             # 운동 가이드 JSON 생성
             guide_data = self.get_exercise_guide_template(exercise_type)
             guide_file = target_data_dir / f"{exercise_type}_form_guide.json"
@@ -9,9 +9,10 @@ import requests
 import json
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import logging
 from dataclasses import dataclass, asdict
 
+from .logging_setup import setup_logging
+
 @dataclass
 class NotionConfig:
     """Notion 설정"""
@@ -64,11 +65,7 @@ class NotionTaskTracker:
 
     def _setup_logging(self):
         """로깅 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [NOTION-TRACKER] %(levelname)s: %(message)s'
-        )
-        return logging.getLogger(__name__)
+        return setup_logging(__name__, "NOTION-TRACKER")
 
     async def start_task_tracking(self, task_name: str, details: Optional[Dict] = None) -> str:
         """Task 추적 시작"""
@@ -247,11 +244,7 @@ class NotionAppFactoryDashboard:
 
     def _setup_logging(self):
         """로깅 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [NOTION] %(levelname)s: %(message)s'
-        )
-        return logging.getLogger(__name__)
+        return setup_logging(__name__, "NOTION")
 
     def setup_dashboard_structure(self) -> Dict[str, str]:
         """Notion 대시보드 구조 자동 생성"""
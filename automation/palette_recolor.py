@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Palette Recolor Engine
+같은 다크 UI 레이아웃을 공유하는 시리즈 앱들의 스크린샷을 테마 색상만 바꿔 재사용
+HSV 색상환 LUT로 소스 팔레트 → 타겟 팔레트 변환 (앱 N개에 레이아웃당 유료 렌더 1회)
+"""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import logging
+
+import numpy as np
+from PIL import Image
+
+# 기가차드 러너 기본 팔레트 (Alpha Gold, Grindset Red)
+DEFAULT_PALETTE = ["#FFD700", "#FF0000"]
+
+
+def parse_hex_color(value: str) -> Tuple[int, int, int]:
+    """'#FFD700', 'FFD700', '0xFFFFD700'(Flutter ARGB) 형식을 RGB로 변환"""
+    text = value.strip().lower()
+    if text.startswith("0x"):
+        text = text[2:]
+    text = text.lstrip("#")
+    if len(text) == 8:  # ARGB → 알파 제거
+        text = text[2:]
+    if len(text) != 6:
+        raise ValueError(f"잘못된 색상 값: {value}")
+    return int(text[0:2], 16), int(text[2:4], 16), int(text[4:6], 16)
+
+
+def palette_from_spec(app_spec: Dict) -> List[str]:
+    """앱 스펙의 테마에서 [primary, secondary] 팔레트 추출"""
+    theme = app_spec.get("theme") or {}
+    if theme.get("primary_color_hex"):
+        return [theme["primary_color_hex"], theme.get("secondary_color_hex", theme["primary_color_hex"])]
+
+    ui_theme = app_spec.get("ui_theme") or {}
+    if ui_theme.get("primary_color"):
+        return [ui_theme["primary_color"], ui_theme.get("secondary_color", ui_theme["primary_color"])]
+
+    return list(DEFAULT_PALETTE)
+
+
+def _rgb_to_hsv8(rgb: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """RGB를 PIL 'HSV' 모드와 같은 0-255 스케일 HSV로 변환"""
+    pixel = Image.new("RGB", (1, 1), rgb).convert("HSV")
+    return pixel.getpixel((0, 0))
+
+
+class PaletteRecolorEngine:
+    """HSV LUT 기반 팔레트 스왑 엔진"""
+
+    def __init__(self, hue_tolerance: int = 14, min_saturation: int = 60):
+        # PIL HSV의 색상(H)은 0-255 스케일 (14 ≈ 20도)
+        self.hue_tolerance = hue_tolerance
+        self.min_saturation = min_saturation
+        self._lut_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def _build_luts(self, source_palette: List[str], target_palette: List[str]):
+        """팔레트 쌍에 대한 LUT 생성 (팔레트 쌍별 1회)
+
+        hue_index[h]       : 해당 색상이 매칭되는 팔레트 인덱스 (없으면 0 = 변경 없음)
+        hue_lut[i, h]      : 매칭된 색상을 타겟 색상으로 회전
+        sat_lut[i, s]      : 채도 비율 보정
+        val_lut[i, v]      : 명도 비율 보정
+        """
+        key = (tuple(source_palette), tuple(target_palette))
+        if key in self._lut_cache:
+            return self._lut_cache[key]
+
+        count = min(len(source_palette), len(target_palette))
+        levels = np.arange(256, dtype=np.float32)
+
+        # 인덱스 0은 항등 변환
+        hue_index = np.zeros(256, dtype=np.uint8)
+        best_distance = np.full(256, self.hue_tolerance + 1, dtype=np.int32)
+        hue_lut = np.tile(np.arange(256, dtype=np.uint8), (count + 1, 1))
+        sat_lut = np.tile(np.arange(256, dtype=np.uint8), (count + 1, 1))
+        val_lut = np.tile(np.arange(256, dtype=np.uint8), (count + 1, 1))
+
+        hues = np.arange(256, dtype=np.int32)
+        for i in range(count):
+            src_h, src_s, src_v = _rgb_to_hsv8(parse_hex_color(source_palette[i]))
+            dst_h, dst_s, dst_v = _rgb_to_hsv8(parse_hex_color(target_palette[i]))
+
+            # 원형 색상 거리로 가장 가까운 소스 색상에 매칭
+            distance = np.abs(hues - src_h)
+            distance = np.minimum(distance, 256 - distance)
+            closer = distance < best_distance
+            hue_index[closer] = i + 1
+            best_distance[closer] = distance[closer]
+
+            # 색상은 회전(그라데이션/안티앨리어싱의 미세한 색상 차이 유지)
+            hue_lut[i + 1] = ((hues + (dst_h - src_h)) % 256).astype(np.uint8)
+            sat_lut[i + 1] = np.clip(levels * (dst_s / max(src_s, 1)), 0, 255).astype(np.uint8)
+            val_lut[i + 1] = np.clip(levels * (dst_v / max(src_v, 1)), 0, 255).astype(np.uint8)
+
+        luts = (hue_index, hue_lut, sat_lut, val_lut)
+        self._lut_cache[key] = luts
+        return luts
+
+    def recolor(self, image: Image.Image, source_palette: List[str], target_palette: List[str]) -> Image.Image:
+        """이미지의 소스 팔레트 색상을 타겟 팔레트로 교체 (무채색 배경/텍스트는 유지)"""
+
+        hue_index, hue_lut, sat_lut, val_lut = self._build_luts(source_palette, target_palette)
+
+        alpha = image.getchannel("A") if image.mode in ("RGBA", "LA") else None
+        hsv = np.asarray(image.convert("RGB").convert("HSV"))
+        h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+        # 픽셀별 팔레트 인덱스 (채도가 낮은 다크 UI 배경은 0 = 변경 없음)
+        idx = hue_index[h]
+        idx[s < self.min_saturation] = 0
+
+        recolored = np.stack([hue_lut[idx, h], sat_lut[idx, s], val_lut[idx, v]], axis=-1)
+        result = Image.fromarray(recolored, "HSV").convert("RGB")
+
+        if alpha is not None:
+            result.putalpha(alpha)
+        return result
+
+    def recolor_file(self, base_path: Path, source_palette: List[str], target_palette: List[str],
+                     output_path: Path) -> Path:
+        """파일 단위 리컬러링"""
+        with Image.open(base_path) as image:
+            result = self.recolor(image, source_palette, target_palette)
+        result.save(output_path, "PNG", optimize=True)
+        return output_path
+
+
+class LayoutBaseRegistry:
+    """레이아웃별 유료 렌더 베이스 이미지 저장소 (팔레트 정보 포함)"""
+
+    def __init__(self, cache_dir: str = None):
+        self.logger = logging.getLogger(__name__)
+
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / ".cache" / "app-factory" / "layouts"
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / "layout_bases.json"
+        self.index = self._load_index()
+        self.engine = PaletteRecolorEngine()
+
+    def _load_index(self) -> Dict:
+        """레이아웃 인덱스 로드"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.warning(f"레이아웃 인덱스 로드 실패: {e}")
+        return {}
+
+    def _save_index(self):
+        """레이아웃 인덱스 저장"""
+        try:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.logger.error(f"레이아웃 인덱스 저장 실패: {e}")
+
+    @staticmethod
+    def layout_key(layout_name: str, width: int, height: int) -> str:
+        """레이아웃 키 (화면 이름 + 크기)"""
+        return f"{layout_name}_{width}x{height}"
+
+    def register(self, layout_key: str, image_path: Path, palette: List[str]):
+        """유료 렌더 결과를 레이아웃 베이스로 등록"""
+        filename = f"{layout_key}.png"
+        shutil.copyfile(image_path, self.cache_dir / filename)
+
+        self.index[layout_key] = {
+            "filename": filename,
+            "palette": list(palette),
+            "registered_at": datetime.now().isoformat()
+        }
+        self._save_index()
+        self.logger.info(f"🎨 레이아웃 베이스 등록: {layout_key} ({', '.join(palette)})")
+
+    def recolor_from_base(self, layout_key: str, target_palette: List[str], output_path: Path) -> Optional[Dict]:
+        """등록된 베이스를 타겟 팔레트로 리컬러링 (베이스 없으면 None)"""
+        entry = self.index.get(layout_key)
+        if not entry:
+            return None
+
+        base_file = self.cache_dir / entry["filename"]
+        if not base_file.exists():
+            return None
+
+        self.engine.recolor_file(base_file, entry["palette"], target_palette, output_path)
+        self.logger.info(f"🎨 팔레트 리컬러링 재사용: {layout_key} → {output_path.name}")
+
+        return {
+            "status": "success",
+            "file_path": str(output_path),
+            "size_kb": output_path.stat().st_size // 1024,
+            "method": "palette_recolor",
+            "cost": 0,
+            "base_palette": entry["palette"]
+        }
+
+
+def main():
+    """테스트 실행"""
+
+    import tempfile
+    import time
+
+    print("🎨 팔레트 리컬러링 엔진 테스트")
+    print("=" * 50)
+
+    # 다크 배경 + 골드/레드 액센트 합성 스크린샷
+    base = np.full((1920, 1080, 3), 26, dtype=np.uint8)
+    base[200:400, 100:980] = parse_hex_color("#FFD700")
+    base[1600:1750, 100:980] = parse_hex_color("#FF0000")
+    image = Image.fromarray(base, "RGB")
+
+    engine = PaletteRecolorEngine()
+    start = time.perf_counter()
+    result = engine.recolor(image, DEFAULT_PALETTE, ["0xFFFF6B35", "0xFF004E89"])
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"⏱️ 1080x1920 리컬러링: {elapsed:.1f}ms")
+    print(f"  골드 → {result.getpixel((500, 300))}")
+    print(f"  레드 → {result.getpixel((500, 1700))}")
+    print(f"  배경 → {result.getpixel((10, 10))}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        registry = LayoutBaseRegistry(cache_dir=tmp)
+        base_path = Path(tmp) / "base.png"
+        image.save(base_path)
+        registry.register("main_screen_1080x1920", base_path, DEFAULT_PALETTE)
+        print(registry.recolor_from_base("main_screen_1080x1920", ["#3498DB", "#34495E"], Path(tmp) / "out.png"))
+
+
+if __name__ == "__main__":
+    main()
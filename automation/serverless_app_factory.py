@@ -10,7 +10,6 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import json
-import logging
 from pathlib import Path
 from .config_manager import SecureConfigManager
 from .store_compliance_checker import StoreComplianceChecker
@@ -20,6 +19,7 @@ from .store_deployer import StoreDeployer
 from .slack_notifier import SlackNotifier
 from .asset_cache_manager import AssetCacheManager
 from .mission100_asset_adapter import Mission100AssetAdapter
+from .logging_setup import log_context, new_run_id, set_log_stage, setup_logging
 
 class ServerlessAppFactory:
     """서버리스 앱 전문 팩토리"""
@@ -27,6 +27,8 @@ class ServerlessAppFactory:
     def __init__(self, dry_run: bool = False):
         # 1. 로거 우선 초기화 (다른 모든 것보다 먼저)
         self.logger = self._setup_logging()
+        # 이 프로세스 실행의 로그 식별자 (JSON 로그의 run_id)
+        self.run_id = new_run_id()
         self.logger.info("🏭 서버리스 앱 팩토리 초기화 시작")
 
         # 2. 운영 모드 설정
@@ -41,7 +43,7 @@ class ServerlessAppFactory:
         # 설정 검증 (조기 실패 방지)
         validation = self.config_manager.validate_config()
         if not validation["valid"]:
-            self.logger.error(f"❌ 설정 오류: {', '.join(validation['issues'])}")
+            self.logger.error("❌ 설정 오류: %s", ', '.join(validation['issues']))
             raise Exception(f"Invalid configuration: {', '.join(validation['issues'])}")
 
         # 4. 예산 및 비용 설정 (기본값 포함)
@@ -136,14 +138,14 @@ class ServerlessAppFactory:
             self.compliance_checker = StoreComplianceChecker()
             self.logger.info("✅ 스토어 규정 준수 검사기 초기화 완료")
         except Exception as e:
-            self.logger.error(f"❌ 규정 준수 검사기 초기화 실패: {e}")
+            self.logger.error("❌ 규정 준수 검사기 초기화 실패: %s", e)
             raise
 
         try:
             self.duplicate_detector = AdvancedDuplicateDetector()
             self.logger.info("✅ 중복 탐지 시스템 초기화 완료")
         except Exception as e:
-            self.logger.error(f"❌ 중복 탐지 시스템 초기화 실패: {e}")
+            self.logger.error("❌ 중복 탐지 시스템 초기화 실패: %s", e)
             raise
 
         # 11. Notion 대시보드 초기화 (선택적)
@@ -153,7 +155,7 @@ class ServerlessAppFactory:
                 self.notion_dashboard = NotionKPIDashboard()
                 self.logger.info("✅ Notion 대시보드 연결됨")
             except Exception as e:
-                self.logger.warning(f"⚠️ Notion 대시보드 연결 실패: {e}")
+                self.logger.warning("⚠️ Notion 대시보드 연결 실패: %s", e)
                 self.logger.info("💡 Notion 없이도 앱 생성은 정상 작동됩니다")
 
         # 12. 스토어 배포 자동화 시스템 초기화
@@ -161,7 +163,7 @@ class ServerlessAppFactory:
             self.store_deployer = StoreDeployer()
             self.logger.info("✅ 스토어 배포 시스템 초기화 완료")
         except Exception as e:
-            self.logger.warning(f"⚠️ 스토어 배포 시스템 초기화 실패: {e}")
+            self.logger.warning("⚠️ 스토어 배포 시스템 초기화 실패: %s", e)
             self.store_deployer = None
 
         # 13. Slack 알림 시스템 초기화
@@ -173,7 +175,7 @@ class ServerlessAppFactory:
                 self.logger.info("ℹ️ Slack 알림 비활성화 (웹훅 URL 미설정)")
                 self.logger.info("💡 python automation/config_manager.py --setup 으로 설정 가능")
         except Exception as e:
-            self.logger.warning(f"⚠️ Slack 알림 시스템 초기화 실패: {e}")
+            self.logger.warning("⚠️ Slack 알림 시스템 초기화 실패: %s", e)
             self.slack_notifier = None
 
         # 14. 에셋 캐시 매니저 초기화
@@ -181,10 +183,10 @@ class ServerlessAppFactory:
             self.asset_cache = AssetCacheManager()
             cache_stats = self.asset_cache.get_cache_stats()
             self.logger.info("✅ 에셋 캐시 시스템 활성화됨")
-            self.logger.info(f"💾 캐시된 에셋: {cache_stats['cache_storage']['total_assets']}개")
-            self.logger.info(f"💰 절약된 비용: {cache_stats['cache_performance']['total_cost_saved']}")
+            self.logger.info("💾 캐시된 에셋: %s개", cache_stats['cache_storage']['total_assets'])
+            self.logger.info("💰 절약된 비용: %s", cache_stats['cache_performance']['total_cost_saved'])
         except Exception as e:
-            self.logger.warning(f"⚠️ 에셋 캐시 시스템 초기화 실패: {e}")
+            self.logger.warning("⚠️ 에셋 캐시 시스템 초기화 실패: %s", e)
             self.asset_cache = None
 
         # 15. Mission100 에셋 어댑터 초기화
@@ -193,27 +195,20 @@ class ServerlessAppFactory:
             self.logger.info("✅ Mission100 에셋 재활용 시스템 활성화됨")
             self.logger.info("🎨 기존 에셋으로 비용 50% 절감 가능")
         except Exception as e:
-            self.logger.warning(f"⚠️ Mission100 에셋 어댑터 초기화 실패: {e}")
+            self.logger.warning("⚠️ Mission100 에셋 어댑터 초기화 실패: %s", e)
             self.mission100_adapter = None
 
         # 16. 초기화 완료 로그
         self.logger.info("🎉 서버리스 앱 팩토리 초기화 완료")
-        self.logger.info(f"📊 월간 예산: ${self.monthly_budget:.2f}")
-        self.logger.info(f"💰 사용 가능 예산: ${self.available_budget:.2f}")
-        self.logger.info(f"📱 최대 생성 가능 앱 수: {self.max_apps_per_month}개")
-        self.logger.info(f"💸 앱당 비용: ${self.cost_per_app['total']:.3f}")
+        self.logger.info("📊 월간 예산: $%.2f", self.monthly_budget)
+        self.logger.info("💰 사용 가능 예산: $%.2f", self.available_budget)
+        self.logger.info("📱 최대 생성 가능 앱 수: %s개", self.max_apps_per_month)
+        self.logger.info("💸 앱당 비용: $%.3f", self.cost_per_app['total'])
 
     def _setup_logging(self):
         """로깅 시스템 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [SERVERLESS-FACTORY] %(levelname)s: %(message)s',
-            handlers=[
-                logging.FileHandler('serverless_app_factory.log'),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(__name__)
+        # 파일/콘솔 쓰기는 공용 큐 리스너 스레드에서 (파일은 JSON 줄)
+        return setup_logging(__name__, "SERVERLESS-FACTORY", 'serverless_app_factory.log')
 
     def _load_factory_state(self):
         """팩토리 상태 파일 로드"""
@@ -230,7 +225,7 @@ class ServerlessAppFactory:
                     self.total_spent = state.get('total_spent', 0.0)
                     self.generation_count = state.get('generation_count', 0)
                     self.current_month_apps = state.get('current_month_apps', [])
-                    self.logger.info(f"📂 상태 복원됨: {self.generation_count}개 앱, ${self.total_spent:.2f} 사용")
+                    self.logger.info("📂 상태 복원됨: %s개 앱, $%.2f 사용", self.generation_count, self.total_spent)
                 else:
                     self.logger.info("📅 새 월 시작 - 상태 초기화")
                     self._reset_monthly_state()
@@ -239,7 +234,7 @@ class ServerlessAppFactory:
                 self._save_factory_state()
 
         except Exception as e:
-            self.logger.warning(f"⚠️ 상태 파일 로드 실패: {e}")
+            self.logger.warning("⚠️ 상태 파일 로드 실패: %s", e)
             self._reset_monthly_state()
 
     def _save_factory_state(self):
@@ -263,7 +258,7 @@ class ServerlessAppFactory:
                 json.dump(state, f, indent=2, ensure_ascii=False)
 
         except Exception as e:
-            self.logger.error(f"❌ 상태 파일 저장 실패: {e}")
+            self.logger.error("❌ 상태 파일 저장 실패: %s", e)
 
     def _reset_monthly_state(self):
         """월간 상태 초기화"""
@@ -278,7 +273,7 @@ class ServerlessAppFactory:
             try:
                 async with self.api_semaphore:  # 동시성 제어
                     if self.dry_run:
-                        self.logger.info(f"🧪 [DRY RUN] {func.__name__} 호출 시뮬레이션")
+                        self.logger.info("🧪 [DRY RUN] %s 호출 시뮬레이션", func.__name__)
                         await asyncio.sleep(0.1)  # 시뮬레이션 지연
                         return {"dry_run": True, "success": True}
 
@@ -287,11 +282,11 @@ class ServerlessAppFactory:
             except Exception as e:
                 wait_time = base_delay * (2 ** attempt)
                 if attempt < max_retries - 1:
-                    self.logger.warning(f"⚠️ API 호출 실패 (시도 {attempt + 1}/{max_retries}): {e}")
-                    self.logger.info(f"⏳ {wait_time:.1f}초 후 재시도...")
+                    self.logger.warning("⚠️ API 호출 실패 (시도 %s/%s): %s", attempt + 1, max_retries, e)
+                    self.logger.info("⏳ %.1f초 후 재시도...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
-                    self.logger.error(f"❌ API 호출 최종 실패: {e}")
+                    self.logger.error("❌ API 호출 최종 실패: %s", e)
                     raise
 
     def analyze_serverless_potential(self, app_concept: str) -> Dict:
@@ -365,7 +360,7 @@ class ServerlessAppFactory:
 
         analysis = self.analyze_serverless_potential(app_concept)
 
-        self.logger.info(f"📋 Generating serverless spec for: {app_concept}")
+        self.logger.info("📋 Generating serverless spec for: %s", app_concept)
 
         # 서버리스 특화 기획서
         serverless_spec = {
@@ -489,7 +484,7 @@ class ServerlessAppFactory:
         """Claude Pro로 서버리스 Flutter 코드 생성"""
 
         app_concept = serverless_spec["app_concept"]
-        self.logger.info(f"💻 Generating serverless Flutter code for: {app_concept}")
+        self.logger.info("💻 Generating serverless Flutter code for: %s", app_concept)
 
         # 서버리스 특화 프로젝트 구조
         flutter_project = {
@@ -564,7 +559,7 @@ class ServerlessAppFactory:
         app_concept = serverless_spec["app_concept"]
         category = serverless_spec["category"]
 
-        self.logger.info(f"🎨 Generating serverless assets for: {app_concept}")
+        self.logger.info("🎨 Generating serverless assets for: %s", app_concept)
 
         # 서버리스 앱 특화 에셋 프롬프트
         serverless_prompts = {
@@ -638,7 +633,7 @@ class ServerlessAppFactory:
                 if cache_hit:
                     # 캐시된 에셋 사용
                     generated_assets[category_name].append(cached_asset)
-                    self.logger.info(f"💾 캐시 사용: {asset_name} - $0.000 (${self.nano_banana_cost:.3f} 절약)")
+                    self.logger.info("💾 캐시 사용: %s - $0.000 ($%.3f 절약)", asset_name, self.nano_banana_cost)
                 else:
                     # 새 에셋 생성
                     asset = await self._api_call_with_retry(
@@ -658,7 +653,7 @@ class ServerlessAppFactory:
                                 category_name
                             )
                         except Exception as e:
-                            self.logger.warning(f"캐시 저장 실패: {e}")
+                            self.logger.warning("캐시 저장 실패: %s", e)
 
         return {
             "app_concept": app_concept,
@@ -706,8 +701,13 @@ class ServerlessAppFactory:
     async def generate_complete_serverless_app(self, app_concept: str) -> Dict:
         """완전한 서버리스 앱 생성"""
 
+        # 이 앱 생성 중의 모든 로그에 run_id / app_id / stage 부여
+        with log_context(run_id=self.run_id, app_id=app_concept, stage="validate"):
+            return await self._generate_complete_serverless_app(app_concept)
+
+    async def _generate_complete_serverless_app(self, app_concept: str) -> Dict:
         start_time = datetime.now()
-        self.logger.info(f"🚀 Starting serverless app generation: {app_concept}")
+        self.logger.info("🚀 Starting serverless app generation: %s", app_concept)
 
         try:
             # 1. 예산 검사
@@ -761,15 +761,18 @@ class ServerlessAppFactory:
             analysis = self.analyze_serverless_potential(app_concept)
 
             if not analysis["recommended"]:
-                self.logger.warning(f"⚠️ {app_concept} may not be optimal for serverless architecture")
+                self.logger.warning("⚠️ %s may not be optimal for serverless architecture", app_concept)
 
             # 2. Claude Pro: 서버리스 기획서 생성
+            set_log_stage("spec")
             serverless_spec = await self.claude_pro_generate_serverless_spec(app_concept)
 
             # 3. Claude Pro: 서버리스 Flutter 코드 생성
+            set_log_stage("code")
             flutter_project = await self.claude_pro_generate_flutter_code(serverless_spec)
 
             # 4. Nano Banana: 서버리스 특화 에셋 생성
+            set_log_stage("assets")
             assets = await self.nano_banana_generate_serverless_assets(serverless_spec)
 
             # 5. 수익화 계산
@@ -778,6 +781,7 @@ class ServerlessAppFactory:
             total_cost = assets["total_cost"] + 0.08  # 기타 비용
 
             # 6. 스토어 규정 준수 검사
+            set_log_stage("compliance")
             compliance_result = self.compliance_checker.check_app_compliance({
                 "app_name": app_concept,
                 "description": serverless_spec.get("description", ""),
@@ -861,6 +865,7 @@ class ServerlessAppFactory:
             self._save_factory_state()
 
             # 9. 자동 스토어 배포 (선택적)
+            set_log_stage("deploy")
             deployment_result = None
             if self.store_deployer and compliance_result["overall_compliance"]:
                 try:
@@ -890,7 +895,7 @@ class ServerlessAppFactory:
                         self.logger.warning("⚠️ 스토어 배포 부분 실패")
 
                 except Exception as e:
-                    self.logger.error(f"❌ 스토어 배포 실패: {e}")
+                    self.logger.error("❌ 스토어 배포 실패: %s", e)
                     deployment_result = {"error": str(e), "overall_success": False}
 
             # 최종 결과에 배포 정보 추가
@@ -901,10 +906,10 @@ class ServerlessAppFactory:
             # 앱을 현재 월 목록에 추가
             self.current_month_apps.append(result)
 
-            self.logger.info(f"✅ Serverless app complete: {app_concept} - ${total_cost:.3f} - No operating costs!")
-            self.logger.info(f"📊 Quality Score: {compliance_result['compliance_score']}, Store Ready: {compliance_result['overall_compliance']}")
-            self.logger.info(f"📱 이번 달 생성된 앱: {self.generation_count}/{self.max_apps_per_month}")
-            self.logger.info(f"💰 남은 예산: ${self.available_budget - self.total_spent:.2f}")
+            self.logger.info("✅ Serverless app complete: %s - $%.3f - No operating costs!", app_concept, total_cost)
+            self.logger.info("📊 Quality Score: %s, Store Ready: %s", compliance_result['compliance_score'], compliance_result['overall_compliance'])
+            self.logger.info("📱 이번 달 생성된 앱: %s/%s", self.generation_count, self.max_apps_per_month)
+            self.logger.info("💰 남은 예산: $%.2f", self.available_budget - self.total_spent)
 
             # Slack 성공 알림
             if self.slack_notifier:
@@ -925,7 +930,7 @@ class ServerlessAppFactory:
             return result
 
         except Exception as e:
-            self.logger.error(f"❌ Serverless app generation failed: {app_concept} - {e}")
+            self.logger.error("❌ Serverless app generation failed: %s - %s", app_concept, e)
 
             # Slack 에러 알림
             if self.slack_notifier:
@@ -1142,4 +1147,6 @@ async def main():
     print(f"  Revenue Potential: {result['revenue_potential']['conservative']['total_revenue']:.0f}-{result['revenue_potential']['optimistic']['total_revenue']:.0f}/month")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # 저장소 루트에서 python -m automation.serverless_app_factory [--profile] 로 실행
+    from factory_profiler import run_entry_point
+    run_entry_point(main, "serverless_app_factory")
\ No newline at end of file
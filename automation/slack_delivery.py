@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slack Delivery Queue
+웹훅 알림을 바로 보내지 않고 영속 큐에 넣은 뒤 백그라운드 스레드에서 전송
+- 채널(웹훅 URL)별 토큰 버킷으로 전송 속도 제한 (429 Retry-After 준수)
+- (유형, 앱, 시그니처) 키 기준 중복 억제 창
+- 짧은 시간에 몰린 일반 알림은 요약 메시지 하나로 묶어 전송 (Critical 은 즉시 단독 전송)
+- 전송 전 메시지는 파일에 보관되어 재시작 후 이어서 전송
+- 큐 파일은 소유자(notifier/monitor 등) + 웹훅별로 분리, 실행 중인 인스턴스가 잠금을 잡고 있음
+  (같은 파일을 쓰려는 다른 인스턴스는 다음 슬롯 파일 사용, 주인 없는 슬롯은 시작 시 인계받아 전송)
+"""
+
+import os
+import json
+import time
+import uuid
+import atexit
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows - 잠금 없이 소유자별 파일만 분리
+    fcntl = None
+
+# Slack Incoming Webhook 은 채널당 초당 1건 정도를 권장
+RATE_PER_SECOND = 1.0
+BURST = 3
+# 같은 키의 알림은 이 시간 동안 한 번만
+DEDUP_SECONDS = 300
+# 일반 알림은 이 시간 동안 모아서 DIGEST_THRESHOLD 건 이상이면 요약 하나로 전송
+DIGEST_WINDOW = 15
+DIGEST_THRESHOLD = 4
+DIGEST_MAX_LINES = 20
+MAX_ATTEMPTS = 5
+REQUEST_TIMEOUT = 10
+# 같은 소유자/웹훅으로 동시에 실행될 수 있는 인스턴스 수 (슬롯 파일 수)
+QUEUE_SLOTS = 8
+QUEUE_DIR = Path.home() / ".cache" / "app-factory" / "slack"
+
+
+def _post_webhook(url: str, payload: Dict) -> Tuple[int, Optional[float]]:
+    """웹훅 전송 → (상태 코드, Retry-After 초)"""
+    response = requests.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+    retry_after = response.headers.get("Retry-After")
+    return response.status_code, float(retry_after) if retry_after else None
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """토큰을 쓸 수 있을 때까지 남은 시간"""
+        self._refill(now)
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        return max(wait, self.blocked_until - now)
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1
+
+    def block(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class SlackDeliveryQueue:
+    """채널별 속도 제한 + 중복 억제 + 요약 전송 큐"""
+
+    def __init__(self, default_channel: Optional[str] = None, owner: str = "default", queue_file: str = None,
+                 rate_per_second: float = RATE_PER_SECOND, burst: int = BURST,
+                 dedup_seconds: float = DEDUP_SECONDS, digest_window: float = DIGEST_WINDOW,
+                 digest_threshold: int = DIGEST_THRESHOLD,
+                 sender: Callable[[str, Dict], Tuple[int, Optional[float]]] = _post_webhook):
+        self.logger = logging.getLogger(__name__)
+        self.default_channel = default_channel
+
+        if queue_file:
+            base_file = Path(queue_file)
+        else:
+            channel_hash = hashlib.sha1((default_channel or "").encode("utf-8")).hexdigest()[:10]
+            base_file = QUEUE_DIR / f"delivery_{owner}_{channel_hash}.json"
+        base_file.parent.mkdir(parents=True, exist_ok=True)
+        self.queue_file, self._file_lock = self._claim_queue_file(base_file)
+
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.dedup_seconds = dedup_seconds
+        self.digest_window = digest_window
+        self.digest_threshold = digest_threshold
+        self.sender = sender
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._flushing = False
+
+        self.data = self._load(self.queue_file)
+        self._adopt_orphaned_slots(base_file)
+        self.stats = {"queued": 0, "sent": 0, "digests": 0, "digested": 0,
+                      "deduplicated": 0, "retried": 0, "dropped": 0}
+
+        if self.data["messages"]:
+            self.logger.info(f"📮 이전 실행에서 남은 Slack 알림 {len(self.data['messages'])}건 전송 재개")
+            self._start()
+
+    @staticmethod
+    def _slot_file(base_file: Path, slot: int) -> Path:
+        return base_file if slot == 0 else base_file.with_name(f"{base_file.stem}.{slot}{base_file.suffix}")
+
+    @staticmethod
+    def _try_lock(queue_file: Path):
+        """큐 파일 잠금 (프로세스/인스턴스 단위) → 잠금 파일 객체, 다른 인스턴스가 쓰는 중이면 None"""
+        lock_file = open(queue_file.with_name(queue_file.name + ".lock"), "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return lock_file
+        except OSError:
+            lock_file.close()
+            return None
+
+    def _claim_queue_file(self, base_file: Path):
+        """비어 있는 슬롯 파일을 잠그고 사용 (잠금은 인스턴스가 살아 있는 동안 유지)"""
+        if fcntl is None:
+            return base_file, None
+        for slot in range(QUEUE_SLOTS):
+            queue_file = self._slot_file(base_file, slot)
+            lock_file = self._try_lock(queue_file)
+            if lock_file:
+                return queue_file, lock_file
+        # 슬롯이 모두 사용 중이면 이 프로세스 전용 파일 (다음 실행 때 인계되지 않음)
+        self.logger.warning(f"⚠️ Slack 전송 큐 슬롯 {QUEUE_SLOTS}개 모두 사용 중 - 프로세스 전용 파일 사용")
+        return base_file.with_name(f"{base_file.stem}.pid{os.getpid()}{base_file.suffix}"), None
+
+    def _adopt_orphaned_slots(self, base_file: Path):
+        """종료된 인스턴스가 남긴 슬롯 파일의 메시지를 이어받고 파일 삭제"""
+        if fcntl is None:
+            return
+        for slot in range(QUEUE_SLOTS):
+            queue_file = self._slot_file(base_file, slot)
+            if queue_file == self.queue_file or not queue_file.exists():
+                continue
+            lock_file = self._try_lock(queue_file)
+            if not lock_file:
+                continue
+            try:
+                orphan = self._load(queue_file)
+                self.data["messages"].extend(orphan["messages"])
+                for key, sent_at in orphan["recent"].items():
+                    self.data["recent"][key] = max(sent_at, self.data["recent"].get(key, 0))
+                self._save()
+                queue_file.unlink()
+            except OSError as e:
+                self.logger.warning(f"⚠️ Slack 전송 큐 인계 실패 ({queue_file.name}): {e}")
+            finally:
+                lock_file.close()
+
+    def _load(self, queue_file: Path) -> Dict:
+        if queue_file.exists():
+            try:
+                with open(queue_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data.setdefault("messages", [])
+                data.setdefault("recent", {})
+                # 전송 도중 종료된 메시지는 다시 전송
+                for message in data["messages"]:
+                    message["sending"] = False
+                return data
+            except Exception as e:
+                self.logger.warning(f"⚠️ Slack 전송 큐 로드 실패: {e}")
+        return {"messages": [], "recent": {}}
+
+    def _save(self):
+        now = time.time()
+        self.data["recent"] = {key: sent_at for key, sent_at in self.data["recent"].items()
+                               if now - sent_at < self.dedup_seconds}
+        tmp_file = self.queue_file.with_name(f".{self.queue_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.queue_file)
+        except OSError as e:
+            # 메모리의 큐는 그대로 - 다음 저장 때 다시 기록
+            self.logger.warning(f"⚠️ Slack 전송 큐 저장 실패: {e}")
+
+    def _start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="slack-delivery", daemon=True)
+        self._thread.start()
+        # 짧게 실행되는 스크립트도 종료 전에 모인 알림을 보냄 (못 보낸 건 다음 실행 때 전송)
+        atexit.register(self.flush, 15)
+
+    def enqueue(self, payload: Dict, channel: Optional[str] = None, key: Union[str, Sequence, None] = None,
+                summary: str = "", critical: bool = False, digestible: bool = True) -> str:
+        """알림 등록 → "queued" / "duplicate" / "disabled"
+
+        key: 중복 억제 키 (예: (유형, 앱, 시그니처)), summary: 요약 메시지에 들어갈 한 줄
+        digestible=False 는 리포트처럼 요약으로 묶지 않을 메시지
+        """
+        channel = channel or self.default_channel
+        if not channel:
+            return "disabled"
+
+        now = time.time()
+        with self._changed:
+            if key is not None:
+                key = key if isinstance(key, str) else "|".join(str(part) for part in key)
+                last_sent = self.data["recent"].get(key)
+                if last_sent is not None and now - last_sent < self.dedup_seconds:
+                    self.stats["deduplicated"] += 1
+                    return "duplicate"
+                self.data["recent"][key] = now
+
+            self.data["messages"].append({
+                "id": uuid.uuid4().hex,
+                "channel": channel,
+                "payload": payload,
+                "key": key,
+                "summary": summary or payload.get("text", ""),
+                "critical": critical,
+                "digestible": digestible and not critical,
+                "queued_at": now,
+                "next_attempt": now,
+                "attempts": 0,
+                "sending": False
+            })
+            self.stats["queued"] += 1
+            self._save()
+            self._changed.notify_all()
+
+        self._start()
+        return "queued"
+
+    def _bucket(self, channel: str) -> TokenBucket:
+        if channel not in self._buckets:
+            self._buckets[channel] = TokenBucket(self.rate_per_second, self.burst)
+        return self._buckets[channel]
+
+    def _next_job(self) -> Tuple[Optional[List[Dict]], float]:
+        """다음 전송 묶음 (lock 안에서 호출) → (메시지들, 없으면 대기할 시간)"""
+        now = time.time()
+        wait = 60.0
+        channels: Dict[str, List[Dict]] = {}
+        for message in self.data["messages"]:
+            if not message["sending"]:
+                channels.setdefault(message["channel"], []).append(message)
+
+        for channel, messages in channels.items():
+            ready = []
+            for message in messages:
+                hold = self.digest_window if message["digestible"] and not self._flushing else 0
+                held_until = message["queued_at"] + hold
+                eligible_at = max(message["next_attempt"], held_until)
+                if eligible_at <= now:
+                    ready.append(message)
+                else:
+                    wait = min(wait, eligible_at - now)
+            if not ready:
+                continue
+
+            bucket = self._bucket(channel)
+            delay = bucket.delay(time.monotonic())
+            if delay > 0:
+                wait = min(wait, delay)
+                continue
+
+            ready.sort(key=lambda message: (not message["critical"], message["queued_at"]))
+            first = ready[0]
+            if first["digestible"]:
+                # 모아 둔 일반 알림이 많으면 아직 대기 중인 것까지 한 번에 요약
+                batch = [message for message in messages if message["digestible"]
+                         and message["next_attempt"] <= now]
+                job = batch if len(batch) >= self.digest_threshold else [first]
+            else:
+                job = [first]
+
+            bucket.take(time.monotonic())
+            for message in job:
+                message["sending"] = True
+            return job, 0.0
+
+        return None, wait
+
+    def _digest_payload(self, job: List[Dict]) -> Dict:
+        counts: Dict[str, int] = {}
+        for message in job:
+            lines = (message["summary"] or "").strip().splitlines()
+            line = lines[0][:150] if lines else "(내용 없음)"
+            counts[line] = counts.get(line, 0) + 1
+
+        lines = [f"• {line}" + (f" (x{count})" if count > 1 else "")
+                 for line, count in sorted(counts.items(), key=lambda item: -item[1])]
+        if len(lines) > DIGEST_MAX_LINES:
+            lines = lines[:DIGEST_MAX_LINES] + [f"… 외 {len(lines) - DIGEST_MAX_LINES}종"]
+
+        started = datetime.fromtimestamp(min(message["queued_at"] for message in job)).strftime("%H:%M:%S")
+        ended = datetime.fromtimestamp(max(message["queued_at"] for message in job)).strftime("%H:%M:%S")
+        return {"text": f"📦 알림 요약: {len(job)}건 ({started} ~ {ended})\n" + "\n".join(lines)}
+
+    def _deliver(self, job: List[Dict]):
+        channel = job[0]["channel"]
+        payload = self._digest_payload(job) if len(job) > 1 else job[0]["payload"]
+        try:
+            status, retry_after = self.sender(channel, payload)
+        except Exception as e:
+            self.logger.error(f"❌ Slack 알림 전송 오류: {e}")
+            status, retry_after = 0, None
+
+        with self._changed:
+            ids = {message["id"] for message in job}
+            if status == 200:
+                self.data["messages"] = [message for message in self.data["messages"] if message["id"] not in ids]
+                self.stats["sent"] += 1
+                if len(job) > 1:
+                    self.stats["digests"] += 1
+                    self.stats["digested"] += len(job)
+            else:
+                rate_limited = status == 429
+                if rate_limited:
+                    # 속도 제한은 실패로 세지 않고 채널 전체를 Retry-After 만큼 멈춤
+                    self._bucket(channel).block(retry_after or 30)
+                kept = []
+                for message in self.data["messages"]:
+                    if message["id"] in ids:
+                        message["sending"] = False
+                        self.stats["retried"] += 1
+                        if not rate_limited:
+                            message["attempts"] += 1
+                            if message["attempts"] >= MAX_ATTEMPTS:
+                                self.stats["dropped"] += 1
+                                self.logger.error(f"❌ Slack 알림 {MAX_ATTEMPTS}회 실패 - 폐기: {message['summary'][:80]}")
+                                continue
+                            message["next_attempt"] = time.time() + min(300, 2 ** message["attempts"])
+                    kept.append(message)
+                self.data["messages"] = kept
+                self.logger.warning(f"⚠️ Slack 알림 실패 ({status}) - 재시도 예정")
+            self._save()
+            self._changed.notify_all()
+
+    def _run(self):
+        while True:
+            job = None
+            try:
+                with self._changed:
+                    job, wait = self._next_job()
+                    if job is None:
+                        self._changed.wait(timeout=wait)
+                        continue
+                self._deliver(job)
+            except Exception as e:
+                # 예상 못 한 오류 하나로 전송 스레드가 멈추지 않도록 - 해당 묶음은 잠시 후 재시도
+                self.logger.error(f"❌ Slack 전송 스레드 오류: {e}")
+                with self._changed:
+                    for message in job or []:
+                        message["sending"] = False
+                        message["next_attempt"] = time.time() + 5
+                time.sleep(1)
+
+    def flush(self, timeout: float = 30) -> bool:
+        """대기 중인 알림을 (요약 대기 없이) 모두 전송 - 다 보냈으면 True"""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            self._flushing = True
+            self._changed.notify_all()
+            try:
+                while self.data["messages"]:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not (self._thread and self._thread.is_alive()):
+                        return False
+                    self._changed.wait(timeout=min(remaining, 0.5))
+                return True
+            finally:
+                self._flushing = False
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self.data["messages"])
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {**self.stats, "pending": len(self.data["messages"])}
@@ -7,12 +7,15 @@ Slack Notification System
 
 import json
 import asyncio
+import hashlib
 import requests
 from typing import Dict, Optional
 from datetime import datetime
 import logging
 from pathlib import Path
 
+from .slack_delivery import SlackDeliveryQueue
+
 class SlackNotifier:
     """Slack 웹훅 알림 시스템"""
 
@@ -35,8 +38,10 @@ class SlackNotifier:
             "enabled": bool(self.webhook_url)
         }
 
-        # 에러 쿨다운 추적
-        self.error_history = {}
+        # notify_* 알림은 전송 큐로 (속도 제한, 중복 억제, 몰린 알림 요약, 재시작 후 재전송)
+        # 같은 에러 쿨다운은 큐의 중복 억제 창으로 처리
+        self.delivery = SlackDeliveryQueue(self.webhook_url, owner="notifier",
+                                           dedup_seconds=self.notification_config["error_cooldown"])
 
     def _load_webhook_url(self) -> Optional[str]:
         """Slack 웹훅 URL 로드"""
@@ -59,13 +64,8 @@ class SlackNotifier:
 
         return None
 
-    def send_notification(self, message: str, level: str = "info",
-                              title: str = "App Factory Alert") -> bool:
-        """Slack 알림 전송"""
-
-        if not self.notification_config["enabled"]:
-            self.logger.debug("Slack 알림이 비활성화됨")
-            return False
+    def _build_payload(self, message: str, level: str, title: str) -> Dict:
+        """Slack 페이로드 구성"""
 
         # 이모지 및 색상 설정
         emoji_map = {
@@ -86,8 +86,7 @@ class SlackNotifier:
             "budget": "#ffaa00"
         }
 
-        # Slack 페이로드 구성
-        payload = {
+        return {
             "text": f"{emoji_map.get(level, 'ℹ️')} {title}",
             "attachments": [
                 {
@@ -113,6 +112,16 @@ class SlackNotifier:
             ]
         }
 
+    def send_notification(self, message: str, level: str = "info",
+                              title: str = "App Factory Alert") -> bool:
+        """Slack 알림 즉시 전송 (큐를 거치지 않음)"""
+
+        if not self.notification_config["enabled"]:
+            self.logger.debug("Slack 알림이 비활성화됨")
+            return False
+
+        payload = self._build_payload(message, level, title)
+
         try:
             response = requests.post(
                 self.webhook_url,
@@ -131,6 +140,26 @@ class SlackNotifier:
             self.logger.error(f"❌ Slack 알림 전송 오류: {e}")
             return False
 
+    def queue_notification(self, message: str, level: str = "info",
+                           title: str = "App Factory Alert", key=None, digestible: bool = True) -> bool:
+        """Slack 알림을 전송 큐에 등록 (critical 과 digestible=False 는 요약으로 묶지 않음)"""
+
+        if not self.notification_config["enabled"]:
+            self.logger.debug("Slack 알림이 비활성화됨")
+            return False
+
+        first_line = next((line.strip() for line in message.splitlines() if line.strip()), "")
+        status = self.delivery.enqueue(
+            self._build_payload(message, level, title),
+            key=key,
+            summary=f"{title}: {first_line}",
+            critical=level == "critical",
+            digestible=digestible
+        )
+        if status == "duplicate":
+            self.logger.debug(f"중복 알림 억제: {key}")
+        return status == "queued"
+
     def notify_budget_alert(self, spent: float, budget: float, apps_generated: int):
         """예산 관련 알림"""
         usage_percentage = (spent / budget) * 100 if budget > 0 else 0
@@ -158,7 +187,7 @@ class SlackNotifier:
         else:
             return  # 알림 필요 없음
 
-        self.send_notification(message, level, title)
+        self.queue_notification(message, level, title, key=("budget", level))
 
     def notify_app_generation_success(self, app_name: str, cost: float,
                                           quality_score: int, store_ready: bool):
@@ -171,21 +200,13 @@ class SlackNotifier:
 ⭐ 품질 점수: {quality_score}/100
 🏪 스토어 준비: {'✅ 완료' if store_ready else '⚠️ 추가 작업 필요'}
 """
-        self.send_notification(message, "success", "App Generation Success")
+        self.queue_notification(message, "success", "App Generation Success")
 
     def notify_error(self, error_type: str, error_message: str, app_name: str = None):
-        """에러 발생 알림 (쿨다운 적용)"""
-
-        # 에러 키 생성 (중복 방지용)
-        error_key = f"{error_type}_{hash(error_message) % 10000}"
-        current_time = datetime.now().timestamp()
+        """에러 발생 알림 (같은 에러는 쿨다운 동안 한 번만)"""
 
-        # 쿨다운 체크
-        if error_key in self.error_history:
-            last_sent = self.error_history[error_key]
-            if current_time - last_sent < self.notification_config["error_cooldown"]:
-                self.logger.debug(f"에러 알림 쿨다운: {error_key}")
-                return
+        # 에러 키 생성 (중복 방지용, 재시작 후에도 같은 값)
+        error_key = (error_type, app_name or "", hashlib.sha1(error_message.encode("utf-8")).hexdigest()[:12])
 
         # 에러 알림 전송
         message = f"""
@@ -198,10 +219,7 @@ class SlackNotifier:
 즉시 확인이 필요합니다!
 """
 
-        self.send_notification(message, "error", "App Factory Error")
-
-        # 쿨다운 기록 업데이트
-        self.error_history[error_key] = current_time
+        self.queue_notification(message, "error", "App Factory Error", key=error_key)
 
     def notify_system_status(self, status_data: Dict):
         """시스템 상태 요약 알림"""
@@ -221,7 +239,7 @@ class SlackNotifier:
 시스템이 정상 작동 중입니다! 🚀
 """
 
-        self.send_notification(message, "info", "Factory Status Report")
+        self.queue_notification(message, "info", "Factory Status Report", digestible=False)
 
     def notify_daily_summary(self, apps_today: int, cost_today: float,
                                  successful_deployments: int):
@@ -236,7 +254,7 @@ class SlackNotifier:
 
 훌륭한 하루였습니다! 🎉
 """
-        self.send_notification(message, "success", "Daily Summary")
+        self.queue_notification(message, "success", "Daily Summary", digestible=False)
 
     def setup_webhook_url(self, webhook_url: str) -> bool:
         """Slack 웹훅 URL 설정"""
@@ -257,6 +275,7 @@ class SlackNotifier:
                 json.dump(config, f, indent=2)
 
             self.webhook_url = webhook_url
+            self.delivery.default_channel = webhook_url
             self.notification_config["enabled"] = True
 
             self.logger.info("✅ Slack 웹훅 URL 설정 완료")
@@ -270,7 +289,7 @@ class SlackNotifier:
         """알림 시스템 테스트"""
         if not self.notification_config["enabled"]:
             print("❌ Slack 웹훅이 설정되지 않았습니다.")
-            print("💡 python automation/slack_notifier.py --setup 을 실행하여 설정하세요.")
+            print("💡 python -m automation.slack_notifier --setup 을 실행하여 설정하세요.")
             return False
 
         test_message = """
@@ -319,7 +338,7 @@ def main():
             success = notifier.setup_webhook_url(webhook_url)
             if success:
                 print("✅ Slack 알림 설정 완료!")
-                print("💡 python automation/slack_notifier.py --test 로 테스트하세요.")
+                print("💡 python -m automation.slack_notifier --test 로 테스트하세요.")
             else:
                 print("❌ 설정 실패")
         else:
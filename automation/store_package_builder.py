@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Store Package Builder
+스토어 리스팅 에셋을 결정적(deterministic) zip/tar 아카이브로 바로 스트리밍
+쓰면서 해시 계산, PNG/WebP 등 이미 압축된 파일은 무압축(stored) 저장
+체크섬 매니페스트로 변경 없는 패키지는 재빌드 없이 감지
+"""
+
+import io
+import os
+import gzip
+import json
+import hashlib
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+# 이미 압축된 포맷은 재압축하지 않음
+STORED_EXTENSIONS = {".png", ".webp", ".jpg", ".jpeg", ".gif", ".zip", ".aab", ".apk", ".mp4"}
+
+# 결정적 아카이브용 고정 타임스탬프 (zip 최소값 1980-01-01)
+FIXED_ZIP_TIME = (1980, 1, 1, 0, 0, 0)
+FIXED_TAR_MTIME = 315532800
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class _HashingReader:
+    """읽는 동안 sha256/크기를 누적하는 파일 래퍼 (tar 스트리밍용)"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.sha256.update(data)
+        self.size += len(data)
+        return data
+
+
+class _HashingWriter(io.RawIOBase):
+    """아카이브 바이트를 쓰면서 전체 sha256 계산 (탐색 불가 스트림)"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        return self._fileobj.write(data)
+
+
+class StorePackageBuilder:
+    """스트리밍 스토어 패키지 빌더"""
+
+    def __init__(self, output_dir: str = "store_packages", archive_format: str = "zip", max_workers: int = None):
+        self.logger = logging.getLogger(__name__)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        if archive_format not in ("zip", "tar", "tar.gz"):
+            raise ValueError(f"지원하지 않는 아카이브 형식: {archive_format}")
+        self.archive_format = archive_format
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+    @staticmethod
+    def collect_asset_files(assets_result: Dict) -> Dict[str, Path]:
+        """generate_all_assets_for_app 결과에서 {아카이브 경로: 파일} 수집"""
+        files = {}
+        assets = assets_result.get("assets", {})
+
+        for key in ("feature_graphic", "app_icon"):
+            file_path = assets.get(key, {}).get("file_path")
+            if file_path:
+                files[Path(file_path).name] = Path(file_path)
+
+        for screenshot in assets.get("screenshots", {}).get("screenshots", []):
+            if screenshot.get("file_path"):
+                files[f"screenshots/{Path(screenshot['file_path']).name}"] = Path(screenshot["file_path"])
+            for locale, localized in screenshot.get("localized", {}).items():
+                if locale != "ko" and localized.get("file_path"):
+                    files[f"screenshots/{locale}/{Path(localized['file_path']).name}"] = Path(localized["file_path"])
+
+        for promo in assets.get("promo_images", {}).get("images", []):
+            if promo.get("file_path"):
+                files[f"promo/{Path(promo['file_path']).name}"] = Path(promo["file_path"])
+
+        return {name: path for name, path in files.items() if path.exists()}
+
+    def _archive_path(self, package_name: str) -> Path:
+        return self.output_dir / f"{package_name}.{self.archive_format}"
+
+    def _manifest_path(self, package_name: str) -> Path:
+        return self.output_dir / f"{package_name}.manifest.json"
+
+    def _input_fingerprint(self, files: Dict[str, Path], extra_files: Dict[str, bytes]) -> str:
+        """입력 파일 stat + 메모리 파일 내용으로 패키지 지문 계산 (파일 내용은 읽지 않음)"""
+        digest = hashlib.sha256(self.archive_format.encode())
+        for name in sorted(files):
+            stat = files[name].stat()
+            digest.update(f"{name}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+        for name in sorted(extra_files):
+            digest.update(f"{name}|".encode())
+            digest.update(hashlib.sha256(extra_files[name]).digest())
+        return digest.hexdigest()
+
+    def is_unchanged(self, package_name: str, fingerprint: str) -> bool:
+        """매니페스트 지문이 같고 아카이브가 그대로면 변경 없음"""
+        manifest_path = self._manifest_path(package_name)
+        archive_path = self._archive_path(package_name)
+        if not manifest_path.exists() or not archive_path.exists():
+            return False
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except Exception:
+            return False
+        return (manifest.get("input_fingerprint") == fingerprint
+                and manifest.get("archive_size") == archive_path.stat().st_size)
+
+    def _write_zip(self, archive, entries: List[Tuple[str, Optional[Path], Optional[bytes]]]) -> List[Dict]:
+        records = []
+        with zipfile.ZipFile(archive, "w") as zf:
+            for name, path, data in entries:
+                stored = Path(name).suffix.lower() in STORED_EXTENSIONS
+                info = zipfile.ZipInfo(name, date_time=FIXED_ZIP_TIME)
+                info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+
+                sha256 = hashlib.sha256()
+                size = 0
+                with zf.open(info, "w", force_zip64=True) as dest:
+                    source = open(path, "rb") if path else io.BytesIO(data)
+                    with source:
+                        while True:
+                            chunk = source.read(CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            sha256.update(chunk)
+                            size += len(chunk)
+                            dest.write(chunk)
+
+                records.append({"name": name, "size": size, "sha256": sha256.hexdigest(),
+                                "compression": "stored" if stored else "deflated"})
+        return records
+
+    def _write_tar(self, archive, entries: List[Tuple[str, Optional[Path], Optional[bytes]]]) -> List[Dict]:
+        records = []
+        # 스트림 모드(w|)로 쓰고, gzip 헤더의 mtime도 고정해 결정적 출력 유지
+        fileobj = archive
+        gz = None
+        if self.archive_format == "tar.gz":
+            gz = gzip.GzipFile(fileobj=archive, mode="wb", mtime=0)
+            fileobj = gz
+
+        with tarfile.open(fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT) as tf:
+            for name, path, data in entries:
+                info = tarfile.TarInfo(name)
+                info.size = path.stat().st_size if path else len(data)
+                info.mtime = FIXED_TAR_MTIME
+                info.mode = 0o644
+                info.uid = info.gid = 0
+                info.uname = info.gname = ""
+
+                source = open(path, "rb") if path else io.BytesIO(data)
+                with source:
+                    reader = _HashingReader(source)
+                    tf.addfile(info, reader)
+
+                records.append({"name": name, "size": reader.size, "sha256": reader.sha256.hexdigest(),
+                                "compression": "gzip" if gz else "none"})
+
+        if gz:
+            gz.close()
+        return records
+
+    def build_package(self, package_name: str, files: Dict[str, Path],
+                      extra_files: Dict[str, bytes] = None, force: bool = False) -> Dict:
+        """패키지 하나 빌드
+
+        files: {아카이브 내 경로: 디스크 파일}
+        extra_files: {아카이브 내 경로: 바이트} (store_listing.json 등 메모리 생성 파일)
+        """
+        extra_files = extra_files or {}
+        fingerprint = self._input_fingerprint(files, extra_files)
+        archive_path = self._archive_path(package_name)
+
+        if not force and self.is_unchanged(package_name, fingerprint):
+            self.logger.info(f"⏭️ 패키지 변경 없음: {archive_path.name}")
+            return {"package": package_name, "archive": str(archive_path), "status": "unchanged"}
+
+        # 이름순 정렬로 항목 순서를 고정
+        entries = [(name, Path(path), None) for name, path in files.items()]
+        entries += [(name, None, data) for name, data in extra_files.items()]
+        entries.sort(key=lambda entry: entry[0])
+
+        tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+
+        with open(tmp_path, "wb") as raw:
+            hashing_writer = _HashingWriter(raw)
+            writer = io.BufferedWriter(hashing_writer, buffer_size=CHUNK_SIZE)
+            if self.archive_format == "zip":
+                records = self._write_zip(writer, entries)
+            else:
+                records = self._write_tar(writer, entries)
+            writer.flush()
+
+        os.replace(tmp_path, archive_path)
+
+        manifest = {
+            "package": package_name,
+            "archive": archive_path.name,
+            "format": self.archive_format,
+            "archive_size": archive_path.stat().st_size,
+            "archive_sha256": hashing_writer.sha256.hexdigest(),
+            "input_fingerprint": fingerprint,
+            "built_at": datetime.now().isoformat(),
+            "files": records
+        }
+        with open(self._manifest_path(package_name), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+        self.logger.info(f"📦 패키지 빌드: {archive_path.name} ({len(records)}개 파일)")
+        return {"package": package_name, "archive": str(archive_path), "status": "built",
+                "archive_sha256": manifest["archive_sha256"], "files": len(records)}
+
+    def build_packages(self, jobs: List[Dict], force: bool = False) -> List[Dict]:
+        """여러 앱 패키지를 병렬로 빌드
+
+        jobs: [{"package_name": ..., "files": {...}, "extra_files": {...}}]
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.build_package, job["package_name"], job["files"],
+                                job.get("extra_files"), force)
+                for job in jobs
+            ]
+            results = []
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"❌ 패키지 빌드 실패 {job['package_name']}: {e}")
+                    results.append({"package": job["package_name"], "status": "failed", "error": str(e)})
+            return results
+
+
+def main():
+    """store_assets/ 아래 모든 앱을 패키징"""
+
+    logging.basicConfig(level=logging.INFO)
+    builder = StorePackageBuilder()
+
+    jobs = []
+    for app_dir in sorted(Path("store_assets").iterdir()):
+        if not app_dir.is_dir():
+            continue
+        files = {str(path.relative_to(app_dir)).replace(os.sep, "/"): path
+                 for path in app_dir.rglob("*") if path.is_file()}
+        listing = Path("store_packages") / app_dir.name / "store_listing.json"
+        extra = {"store_listing.json": listing.read_bytes()} if listing.exists() else {}
+        jobs.append({"package_name": app_dir.name, "files": files, "extra_files": extra})
+
+    print("📦 스토어 패키지 빌드")
+    print("=" * 50)
+    for result in builder.build_packages(jobs):
+        print(f"  {result['package']}: {result['status']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,9 +10,10 @@ import os
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import json
-import logging
 from pathlib import Path
 
+from .logging_setup import setup_logging
+
 class UnifiedAppFactory:
     """통합 서버리스 앱 팩토리 - Claude Pro + Nano Banana (서버 비용 $0)"""
 
@@ -43,15 +44,8 @@ class UnifiedAppFactory:
 
     def _setup_logging(self):
         """로깅 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s [UNIFIED-FACTORY] %(levelname)s: %(message)s',
-            handlers=[
-                logging.FileHandler('app_factory.log'),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger(__name__)
+        # 파일/콘솔 쓰기는 공용 큐 리스너 스레드에서 (파일은 JSON 줄)
+        return setup_logging(__name__, "UNIFIED-FACTORY", 'app_factory.log')
 
     async def claude_pro_generate_app_spec(self, app_concept: str) -> Dict:
         """Claude Pro로 완전한 앱 기획서 생성"""
@@ -13,6 +13,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 import google.generativeai as genai
 from automated_app_planner import AutomatedAppPlanner
+from factory_profiler import run_entry_point
 
 load_dotenv()
 
@@ -135,4 +136,4 @@ async def main():
     print("📁 generated_projects 폴더를 확인하세요.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_entry_point(main, "batch_app_generator")
\ No newline at end of file
@@ -7,9 +7,9 @@ com.reaf.XXX 패키지명으로 일괄 설정
 
 import os
 import json
-import shutil
 from pathlib import Path
-import subprocess
+
+from flutter_build_orchestrator import FlutterBuildOrchestrator, BuildJob
 
 class BatchUploadPreparation:
     def __init__(self):
@@ -43,6 +43,8 @@ class BatchUploadPreparation:
         # 모든 앱 통합
         self.all_apps = {**self.flutter_apps, **self.generated_apps}
 
+        self.orchestrator = FlutterBuildOrchestrator()
+
     def update_package_name(self, app_name, new_package_name):
         """앱의 패키지명을 com.reaf.XXX로 변경"""
         # Flutter Apps 경로
@@ -167,9 +169,8 @@ class BatchUploadPreparation:
         except Exception as e:
             print(f"  ❌ pubspec.yaml 확인 실패: {e}")
 
-    def build_apk(self, app_name):
-        """APK 빌드"""
-        # Flutter Apps 경로
+    def _build_job(self, app_name):
+        """앱 빌드 작업 생성 (폴더가 없으면 None)"""
         flutter_path = Path(f"flutter_apps/{app_name}")
         generated_path = Path(f"generated_projects/{app_name}")
 
@@ -177,38 +178,29 @@ class BatchUploadPreparation:
 
         if not app_path.exists():
             print(f"❌ {app_name} 폴더를 찾을 수 없습니다.")
-            return False
-
-        print(f"🔨 {app_name} APK 빌드 중...")
-
-        try:
-            # Flutter clean
-            subprocess.run(["flutter", "clean"], cwd=app_path, check=True)
+            return None
 
-            # Flutter pub get
-            subprocess.run(["flutter", "pub", "get"], cwd=app_path, check=True)
+        return BuildJob(app_name=app_name, app_path=app_path,
+                        output_apk=Path("build_outputs") / f"{app_name}-release.apk")
 
-            # Flutter build apk
-            subprocess.run(["flutter", "build", "apk", "--release"], cwd=app_path, check=True)
+    def build_apks(self, app_names):
+        """여러 앱 APK 병렬 빌드 ({앱 이름: 성공 여부})"""
+        jobs = [job for job in (self._build_job(app_name) for app_name in app_names) if job]
+        built = {app_name: False for app_name in app_names}
+        if not jobs:
+            return built
 
-            print(f"  ✅ {app_name} APK 빌드 완료")
+        report = self.orchestrator.build_all(jobs)
+        for result in report["results"]:
+            built[result["app"]] = result["status"] == "success"
+            if result["apk_path"]:
+                print(f"  📦 APK 저장: {result['apk_path']}")
+        return built
 
-            # APK 파일 복사
-            apk_source = app_path / "build" / "app" / "outputs" / "flutter-apk" / "app-release.apk"
-            apk_dest = Path("build_outputs") / f"{app_name}-release.apk"
-            apk_dest.parent.mkdir(exist_ok=True)
-
-            if apk_source.exists():
-                shutil.copy2(apk_source, apk_dest)
-                print(f"  📦 APK 저장: {apk_dest}")
-                return True
-            else:
-                print(f"  ❌ APK 파일을 찾을 수 없음")
-                return False
-
-        except subprocess.CalledProcessError as e:
-            print(f"  ❌ {app_name} 빌드 실패: {e}")
-            return False
+    def build_apk(self, app_name):
+        """APK 빌드"""
+        print(f"🔨 {app_name} APK 빌드 중...")
+        return self.build_apks([app_name])[app_name]
 
     def create_upload_checklist(self):
         """업로드 체크리스트 생성"""
@@ -257,23 +249,29 @@ class BatchUploadPreparation:
 
         success_count = 0
         failed_apps = []
+        ready_apps = []
 
+        # 1. 패키지명 변경
         for app_name, package_name in self.all_apps.items():
             print(f"\n🔧 {app_name} 준비 중...")
 
-            # 1. 패키지명 변경
             if self.update_package_name(app_name, package_name):
-                # 2. APK 빌드
-                if self.build_apk(app_name):
-                    success_count += 1
-                    print(f"  ✅ {app_name} 준비 완료!")
-                else:
-                    failed_apps.append(app_name)
-                    print(f"  ❌ {app_name} 빌드 실패")
+                ready_apps.append(app_name)
             else:
                 failed_apps.append(app_name)
                 print(f"  ❌ {app_name} 패키지명 변경 실패")
 
+        # 2. APK 병렬 빌드
+        print()
+        built = self.build_apks(ready_apps)
+        for app_name in ready_apps:
+            if built[app_name]:
+                success_count += 1
+                print(f"  ✅ {app_name} 준비 완료!")
+            else:
+                failed_apps.append(app_name)
+                print(f"  ❌ {app_name} 빌드 실패 (로그: build_logs/{app_name}.log)")
+
         # 3. 체크리스트 생성
         checklist = self.create_upload_checklist()
 
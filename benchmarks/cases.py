@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+팩토리 CPU 핫패스 벤치마크 케이스
+중복 탐지, 에셋 캐시 조회, 이미지 오버레이/임시 이미지, 템플릿 기반 앱 생성, 스토어 정책 검사
+- 모든 입력은 fixtures 의 합성 데이터, 파일은 임시 디렉토리 (API/네트워크 사용 안 함)
+- 대상 모듈의 의존성(PIL 등)이 없으면 해당 케이스만 건너뜀
+- 저장소 루트에서 실행 (fonts/, templates/, modules/ 상대 경로 사용)
+"""
+
+import os
+import asyncio
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import Dict, List
+
+from .fixtures import synthetic_apps, synthetic_prompts
+from .harness import Benchmark, BenchmarkSkipped
+
+# 픽스처 크기 (바꾸면 이전 결과와 비교 시 "픽스처 크기 다름" 표시)
+FINGERPRINT_DB_APPS = 300
+ASSET_CACHE_ENTRIES = 300
+COMPLIANCE_DB_APPS = 500
+FEATURE_GRAPHIC_SIZE = (1024, 500)
+SCREENSHOT_SIZE = (1080, 1920)
+
+
+def _import_target(module: str):
+    """대상 모듈 임포트 - 의존성이 없으면 건너뛰기"""
+    import importlib
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise BenchmarkSkipped(f"{module} 임포트 불가: {e.name or e}")
+
+
+def _cleanup(state: Dict):
+    if state.get("loop"):
+        state["loop"].close()
+    if state.get("devnull"):
+        state["devnull"].close()
+    state["temp_dir"].cleanup()
+
+
+# --- 중복 탐지 ---
+
+def _setup_duplicates() -> Dict:
+    module = _import_target("automation.duplicate_detection")
+    temp_dir = tempfile.TemporaryDirectory(prefix="bench_dup_")
+    detector = module.AdvancedDuplicateDetector(db_path=str(Path(temp_dir.name) / "app_fingerprints.json"))
+
+    apps = synthetic_apps(FINGERPRINT_DB_APPS + 1)
+    for app in apps[:FINGERPRINT_DB_APPS]:
+        detector.fingerprint_db["apps"][app["app_name"]] = detector.create_app_fingerprint(app)
+    return {"temp_dir": temp_dir, "detector": detector, "query": apps[-1]}
+
+
+# --- 에셋 캐시 ---
+
+def _setup_asset_cache() -> Dict:
+    module = _import_target("automation.asset_cache_manager")
+    temp_dir = tempfile.TemporaryDirectory(prefix="bench_cache_")
+    cache = module.AssetCacheManager(cache_dir=temp_dir.name)
+
+    prompts = synthetic_prompts(ASSET_CACHE_ENTRIES + 1)
+    for entry in prompts[:ASSET_CACHE_ENTRIES]:
+        cache_key = cache.generate_cache_key(entry["prompt"], entry["category"])
+        cache.cache_asset({}, cache_key, entry["prompt"], entry["category"])
+
+    hit, miss = prompts[0], prompts[-1]
+    return {
+        "temp_dir": temp_dir,
+        "cache": cache,
+        "hit": (cache.generate_cache_key(hit["prompt"], hit["category"]), hit["prompt"], hit["category"]),
+        "miss": (cache.generate_cache_key(miss["prompt"], miss["category"]), miss["prompt"], miss["category"])
+    }
+
+
+# --- 이미지 ---
+
+def _setup_image_generator() -> Dict:
+    try:
+        from PIL import Image
+    except ImportError:
+        raise BenchmarkSkipped("PIL(Pillow) 없음")
+    module = _import_target("automation.gemini_store_assets")
+    temp_dir = tempfile.TemporaryDirectory(prefix="bench_image_")
+    generator = module.GeminiStoreAssetGenerator(gemini_api_key="offline-benchmark")
+    return {"temp_dir": temp_dir, "generator": generator, "image_module": Image}
+
+
+def _setup_overlay() -> Dict:
+    if not Path("fonts").is_dir():
+        raise BenchmarkSkipped("fonts/ 디렉토리 없음 (저장소 루트에서 실행)")
+    state = _setup_image_generator()
+    Image = state["image_module"]
+
+    width, height = FEATURE_GRAPHIC_SIZE
+    base = Image.new("RGB", (width, height))
+    base.putdata([(26 + x * 50 // width, 26, 26 + y * 50 // height) for y in range(height) for x in range(width)])
+    base_path = Path(state["temp_dir"].name) / "feature_graphic_base.png"
+    base.save(base_path, "PNG")
+
+    state["base_bytes"] = base_path.read_bytes()
+    state["image_path"] = Path(state["temp_dir"].name) / "feature_graphic.png"
+    return state
+
+
+def _reset_overlay_image(state: Dict):
+    # 오버레이는 파일을 덮어쓰므로 매 호출 전 원본으로 복원 (측정 제외)
+    state["image_path"].write_bytes(state["base_bytes"])
+
+
+def _setup_temporary_image() -> Dict:
+    state = _setup_image_generator()
+    state["loop"] = asyncio.new_event_loop()
+    state["output_path"] = Path(state["temp_dir"].name) / "temporary.png"
+    return state
+
+
+# --- 앱 생성 ---
+
+def _setup_generate_app() -> Dict:
+    module = _import_target("modular_app_factory")
+    temp_dir = tempfile.TemporaryDirectory(prefix="bench_factory_")
+    state = {
+        "temp_dir": temp_dir,
+        "module": module,
+        "config": module.synthetic_configs(1)[0],
+        "devnull": open(os.devnull, "w"),
+        "runs": 0
+    }
+    _new_factory(state)
+    if not _generate(state):
+        _cleanup(state)
+        raise RuntimeError("벤치마크 설정으로 앱 생성 실패")
+    return state
+
+
+def _new_factory(state: Dict):
+    # 매번 빈 출력 디렉토리 + 새 팩토리 (처음 생성하는 경우의 비용)
+    state["runs"] += 1
+    output_dir = Path(state["temp_dir"].name) / f"flutter_apps_{state['runs']}"
+    state["factory"] = state["module"].ModularAppFactory(output_dir=output_dir)
+
+
+def _generate(state: Dict) -> bool:
+    with contextlib.redirect_stdout(state["devnull"]):
+        return state["factory"].generate_app(state["config"])
+
+
+# --- 스토어 정책 검사 ---
+
+def _setup_compliance() -> Dict:
+    module = _import_target("automation.store_compliance_checker")
+    checker = module.StoreComplianceChecker()
+    apps = synthetic_apps(COMPLIANCE_DB_APPS + 1)
+    for app in apps[:COMPLIANCE_DB_APPS]:
+        checker.check_app_compliance(app)
+    return {"checker": checker, "query": apps[-1]}
+
+
+def all_benchmarks() -> List[Benchmark]:
+    return [
+        Benchmark(
+            name="duplicates.detect_duplicates",
+            group="duplicate_detection",
+            setup=_setup_duplicates,
+            run=lambda state: state["detector"].detect_duplicates(state["query"]),
+            teardown=_cleanup,
+            params={"db_apps": FINGERPRINT_DB_APPS},
+            description="새 앱 하나를 핑거프린트 DB 전체와 비교"
+        ),
+        Benchmark(
+            name="asset_cache.find_similar_asset.exact",
+            group="asset_cache",
+            setup=_setup_asset_cache,
+            run=lambda state: state["cache"].find_similar_asset(*state["hit"]),
+            teardown=_cleanup,
+            params={"entries": ASSET_CACHE_ENTRIES},
+            description="캐시 키 정확 매치"
+        ),
+        Benchmark(
+            name="asset_cache.find_similar_asset.scan",
+            group="asset_cache",
+            setup=_setup_asset_cache,
+            run=lambda state: state["cache"].find_similar_asset(*state["miss"]),
+            teardown=_cleanup,
+            params={"entries": ASSET_CACHE_ENTRIES},
+            description="정확 매치 없음 → 같은 카테고리 전체 유사도 검색"
+        ),
+        Benchmark(
+            name="store_assets.add_korean_text_overlay",
+            group="images",
+            setup=_setup_overlay,
+            run=lambda state: state["generator"].add_korean_text_overlay(
+                state["image_path"], "기가차드 푸시업", "100일 만에 완성하는 알파 루틴"),
+            before_each=_reset_overlay_image,
+            teardown=_cleanup,
+            params={"size": list(FEATURE_GRAPHIC_SIZE)},
+            description="Feature Graphic 에 외곽선 한글 타이틀/서브타이틀 + PNG 저장"
+        ),
+        Benchmark(
+            name="store_assets.create_temporary_image",
+            group="images",
+            setup=_setup_temporary_image,
+            run=lambda state: state["loop"].run_until_complete(state["generator"]._create_temporary_image(
+                "benchmark placeholder", *SCREENSHOT_SIZE, state["output_path"])),
+            teardown=_cleanup,
+            params={"size": list(SCREENSHOT_SIZE)},
+            description="그라데이션 플레이스홀더 스크린샷 생성 + PNG 저장"
+        ),
+        Benchmark(
+            name="modular_factory.generate_app.cold",
+            group="app_generation",
+            setup=_setup_generate_app,
+            run=_generate,
+            before_each=_new_factory,
+            teardown=_cleanup,
+            description="빈 출력 디렉토리에 앱 하나 생성 (디렉토리 + 템플릿 렌더링 + 파일 쓰기 + 의존성 그래프)"
+        ),
+        Benchmark(
+            name="modular_factory.generate_app.unchanged",
+            group="app_generation",
+            setup=_setup_generate_app,
+            run=_generate,
+            teardown=_cleanup,
+            description="이미 생성된 앱 재생성 (렌더링 후 변경 없음 → 쓰기 생략)"
+        ),
+        Benchmark(
+            name="compliance.check_app_compliance",
+            group="store_compliance",
+            setup=_setup_compliance,
+            run=lambda state: state["checker"].check_app_compliance(state["query"]),
+            params={"db_apps": COMPLIANCE_DB_APPS},
+            description="앱 하나 정책 검사 (기존 앱 DB 대비 유니크성 포함)"
+        ),
+    ]
+
+
+def select_benchmarks(patterns: List[str] = None) -> List[Benchmark]:
+    """이름/그룹에 패턴 중 하나라도 포함된 케이스 (없으면 전체)"""
+    benchmarks = all_benchmarks()
+    if not patterns:
+        return benchmarks
+    return [bench for bench in benchmarks
+            if any(pattern in bench.name or pattern == bench.group for pattern in patterns)]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 픽스처
+네트워크/API 키 없이 재현 가능한 입력 (고정 시드) - 실행마다 같은 데이터라 결과를 비교할 수 있음
+"""
+
+import random
+from typing import Dict, List
+
+SEED = 20250922
+
+EXERCISES = ["푸시업", "스쿼트", "플랭크", "버피", "런지", "풀업", "크런치", "러닝", "줄넘기", "딥스"]
+ENGLISH_EXERCISES = ["pushup", "squat", "plank", "burpee", "lunge", "pullup", "crunch", "running", "jump rope", "dips"]
+STYLES = ["기가차드", "알파", "챌린지", "마스터", "프로", "스파르타", "100일", "30일", "레전드", "비스트"]
+CATEGORIES = ["health_fitness", "lifestyle", "education", "productivity"]
+FEATURES = [
+    "progressive overload program", "daily workout reminder", "weekly progress chart",
+    "level test", "achievement badges", "rest timer", "streak tracking", "offline mode",
+    "dark theme", "home widget", "voice coaching", "calendar sync", "custom routines",
+    "body weight log", "social sharing", "ad free upgrade"
+]
+DESCRIPTION_WORDS = [
+    "mobile", "app", "workout", "training", "beginner", "advanced", "program", "weeks",
+    "scientific", "progression", "strength", "endurance", "daily", "routine", "coach",
+    "track", "progress", "levels", "challenge", "habit", "home", "gym", "minutes", "goal"
+]
+PROMPT_SUBJECTS = ["muscular chad", "fitness silhouette", "stopwatch", "trophy", "flame", "dumbbell", "running shoe"]
+PROMPT_STYLES = ["modern", "minimalist", "premium", "sleek", "bold", "gradient", "flat", "3d"]
+PROMPT_COLORS = ["gold", "black", "red", "neon green", "deep blue", "orange"]
+ASSET_CATEGORIES = ["app_icon", "feature_graphic", "screenshot"]
+
+
+def _description(rng: random.Random, exercise: str, words: int = 40) -> str:
+    body = " ".join(rng.choice(DESCRIPTION_WORDS) for _ in range(words))
+    return f"{exercise} {body}. A mobile app to build the {exercise} habit step by step."
+
+
+def synthetic_apps(count: int, seed: int = SEED) -> List[Dict]:
+    """중복 탐지 / 스토어 정책 검사 입력 형태의 앱 데이터"""
+    rng = random.Random(seed)
+    apps = []
+    for index in range(count):
+        exercise_index = rng.randrange(len(EXERCISES))
+        exercise = ENGLISH_EXERCISES[exercise_index]
+        app_name = f"{rng.choice(STYLES)} {EXERCISES[exercise_index]} {index}"
+        apps.append({
+            "app_name": app_name,
+            "description": _description(rng, exercise),
+            "core_features": rng.sample(FEATURES, 5),
+            "unique_features": rng.sample(FEATURES, 3),
+            "category": rng.choice(CATEGORIES),
+            "total_cost": round(rng.uniform(0.1, 2.0), 2),
+            "quality_score": rng.randint(60, 100),
+            "completion_percentage": rng.randint(70, 100),
+            "core_features_completion": rng.randint(70, 100),
+            "generated_assets": {
+                "app_icon": "app_icon.png",
+                "feature_graphic": "feature_graphic.png",
+                "screenshots": [f"screenshot_{shot}.png" for shot in range(rng.randint(2, 8))]
+            },
+            "privacy_policy_url": "https://example.com/privacy",
+            "terms_of_service_url": "https://example.com/terms",
+            "monetization": {"ads_enabled": True},
+            "ads_disclosure": True,
+            "required_permissions": ["INTERNET", "VIBRATE"],
+            "permission_rationale": {"INTERNET": "광고", "VIBRATE": "타이머 알림"},
+            "target_stores": {"google_play": True, "app_store": True},
+            "android_config": {"target_sdk": 34, "supports_64bit": True},
+            "ios_config": {"min_ios_version": "13.0"}
+        })
+    return apps
+
+
+def synthetic_prompts(count: int, seed: int = SEED) -> List[Dict]:
+    """에셋 캐시 입력 형태의 (카테고리, 프롬프트)"""
+    rng = random.Random(seed + 1)
+    prompts = []
+    for index in range(count):
+        prompt = (f"{rng.choice(PROMPT_STYLES)} {rng.choice(PROMPT_STYLES)} {rng.choice(PROMPT_SUBJECTS)} "
+                  f"for {rng.choice(ENGLISH_EXERCISES)} app, {rng.choice(PROMPT_COLORS)} and "
+                  f"{rng.choice(PROMPT_COLORS)} palette, variant {index}")
+        prompts.append({"category": rng.choice(ASSET_CATEGORIES), "prompt": prompt})
+    return prompts
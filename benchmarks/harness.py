@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+마이크로 벤치마크 하네스
+- 케이스별 준비(setup) → 워밍업 1회 → 반복 측정 (측정 중 GC 끔, timeit 과 같은 방식)
+- 한 번 실행이 짧은 함수는 min_time 을 넘을 때까지 호출 횟수를 늘려 평균 (타이머 해상도 보정)
+- 매 호출 전에 입력을 되돌려야 하는 케이스(before_each)는 호출 1회씩 측정, 되돌리는 시간은 제외
+- 결과는 JSON 한 파일, compare_results 로 두 실행 비교
+"""
+
+import gc
+import json
+import time
+import platform
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_SCHEMA = 1
+DEFAULT_REPEATS = 7
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+MAX_NUMBER = 1_000_000
+
+
+class BenchmarkSkipped(Exception):
+    """이 환경에서 실행할 수 없는 케이스 (선택 의존성 없음 등)"""
+
+
+@dataclass
+class Benchmark:
+    """벤치마크 케이스 - run(state) 한 번이 측정 단위"""
+    name: str
+    group: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+    before_each: Optional[Callable[[Any], None]] = None
+    teardown: Optional[Callable[[Any], None]] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    description: str = ""
+
+
+def _time_calls(bench: Benchmark, state: Any, number: int) -> float:
+    """number 번 호출 시간(초) - 측정 중 GC 끔"""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(number):
+            bench.run(state)
+        return time.perf_counter() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _calibrate(bench: Benchmark, state: Any, min_time: float) -> int:
+    """한 샘플이 min_time 이상 걸리는 호출 횟수"""
+    if bench.before_each is not None:
+        return 1
+    number = 1
+    while number < MAX_NUMBER:
+        if _time_calls(bench, state, number) >= min_time:
+            break
+        number *= 2
+    return number
+
+
+def measure(bench: Benchmark, repeats: int = DEFAULT_REPEATS, min_time: float = DEFAULT_MIN_TIME) -> Dict:
+    """케이스 하나 측정 → 결과 dict (실행할 수 없으면 skipped 사유)"""
+    try:
+        state = bench.setup()
+    except BenchmarkSkipped as e:
+        return {"group": bench.group, "params": bench.params, "skipped": str(e)}
+
+    try:
+        # 워밍업 (임포트/폰트 로드/템플릿 컴파일 등 첫 호출 비용 제외)
+        if bench.before_each:
+            bench.before_each(state)
+        bench.run(state)
+
+        number = _calibrate(bench, state, min_time)
+        samples = []
+        for _ in range(repeats):
+            if bench.before_each:
+                bench.before_each(state)
+            samples.append(_time_calls(bench, state, number) / number)
+    finally:
+        if bench.teardown:
+            bench.teardown(state)
+
+    samples_ms = [sample * 1000 for sample in samples]
+    median_ms = statistics.median(samples_ms)
+    return {
+        "group": bench.group,
+        "params": bench.params,
+        "number": number,
+        "repeats": repeats,
+        "min_ms": round(min(samples_ms), 4),
+        "median_ms": round(median_ms, 4),
+        "mean_ms": round(statistics.fmean(samples_ms), 4),
+        "stdev_ms": round(statistics.stdev(samples_ms), 4) if len(samples_ms) > 1 else 0.0,
+        "max_ms": round(max(samples_ms), 4),
+        "ops_per_second": round(1000 / median_ms, 2) if median_ms else None,
+        "samples_ms": [round(sample, 4) for sample in samples_ms]
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_suite(benchmarks: List[Benchmark], repeats: int = DEFAULT_REPEATS,
+              min_time: float = DEFAULT_MIN_TIME, quiet: bool = False) -> Dict:
+    """케이스 목록 실행 → 결과 문서 (save_results 로 저장)"""
+    results = {
+        "schema": RESULTS_SCHEMA,
+        "created": datetime.now().isoformat(),
+        "git_commit": _git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "processor": platform.processor()
+        },
+        "settings": {"repeats": repeats, "min_time": min_time},
+        "benchmarks": {}
+    }
+
+    for bench in benchmarks:
+        if not quiet:
+            print(f"⏱️ {bench.name} ...", end=" ", flush=True)
+        result = measure(bench, repeats, min_time)
+        results["benchmarks"][bench.name] = result
+        if not quiet:
+            if "skipped" in result:
+                print(f"⏭️ 건너뜀 ({result['skipped']})")
+            else:
+                print(f"{result['median_ms']:.3f} ms (±{result['stdev_ms']:.3f}, ×{result['number']})")
+    return results
+
+
+def save_results(results: Dict, path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    temp_path.replace(path)
+    return path
+
+
+def load_results(path: Path) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(f"지원하지 않는 결과 형식: {path} (schema {results.get('schema')})")
+    return results
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """두 실행 비교 - 케이스별 상태 (regression / improved / unchanged / added / removed / skipped)
+
+    중앙값이 threshold 이상 느려지고 최솟값도 threshold/2 이상 느려졌을 때만 회귀로 판정
+    (한쪽 실행에만 튄 노이즈로 오탐하지 않도록)
+    """
+    rows = []
+    names = sorted(set(baseline["benchmarks"]) | set(current["benchmarks"]))
+    for name in names:
+        base = baseline["benchmarks"].get(name)
+        new = current["benchmarks"].get(name)
+        row = {"name": name, "baseline_ms": None, "current_ms": None, "ratio": None, "note": ""}
+
+        if base is None:
+            row["status"] = "added"
+        elif new is None:
+            row["status"] = "removed"
+        elif "skipped" in base or "skipped" in new:
+            row["status"] = "skipped"
+            row["note"] = new.get("skipped") or base.get("skipped")
+        else:
+            ratio = new["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+            min_ratio = new["min_ms"] / base["min_ms"] if base["min_ms"] else 1.0
+            row.update(baseline_ms=base["median_ms"], current_ms=new["median_ms"], ratio=round(ratio, 3))
+            if ratio > 1 + threshold and min_ratio > 1 + threshold / 2:
+                row["status"] = "regression"
+            elif ratio < 1 / (1 + threshold) and min_ratio < 1 / (1 + threshold / 2):
+                row["status"] = "improved"
+            else:
+                row["status"] = "unchanged"
+            if base.get("params") != new.get("params"):
+                row["note"] = "픽스처 크기 다름"
+        rows.append(row)
+    return rows
+
+
+STATUS_ICONS = {
+    "regression": "🔴", "improved": "🟢", "unchanged": "⚪",
+    "added": "🆕", "removed": "➖", "skipped": "⏭️"
+}
+
+
+def print_comparison(rows: List[Dict], baseline: Dict, current: Dict, threshold: float):
+    print(f"📊 벤치마크 비교 (임계값 {threshold:.0%})")
+    print(f"  기준: {baseline.get('git_commit') or '?'} ({baseline['created'][:19]})")
+    print(f"  현재: {current.get('git_commit') or '?'} ({current['created'][:19]})")
+    if baseline["environment"] != current["environment"]:
+        print("  ⚠️ 실행 환경이 다름 - 수치 비교에 주의")
+    print()
+    print(f"  {'':2} {'benchmark':<46} {'기준 ms':>10} {'현재 ms':>10} {'변화':>8}")
+    for row in rows:
+        icon = STATUS_ICONS[row["status"]]
+        if row["ratio"] is None:
+            print(f"  {icon} {row['name']:<46} {row['status']:>30} {row['note']}")
+            continue
+        change = f"{(row['ratio'] - 1) * 100:+.1f}%"
+        note = f"  ⚠️ {row['note']}" if row["note"] else ""
+        print(f"  {icon} {row['name']:<46} {row['baseline_ms']:>10.3f} {row['current_ms']:>10.3f} {change:>8}{note}")
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    improved = [row for row in rows if row["status"] == "improved"]
+    print()
+    if regressions:
+        print(f"❌ 회귀 {len(regressions)}건: {', '.join(row['name'] for row in regressions)}")
+    else:
+        print(f"✅ 회귀 없음 (개선 {len(improved)}건)")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ 팩토리 마이크로 벤치마크 실행기
+오프라인 합성 픽스처로 CPU 핫패스를 측정하고 JSON 으로 저장, 두 실행을 비교해 회귀 표시
+
+  python -m benchmarks.run_benchmarks run                       # 전체 실행 → benchmarks/results/<시각>.json
+  python -m benchmarks.run_benchmarks run -k asset_cache -o base.json
+  python -m benchmarks.run_benchmarks list
+  python -m benchmarks.run_benchmarks compare base.json new.json [--threshold 0.1]
+
+compare 는 회귀가 있으면 종료 코드 1 (CI 에서 사용)
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+from .cases import select_benchmarks
+from .harness import (DEFAULT_MIN_TIME, DEFAULT_REPEATS, DEFAULT_THRESHOLD, compare_results,
+                      load_results, print_comparison, run_suite, save_results)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+
+def cmd_run(args) -> int:
+    output = Path(args.output).resolve() if args.output else \
+        RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    benchmarks = select_benchmarks(args.filter)
+    if not benchmarks:
+        print(f"❌ 일치하는 벤치마크 없음: {', '.join(args.filter)}")
+        return 1
+
+    repeats, min_time = (3, 0.01) if args.quick else (args.repeats, args.min_time)
+    # 케이스들이 fonts/, templates/, modules/ 를 상대 경로로 사용
+    os.chdir(REPO_ROOT)
+    print(f"🏁 벤치마크 {len(benchmarks)}개 (반복 {repeats}회, 샘플당 최소 {min_time * 1000:.0f}ms)")
+    results = run_suite(benchmarks, repeats=repeats, min_time=min_time)
+    save_results(results, output)
+
+    skipped = sum(1 for result in results["benchmarks"].values() if "skipped" in result)
+    print(f"💾 결과 저장: {output}" + (f" (건너뜀 {skipped}개)" if skipped else ""))
+    return 0
+
+
+def cmd_list(args) -> int:
+    for bench in select_benchmarks(args.filter):
+        params = ", ".join(f"{key}={value}" for key, value in bench.params.items())
+        print(f"  • {bench.name:<44} [{bench.group}] {bench.description}" + (f" ({params})" if params else ""))
+    return 0
+
+
+def cmd_compare(args) -> int:
+    baseline = load_results(Path(args.baseline))
+    current = load_results(Path(args.current))
+    rows = compare_results(baseline, current, args.threshold)
+    print_comparison(rows, baseline, current, args.threshold)
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="팩토리 마이크로 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="벤치마크 실행 후 JSON 저장")
+    run_parser.add_argument("-k", "--filter", action="append", help="이름 일부 또는 그룹 (여러 번 가능)")
+    run_parser.add_argument("-o", "--output", help="결과 JSON 경로 (기본: benchmarks/results/<시각>.json)")
+    run_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="샘플당 최소 측정 시간(초)")
+    run_parser.add_argument("--quick", action="store_true", help="빠른 확인용 (반복 3회, 비교용으로는 부정확)")
+    run_parser.set_defaults(handler=cmd_run)
+
+    list_parser = subparsers.add_parser("list", help="벤치마크 목록")
+    list_parser.add_argument("-k", "--filter", action="append")
+    list_parser.set_defaults(handler=cmd_list)
+
+    compare_parser = subparsers.add_parser("compare", help="두 결과 비교 (회귀 시 종료 코드 1)")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="회귀로 볼 중앙값 증가율 (기본 0.10 = 10%%)")
+    compare_parser.set_defaults(handler=cmd_compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,16 @@
 앱 생성 → Flutter 프로젝트 생성 → GitHub 업로드 → APK 빌드 → 릴리즈
 """
 
-import os
 import sys
 import json
 import time
-import subprocess
 import requests
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+from async_command_runner import get_command_runner
+
 class CompleteCICDAutomation:
     def __init__(self):
         self.github_token = "your_github_token_here"
@@ -23,6 +23,7 @@ class CompleteCICDAutomation:
         self.generated_dir = self.base_dir / "generated_projects"
         self.flutter_apps_dir = self.base_dir / "flutter_apps"
         self.mission100_assets = Path("E:/Projects/Flutter/misson100_version_2/assets")
+        self.command_runner = get_command_runner()
 
         # Flutter 기본 템플릿 설정
         self.flutter_template = {
@@ -133,11 +134,10 @@ class CompleteCICDAutomation:
             shutil.rmtree(project_path)
 
         # Flutter 프로젝트 생성
-        cmd = f'flutter create --org com.reaf {project_name}'
-        result = subprocess.run(cmd, shell=True, cwd=self.flutter_apps_dir,
-                              capture_output=True, text=True, encoding='utf-8')
+        cmd = ["flutter", "create", "--org", "com.reaf", project_name]
+        result = self.command_runner.run_sync(cmd, cwd=self.flutter_apps_dir, timeout=300)
 
-        if result.returncode != 0:
+        if not result.ok:
             raise Exception(f"Flutter create 실패: {result.stderr}")
 
         # Mission100 에셋 복사
@@ -445,35 +445,31 @@ class _HomeScreenState extends State<HomeScreen> {{
 
     def initialize_git_repository(self, project_path, repo_url):
         """Git 저장소 초기화"""
-        os.chdir(project_path)
-
         commands = [
-            "git init",
-            'git config user.name "App Factory Bot"',
-            'git config user.email "bot@appfactory.com"',
-            f"git remote add origin {repo_url}"
+            ["git", "init"],
+            ["git", "config", "user.name", "App Factory Bot"],
+            ["git", "config", "user.email", "bot@appfactory.com"],
+            ["git", "remote", "add", "origin", repo_url]
         ]
 
         for cmd in commands:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise Exception(f"Git 명령 실패: {cmd} - {result.stderr}")
+            result = self.command_runner.run_sync(cmd, cwd=project_path, timeout=60)
+            if not result.ok:
+                raise Exception(f"Git 명령 실패: {' '.join(cmd)} - {result.stderr}")
 
     def commit_and_push_initial_files(self, project_path):
         """초기 파일 커밋 및 푸시"""
-        os.chdir(project_path)
-
         commands = [
-            "git add .",
-            'git commit -m "Initial commit: Chad workout app with automation"',
-            "git branch -M main",
-            "git push -u origin main"
+            ["git", "add", "."],
+            ["git", "commit", "-m", "Initial commit: Chad workout app with automation"],
+            ["git", "branch", "-M", "main"],
+            ["git", "push", "-u", "origin", "main"]
         ]
 
         for cmd in commands:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise Exception(f"Git 명령 실패: {cmd} - {result.stderr}")
+            result = self.command_runner.run_sync(cmd, cwd=project_path, timeout=300)
+            if not result.ok:
+                raise Exception(f"Git 명령 실패: {' '.join(cmd)} - {result.stderr}")
 
     def setup_github_actions(self, project_path):
         """GitHub Actions 워크플로우 설정"""
@@ -547,18 +543,16 @@ jobs:
 
     def final_commit_and_push(self, project_path):
         """최종 커밋 및 푸시 (GitHub Actions 트리거)"""
-        os.chdir(project_path)
-
         commands = [
-            "git add .",
-            'git commit -m "Add GitHub Actions CI/CD workflow"',
-            "git push origin main"
+            ["git", "add", "."],
+            ["git", "commit", "-m", "Add GitHub Actions CI/CD workflow"],
+            ["git", "push", "origin", "main"]
         ]
 
         for cmd in commands:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                print(f"경고: {cmd} 실행 중 오류 (계속 진행): {result.stderr}")
+            result = self.command_runner.run_sync(cmd, cwd=project_path, timeout=300)
+            if not result.ok:
+                print(f"경고: {' '.join(cmd)} 실행 중 오류 (계속 진행): {result.stderr}")
 
     def print_automation_summary(self, successful_apps, failed_apps):
         """자동화 결과 요약 출력"""
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧩 Dart 템플릿 엔진
+템플릿을 한 번 파싱해 파이썬 렌더 함수로 컴파일하고 파일 해시로 캐시
+문법:
+  {{ name }} / {{ config.app_name }} / {{ name|upper }}   값 출력 (+ 필터)
+  {% for x in items %} ... {% endfor %}                   반복 (dict 는 for k, v in ...)
+  {% if name %} / {% elif not other %} / {% else %} / {% endif %}
+  {% include "file.dart.tmpl" %}                          다른 템플릿 포함
+  {% raw %} ... {% endraw %}                              그대로 출력
+  {# 주석 #}
+기존 {{APP_NAME}} 스타일 플레이스홀더 템플릿도 그대로 렌더 가능
+"""
+
+import re
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+TOKEN_PATTERN = re.compile(r"(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})", re.DOTALL)
+PATH_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z0-9_]+)*$")
+
+
+class TemplateError(Exception):
+    """템플릿 파싱/렌더링 오류"""
+
+
+def _pascal(value) -> str:
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^A-Za-z0-9]+", str(value)) if part)
+
+
+def _dart_list(value) -> str:
+    return "[" + ", ".join(str(item) for item in value) + "]"
+
+
+def _dart_string(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("'", "\\'").replace("$", "\\$")
+
+
+DEFAULT_FILTERS: Dict[str, Callable[[Any], str]] = {
+    "upper": lambda value: str(value).upper(),
+    "lower": lambda value: str(value).lower(),
+    "title": lambda value: str(value).title(),
+    "pascal": _pascal,
+    "dart_list": _dart_list,
+    "dart_string": _dart_string,
+}
+
+
+class _Loop:
+    """반복문 안에서 쓰는 loop.index / loop.first / loop.last"""
+    __slots__ = ("index0", "length")
+
+    def __init__(self, index0: int, length: int):
+        self.index0 = index0
+        self.length = length
+
+    @property
+    def index(self) -> int:
+        return self.index0 + 1
+
+    @property
+    def first(self) -> bool:
+        return self.index0 == 0
+
+    @property
+    def last(self) -> bool:
+        return self.index0 == self.length - 1
+
+
+_MISSING = object()
+
+
+def _resolve(value, attr: str, expression: str, template_name: str, line: int):
+    """dict 키 → 속성 순으로 조회"""
+    if isinstance(value, dict):
+        result = value.get(attr, _MISSING)
+    else:
+        result = getattr(value, attr, _MISSING)
+    if result is _MISSING:
+        raise TemplateError(f"{template_name}:{line}: '{expression}' 값을 찾을 수 없습니다")
+    return result
+
+
+def _iterate(value, names: int):
+    """반복 대상 정규화 (변수 2개 + dict 면 items)"""
+    if names == 2 and isinstance(value, dict):
+        items = list(value.items())
+    else:
+        items = list(value)
+    length = len(items)
+    return ((index, _Loop(index, length), item) for index, item in enumerate(items))
+
+
+class Template:
+    """컴파일된 템플릿"""
+
+    def __init__(self, source: str, name: str = "<string>", engine: "TemplateEngine" = None):
+        self.name = name
+        self.source_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        self.engine = engine
+        self.includes: Set[str] = set()
+        self.variables: Set[str] = set()
+        self.python_source = self._compile(source)
+
+        # 렌더 함수가 참조하는 헬퍼만 넣은 전역 이름공간
+        namespace: Dict[str, Any] = {"_TemplateError": TemplateError, "_iterate": _iterate, "_resolve": _resolve}
+        exec(compile(self.python_source, f"<template {name}>", "exec"), namespace)
+        self._render_func = namespace["_render"]
+
+    # ── 파싱 ──────────────────────────────────────────────
+
+    @staticmethod
+    def _tokenize(source: str) -> List[Tuple[str, str, int]]:
+        """(종류, 내용, 줄 번호) 목록, 한 줄에 태그만 있으면 그 줄의 들여쓰기/줄바꿈 제거"""
+        tokens = []
+        line = 1
+        parts = TOKEN_PATTERN.split(source)
+        for index, part in enumerate(parts):
+            if not part:
+                continue
+            if index % 2 == 0:
+                tokens.append(("text", part, line))
+            elif part.startswith("{{"):
+                tokens.append(("expr", part[2:-2].strip(), line))
+            elif part.startswith("{%"):
+                tokens.append(("stmt", part[2:-2].strip(), line))
+            else:
+                tokens.append(("comment", part, line))
+            line += part.count("\n")
+
+        # 블록 태그만 있는 줄 정리 (trim_blocks + lstrip_blocks)
+        for i, (kind, value, line) in enumerate(tokens):
+            if kind not in ("stmt", "comment"):
+                continue
+            before = tokens[i - 1] if i > 0 else None
+            after = tokens[i + 1] if i + 1 < len(tokens) else None
+
+            before_ok = before is None or before[0] == "text"
+            lead = ""
+            if before is not None and before[0] == "text":
+                lead = before[1].rsplit("\n", 1)[-1]
+                at_line_start = "\n" in before[1] or i - 1 == 0
+                before_ok = at_line_start and lead.strip() == ""
+            after_ok = after is None or (after[0] == "text" and re.match(r"[ \t]*(\n|$)", after[1]))
+
+            if before_ok and after_ok:
+                if before is not None and lead:
+                    tokens[i - 1] = ("text", before[1][:len(before[1]) - len(lead)], before[2])
+                if after is not None:
+                    tokens[i + 1] = ("text", re.sub(r"^[ \t]*\n?", "", after[1], count=1), after[2])
+        return tokens
+
+    def _expression(self, expression: str, scope: Dict[str, str], line: int) -> str:
+        """'a.b|upper' → 파이썬 식"""
+        parts = [part.strip() for part in expression.split("|")]
+        path = parts[0]
+
+        if (path.startswith('"') and path.endswith('"')) or (path.startswith("'") and path.endswith("'")):
+            code = repr(path[1:-1])
+        elif path.isdigit():
+            code = path
+        elif PATH_PATTERN.match(path):
+            root, *attrs = path.split(".")
+            if root in scope:
+                code = scope[root]
+            else:
+                self.variables.add(root)
+                code = f"_ctx_get({root!r}, {path!r}, {line})"
+            for attr in attrs:
+                code = f"_resolve({code}, {attr!r}, {path!r}, _name, {line})"
+        else:
+            raise TemplateError(f"{self.name}:{line}: 지원하지 않는 식 '{expression}'")
+
+        for filter_name in parts[1:]:
+            code = f"_filter({filter_name!r}, {line})({code})"
+        return code
+
+    def _condition(self, expression: str, scope: Dict[str, str], line: int) -> str:
+        negate = expression.startswith("not ")
+        code = self._expression(expression[4:].strip() if negate else expression, scope, line)
+        return f"not ({code})" if negate else f"({code})"
+
+    def _compile(self, source: str) -> str:
+        """토큰을 파이썬 렌더 함수 소스로 변환"""
+        code = ["def _render(_ctx, _engine, _name):",
+                "    _out = []",
+                "    _w = _out.append",
+                "    def _ctx_get(key, expr, line):",
+                "        if key not in _ctx:",
+                "            raise _TemplateError(f'{_name}:{line}: \\'{expr}\\' 값을 찾을 수 없습니다')",
+                "        return _ctx[key]",
+                "    def _filter(name, line):",
+                "        if name not in _engine.filters:",
+                "            raise _TemplateError(f'{_name}:{line}: 알 수 없는 필터 {name}')",
+                "        return _engine.filters[name]"]
+        indent = 1
+        scopes: List[Dict[str, str]] = [{}]
+        blocks: List[Tuple[str, int]] = []
+        raw_depth = 0
+        counter = 0
+
+        def emit(line_code: str):
+            code.append("    " * indent + line_code)
+
+        for kind, value, line in self._tokenize(source):
+            scope = scopes[-1]
+
+            if raw_depth:
+                if kind == "stmt" and value == "endraw":
+                    raw_depth = 0
+                    continue
+                text = value if kind == "text" else ("{{ " + value + " }}" if kind == "expr"
+                                                     else "{% " + value + " %}" if kind == "stmt" else value)
+                emit(f"_w({text!r})")
+                continue
+
+            if kind == "text":
+                emit(f"_w({value!r})")
+            elif kind == "expr":
+                emit(f"_w(str({self._expression(value, scope, line)}))")
+            elif kind == "comment":
+                continue
+            else:
+                keyword, _, rest = value.partition(" ")
+                rest = rest.strip()
+
+                if keyword == "raw":
+                    raw_depth = 1
+                elif keyword == "for":
+                    match = re.match(r"^([A-Za-z_]\w*)(?:\s*,\s*([A-Za-z_]\w*))?\s+in\s+(.+)$", rest)
+                    if not match:
+                        raise TemplateError(f"{self.name}:{line}: 잘못된 for 문 '{value}'")
+                    first, second, iterable = match.groups()
+                    counter += 1
+                    new_scope = dict(scope)
+                    item_var = f"_item{counter}"
+                    loop_var = f"_loop{counter}"
+                    emit(f"for _i{counter}, {loop_var}, {item_var} in "
+                         f"_iterate({self._expression(iterable, scope, line)}, {2 if second else 1}):")
+                    indent += 1
+                    if second:
+                        emit(f"_a{counter}, _b{counter} = {item_var}")
+                        new_scope[first] = f"_a{counter}"
+                        new_scope[second] = f"_b{counter}"
+                    else:
+                        new_scope[first] = item_var
+                    new_scope["loop"] = loop_var
+                    scopes.append(new_scope)
+                    blocks.append(("for", line))
+                elif keyword == "if":
+                    emit(f"if {self._condition(rest, scope, line)}:")
+                    indent += 1
+                    emit("pass")
+                    blocks.append(("if", line))
+                elif keyword == "elif":
+                    if not blocks or blocks[-1][0] != "if":
+                        raise TemplateError(f"{self.name}:{line}: if 없는 elif")
+                    indent -= 1
+                    emit(f"elif {self._condition(rest, scope, line)}:")
+                    indent += 1
+                    emit("pass")
+                elif keyword == "else":
+                    if not blocks or blocks[-1][0] != "if":
+                        raise TemplateError(f"{self.name}:{line}: if 없는 else")
+                    indent -= 1
+                    emit("else:")
+                    indent += 1
+                    emit("pass")
+                elif keyword in ("endfor", "endif"):
+                    expected = keyword[3:]
+                    if not blocks or blocks[-1][0] != expected:
+                        raise TemplateError(f"{self.name}:{line}: 짝이 맞지 않는 {keyword}")
+                    blocks.pop()
+                    if expected == "for":
+                        scopes.pop()
+                    indent -= 1
+                elif keyword == "include":
+                    target = rest.strip("'\"")
+                    self.includes.add(target)
+                    local_names = {name: var for name, var in scope.items() if name != "loop"}
+                    locals_code = "{" + ", ".join(f"{name!r}: {var}" for name, var in local_names.items()) + "}"
+                    emit(f"_w(_engine.get_template({target!r}).render_context("
+                         f"{{**_ctx, **{locals_code}}}))")
+                else:
+                    raise TemplateError(f"{self.name}:{line}: 알 수 없는 태그 '{keyword}'")
+
+        if blocks:
+            kind, line = blocks[-1]
+            raise TemplateError(f"{self.name}:{line}: 닫히지 않은 {kind} 블록")
+
+        code.append("    return ''.join(_out)")
+        return "\n".join(code) + "\n"
+
+    # ── 렌더링 ────────────────────────────────────────────
+
+    def render_context(self, context: Dict[str, Any]) -> str:
+        engine = self.engine or default_engine()
+        return self._render_func(context, engine, self.name)
+
+    def render(self, context: Dict[str, Any] = None, **kwargs) -> str:
+        return self.render_context({**(context or {}), **kwargs})
+
+
+class TemplateEngine:
+    """템플릿 디렉토리 기반 로더 + 해시 캐시"""
+
+    def __init__(self, template_dirs: List[Union[str, Path]] = None, filters: Dict[str, Callable] = None):
+        self.template_dirs = [Path(d) for d in (template_dirs or ["templates"])]
+        self.filters = {**DEFAULT_FILTERS, **(filters or {})}
+
+        self._lock = threading.Lock()
+        self._by_hash: Dict[str, Template] = {}
+        self._stat_memo: Dict[str, Tuple[int, int, str]] = {}
+        self.stats = {"compiled": 0, "cache_hits": 0}
+
+    def resolve(self, name: str) -> Path:
+        """템플릿 이름 → 파일 경로"""
+        candidate = Path(name)
+        if candidate.is_absolute() and candidate.exists():
+            return candidate
+        for template_dir in self.template_dirs:
+            path = template_dir / name
+            if path.exists():
+                return path
+        raise TemplateError(f"템플릿을 찾을 수 없습니다: {name} ({', '.join(map(str, self.template_dirs))})")
+
+    def _compile_cached(self, source: str, name: str, source_hash: str = None) -> Template:
+        source_hash = source_hash or hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self._lock:
+            template = self._by_hash.get(source_hash)
+            if template is not None and template.name == name:
+                self.stats["cache_hits"] += 1
+                return template
+
+        template = Template(source, name=name, engine=self)
+        with self._lock:
+            self._by_hash[source_hash] = template
+            self.stats["compiled"] += 1
+        return template
+
+    def get_template(self, name: str) -> Template:
+        """파일 템플릿 (크기/mtime 이 같으면 해시 계산도 생략)"""
+        path = self.resolve(name)
+        stat = path.stat()
+        key = str(path)
+
+        memo = self._stat_memo.get(key)
+        if memo and memo[0] == stat.st_size and memo[1] == stat.st_mtime_ns:
+            template = self._by_hash.get(memo[2])
+            if template is not None:
+                self.stats["cache_hits"] += 1
+                return template
+
+        data = path.read_bytes()
+        source_hash = hashlib.sha256(data).hexdigest()
+        self._stat_memo[key] = (stat.st_size, stat.st_mtime_ns, source_hash)
+        return self._compile_cached(data.decode("utf-8"), name, source_hash)
+
+    def from_string(self, source: str, name: str = "<string>") -> Template:
+        return self._compile_cached(source, name)
+
+    def render(self, name: str, context: Dict[str, Any] = None, **kwargs) -> str:
+        return self.get_template(name).render(context, **kwargs)
+
+    def template_hash(self, name: str) -> str:
+        """템플릿 내용 해시 (의존성 추적용)"""
+        return self.get_template(name).source_hash
+
+    def dependencies(self, name: str) -> Set[str]:
+        """템플릿이 (재귀적으로) include 하는 모든 템플릿"""
+        seen: Set[str] = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            for include in self.get_template(current).includes:
+                if include not in seen:
+                    seen.add(include)
+                    pending.append(include)
+        return seen
+
+    def variables(self, name: str) -> Set[str]:
+        """템플릿과 include 템플릿이 참조하는 컨텍스트 최상위 이름"""
+        names = set(self.get_template(name).variables)
+        for include in self.dependencies(name):
+            names |= self.get_template(include).variables
+        return names
+
+
+_default_engine: Optional[TemplateEngine] = None
+
+
+def default_engine() -> TemplateEngine:
+    """공용 엔진 (현재 디렉토리 templates/ 우선, 없으면 이 파일 옆 templates/)"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = TemplateEngine(["templates", Path(__file__).resolve().parent / "templates"])
+    return _default_engine
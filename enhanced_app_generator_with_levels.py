@@ -376,7 +376,7 @@ class _LevelSelectionScreenState extends State<LevelSelectionScreen> {{
 class Scientific{config['package_name'].title()}Program {{
 
   /// 레벨별 시작 값 설정
-  static Map<int, Map<String, dynamic>> get levelConfigs => {{
+  static const Map<int, Map<String, dynamic>> levelConfigs = {{
     1: {{ // 완전 초보자
       'startValue': {max_target // 20},
       'weeklyIncrease': 1.2,
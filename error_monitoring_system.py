@@ -16,11 +16,19 @@ import traceback
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-import subprocess
 import requests
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from async_command_runner import get_command_runner
+from flutter_analysis_cache import FlutterAnalysisCache, parse_analyze_output, format_diagnostics
+from log_tailer import LogTailer
+from error_signatures import ErrorSignatureCache, error_signature, normalize_error
+from error_triage import TriageBatcher
+from portfolio_health import PortfolioHealthRunner, list_app_dirs, print_health_report, record_health_report
+from metrics_store import MetricsStore
+from automation.slack_delivery import SlackDeliveryQueue
+
 load_dotenv()
 
 class ErrorMonitoringSystem:
@@ -32,15 +40,35 @@ class ErrorMonitoringSystem:
         self.notion_token = os.getenv('NOTION_API_TOKEN')
         self.notion_database_id = os.getenv('NOTION_DATABASE_ID')
 
-        # Slack 설정
+        # Slack 설정 (전송 큐: 속도 제한, 중복 억제, 몰린 알림 요약, 재시작 후 재전송)
         self.slack_webhook_url = os.getenv('SLACK_WEBHOOK_URL')
+        self.slack_delivery = SlackDeliveryQueue(self.slack_webhook_url, owner="monitor")
 
         # 오류 로그 폴더
         self.error_logs_dir = Path("error_logs")
         self.error_logs_dir.mkdir(exist_ok=True)
 
-        # 자동 수정 시도 히스토리
-        self.auto_fix_history = []
+        # 오류 보고/자동 수정/건강 체크 지표 (재시작 후에도 유지되는 시계열 저장소)
+        self.metrics = MetricsStore()
+
+        # flutter 명령은 공용 비동기 실행기로 (이벤트 루프 블로킹 방지)
+        self.command_runner = get_command_runner()
+
+        # 변경 없는 앱은 flutter analyze 결과 재사용
+        self.analysis_cache = FlutterAnalysisCache()
+
+        # 로그 파일은 지난 검사 이후 추가된 부분만 읽음
+        self.log_tailer = LogTailer()
+
+        # 같은 원인의 오류는 AI 분석 결과 재사용 (시그니처별 TTL 캐시)
+        self.signature_cache = ErrorSignatureCache()
+        self._pending_analyses: Dict[str, asyncio.Future] = {}
+
+        # 캐시에 없는 오류 여러 개는 한 번의 Gemini 요청으로 묶어서 분석
+        self.triage_batcher = TriageBatcher(self.model, self._request_ai_analysis)
+
+        # 앱 상태 체크는 앱 단위로 병렬 실행
+        self.health_runner = PortfolioHealthRunner()
 
     async def monitor_all_processes(self):
         """모든 백그라운드 프로세스 모니터링"""
@@ -61,22 +89,28 @@ class ErrorMonitoringSystem:
         ]
 
         await asyncio.gather(*monitoring_tasks)
+        self.metrics.flush()
+        self.signature_cache.flush()
 
     async def monitor_flutter_builds(self):
         """Flutter 빌드 오류 모니터링"""
 
-        flutter_apps_dir = Path("flutter_apps")
-        if not flutter_apps_dir.exists():
+        app_dirs = list_app_dirs("flutter_apps")
+        if not app_dirs:
             return
 
-        for app_dir in flutter_apps_dir.iterdir():
-            if app_dir.is_dir():
-                await self.check_flutter_app_health(app_dir)
+        report = await self.health_runner.run(app_dirs, self.check_flutter_app_health)
+        print_health_report(report)
+        record_health_report(self.metrics, report, "flutter_builds")
 
-    async def check_flutter_app_health(self, app_dir: Path):
-        """개별 Flutter 앱 상태 체크"""
+        stats = self.analysis_cache.get_stats()
+        print(f"🔎 분석 캐시: 적중 {stats['hits']} / 부분 {stats['partial']} / 미스 {stats['misses']}")
+
+    async def check_flutter_app_health(self, app_dir: Path) -> List[str]:
+        """개별 Flutter 앱 상태 체크 → 발견한 문제 목록 (통합 건강 리포트용, 각 문제는 여기서 보고)"""
 
         print(f"🔍 Flutter 앱 상태 체크: {app_dir.name}")
+        issues = []
 
         try:
             # pubspec.yaml 체크
@@ -89,42 +123,58 @@ class ErrorMonitoringSystem:
                     severity="High",
                     auto_fixable=True
                 )
-                return
-
-            # 의존성 체크
-            result = subprocess.run(
-                ["flutter", "pub", "get"],
-                cwd=app_dir,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode != 0:
-                await self.handle_flutter_dependency_error(app_dir, result.stderr)
-
-            # 분석 체크
-            result = subprocess.run(
-                ["flutter", "analyze"],
-                cwd=app_dir,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-
-            if result.returncode != 0:
-                await self.handle_flutter_analysis_error(app_dir, result.stdout)
-
-        except subprocess.TimeoutExpired:
-            await self.report_error(
-                error_type="Timeout",
-                app_name=app_dir.name,
-                description="Flutter 명령어 실행 시간 초과",
-                severity="Medium",
-                auto_fixable=False
-            )
+                return ["pubspec.yaml 누락"]
+
+            # lib/ 와 analysis_options.yaml / pubspec 이 그대로면 이전 진단 재사용 (이미 보고됨)
+            plan = self.analysis_cache.plan(app_dir)
+            self.analysis_cache.record(plan["mode"])
+            if plan["mode"] == "hit":
+                if plan.get("deleted"):
+                    # 참조되지 않는 파일만 삭제됨 - 분석 없이 해당 진단만 제거
+                    self.analysis_cache.update(app_dir, plan, {}, fatal=False)
+                    print(f"  ♻️ 삭제된 파일 {len(plan['deleted'])}개 진단 제거 - 이전 분석 결과 재사용")
+                else:
+                    print("  ♻️ 변경 없음 - 이전 분석 결과 재사용")
+                if self.analysis_cache.is_fatal(app_dir):
+                    diagnostics = self.analysis_cache.get_diagnostics(app_dir)
+                    issues.append(f"분석 오류 {sum(map(len, diagnostics.values()))}건 (변경 없음)")
+                return issues
+
+            # 의존성 체크 (pubspec 이 바뀌었거나 패키지 설정이 없을 때만)
+            if plan["deps_changed"] or not (app_dir / ".dart_tool" / "package_config.json").exists():
+                result = await self.command_runner.run(["flutter", "pub", "get"], cwd=app_dir, timeout=60)
+
+                if result.timed_out:
+                    await self.report_flutter_timeout(app_dir, result)
+                    return ["flutter pub get 타임아웃"]
+
+                if result.returncode != 0:
+                    issues.append("flutter pub get 실패")
+                    await self.handle_flutter_dependency_error(app_dir, result.stderr)
+
+                # pub get 이 pubspec.lock 을 갱신했을 수 있으므로 상태 다시 스캔
+                plan = {**self.analysis_cache.plan(app_dir), "mode": plan["mode"], "files": plan["files"]}
+
+            # 분석 체크 (partial 이면 바뀐 파일과 그 파일에 직간접적으로 의존하는 파일만)
+            if plan["mode"] == "partial":
+                print(f"  🔎 부분 분석: {len(plan['files'])}개 파일")
+            result = await self.command_runner.run(["flutter", "analyze"] + plan["files"], cwd=app_dir, timeout=120)
+
+            if result.timed_out:
+                await self.report_flutter_timeout(app_dir, result)
+                issues.append("flutter analyze 타임아웃")
+                return issues
+
+            self.analysis_cache.update(app_dir, plan, parse_analyze_output(result.stdout),
+                                       fatal=result.returncode != 0)
+
+            if self.analysis_cache.is_fatal(app_dir):
+                diagnostics = self.analysis_cache.get_diagnostics(app_dir)
+                issues.append(f"분석 오류 {sum(map(len, diagnostics.values()))}건")
+                await self.handle_flutter_analysis_error(app_dir, format_diagnostics(diagnostics) or result.stdout)
 
         except Exception as e:
+            issues.append(f"시스템 오류: {e}")
             await self.report_error(
                 error_type="System Error",
                 app_name=app_dir.name,
@@ -133,13 +183,39 @@ class ErrorMonitoringSystem:
                 auto_fixable=False
             )
 
+        return issues
+
+    async def handle_flutter_analysis_error(self, app_dir: Path, analysis_output: str):
+        """Flutter 정적 분석 오류 보고"""
+
+        print(f"⚠️ 분석 오류 감지: {app_dir.name}")
+
+        has_errors = any(line.strip().startswith("error") for line in analysis_output.splitlines())
+        await self.report_error(
+            error_type="Analysis Error",
+            app_name=app_dir.name,
+            description=analysis_output[:2000],
+            severity="High" if has_errors else "Medium",
+            auto_fixable=False
+        )
+
+    async def report_flutter_timeout(self, app_dir: Path, result):
+        """Flutter 명령 타임아웃 보고"""
+        await self.report_error(
+            error_type="Timeout",
+            app_name=app_dir.name,
+            description=f"Flutter 명령어 실행 시간 초과: {' '.join(result.command)} (로그: {result.log_file})",
+            severity="Medium",
+            auto_fixable=False
+        )
+
     async def handle_flutter_dependency_error(self, app_dir: Path, error_output: str):
         """Flutter 의존성 오류 처리"""
 
         print(f"⚠️ 의존성 오류 감지: {app_dir.name}")
 
         # AI를 사용해 오류 분석
-        analysis = await self.analyze_error_with_ai(error_output, "Flutter Dependency")
+        analysis = await self.analyze_error_with_ai(error_output, "Flutter Dependency", app_name=app_dir.name)
 
         if analysis.get("auto_fixable", False):
             fix_success = await self.attempt_dependency_fix(app_dir, analysis)
@@ -183,34 +259,27 @@ class ErrorMonitoringSystem:
             for fix_command in fixes:
                 print(f"🔧 수정 시도: {' '.join(fix_command)}")
 
-                result = subprocess.run(
-                    fix_command,
-                    cwd=app_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
+                result = await self.command_runner.run(fix_command, cwd=app_dir, timeout=120)
 
-                if result.returncode == 0:
+                if result.ok:
                     # 수정 후 다시 테스트
-                    test_result = subprocess.run(
-                        ["flutter", "pub", "get"],
-                        cwd=app_dir,
-                        capture_output=True,
-                        text=True,
-                        timeout=60
-                    )
-
-                    if test_result.returncode == 0:
-                        self.auto_fix_history.append({
+                    test_result = await self.command_runner.run(["flutter", "pub", "get"], cwd=app_dir, timeout=60)
+
+                    if test_result.ok:
+                        self.metrics.record("autofix.attempts", 1, {
                             "app": app_dir.name,
                             "issue": "dependency_error",
                             "fix": ' '.join(fix_command),
-                            "timestamp": datetime.now().isoformat(),
                             "success": True
                         })
                         return True
 
+            self.metrics.record("autofix.attempts", 1, {
+                "app": app_dir.name,
+                "issue": "dependency_error",
+                "fix": "none",
+                "success": False
+            })
             return False
 
         except Exception as e:
@@ -227,33 +296,27 @@ class ErrorMonitoringSystem:
             if log_file.stat().st_size > 0:
                 await self.check_python_log_errors(log_file)
 
+        # 다음 검사는 이번에 읽은 위치부터
+        self.log_tailer.save()
+
     async def check_python_log_errors(self, log_file: Path):
-        """Python 로그 파일에서 오류 확인"""
+        """Python 로그 파일에서 새로 추가된 오류 확인 (이미 보고한 줄은 다시 보고하지 않음)"""
 
         try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # 오류 패턴 감지
-            error_patterns = [
-                r"ERROR:.*",
-                r"Traceback.*",
-                r"Exception:.*",
-                r"Failed.*",
-                r"TimeoutError.*"
-            ]
+            matches = self.log_tailer.scan(log_file)
 
-            for pattern in error_patterns:
-                matches = re.findall(pattern, content, re.MULTILINE)
+            if matches:
+                description = "\n".join(matches[-3:])  # 최근 3개 오류
+                if len(matches) > 3:
+                    description += f"\n... 외 {len(matches) - 3}건"
 
-                if matches:
-                    await self.report_error(
-                        error_type="Python Script Error",
-                        app_name=log_file.stem,
-                        description="\n".join(matches[-3:]),  # 최근 3개 오류
-                        severity="Medium",
-                        auto_fixable=True
-                    )
+                await self.report_error(
+                    error_type="Python Script Error",
+                    app_name=log_file.stem,
+                    description=description,
+                    severity="Medium",
+                    auto_fixable=True
+                )
 
         except Exception as e:
             print(f"❌ 로그 파일 읽기 실패: {e}")
@@ -301,8 +364,8 @@ class ErrorMonitoringSystem:
 
         # Flutter 설치 체크
         try:
-            result = subprocess.run(["flutter", "--version"], capture_output=True, text=True)
-            if result.returncode != 0:
+            result = await self.command_runner.run(["flutter", "--version"], timeout=60)
+            if not result.ok:
                 await self.report_error(
                     error_type="Environment Error",
                     app_name="Flutter",
@@ -333,8 +396,108 @@ class ErrorMonitoringSystem:
                     auto_fixable=True
                 )
 
-    async def analyze_error_with_ai(self, error_message: str, error_type: str) -> Dict:
-        """AI를 사용한 오류 분석"""
+    @staticmethod
+    def known_app_names() -> List[str]:
+        """시그니처에서 지울 앱 이름 (flutter_apps/ 하위 디렉토리)"""
+        apps_dir = Path("flutter_apps")
+        if not apps_dir.is_dir():
+            return []
+        return [entry.name for entry in os.scandir(apps_dir) if entry.is_dir()]
+
+    def _record_signature(self, error_message: str, error_type: str, app_name: str = None,
+                          app_names: List[str] = None):
+        """오류 시그니처 계산 + 발생 기록 → (시그니처, 발생 횟수)"""
+        if app_names is None:
+            app_names = self.known_app_names()
+        app_names = app_names + ([app_name] if app_name else [])
+        signature = error_signature(error_message, error_type, app_names)
+        occurrence = self.signature_cache.record_occurrence(
+            signature, error_type, normalize_error(error_message, app_names), app_name)
+        return signature, occurrence["count"]
+
+    async def analyze_error_with_ai(self, error_message: str, error_type: str, app_name: str = None) -> Dict:
+        """AI를 사용한 오류 분석 (같은 시그니처의 오류는 캐시된 분석 재사용)"""
+
+        signature, occurrences = self._record_signature(error_message, error_type, app_name)
+
+        cached = self.signature_cache.lookup(signature)
+        if cached is None and signature in self._pending_analyses:
+            # 같은 오류를 이미 분석 중이면 그 결과를 기다림
+            cached = dict(await asyncio.shield(self._pending_analyses[signature]))
+
+        if cached is not None:
+            self.signature_cache.flush_if_due()
+            cached.update({"signature": signature, "occurrences": occurrences, "cached": True})
+            return cached
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_analyses[signature] = future
+        try:
+            analysis = await self._request_ai_analysis(error_message, error_type)
+            self.signature_cache.store(signature, analysis)
+            self.signature_cache.flush()
+            future.set_result(analysis)
+        finally:
+            del self._pending_analyses[signature]
+            if not future.done():
+                # 분석이 취소/실패하면 기다리던 쪽도 함께 취소
+                future.cancel()
+
+        return {**analysis, "signature": signature, "occurrences": occurrences, "cached": False}
+
+    async def analyze_errors_with_ai(self, errors: List[Dict]) -> List[Dict]:
+        """여러 오류 일괄 분석 (errors: [{message, error_type, app_name}], 결과는 입력 순서대로)
+
+        캐시된 시그니처는 바로 반환하고, 나머지는 시그니처별로 한 번씩만 배치 요청
+        """
+
+        app_names = self.known_app_names()
+        tracked = [self._record_signature(error["message"], error["error_type"], error.get("app_name"), app_names)
+                   for error in errors]
+
+        analyses: Dict[str, Dict] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        to_request: Dict[str, Dict] = {}
+        for error, (signature, _) in zip(errors, tracked):
+            if signature in analyses or signature in waiting or signature in to_request:
+                continue
+            cached = self.signature_cache.lookup(signature)
+            if cached is not None:
+                analyses[signature] = cached
+            elif signature in self._pending_analyses:
+                waiting[signature] = self._pending_analyses[signature]
+            else:
+                to_request[signature] = {"id": signature, "message": error["message"], "error_type": error["error_type"]}
+
+        loop = asyncio.get_running_loop()
+        futures = {signature: loop.create_future() for signature in to_request}
+        self._pending_analyses.update(futures)
+        try:
+            results = await self.triage_batcher.analyze(list(to_request.values()))
+            for signature, analysis in results.items():
+                self.signature_cache.store(signature, analysis)
+                futures[signature].set_result(analysis)
+        finally:
+            for signature, future in futures.items():
+                del self._pending_analyses[signature]
+                if not future.done():
+                    future.cancel()
+
+        # 발생 횟수는 배치당 한 번 (새 분석 결과가 있으면 바로) 저장
+        if results:
+            self.signature_cache.flush()
+        else:
+            self.signature_cache.flush_if_due()
+
+        for signature, future in waiting.items():
+            analyses[signature] = dict(await asyncio.shield(future))
+
+        return [{**(results.get(signature) or analyses[signature]), "signature": signature,
+                 "occurrences": occurrences, "cached": signature not in results}
+                for signature, occurrences in tracked]
+
+    async def _request_ai_analysis(self, error_message: str, error_type: str) -> Dict:
+        """Gemini 오류 분석 요청"""
 
         analysis_prompt = f"""
 다음 {error_type} 오류를 분석하고 해결 방법을 제시해주세요:
@@ -400,6 +563,12 @@ class ErrorMonitoringSystem:
 
         # 로컬 로그 저장
         await self.save_error_log(error_data)
+        self.metrics.record("errors.reported", 1, {
+            "type": error_type,
+            "app": app_name,
+            "severity": severity,
+            "auto_fixable": auto_fixable
+        })
 
         # Notion에 오류 기록
         await self.create_notion_error_entry(error_data)
@@ -658,12 +827,19 @@ class ErrorMonitoringSystem:
                     }
                 })
 
-            response = requests.post(self.slack_webhook_url, json=message)
+            signature = error_data['ai_analysis'].get('signature') or \
+                error_signature(error_data['description'], error_data['error_type'], [error_data['app_name']])
+            status = self.slack_delivery.enqueue(
+                message,
+                key=(error_data['error_type'], error_data['app_name'], signature),
+                summary=f"{emoji} {error_data['error_type']} - {error_data['app_name']}: {error_data['description'][:100]}",
+                critical=error_data['severity'] == "Critical"
+            )
 
-            if response.status_code == 200:
-                print("✅ Slack 알림 전송 완료")
+            if status == "queued":
+                print("✅ Slack 알림 전송 대기열 등록")
             else:
-                print(f"⚠️ Slack 알림 실패: {response.status_code}")
+                print("♻️ 같은 오류 알림이 최근 전송됨 - 생략")
 
         except Exception as e:
             print(f"❌ Slack 알림 전송 실패: {e}")
@@ -709,10 +885,11 @@ class ErrorMonitoringSystem:
                 ]
             }
 
-            response = requests.post(self.slack_webhook_url, json=message)
-
-            if response.status_code == 200:
-                print("✅ Slack 성공 알림 전송 완료")
+            self.slack_delivery.enqueue(
+                message,
+                key=("Auto-Fixed", success_data['app_name'], success_data['issue']),
+                summary=f"✅ 자동 수정 - {success_data['app_name']}: {success_data['issue']}"
+            )
 
         except Exception as e:
             print(f"❌ Slack 성공 알림 실패: {e}")
@@ -720,39 +897,37 @@ class ErrorMonitoringSystem:
     async def generate_daily_report(self):
         """일일 오류 리포트 생성"""
 
-        today = datetime.now().strftime('%Y-%m-%d')
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
 
-        # 오늘 발생한 오류들 수집
-        error_files = list(self.error_logs_dir.glob(f"error_{today.replace('-', '')}*.json"))
+        # 하루 한 번 보관 기간 적용 (원본 샘플/5분 롤업 삭제, 리포트는 1시간 롤업만 사용)
+        self.metrics.flush()
+        pruned = self.metrics.prune()
+        if any(pruned.values()):
+            print(f"🧹 오래된 지표 정리: 샘플 {pruned['samples']}개, 5분 롤업 {pruned['rollups_5m']}개")
 
-        if not error_files:
+        stats = self.collect_error_stats(start, now.timestamp())
+        if not stats["total_errors"]:
             print("📊 오늘 발생한 오류가 없습니다.")
             return
 
-        errors = []
-        for error_file in error_files:
-            with open(error_file, "r", encoding="utf-8") as f:
-                errors.append(json.load(f))
-
-        # 통계 생성
-        stats = {
-            "total_errors": len(errors),
-            "by_severity": {},
-            "by_type": {},
-            "auto_fixed": len([e for e in errors if e.get('status') == 'Auto-Fixed']),
-            "manual_required": len([e for e in errors if not e.get('auto_fixable', False)])
-        }
-
-        for error in errors:
-            severity = error.get('severity', 'Unknown')
-            error_type = error.get('error_type', 'Unknown')
-
-            stats['by_severity'][severity] = stats['by_severity'].get(severity, 0) + 1
-            stats['by_type'][error_type] = stats['by_type'].get(error_type, 0) + 1
-
         # Slack 일일 리포트 전송
         await self.send_daily_report_to_slack(stats, today)
 
+    def collect_error_stats(self, start: float, end: float) -> Dict:
+        """기간 내 오류/자동 수정 통계 (시계열 저장소의 시간 롤업 조회)"""
+
+        by_severity = self.metrics.summary("errors.reported", start, end, by="severity")
+        return {
+            "total_errors": by_severity["count"],
+            "by_severity": by_severity["by"],
+            "by_type": self.metrics.summary("errors.reported", start, end, by="type")["by"],
+            "auto_fixed": self.metrics.summary("autofix.attempts", start, end, where={"success": True})["count"],
+            "manual_required": self.metrics.summary("errors.reported", start, end,
+                                                    where={"auto_fixable": False})["count"]
+        }
+
     async def send_daily_report_to_slack(self, stats: Dict, date: str):
         """Slack 일일 리포트 전송"""
 
@@ -816,10 +991,8 @@ class ErrorMonitoringSystem:
                 ]
             }
 
-            response = requests.post(self.slack_webhook_url, json=message)
-
-            if response.status_code == 200:
-                print("✅ 일일 리포트 전송 완료")
+            self.slack_delivery.enqueue(message, digestible=False)
+            print("✅ 일일 리포트 전송 대기열 등록")
 
         except Exception as e:
             print(f"❌ 일일 리포트 전송 실패: {e}")
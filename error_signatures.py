@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧬 오류 시그니처
+오류 메시지/스택 트레이스에서 경로, 숫자, 시간, 앱 이름 등 실행마다 바뀌는 부분을 지워
+같은 원인의 오류가 같은 키를 갖도록 정규화하고, 키별 AI 분석 결과를 TTL 캐시로 보관
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+# 정규화 순서가 중요 (시간/ID → 경로 → 앱 이름 → 숫자)
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?|\b\d{1,2}:\d{2}:\d{2}(?:[.,]\d+)?\b")
+_UUID = re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b")
+_HEX = re.compile(r"\b0x[0-9a-fA-F]+\b|\b[0-9a-f]{12,}\b")
+_WINDOWS_PATH = re.compile(r"\b[A-Za-z]:[\\/][^\s'\"<>|:*?]+")
+_POSIX_PATH = re.compile(r"(?:~|\.{1,2})?(?:/[\w.\-@+]+)+/?|\b[\w.\-]+(?:/[\w.\-@+]+)+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)*\b")
+_SPACES = re.compile(r"[ \t]+")
+
+# 시그니처에 반영할 최대 줄 수 (긴 빌드 로그 뒤쪽은 대부분 반복)
+MAX_SIGNATURE_LINES = 40
+
+# 실패한 분석은 캐시하지 않음 (다음 발생 때 다시 시도)
+UNCACHEABLE_CATEGORIES = {"AI Analysis Failed"}
+
+
+def normalize_error(message: str, app_names: Iterable[str] = ()) -> str:
+    """실행마다 바뀌는 부분을 자리표시자로 바꾼 오류 텍스트"""
+    text = _TIMESTAMP.sub("<time>", message)
+    text = _UUID.sub("<id>", text)
+    text = _HEX.sub("<hex>", text)
+    text = _WINDOWS_PATH.sub("<path>", text)
+    text = _POSIX_PATH.sub("<path>", text)
+
+    for name in sorted({n for n in app_names if n}, key=len, reverse=True):
+        text = re.sub(rf"(?i)\b{re.escape(name)}\b", "<app>", text)
+
+    text = _NUMBER.sub("<n>", text)
+
+    lines = []
+    for line in text.splitlines():
+        line = _SPACES.sub(" ", line).strip()
+        # 빈 줄과 연속 중복 줄(반복되는 스택 프레임 등) 제거
+        if line and (not lines or lines[-1] != line):
+            lines.append(line)
+        if len(lines) >= MAX_SIGNATURE_LINES:
+            break
+    return "\n".join(lines)
+
+
+def error_signature(message: str, error_type: str = "", app_names: Iterable[str] = ()) -> str:
+    """정규화한 오류의 안정적인 키"""
+    normalized = normalize_error(message, app_names)
+    return hashlib.sha256(f"{error_type}\n{normalized}".encode("utf-8")).hexdigest()[:16]
+
+
+# 발생 횟수/통계는 메모리에서 갱신하고 이 간격으로 모아서 저장 (AI 분석 결과는 flush 로 즉시 저장)
+SAVE_INTERVAL = 30
+
+
+class ErrorSignatureCache:
+    """시그니처별 AI 분석 결과(TTL) + 발생 횟수"""
+
+    def __init__(self, cache_file: str = None, ttl_hours: float = 72):
+        if cache_file:
+            self.cache_file = Path(cache_file)
+        else:
+            self.cache_file = Path.home() / ".cache" / "app-factory" / "monitoring" / "error_signatures.json"
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = timedelta(hours=ttl_hours)
+
+        self._lock = threading.Lock()
+        self.data = self._load()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        atexit.register(self.flush)
+
+    def _load(self) -> Dict:
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data.setdefault("signatures", {})
+                data.setdefault("stats", {"hits": 0, "misses": 0})
+                return data
+            except Exception as e:
+                print(f"⚠️ 오류 시그니처 캐시 로드 실패: {e}")
+        return {"signatures": {}, "stats": {"hits": 0, "misses": 0}}
+
+    def _save(self):
+        tmp_file = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    def flush(self):
+        """메모리에만 반영된 변경 저장"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def flush_if_due(self):
+        """마지막 저장 후 SAVE_INTERVAL 이 지났을 때만 저장 (오류마다 호출해도 디스크 쓰기는 드묾)"""
+        if self._dirty and time.monotonic() - self._last_save >= SAVE_INTERVAL:
+            self.flush()
+
+    def record_occurrence(self, signature: str, error_type: str, normalized: str, app_name: str = None) -> Dict:
+        """발생 횟수/앱 기록 → 시그니처 항목"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            entry = self.data["signatures"].setdefault(signature, {
+                "error_type": error_type,
+                "sample": normalized[:500],
+                "first_seen": now,
+                "count": 0,
+                "apps": []
+            })
+            entry["count"] += 1
+            entry["last_seen"] = now
+            if app_name and app_name not in entry["apps"]:
+                entry["apps"].append(app_name)
+            self._dirty = True
+            return dict(entry)
+
+    def lookup(self, signature: str) -> Optional[Dict]:
+        """만료되지 않은 분석 결과 (없으면 None)"""
+        with self._lock:
+            entry = self.data["signatures"].get(signature)
+            analysis = entry.get("analysis") if entry else None
+            self._dirty = True
+            if analysis and datetime.now() - datetime.fromisoformat(entry["analyzed_at"]) < self.ttl:
+                self.data["stats"]["hits"] += 1
+                return dict(analysis)
+            self.data["stats"]["misses"] += 1
+            return None
+
+    def store(self, signature: str, analysis: Dict):
+        if analysis.get("error_category") in UNCACHEABLE_CATEGORIES:
+            return
+        with self._lock:
+            entry = self.data["signatures"].setdefault(signature, {"count": 0, "apps": []})
+            entry["analysis"] = analysis
+            entry["analyzed_at"] = datetime.now().isoformat()
+            self._dirty = True
+
+    def prune(self, max_age_days: int = 30) -> int:
+        """오래 발생하지 않은 시그니처 정리"""
+        cutoff = datetime.now() - timedelta(days=max_age_days)
+        with self._lock:
+            stale = [sig for sig, entry in self.data["signatures"].items()
+                     if datetime.fromisoformat(entry.get("last_seen", entry.get("analyzed_at"))) < cutoff]
+            for sig in stale:
+                del self.data["signatures"][sig]
+            if stale:
+                self._save()
+        return len(stale)
+
+    def top_signatures(self, limit: int = 10) -> List[Dict]:
+        """발생 횟수 상위 시그니처"""
+        with self._lock:
+            items = sorted(self.data["signatures"].items(), key=lambda item: item[1]["count"], reverse=True)
+            return [{"signature": sig, **{k: v for k, v in entry.items() if k != "analysis"}}
+                    for sig, entry in items[:limit]]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self.data["stats"])
+            total = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / total * 100, 1) if total else 0.0
+            stats["signatures"] = len(self.data["signatures"])
+        return stats
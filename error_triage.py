@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗂️ 오류 일괄 분류 (Triage)
+서로 다른 오류 여러 개를 하나의 구조화된 프롬프트로 묶어 Gemini 에 한 번만 요청하고,
+오류별 JSON 결과를 파싱 (파싱 실패/누락된 오류만 개별 요청으로 재시도)
+배치는 오류 개수와 토큰 예산 둘 다로 제한
+"""
+
+import re
+import json
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+# 배치 하나에 넣을 최대 오류 수 / 토큰 예산 (프롬프트 + 오류 본문 추정치)
+MAX_BATCH_SIZE = 8
+TOKEN_BUDGET = 6000
+# 오류 하나가 배치를 독차지하지 않도록 본문은 이 토큰 수까지만 포함
+MAX_ITEM_TOKENS = 1200
+
+ANALYSIS_FIELDS = {
+    "error_category": "오류 카테고리",
+    "severity": "Low/Medium/High/Critical",
+    "auto_fixable": "true/false",
+    "fix_description": "수정 방법 설명",
+    "manual_steps": ["수동으로 해야할 단계들"],
+    "prevention": "예방 방법",
+    "estimated_fix_time": "예상 수정 시간"
+}
+REQUIRED_FIELDS = ("error_category", "severity", "auto_fixable")
+
+_PROMPT_HEADER = """다음 오류 {count}개를 각각 분석하고 해결 방법을 제시해주세요.
+오류마다 id 를 그대로 포함한 JSON 배열 하나로만 답해주세요 (설명 문장 없이):
+[
+  {{"id": "E1", {fields}}}
+]
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (영문 ~4자, 한글 ~1-2자 = 1토큰 → 3자로 보수적으로 계산)"""
+    return len(text) // 3 + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * 3
+    if len(text) <= max_chars:
+        return text
+    # 오류 원인은 보통 앞부분(메시지)과 끝부분(마지막 프레임)에 있음
+    half = max_chars // 2
+    return f"{text[:half]}\n... (중략) ...\n{text[-half:]}"
+
+
+def _prompt_header(count: int) -> str:
+    fields = ", ".join(f'"{name}": {json.dumps(example, ensure_ascii=False)}'
+                       for name, example in ANALYSIS_FIELDS.items())
+    return _PROMPT_HEADER.format(count=count, fields=fields)
+
+
+def pack_batches(items: List[Dict], max_batch_size: int = MAX_BATCH_SIZE,
+                 token_budget: int = TOKEN_BUDGET, max_item_tokens: int = MAX_ITEM_TOKENS) -> List[List[Dict]]:
+    """items({id, error_type, message})를 개수/토큰 예산 안에서 순서대로 배치로 나눔"""
+    overhead = estimate_tokens(_prompt_header(max_batch_size))
+    batches: List[List[Dict]] = []
+    current: List[Dict] = []
+    used = overhead
+
+    for item in items:
+        message = truncate_to_tokens(item["message"], max_item_tokens)
+        cost = estimate_tokens(message) + estimate_tokens(item["error_type"]) + 10
+        if current and (len(current) >= max_batch_size or used + cost > token_budget):
+            batches.append(current)
+            current, used = [], overhead
+        current.append({**item, "message": message})
+        used += cost
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_batch_prompt(batch: List[Dict]) -> str:
+    """프롬프트 안에서는 짧은 id(E1, E2, ...)로 오류를 구분"""
+    sections = [_prompt_header(len(batch))]
+    for index, item in enumerate(batch, 1):
+        sections.append(f"### id: E{index} ({item['error_type']})\n{item['message']}\n")
+    return "\n".join(sections)
+
+
+def parse_batch_response(text: str, expected_ids: List[str]) -> Dict[str, Dict]:
+    """응답에서 {id: 분석} 추출 (형식이 맞지 않는 항목은 제외)"""
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        return {}
+    try:
+        results = json.loads(match.group())
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(results, list):
+        return {}
+
+    expected = set(expected_ids)
+    parsed: Dict[str, Dict] = {}
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        item_id = str(result.pop("id", ""))
+        if item_id in expected and all(field in result for field in REQUIRED_FIELDS):
+            parsed[item_id] = result
+    return parsed
+
+
+class TriageBatcher:
+    """여러 오류를 배치 프롬프트로 분석, 실패한 항목은 single_analyzer 로 개별 분석"""
+
+    def __init__(self, model, single_analyzer: Callable[[str, str], Awaitable[Dict]],
+                 max_batch_size: int = MAX_BATCH_SIZE, token_budget: int = TOKEN_BUDGET,
+                 max_item_tokens: int = MAX_ITEM_TOKENS):
+        self.model = model
+        self.single_analyzer = single_analyzer
+        self.max_batch_size = max_batch_size
+        self.token_budget = token_budget
+        self.max_item_tokens = max(1, min(max_item_tokens, token_budget // 2))
+
+        self.stats = {"batch_calls": 0, "batched_items": 0, "fallback_calls": 0}
+
+    async def _analyze_batch(self, batch: List[Dict]) -> Dict[str, Dict]:
+        if len(batch) == 1:
+            item = batch[0]
+            self.stats["fallback_calls"] += 1
+            return {item["id"]: await self.single_analyzer(item["message"], item["error_type"])}
+
+        parsed: Dict[str, Dict] = {}
+        try:
+            self.stats["batch_calls"] += 1
+            response = await self.model.generate_content_async(build_batch_prompt(batch))
+            local_ids = [f"E{index}" for index in range(1, len(batch) + 1)]
+            by_local_id = parse_batch_response(response.text, local_ids)
+            parsed = {item["id"]: by_local_id[local_id]
+                      for item, local_id in zip(batch, local_ids) if local_id in by_local_id}
+        except Exception as e:
+            print(f"⚠️ 일괄 분석 실패 ({len(batch)}개) - 개별 분석으로 전환: {e}")
+        self.stats["batched_items"] += len(parsed)
+
+        missing = [item for item in batch if item["id"] not in parsed]
+        if missing:
+            self.stats["fallback_calls"] += len(missing)
+            results = await asyncio.gather(*(self.single_analyzer(item["message"], item["error_type"])
+                                             for item in missing))
+            parsed.update({item["id"]: result for item, result in zip(missing, results)})
+        return parsed
+
+    async def analyze(self, items: List[Dict]) -> Dict[str, Dict]:
+        """items({id, error_type, message}) → {id: 분석} (id 는 호출 측에서 중복 없이 지정)"""
+        if not items:
+            return {}
+        batches = pack_batches(items, self.max_batch_size, self.token_budget, self.max_item_tokens)
+        results: Dict[str, Dict] = {}
+        for batch_results in await asyncio.gather(*(self._analyze_batch(batch) for batch in batches)):
+            results.update(batch_results)
+        return results
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats)
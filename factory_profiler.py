@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔥 팩토리 실행 프로파일러
+모든 진입점에서 --profile (또는 APP_FACTORY_PROFILE 환경 변수) 로 켜는 샘플링 프로파일러
+- 기본: SIGPROF/setitimer 기반 스택 샘플러 (CPU 시간 기준, 오버헤드 낮음)
+  --profile=wall 은 대기 시간까지 포함한 실제 경과 시간 기준 (SIGALRM)
+- 신호 타이머가 없는 환경(Windows 등)이나 --profile=cprofile 은 cProfile 로 대체
+- 결과: profiles/<이름>_<시각>/ 에 flame graph 용 collapsed stacks + self time 상위 N 표
+- asyncio 태스크 안의 샘플은 태스크 이름과 로그 컨텍스트(app/stage) 아래로 묶음
+"""
+
+import os
+import sys
+import time
+import json
+import signal
+import asyncio
+import inspect
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from automation.logging_setup import app_id_var, stage_var
+
+PROFILE_ENV = "APP_FACTORY_PROFILE"
+PROFILE_DIR_ENV = "APP_FACTORY_PROFILE_DIR"
+MODES = ("cpu", "wall", "cprofile")
+SAMPLE_INTERVAL = 0.005
+MAX_STACK_DEPTH = 128
+TOP_N = 30
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """신호 타이머로 주기적으로 메인 스레드 스택을 기록"""
+
+    TIMERS = {"cpu": ("ITIMER_PROF", "SIGPROF"), "wall": ("ITIMER_REAL", "SIGALRM")}
+
+    def __init__(self, mode: str = "cpu", interval: float = SAMPLE_INTERVAL):
+        self.mode = mode
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.handler_seconds = 0.0
+        self._previous_handler = None
+        timer_name, signal_name = self.TIMERS[mode]
+        self._timer = getattr(signal, timer_name)
+        self._signal = getattr(signal, signal_name)
+
+    @classmethod
+    def available(cls, mode: str) -> bool:
+        if mode not in cls.TIMERS or not hasattr(signal, "setitimer"):
+            return False
+        import threading
+        return threading.current_thread() is threading.main_thread()
+
+    def _task_prefix(self) -> List[str]:
+        """실행 중인 asyncio 태스크 + 로그 컨텍스트 (신호 처리기는 중단된 태스크의 컨텍스트에서 실행됨)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return []
+        prefix = []
+        task = asyncio.current_task(loop)
+        if task is not None:
+            prefix.append(f"task:{task.get_name()}")
+        app_id, stage = app_id_var.get(), stage_var.get()
+        if app_id:
+            prefix.append(f"app:{app_id}")
+        if stage:
+            prefix.append(f"stage:{stage}")
+        return prefix
+
+    def _handle(self, signum, frame):
+        started = time.perf_counter()
+        stack = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        stack.reverse()
+        self.samples[";".join(self._task_prefix() + stack)] += 1
+        self.sample_count += 1
+        self.handler_seconds += time.perf_counter() - started
+
+    def start(self):
+        self._previous_handler = signal.signal(self._signal, self._handle)
+        signal.setitimer(self._timer, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(self._timer, 0, 0)
+        signal.signal(self._signal, self._previous_handler or signal.SIG_DFL)
+
+    def collapsed(self) -> List[str]:
+        """flamegraph.pl / speedscope 입력 형식"""
+        return [f"{stack} {count}" for stack, count in self.samples.most_common()]
+
+    def self_time_table(self, top_n: int = TOP_N) -> List[Tuple[str, int, int]]:
+        """(함수, self 샘플, 포함 샘플) 상위 N"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.samples.items():
+            frames = [name for name in stack.split(";") if not name.startswith(("task:", "app:", "stage:"))]
+            if not frames:
+                continue
+            self_counts[frames[-1]] += count
+            for name in set(frames):
+                total_counts[name] += count
+        return [(name, count, total_counts[name]) for name, count in self_counts.most_common(top_n)]
+
+    def owner_table(self) -> List[Tuple[str, int]]:
+        """태스크/단계별 샘플 수"""
+        owners: Counter = Counter()
+        for stack, count in self.samples.items():
+            prefix = [name for name in stack.split(";") if name.startswith(("task:", "app:", "stage:"))]
+            owners[" / ".join(prefix) or "(동기 코드)"] += count
+        return owners.most_common()
+
+
+class FactoryProfiler:
+    """진입점 하나의 실행을 프로파일링하고 결과 파일 작성"""
+
+    def __init__(self, name: str, mode: str = "cpu", output_dir: str = None,
+                 interval: float = SAMPLE_INTERVAL, top_n: int = TOP_N):
+        if mode != "cprofile" and not StackSampler.available(mode):
+            print("⚠️ 신호 기반 샘플링을 쓸 수 없는 환경 - cProfile 로 대체")
+            mode = "cprofile"
+        self.name = name
+        self.mode = mode
+        self.interval = interval
+        self.top_n = top_n
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        root = Path(output_dir or os.getenv(PROFILE_DIR_ENV, "profiles"))
+        self.output_dir = root / f"{name}_{stamp}"
+
+        self.sampler: Optional[StackSampler] = None
+        self.cprofile = None
+        self.started = 0.0
+
+    def start(self):
+        self.started = time.perf_counter()
+        if self.mode == "cprofile":
+            import cProfile
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+        else:
+            self.sampler = StackSampler(self.mode, self.interval)
+            self.sampler.start()
+
+    def stop(self) -> Path:
+        elapsed = time.perf_counter() - self.started
+        if self.cprofile:
+            self.cprofile.disable()
+        if self.sampler:
+            self.sampler.stop()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary = {"name": self.name, "mode": self.mode, "elapsed_seconds": round(elapsed, 3),
+                   "argv": sys.argv, "created": datetime.now().isoformat()}
+
+        if self.sampler:
+            self._write_sampler_report(summary)
+        else:
+            self._write_cprofile_report(summary)
+
+        with open(self.output_dir / "summary.json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+        print(f"🔥 프로파일 저장: {self.output_dir} ({summary['elapsed_seconds']:.1f}초, {self.mode})")
+        return self.output_dir
+
+    def _write_sampler_report(self, summary: Dict):
+        sampler = self.sampler
+        (self.output_dir / "stacks.collapsed").write_text("\n".join(sampler.collapsed()) + "\n", encoding="utf-8")
+
+        total = max(sampler.sample_count, 1)
+        lines = [f"{self.name} - {sampler.sample_count} samples @ {self.interval * 1000:.1f}ms ({self.mode})", "",
+                 f"{'self%':>7} {'total%':>7}  function"]
+        for name, self_count, total_count in sampler.self_time_table(self.top_n):
+            lines.append(f"{self_count / total * 100:6.1f}% {total_count / total * 100:6.1f}%  {name}")
+        lines += ["", "태스크/단계별:"]
+        for owner, count in sampler.owner_table():
+            lines.append(f"{count / total * 100:6.1f}%  {owner}")
+        (self.output_dir / "top.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        summary.update({
+            "samples": sampler.sample_count,
+            "interval_ms": self.interval * 1000,
+            "sampler_overhead_ms": round(sampler.handler_seconds * 1000, 1),
+            "top": [{"function": name, "self_samples": self_count, "total_samples": total_count}
+                    for name, self_count, total_count in sampler.self_time_table(self.top_n)]
+        })
+
+    def _write_cprofile_report(self, summary: Dict):
+        import io
+        import pstats
+
+        self.cprofile.dump_stats(str(self.output_dir / "profile.prof"))
+        stream = io.StringIO()
+        stats = pstats.Stats(self.cprofile, stream=stream)
+        stats.sort_stats("tottime").print_stats(self.top_n)
+        (self.output_dir / "top.txt").write_text(stream.getvalue(), encoding="utf-8")
+        summary["note"] = "cProfile 모드는 collapsed stacks 대신 profile.prof (snakeviz 등으로 확인)"
+
+
+def profile_mode_from_args(argv: List[str] = None) -> Optional[str]:
+    """--profile[=cpu|wall|cprofile] 을 argv 에서 제거하고 모드 반환 (없으면 환경 변수 확인)
+
+    진입점의 argparse 가 모르는 옵션으로 실패하지 않도록 먼저 꺼냄
+    """
+    argv = sys.argv if argv is None else argv
+    mode = None
+    for arg in list(argv[1:]):
+        if arg == "--profile" or arg.startswith("--profile="):
+            argv.remove(arg)
+            mode = arg.partition("=")[2] or "cpu"
+
+    if mode is None:
+        value = os.getenv(PROFILE_ENV, "").strip().lower()
+        if value and value not in ("0", "false", "no"):
+            mode = value if value in MODES else "cpu"
+
+    if mode is not None and mode not in MODES:
+        print(f"⚠️ 알 수 없는 프로파일 모드 '{mode}' - cpu 사용 ({', '.join(MODES)})")
+        mode = "cpu"
+    return mode
+
+
+def run_entry_point(main: Callable, name: str = None):
+    """진입점 실행 (main 이 코루틴 함수면 asyncio.run) - 프로파일 옵션이 있으면 감싸서 실행"""
+    name = name or Path(sys.argv[0]).stem or "factory"
+    mode = profile_mode_from_args()
+
+    def invoke():
+        return asyncio.run(main()) if inspect.iscoroutinefunction(main) else main()
+
+    if mode is None:
+        return invoke()
+
+    profiler = FactoryProfiler(name, mode)
+    profiler.start()
+    try:
+        return invoke()
+    finally:
+        profiler.stop()
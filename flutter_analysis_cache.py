@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔎 flutter analyze 결과 캐시
+lib/ 파일별 해시 + analysis_options.yaml / pubspec.lock 해시로 앱 상태를 기록해
+변경 없는 앱은 이전 진단을 재사용하고, 바뀐 파일(과 그 파일에 직간접적으로 의존하는 파일)만 다시 분석
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+# 바뀌면 전체 재분석이 필요한 설정 파일
+CONFIG_FILES = ["analysis_options.yaml", "pubspec.lock", "pubspec.yaml"]
+
+# 바뀐 파일이 전체의 이 비율을 넘으면 부분 분석 대신 전체 분석
+PARTIAL_ANALYSIS_RATIO = 0.5
+
+# `  error • Undefined name 'x' • lib/main.dart:10:5 • undefined_identifier`
+DIAGNOSTIC_PATTERN = re.compile(
+    r"^\s*(error|warning|info)\s+[•-]\s+(.+?)\s+[•-]\s+(\S+?):(\d+):(\d+)\s+[•-]\s+(\S+)\s*$"
+)
+IMPORT_PATTERN = re.compile(r"""^\s*(?:import|export|part)\s+['"]([^'"]+)['"]""", re.MULTILINE)
+
+
+def parse_analyze_output(output: str) -> Dict[str, List[Dict]]:
+    """flutter analyze 출력 → {파일: [진단]}"""
+    diagnostics: Dict[str, List[Dict]] = {}
+    for line in output.splitlines():
+        match = DIAGNOSTIC_PATTERN.match(line)
+        if not match:
+            continue
+        severity, message, file_path, line_no, column, code = match.groups()
+        diagnostics.setdefault(file_path.replace("\\", "/"), []).append({
+            "severity": severity,
+            "message": message,
+            "line": int(line_no),
+            "column": int(column),
+            "code": code
+        })
+    return diagnostics
+
+
+def format_diagnostics(diagnostics: Dict[str, List[Dict]]) -> str:
+    """진단을 flutter analyze 출력 형식으로 복원 (오류 보고용)"""
+    lines = []
+    for file_path in sorted(diagnostics):
+        for item in diagnostics[file_path]:
+            lines.append(f"  {item['severity']} • {item['message']} • "
+                         f"{file_path}:{item['line']}:{item['column']} • {item['code']}")
+    return "\n".join(lines)
+
+
+class FlutterAnalysisCache:
+    """앱별 분석 상태/진단 캐시"""
+
+    def __init__(self, cache_file: str = None):
+        if cache_file:
+            self.cache_file = Path(cache_file)
+        else:
+            self.cache_file = Path.home() / ".cache" / "app-factory" / "analysis" / "analysis_cache.json"
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self) -> Dict:
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data.setdefault("apps", {})
+                data.setdefault("stats", {"hits": 0, "partial": 0, "misses": 0})
+                return data
+            except Exception as e:
+                print(f"⚠️ 분석 캐시 로드 실패: {e}")
+        return {"apps": {}, "stats": {"hits": 0, "partial": 0, "misses": 0}}
+
+    def _save(self):
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+
+    @staticmethod
+    def _app_key(app_dir: Path) -> str:
+        return str(Path(app_dir).resolve())
+
+    def scan(self, app_dir: Path) -> Dict:
+        """현재 앱 상태 (설정 해시 + lib/ 파일별 해시)
+
+        이전 스캔과 크기/mtime 이 같은 파일은 다시 읽지 않음
+        """
+        app_dir = Path(app_dir)
+        previous = self.data["apps"].get(self._app_key(app_dir), {}).get("files", {})
+
+        config_digest = hashlib.sha256()
+        for name in CONFIG_FILES:
+            path = app_dir / name
+            config_digest.update(name.encode())
+            if path.exists():
+                config_digest.update(path.read_bytes())
+
+        files = {}
+        lib_dir = app_dir / "lib"
+        if lib_dir.is_dir():
+            for current, _, names in os.walk(lib_dir):
+                for name in names:
+                    if not name.endswith(".dart"):
+                        continue
+                    path = Path(current) / name
+                    relative = path.relative_to(app_dir).as_posix()
+                    stat = path.stat()
+                    entry = previous.get(relative)
+                    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                        files[relative] = entry
+                    else:
+                        files[relative] = {
+                            "size": stat.st_size,
+                            "mtime_ns": stat.st_mtime_ns,
+                            "sha256": hashlib.sha256(path.read_bytes()).hexdigest()
+                        }
+
+        return {"config_hash": config_digest.hexdigest(), "files": files}
+
+    @staticmethod
+    def _package_name(app_dir: Path) -> Optional[str]:
+        pubspec = Path(app_dir) / "pubspec.yaml"
+        if pubspec.exists():
+            match = re.search(r"^name:\s*(\S+)", pubspec.read_text(encoding="utf-8"), re.MULTILINE)
+            if match:
+                return match.group(1)
+        return None
+
+    def _importers(self, app_dir: Path, targets: Set[str], files: List[str]) -> Set[str]:
+        """targets 에 의존하는 lib/ 파일 - import/export/part 를 따라 간접 의존까지 포함
+
+        A 의 시그니처가 바뀌면 A 를 import 하는 B 뿐 아니라 B 를 import 하는 C 의 진단도 달라질 수 있음
+        """
+        package_prefix = f"package:{self._package_name(app_dir)}/"
+        dependents: Dict[str, Set[str]] = {}
+        for relative in files:
+            path = Path(app_dir) / relative
+            try:
+                source = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            for uri in IMPORT_PATTERN.findall(source):
+                if uri.startswith(package_prefix):
+                    resolved = "lib/" + uri[len(package_prefix):]
+                elif ":" in uri:
+                    continue
+                else:
+                    resolved = os.path.normpath(os.path.join(os.path.dirname(relative), uri)).replace("\\", "/")
+                dependents.setdefault(resolved, set()).add(relative)
+
+        importers = set()
+        pending = list(targets)
+        while pending:
+            for relative in dependents.get(pending.pop(), ()):
+                if relative not in importers:
+                    importers.add(relative)
+                    pending.append(relative)
+        return importers
+
+    def plan(self, app_dir: Path) -> Dict:
+        """분석 계획: hit(재사용) / partial(일부 파일) / full(전체)
+
+        hit 이어도 "deleted" 가 있으면 삭제된 파일의 진단만 버리도록 update(plan, {}) 호출 필요
+        """
+        app_dir = Path(app_dir)
+        state = self.scan(app_dir)
+        cached = self.data["apps"].get(self._app_key(app_dir))
+
+        if not cached or cached.get("config_hash") != state["config_hash"]:
+            return {"mode": "full", "files": [], "state": state, "deps_changed": True}
+
+        old_files = cached["files"]
+        new_files = state["files"]
+        changed = {f for f, entry in new_files.items()
+                   if f not in old_files or old_files[f]["sha256"] != entry["sha256"]}
+        deleted = set(old_files) - set(new_files)
+
+        if not changed and not deleted:
+            return {"mode": "hit", "files": [], "state": state, "deps_changed": False}
+
+        # 바뀐/삭제된 파일을 참조하는 파일도 진단이 달라질 수 있음
+        targets = self._importers(app_dir, changed | deleted, sorted(new_files)) | changed
+        if not targets:
+            # 아무도 import 하지 않는 파일만 삭제됨 - 다시 분석할 파일 없음 (빈 인자로 analyze 하면 앱 전체 분석)
+            return {"mode": "hit", "files": [], "state": state, "deps_changed": False, "deleted": sorted(deleted)}
+        if len(targets) > len(new_files) * PARTIAL_ANALYSIS_RATIO:
+            return {"mode": "full", "files": [], "state": state, "deps_changed": False}
+
+        return {"mode": "partial", "files": sorted(targets), "state": state, "deps_changed": False}
+
+    def get_diagnostics(self, app_dir: Path) -> Dict[str, List[Dict]]:
+        cached = self.data["apps"].get(self._app_key(app_dir))
+        return cached["diagnostics"] if cached else {}
+
+    def update(self, app_dir: Path, plan: Dict, diagnostics: Dict[str, List[Dict]], fatal: bool):
+        """분석 결과 반영 (partial 이면 분석한 파일의 진단만 교체, hit 이면 삭제된 파일 진단만 제거)"""
+        key = self._app_key(app_dir)
+        with self._lock:
+            cached = self.data["apps"].get(key)
+            if plan["mode"] in ("partial", "hit") and cached:
+                # 삭제된 lib/ 파일의 진단은 버리고, test/ 등 lib 밖 진단은 유지
+                merged = {f: d for f, d in cached["diagnostics"].items()
+                          if f not in plan["files"] and (f in plan["state"]["files"] or not f.startswith("lib/"))}
+                merged.update({f: d for f, d in diagnostics.items() if f in plan["files"]})
+                # 부분 분석의 종료 코드는 일부 파일 기준이므로 남은 진단까지 포함해 판단
+                # (flutter analyze 는 기본적으로 info 도 실패로 처리)
+                fatal = fatal or any(merged.values())
+                diagnostics = merged
+
+            self.data["apps"][key] = {
+                "app": Path(app_dir).name,
+                "config_hash": plan["state"]["config_hash"],
+                "files": plan["state"]["files"],
+                "diagnostics": diagnostics,
+                "fatal": fatal,
+                "analyzed_at": datetime.now().isoformat()
+            }
+            self._save()
+
+    def record(self, mode: str):
+        """적중/부분/미스 통계"""
+        with self._lock:
+            name = {"hit": "hits", "partial": "partial"}.get(mode, "misses")
+            self.data["stats"][name] += 1
+            self._save()
+
+    def is_fatal(self, app_dir: Path) -> bool:
+        cached = self.data["apps"].get(self._app_key(app_dir))
+        return bool(cached and cached.get("fatal"))
+
+    def get_stats(self) -> Dict:
+        stats = dict(self.data["stats"])
+        total = stats["hits"] + stats["partial"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total * 100, 1) if total else 0.0
+        stats["apps"] = len(self.data["apps"])
+        return stats
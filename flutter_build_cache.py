@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📦 Flutter 증분 빌드 캐시
+lib/, pubspec.yaml/pubspec.lock, assets/, android/ 내용 해시 + Flutter SDK 버전으로 빌드 입력 지문을 만들고
+같은 지문의 APK가 있으면 내용 주소(content-addressed) 아티팩트 저장소에서 복원
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+import subprocess
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+# 지문에 포함되는 빌드 입력
+FINGERPRINT_FILES = ["pubspec.yaml", "pubspec.lock"]
+FINGERPRINT_DIRS = ["lib", "assets", "android"]
+
+# 빌드 산출물/머신별 파일은 지문에서 제외
+EXCLUDED_DIRS = {"build", ".gradle", ".cxx", ".idea", ".dart_tool"}
+EXCLUDED_FILES = {"local.properties", ".DS_Store"}
+
+# SDK 루트 기준 버전 파일 (flutter upgrade / 채널 변경 시 바뀜)
+TOOLCHAIN_VERSION_FILES = ["bin/cache/flutter.version.json", "version", "bin/cache/dart-sdk/version"]
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FlutterBuildCache:
+    """빌드 입력 지문 → APK 아티팩트 캐시"""
+
+    def __init__(self, cache_dir: str = None, max_age_days: int = 30, keep_per_app: int = 6):
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path.home() / ".cache" / "app-factory" / "builds"
+
+        self.objects_dir = self.cache_dir / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / "build_cache.json"
+
+        self.max_age_days = max_age_days
+        self.keep_per_app = keep_per_app
+
+        # 병렬 빌드 워커들이 함께 쓰므로 인덱스 접근은 잠금
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+
+        # 버전 파일이 없는 SDK 의 `flutter --version --machine` 결과 (실행 파일 경로별)
+        self._machine_versions: Dict[str, str] = {}
+
+    def _load_index(self) -> Dict:
+        """캐시 인덱스 로드"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                index.setdefault("artifacts", {})
+                index.setdefault("file_hashes", {})
+                index.setdefault("stats", {"hits": 0, "misses": 0, "stores": 0})
+                return index
+            except Exception as e:
+                print(f"⚠️ 빌드 캐시 인덱스 로드 실패: {e}")
+        return {"artifacts": {}, "file_hashes": {}, "stats": {"hits": 0, "misses": 0, "stores": 0}}
+
+    def _save_index(self):
+        """캐시 인덱스 저장 (원자적 교체)"""
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.index_file)
+
+    def _iter_input_files(self, app_path: Path) -> List[Path]:
+        """지문 대상 파일 목록 (정렬)"""
+        files = [app_path / name for name in FINGERPRINT_FILES if (app_path / name).is_file()]
+
+        for dir_name in FINGERPRINT_DIRS:
+            root_dir = app_path / dir_name
+            if not root_dir.is_dir():
+                continue
+            for current, dirs, names in os.walk(root_dir):
+                dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+                files.extend(Path(current) / name for name in names if name not in EXCLUDED_FILES)
+
+        return sorted(files)
+
+    def _cached_file_hash(self, path: Path) -> str:
+        """크기/mtime이 같으면 저장된 해시 재사용 (변경된 파일만 다시 읽음)"""
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = self.index["file_hashes"].get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        sha256 = _file_sha256(path)
+        self.index["file_hashes"][key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        return sha256
+
+    def _machine_version(self, flutter_bin: str) -> Optional[str]:
+        """`flutter --version --machine` 출력 (실패하면 None)"""
+        with self._lock:
+            cached = self._machine_versions.get(flutter_bin)
+        if cached:
+            return cached
+
+        try:
+            completed = subprocess.run([flutter_bin, "--version", "--machine"], capture_output=True,
+                                       text=True, timeout=120, stdin=subprocess.DEVNULL)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"⚠️ Flutter 버전 확인 실패: {e}")
+            return None
+        if completed.returncode != 0 or not completed.stdout.strip():
+            print(f"⚠️ Flutter 버전 확인 실패 (종료 코드 {completed.returncode})")
+            return None
+
+        with self._lock:
+            self._machine_versions[flutter_bin] = completed.stdout.strip()
+        return completed.stdout.strip()
+
+    def toolchain_identity(self, flutter_bin: str) -> Optional[str]:
+        """Flutter/Dart SDK 식별자 - flutter 실행 파일 실제 경로 + SDK 버전 (알 수 없으면 None)"""
+        resolved = shutil.which(flutter_bin)
+        if not resolved:
+            return None
+        resolved = os.path.realpath(resolved)
+
+        # <SDK>/bin/flutter → SDK 루트의 버전 파일 (없으면 flutter 에 직접 질의)
+        sdk_root = Path(resolved).parent.parent
+        parts = [resolved]
+        for name in TOOLCHAIN_VERSION_FILES:
+            path = sdk_root / name
+            if path.is_file():
+                parts.append(f"{name}={path.read_text(encoding='utf-8', errors='replace').strip()}")
+        if len(parts) == 1:
+            machine_version = self._machine_version(resolved)
+            if machine_version is None:
+                return None
+            parts.append(machine_version)
+
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def fingerprint(self, app_path: Path, build_args: List[str], toolchain: str = "") -> str:
+        """빌드 입력 + 빌드 옵션 + SDK(toolchain_identity) 지문"""
+        app_path = Path(app_path)
+        digest = hashlib.sha256(f"{toolchain}\n{' '.join(build_args)}".encode())
+
+        files = self._iter_input_files(app_path)
+        with self._lock:
+            for path in files:
+                relative = path.relative_to(app_path).as_posix()
+                digest.update(f"{relative}|{self._cached_file_hash(path)}\n".encode())
+
+        return digest.hexdigest()
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.apk"
+
+    def restore(self, fingerprint: str, app_name: str, destination: Path) -> Optional[Dict]:
+        """지문이 일치하는 APK를 destination으로 복원 (없으면 None)"""
+        with self._lock:
+            entry = self.index["artifacts"].get(fingerprint)
+            object_path = self._object_path(entry["sha256"]) if entry else None
+
+            if not entry or not object_path.exists():
+                self.index["stats"]["misses"] += 1
+                self._save_index()
+                return None
+
+            entry["last_used"] = datetime.now().isoformat()
+            self.index["stats"]["hits"] += 1
+            self._save_index()
+
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(object_path, destination)
+        print(f"  ♻️ 빌드 캐시 적중: {app_name} ({fingerprint[:12]})")
+        return entry
+
+    def store(self, fingerprint: str, app_name: str, apk_path: Path) -> Dict:
+        """빌드된 APK를 내용 해시 경로에 저장하고 지문에 연결"""
+        apk_path = Path(apk_path)
+        sha256 = _file_sha256(apk_path)
+        object_path = self._object_path(sha256)
+
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_name(object_path.name + f".{threading.get_ident()}.tmp")
+            shutil.copyfile(apk_path, tmp_path)
+            os.replace(tmp_path, object_path)
+
+        now = datetime.now().isoformat()
+        entry = {
+            "app": app_name,
+            "sha256": sha256,
+            "size": apk_path.stat().st_size,
+            "created_at": now,
+            "last_used": now
+        }
+
+        with self._lock:
+            self.index["artifacts"][fingerprint] = entry
+            self.index["stats"]["stores"] += 1
+            self._save_index()
+
+        return entry
+
+    def link(self, fingerprint: str, entry: Dict):
+        """이미 저장된 아티팩트를 다른 지문에도 연결"""
+        with self._lock:
+            self.index["artifacts"][fingerprint] = dict(entry)
+            self._save_index()
+
+    def garbage_collect(self) -> Dict:
+        """오래된 항목과 앱별 초과 항목 제거 후, 참조 없는 아티팩트 삭제"""
+        with self._lock:
+            artifacts = self.index["artifacts"]
+            cutoff = datetime.now() - timedelta(days=self.max_age_days)
+
+            expired = [fp for fp, entry in artifacts.items()
+                       if datetime.fromisoformat(entry["last_used"]) < cutoff]
+            for fp in expired:
+                del artifacts[fp]
+
+            # 앱별로 최근 사용한 keep_per_app 개만 유지
+            by_app: Dict[str, List[str]] = {}
+            for fp, entry in artifacts.items():
+                by_app.setdefault(entry["app"], []).append(fp)
+            evicted = 0
+            for fps in by_app.values():
+                fps.sort(key=lambda fp: artifacts[fp]["last_used"], reverse=True)
+                for fp in fps[self.keep_per_app:]:
+                    del artifacts[fp]
+                    evicted += 1
+
+            # 사라진 입력 파일의 해시 메모 정리
+            for key in [key for key in self.index["file_hashes"] if not os.path.exists(key)]:
+                del self.index["file_hashes"][key]
+
+            referenced = {entry["sha256"] for entry in artifacts.values()}
+            removed_objects = 0
+            freed_bytes = 0
+            for object_path in self.objects_dir.glob("*/*.apk"):
+                if object_path.stem not in referenced:
+                    freed_bytes += object_path.stat().st_size
+                    object_path.unlink()
+                    removed_objects += 1
+
+            self._save_index()
+
+        result = {
+            "expired_entries": len(expired),
+            "evicted_entries": evicted,
+            "removed_artifacts": removed_objects,
+            "freed_mb": round(freed_bytes / 1024 / 1024, 1)
+        }
+        print(f"🧹 빌드 캐시 정리: 항목 {len(expired) + evicted}개, 아티팩트 {removed_objects}개 "
+              f"({result['freed_mb']}MB)")
+        return result
+
+    def get_stats(self) -> Dict:
+        """적중/미스 통계"""
+        with self._lock:
+            stats = dict(self.index["stats"])
+            total = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = round(stats["hits"] / total * 100, 1) if total else 0.0
+            stats["artifacts"] = len(self.index["artifacts"])
+            stats["size_mb"] = round(
+                sum(p.stat().st_size for p in self.objects_dir.glob("*/*.apk")) / 1024 / 1024, 1)
+        return stats
+
+
+def main():
+    """빌드 캐시 통계 출력 및 정리"""
+
+    cache = FlutterBuildCache()
+    print("📦 Flutter 빌드 캐시")
+    print("=" * 50)
+    for key, value in cache.get_stats().items():
+        print(f"  {key}: {value}")
+    cache.garbage_collect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔨 Flutter 병렬 빌드 오케스트레이터
+CPU 코어 수와 가용 메모리로 워커 수를 정해 여러 앱의 pub get / build apk 를 동시에 실행
+앱별 로그 스트리밍, 단계별 타임아웃, JSON 빌드 리포트 지원
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import threading
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from flutter_build_cache import FlutterBuildCache
+
+# Gradle 릴리즈 빌드 1개가 점유하는 대략적인 메모리 (GB)
+DEFAULT_MEMORY_PER_BUILD_GB = 3.0
+
+DEFAULT_PUB_GET_TIMEOUT = 600
+DEFAULT_BUILD_TIMEOUT = 1800
+
+RELEASE_APK = Path("build") / "app" / "outputs" / "flutter-apk" / "app-release.apk"
+
+
+@dataclass
+class BuildJob:
+    """앱 하나의 빌드 작업"""
+    app_name: str
+    app_path: Path
+    output_apk: Optional[Path] = None  # 지정하면 빌드된 APK를 이 경로로 복사
+    build_args: List[str] = field(default_factory=lambda: ["apk", "--release"])
+    pub_get: bool = True
+
+
+def available_memory_gb() -> Optional[float]:
+    """가용 메모리 (GB), 알 수 없으면 None"""
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024 / 1024
+    except OSError:
+        pass
+
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return pages * page_size / 1024 ** 3
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def recommended_workers(memory_per_build_gb: float = DEFAULT_MEMORY_PER_BUILD_GB) -> int:
+    """코어 수와 가용 메모리 중 더 작은 쪽으로 동시 빌드 수 결정"""
+    # Gradle 데몬이 빌드 하나에 여러 코어를 쓰므로 코어 2개당 빌드 1개
+    by_cpu = max(1, (os.cpu_count() or 2) // 2)
+
+    memory_gb = available_memory_gb()
+    if memory_gb is None:
+        return by_cpu
+
+    by_memory = max(1, int(memory_gb // memory_per_build_gb))
+    return min(by_cpu, by_memory)
+
+
+class FlutterBuildOrchestrator:
+    """포트폴리오 전체 Flutter 빌드 스케줄러"""
+
+    def __init__(self, max_workers: int = None, log_dir: str = "build_logs",
+                 report_path: str = "build_report.json",
+                 pub_get_timeout: int = DEFAULT_PUB_GET_TIMEOUT,
+                 build_timeout: int = DEFAULT_BUILD_TIMEOUT,
+                 pub_get_concurrency: int = 2,
+                 memory_per_build_gb: float = DEFAULT_MEMORY_PER_BUILD_GB,
+                 build_cache: FlutterBuildCache = None, use_cache: bool = True,
+                 offline_pub_get: bool = False):
+        self.max_workers = max_workers or recommended_workers(memory_per_build_gb)
+        self.log_dir = Path(log_dir)
+        self.report_path = Path(report_path) if report_path else None
+        self.pub_get_timeout = pub_get_timeout
+        self.build_timeout = build_timeout
+        # pub 캐시를 PubDependencyPlanner 로 미리 예열했다면 네트워크 없이 해석
+        self.offline_pub_get = offline_pub_get
+
+        # pub get 은 공유 pub 캐시/네트워크를 쓰므로 별도로 동시 실행 수 제한
+        self._pub_get_slots = threading.Semaphore(max(1, pub_get_concurrency))
+
+        # Windows 에서는 flutter.bat 이므로 PATH 에서 실제 실행 파일을 찾음
+        self.flutter_bin = shutil.which("flutter") or "flutter"
+
+        # 입력 지문이 같으면 빌드 대신 아티팩트 저장소에서 APK 복원
+        self.build_cache = build_cache or (FlutterBuildCache() if use_cache else None)
+
+    def _run_step(self, step: str, args: List[str], cwd: Path, timeout: int, log) -> Dict:
+        """명령 하나를 실행하며 출력을 앱 로그 파일로 스트리밍"""
+        command = [self.flutter_bin] + args
+        log.write(f"\n$ flutter {' '.join(args)}  ({datetime.now().isoformat()})\n")
+        log.flush()
+
+        popen_kwargs = {}
+        if os.name == "posix":
+            popen_kwargs["start_new_session"] = True
+        else:
+            popen_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+
+        start = time.time()
+        process = subprocess.Popen(command, cwd=cwd, stdout=log, stderr=subprocess.STDOUT,
+                                   stdin=subprocess.DEVNULL, **popen_kwargs)
+        try:
+            returncode = process.wait(timeout=timeout)
+            status = "success" if returncode == 0 else "failed"
+        except subprocess.TimeoutExpired:
+            self._kill_process_group(process)
+            returncode = None
+            status = "timeout"
+            log.write(f"\n⏰ {step} 타임아웃 ({timeout}초) - 프로세스 그룹 종료\n")
+
+        duration = round(time.time() - start, 2)
+        log.write(f"[{step}] {status} ({duration}초)\n")
+        log.flush()
+
+        return {"step": step, "status": status, "returncode": returncode, "duration": duration}
+
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen):
+        """Gradle 데몬 자식까지 포함해 프로세스 그룹 전체 종료"""
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        process.wait()
+
+    def build_app(self, job: BuildJob) -> Dict:
+        """앱 하나 빌드 (pub get → build)"""
+        app_path = Path(job.app_path)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = self.log_dir / f"{job.app_name}.log"
+
+        result = {
+            "app": job.app_name,
+            "app_path": str(app_path),
+            "log_file": str(log_file),
+            "steps": [],
+            "apk_path": None,
+            "apk_size_mb": None,
+            "cached": False
+        }
+
+        start = time.time()
+        apk_source = app_path / RELEASE_APK
+        # split-per-abi 는 APK가 여러 개라 캐시하지 않음
+        cacheable = self.build_cache is not None and "--split-per-abi" not in job.build_args
+
+        with open(log_file, "w", encoding="utf-8") as log:
+            if not app_path.exists():
+                log.write(f"앱 폴더 없음: {app_path}\n")
+                result.update({"status": "failed", "error": "app path not found", "duration": 0})
+                return result
+
+            fingerprint = None
+            toolchain = self.build_cache.toolchain_identity(self.flutter_bin) if cacheable else None
+            if cacheable and toolchain is None:
+                # 다른 SDK 로 만든 APK 를 복원하지 않도록 캐시 사용 안 함
+                log.write("Flutter SDK 버전 확인 불가 - 빌드 캐시 사용 안 함\n")
+            elif cacheable:
+                fingerprint = self.build_cache.fingerprint(app_path, job.build_args, toolchain)
+                result["fingerprint"] = fingerprint
+                if self.build_cache.restore(fingerprint, job.app_name, apk_source):
+                    log.write(f"빌드 캐시 적중: {fingerprint}\n")
+                    result["cached"] = True
+
+            steps = []
+            if job.pub_get and not result["cached"]:
+                pub_get_args = ["pub", "get", "--offline"] if self.offline_pub_get else ["pub", "get"]
+                steps.append(("pub_get", pub_get_args, self.pub_get_timeout))
+            if not result["cached"]:
+                steps.append(("build", ["build"] + list(job.build_args), self.build_timeout))
+
+            status = "success"
+            for step, args, timeout in steps:
+                if step == "pub_get":
+                    with self._pub_get_slots:
+                        step_result = self._run_step(step, args, app_path, timeout, log)
+                else:
+                    step_result = self._run_step(step, args, app_path, timeout, log)
+                result["steps"].append(step_result)
+
+                if step_result["status"] != "success":
+                    status = step_result["status"]
+                    result["error"] = f"{step} {step_result['status']}"
+                    break
+
+        if status == "success":
+            if apk_source.exists():
+                if fingerprint and not result["cached"]:
+                    # pub get 이 pubspec.lock / 플러그인 등록 파일을 바꿨다면 빌드 후 지문으로도 저장
+                    entry = self.build_cache.store(fingerprint, job.app_name, apk_source)
+                    built_fingerprint = self.build_cache.fingerprint(app_path, job.build_args, toolchain)
+                    if built_fingerprint != fingerprint:
+                        self.build_cache.link(built_fingerprint, entry)
+                apk_path = apk_source
+                if job.output_apk:
+                    apk_path = Path(job.output_apk)
+                    apk_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(apk_source, apk_path)
+                result["apk_path"] = str(apk_path)
+                result["apk_size_mb"] = round(apk_path.stat().st_size / 1024 / 1024, 1)
+            elif "--split-per-abi" not in job.build_args:
+                status = "failed"
+                result["error"] = "apk not found"
+
+        result["status"] = status
+        result["duration"] = round(time.time() - start, 2)
+        return result
+
+    def build_all(self, jobs: List[BuildJob]) -> Dict:
+        """모든 빌드 작업을 워커 풀에서 병렬 실행하고 리포트 작성"""
+        print(f"🔨 {len(jobs)}개 앱 병렬 빌드 (워커 {self.max_workers}개, 로그: {self.log_dir}/)")
+
+        started_at = datetime.now()
+        start = time.time()
+        results = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.build_app, job) for job in jobs]
+            for job, future in zip(jobs, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"app": job.app_name, "app_path": str(job.app_path), "status": "failed",
+                              "error": str(e), "steps": [], "apk_path": None, "duration": 0}
+                results.append(result)
+
+                icon = {"success": "♻️" if result.get("cached") else "✅", "timeout": "⏰"}.get(result["status"], "❌")
+                detail = f"{result['apk_size_mb']}MB" if result.get("apk_size_mb") is not None else result.get("error", "")
+                print(f"  {icon} {result['app']}: {result['status']} ({result['duration']}초) {detail}")
+
+        wall_time = round(time.time() - start, 2)
+        report = {
+            "started_at": started_at.isoformat(),
+            "finished_at": datetime.now().isoformat(),
+            "workers": self.max_workers,
+            "total": len(results),
+            "successful": len([r for r in results if r["status"] == "success"]),
+            "failed": len([r for r in results if r["status"] == "failed"]),
+            "timed_out": len([r for r in results if r["status"] == "timeout"]),
+            "wall_time": wall_time,
+            "total_build_time": round(sum(r["duration"] for r in results), 2),
+            "cache_hits": len([r for r in results if r.get("cached")]),
+            "cache_stats": self.build_cache.get_stats() if self.build_cache else None,
+            "results": results
+        }
+
+        if self.report_path:
+            with open(self.report_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+        print(f"📊 빌드 완료: {report['successful']}/{report['total']} 성공, "
+              f"{wall_time}초 (순차 합계 {report['total_build_time']}초)")
+        return report
+
+
+def main():
+    """flutter_apps/ 전체 앱 병렬 빌드"""
+
+    apps_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("flutter_apps")
+    jobs = [
+        BuildJob(app_name=app_dir.name, app_path=app_dir,
+                 output_apk=Path("build_outputs") / f"{app_dir.name}-release.apk")
+        for app_dir in sorted(apps_dir.iterdir())
+        if (app_dir / "pubspec.yaml").exists()
+    ]
+
+    print("🔨 Flutter 병렬 빌드 오케스트레이터")
+    print("=" * 60)
+    FlutterBuildOrchestrator().build_all(jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,15 @@ import json
 import os
 import re
 import shutil
-import subprocess
 from pathlib import Path
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from async_command_runner import get_command_runner
+from flutter_build_orchestrator import FlutterBuildOrchestrator, BuildJob
+from generated_output import write_if_changed
+from pub_dependency_planner import PORTFOLIO_DEPENDENCIES, standard_dependency_lines
+
 load_dotenv()
 
 class FlutterCodeGenerator:
@@ -23,6 +27,8 @@ class FlutterCodeGenerator:
         self.model = genai.GenerativeModel('gemini-1.5-flash')
         self.flutter_apps_dir = Path("flutter_apps")
         self.flutter_apps_dir.mkdir(exist_ok=True)
+        self.orchestrator = FlutterBuildOrchestrator(report_path="flutter_build_report.json")
+        self.command_runner = get_command_runner()
 
     async def extract_flutter_code_from_plan(self, project_dir: Path):
         """기획서에서 Flutter 코드 추출 및 정리"""
@@ -69,10 +75,10 @@ class FlutterCodeGenerator:
             str(flutter_project_dir)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.flutter_apps_dir)
+        result = await self.command_runner.run(cmd, cwd=self.flutter_apps_dir, timeout=300)
 
-        if result.returncode != 0:
-            raise RuntimeError(f"Flutter 프로젝트 생성 실패: {result.stderr}")
+        if not result.ok:
+            raise RuntimeError(f"Flutter 프로젝트 생성 실패: {result.stderr or '시간 초과'}")
 
         return flutter_project_dir, safe_name
 
@@ -93,8 +99,7 @@ class FlutterCodeGenerator:
         # main.dart 업데이트
         if dart_content:
             main_dart_file = flutter_project_dir / "lib" / "main.dart"
-            with open(main_dart_file, "w", encoding="utf-8") as f:
-                f.write(dart_content)
+            write_if_changed(main_dart_file, dart_content)
 
         # AdMob 기본 설정 추가
         await self.add_basic_admob_config(flutter_project_dir)
@@ -109,13 +114,9 @@ class FlutterCodeGenerator:
         # AI가 생성한 dependencies 추출
         ai_deps = self.extract_dependencies(ai_pubspec_content)
 
-        # 기본 dependencies에 추가
-        basic_deps = """
-  cupertino_icons: ^1.0.8
-  provider: ^6.1.2
-  shared_preferences: ^2.2.3
-  google_mobile_ads: ^5.1.0
-"""
+        # 기본 dependencies에 추가 (포트폴리오 공유 버전 세트)
+        basic_deps = "\n" + standard_dependency_lines(
+            ["cupertino_icons", "provider", "shared_preferences", "google_mobile_ads"]) + "\n"
 
         # dependencies 섹션 찾아서 업데이트
         updated_content = re.sub(
@@ -125,8 +126,7 @@ class FlutterCodeGenerator:
             flags=re.DOTALL
         )
 
-        with open(pubspec_file, "w", encoding="utf-8") as f:
-            f.write(updated_content)
+        write_if_changed(pubspec_file, updated_content)
 
     def extract_dependencies(self, pubspec_content: str):
         """pubspec 내용에서 dependencies만 추출"""
@@ -139,9 +139,15 @@ class FlutterCodeGenerator:
         deps_lines = deps_match.group(1).split('\n')
         ai_deps = []
 
+        basic_names = {'cupertino_icons', 'provider', 'shared_preferences', 'google_mobile_ads'}
+
         for line in deps_lines:
             line = line.strip()
-            if line and not line.startswith('flutter:') and not line.startswith('cupertino_icons:'):
+            name = line.split(':', 1)[0].strip()
+            if line and not line.startswith('flutter:') and name not in basic_names:
+                # 표준 패키지는 AI가 쓴 제약 대신 공유 버전 사용
+                if name in PORTFOLIO_DEPENDENCIES:
+                    line = f"{name}: {PORTFOLIO_DEPENDENCIES[name]}"
                 if not line.startswith(' '):
                     ai_deps.append(f"  {line}")
                 else:
@@ -171,44 +177,27 @@ class FlutterCodeGenerator:
                     f'{admob_meta}\n    </application>'
                 )
 
-                with open(manifest_file, "w", encoding="utf-8") as f:
-                    f.write(manifest_content)
+                write_if_changed(manifest_file, manifest_content)
 
     async def build_apk(self, flutter_project_dir: Path):
         """Flutter APK 빌드"""
 
         print(f"🔨 APK 빌드 시작: {flutter_project_dir.name}")
 
-        # flutter pub get 실행
-        pub_get_cmd = ["flutter", "pub", "get"]
-        result = subprocess.run(pub_get_cmd, capture_output=True, text=True, cwd=flutter_project_dir)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"pub get 실패: {result.stderr}")
-
-        # flutter build apk 실행
-        build_cmd = ["flutter", "build", "apk", "--release"]
-        result = subprocess.run(build_cmd, capture_output=True, text=True, cwd=flutter_project_dir)
+        # pub get + build apk 를 오케스트레이터로 실행 (이벤트 루프 블로킹 방지)
+        job = BuildJob(app_name=flutter_project_dir.name, app_path=flutter_project_dir)
+        result = await asyncio.to_thread(self.orchestrator.build_app, job)
 
-        if result.returncode != 0:
-            # 빌드 실패시 더 자세한 정보 제공
-            print(f"❌ APK 빌드 실패: {flutter_project_dir.name}")
-            print(f"Error: {result.stderr}")
+        if result["status"] != "success":
+            print(f"❌ APK 빌드 실패: {flutter_project_dir.name} ({result.get('error')})")
+            print(f"로그: {result['log_file']}")
             return None
 
-        # APK 파일 경로 확인
-        apk_path = flutter_project_dir / "build" / "app" / "outputs" / "flutter-apk" / "app-release.apk"
+        print(f"✅ APK 빌드 완료: {flutter_project_dir.name} ({result['apk_size_mb']:.1f}MB)")
+        return Path(result["apk_path"])
 
-        if apk_path.exists():
-            apk_size = apk_path.stat().st_size / 1024 / 1024  # MB
-            print(f"✅ APK 빌드 완료: {flutter_project_dir.name} ({apk_size:.1f}MB)")
-            return apk_path
-        else:
-            print(f"❌ APK 파일을 찾을 수 없음: {flutter_project_dir.name}")
-            return None
-
-    async def process_project(self, project_dir: Path):
-        """단일 프로젝트를 Flutter 앱으로 변환"""
+    async def process_project(self, project_dir: Path, build: bool = True):
+        """단일 프로젝트를 Flutter 앱으로 변환 (build=False면 코드 생성까지만)"""
 
         try:
             print(f"\n🔄 프로젝트 처리 중: {project_dir.name}")
@@ -227,6 +216,14 @@ class FlutterCodeGenerator:
             await self.apply_generated_code(flutter_project_dir, pubspec_content, dart_content)
 
             # 4. APK 빌드
+            if not build:
+                return {
+                    "project_name": project_dir.name,
+                    "flutter_project_dir": str(flutter_project_dir),
+                    "apk_path": None,
+                    "status": "generated"
+                }
+
             apk_path = await self.build_apk(flutter_project_dir)
 
             return {
@@ -267,11 +264,21 @@ class FlutterCodeGenerator:
 
         results = []
 
+        # 코드 생성은 순차로, 빌드는 생성이 끝난 앱들을 모아 병렬로
         for project_dir in project_dirs:
-            result = await self.process_project(project_dir)
+            result = await self.process_project(project_dir, build=False)
             if result:
                 results.append(result)
 
+        pending = {Path(r["flutter_project_dir"]).name: r for r in results if r["status"] == "generated"}
+        if pending:
+            jobs = [BuildJob(app_name=name, app_path=Path(r["flutter_project_dir"])) for name, r in pending.items()]
+            report = await asyncio.to_thread(self.orchestrator.build_all, jobs)
+            for build_result in report["results"]:
+                result = pending[build_result["app"]]
+                result["apk_path"] = build_result["apk_path"]
+                result["status"] = "success" if build_result["status"] == "success" else "build_failed"
+
         # 결과 요약 저장
         await self.save_build_summary(results)
 
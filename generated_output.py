@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📝 생성 파일 출력 레이어
+메모리에서 렌더링한 내용을 기존 파일과 비교해 바뀐 파일만 원자적으로 쓰고,
+이전 실행에서 생성했지만 이번에는 생성하지 않은 파일은 삭제
+(내용이 같은 파일의 mtime 을 건드리지 않아 Flutter/Gradle 증분 빌드와 빌드 캐시가 유지됨)
+"""
+
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Union
+
+# 앱 디렉토리마다 생성한 파일 목록/해시 기록
+MANIFEST_NAME = ".generated_files.json"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Union[str, Path], content: Union[str, bytes]) -> bool:
+    """내용이 다를 때만 원자적으로 쓰기 (썼으면 True)"""
+    path = Path(path)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+class GenerationSummary:
+    """실행 단위 작성/변경 없음/삭제 집계 (병렬 생성 워커 공용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.written: List[str] = []
+        self.unchanged: List[str] = []
+        self.deleted: List[str] = []
+        self.kept: List[str] = []
+
+    def add(self, kind: str, path: Path):
+        with self._lock:
+            getattr(self, kind).append(str(path))
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            return {
+                "written": len(self.written),
+                "unchanged": len(self.unchanged),
+                "deleted": len(self.deleted),
+                "kept_modified": len(self.kept),
+                "written_files": sorted(self.written),
+                "deleted_files": sorted(self.deleted),
+                "kept_files": sorted(self.kept)
+            }
+
+    def print_summary(self):
+        summary = self.to_dict()
+        print(f"📝 생성 파일: 작성 {summary['written']}개, 변경 없음 {summary['unchanged']}개, "
+              f"삭제 {summary['deleted']}개")
+        for path in summary["kept_files"]:
+            print(f"  ⚠️ 직접 수정된 이전 생성 파일 유지: {path}")
+
+
+class GeneratedOutput:
+    """앱 디렉토리 단위 생성 파일 동기화"""
+
+    def __init__(self, summary: GenerationSummary = None):
+        self.summary = summary or GenerationSummary()
+
+    @staticmethod
+    def _load_manifest(app_dir: Path) -> Dict[str, str]:
+        manifest_file = app_dir / MANIFEST_NAME
+        if manifest_file.exists():
+            try:
+                with open(manifest_file, "r", encoding="utf-8") as f:
+                    return json.load(f).get("files", {})
+            except Exception as e:
+                print(f"⚠️ 생성 목록 로드 실패 ({manifest_file}): {e}")
+        return {}
+
+    def sync(self, app_dir: Union[str, Path], files: Dict[str, str], prune: bool = True) -> Dict[str, int]:
+        """files({앱 기준 상대 경로: 내용})를 app_dir 에 반영
+
+        prune=False 는 일부 파일만 다시 생성할 때 사용 (나머지 생성 파일은 그대로 유지)
+        """
+        app_dir = Path(app_dir)
+        previous = self._load_manifest(app_dir)
+        counts = {"written": 0, "unchanged": 0, "deleted": 0}
+
+        hashes = {}
+        for relative_path, content in sorted(files.items()):
+            data = content.encode("utf-8")
+            hashes[relative_path] = content_hash(data)
+            kind = "written" if write_if_changed(app_dir / relative_path, data) else "unchanged"
+            counts[kind] += 1
+            self.summary.add(kind, app_dir / relative_path)
+
+        if not prune:
+            hashes = {**previous, **hashes}
+
+        # 이전에 생성했지만 이번에는 없는 파일 삭제 (생성 후 직접 수정된 파일은 유지)
+        for relative_path in sorted(set(previous) - set(hashes)):
+            path = app_dir / relative_path
+            if not path.is_file():
+                continue
+            if content_hash(path.read_bytes()) != previous[relative_path]:
+                self.summary.add("kept", path)
+                continue
+            path.unlink()
+            counts["deleted"] += 1
+            self.summary.add("deleted", path)
+
+        manifest = json.dumps({"files": hashes}, indent=2, ensure_ascii=False) + "\n"
+        write_if_changed(app_dir / MANIFEST_NAME, manifest)
+        return counts
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🕸️ 템플릿 → 앱 의존성 그래프
+생성 시점에 출력 파일마다 사용한 템플릿(+ include)과 참조한 앱 설정 필드를 기록해
+템플릿/설정이 바뀌었을 때 영향받는 앱과 파일만 다시 생성할 수 있게 함
+watchdog 기반 감시 모드 제공 (templates/, 앱 설정 파일)
+"""
+
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from generated_output import write_if_changed
+
+GRAPH_NAME = ".generation_graph.json"
+
+
+def field_hash(value: Any) -> str:
+    """설정 필드 값 해시 (dict 키 순서와 무관)"""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class GenerationGraph:
+    """{앱: {출력 파일: {generator, templates: {이름: 해시}, fields: [...]}}} + 앱별 설정 필드 해시"""
+
+    def __init__(self, graph_file: Path):
+        self.graph_file = Path(graph_file)
+        self._lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self) -> Dict:
+        if self.graph_file.exists():
+            try:
+                with open(self.graph_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data.setdefault("apps", {})
+                return data
+            except Exception as e:
+                print(f"⚠️ 의존성 그래프 로드 실패: {e}")
+        return {"apps": {}}
+
+    def save(self):
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        # 내용이 같으면 쓰지 않음 (감시 중인 디렉토리에 있어도 이벤트 루프가 생기지 않게)
+        write_if_changed(self.graph_file, json.dumps(self.data, indent=2, ensure_ascii=False, sort_keys=True) + "\n")
+
+    def record_app(self, app: str, generator: str, field_hashes: Dict[str, str],
+                   outputs: Dict[str, Dict], replace: bool = True, save: bool = True):
+        """앱 생성 결과 기록 (replace=False 면 일부 파일만 갱신, 대량 기록은 save=False 후 save())"""
+        with self._lock:
+            entry = self.data["apps"].setdefault(app, {"fields": {}, "outputs": {}})
+            if replace:
+                entry["outputs"] = {path: node for path, node in entry["outputs"].items()
+                                    if node["generator"] != generator}
+            for path, node in outputs.items():
+                entry["outputs"][path] = {"generator": generator, **node}
+            entry["fields"].update(field_hashes)
+            if save:
+                self._save()
+
+    def forget_app(self, app: str):
+        with self._lock:
+            if self.data["apps"].pop(app, None) is not None:
+                self._save()
+
+    def apps(self) -> List[str]:
+        return sorted(self.data["apps"])
+
+    def outputs(self, app: str, generator: str = None) -> Set[str]:
+        """기록된 앱 출력 파일 경로"""
+        entry = self.data["apps"].get(app, {"outputs": {}})
+        return {path for path, node in entry["outputs"].items()
+                if not generator or node["generator"] == generator}
+
+    def template_names(self) -> Set[str]:
+        """기록된 모든 템플릿 이름"""
+        return {name for entry in self.data["apps"].values()
+                for node in entry["outputs"].values() for name in node["templates"]}
+
+    def template_dependents(self, template_name: str) -> Dict[str, List[str]]:
+        """템플릿을 (직접 또는 include 로) 사용하는 {앱: [출력 파일]}"""
+        dependents: Dict[str, List[str]] = {}
+        for app, entry in self.data["apps"].items():
+            for path, node in entry["outputs"].items():
+                if template_name in node["templates"]:
+                    dependents.setdefault(app, []).append(path)
+        return {app: sorted(paths) for app, paths in dependents.items()}
+
+    def affected_by_templates(self, current_hashes: Dict[str, Optional[str]],
+                              generator: str = None) -> Dict[str, Set[str]]:
+        """기록된 해시와 현재 템플릿 해시가 다른 출력 파일 (current_hashes: {템플릿 이름: 해시})"""
+        affected: Dict[str, Set[str]] = {}
+        for app, entry in self.data["apps"].items():
+            for path, node in entry["outputs"].items():
+                if generator and node["generator"] != generator:
+                    continue
+                for name, recorded in node["templates"].items():
+                    if name in current_hashes and current_hashes[name] != recorded:
+                        affected.setdefault(app, set()).add(path)
+                        break
+        return affected
+
+    def changed_fields(self, app: str, field_hashes: Dict[str, str]) -> Set[str]:
+        entry = self.data["apps"].get(app, {"fields": {}})
+        return {name for name, value in field_hashes.items() if entry["fields"].get(name) != value}
+
+    def affected_by_fields(self, app: str, field_hashes: Dict[str, str],
+                           generator: str = None) -> Optional[Set[str]]:
+        """설정 필드 변경으로 다시 만들어야 하는 파일 (기록이 없으면 None = 앱 전체)"""
+        entry = self.data["apps"].get(app)
+        if not entry:
+            return None
+
+        changed = self.changed_fields(app, field_hashes)
+        if not changed:
+            return set()
+
+        affected = set()
+        for path, node in entry["outputs"].items():
+            if generator and node["generator"] != generator:
+                continue
+            if changed & set(node["fields"]):
+                affected.add(path)
+        return affected
+
+
+class RegenerationWatcher:
+    """템플릿/설정 파일 변경 감시 → 변경 묶음 단위로 콜백 호출
+
+    편집기 저장은 이벤트가 여러 번 발생하므로 quiet_seconds 동안 조용해지면 한 번에 처리
+    """
+
+    def __init__(self, paths: Iterable[Path], on_change: Callable[[Set[Path]], None],
+                 quiet_seconds: float = 0.5):
+        self.paths = [Path(p) for p in paths]
+        self.on_change = on_change
+        self.quiet_seconds = quiet_seconds
+
+        self._pending: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def _queue(self, path: str):
+        path = Path(path)
+        if path.name.startswith(".") or path.name.endswith((".tmp", "~", ".swp")):
+            return
+        with self._lock:
+            self._pending.add(path.resolve())
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.quiet_seconds, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self):
+        with self._lock:
+            changed, self._pending = self._pending, set()
+            self._timer = None
+        if not changed:
+            return
+        try:
+            self.on_change(changed)
+        except Exception as e:
+            print(f"❌ 재생성 실패: {e}")
+
+    def run(self):
+        """Ctrl+C 까지 감시"""
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        watcher = self
+
+        class ChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in ("created", "modified", "moved", "deleted"):
+                    return
+                watcher._queue(getattr(event, "dest_path", "") or event.src_path)
+
+        observer = Observer()
+        handler = ChangeHandler()
+        for path in self.paths:
+            if path.is_dir():
+                observer.schedule(handler, str(path), recursive=True)
+            elif path.parent.is_dir():
+                # 단일 파일은 부모 디렉토리를 감시 (원자적 교체 저장도 감지)
+                observer.schedule(handler, str(path.parent), recursive=False)
+
+        observer.start()
+        print(f"👀 감시 시작: {', '.join(str(p) for p in self.paths)} (Ctrl+C 로 종료)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("\n🛑 감시 종료")
+        finally:
+            observer.stop()
+            observer.join()
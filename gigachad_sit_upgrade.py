@@ -18,7 +18,7 @@ import 'package:flutter/material.dart';
 class ScientificSITData {
 
   /// 레벨별 설명
-  static Map<String, String> get levelDescriptions => {
+  static const Map<String, String> levelDescriptions = {
     'rookie': '🏃 초보 스프린터 - 기초 체력 구축',
     'rising': '⚡ 라이징 러너 - 스피드 향상',
     'alpha': '🦾 알파 애슬릿 - 파워 극대화',
@@ -27,7 +27,7 @@ class ScientificSITData {
 
   /// 6주 SIT 프로그레션 (Sprint Interval Training)
   /// 형식: [스프린트 시간(초), 휴식 시간(초), 반복 횟수]
-  static Map<String, Map<int, Map<int, Map<String, dynamic>>>> get sitPrograms => {
+  static const Map<String, Map<int, Map<int, Map<String, dynamic>>>> sitPrograms = {
     'rookie': {
       // Week 1: 적응 단계 (1:9 비율)
       1: {
@@ -99,7 +99,7 @@ class ScientificSITData {
   };
 
   /// HIIT 대안 프로그램 (중간 강도)
-  static Map<String, Map<int, Map<String, dynamic>>> get hiitAlternative => {
+  static const Map<String, Map<int, Map<String, dynamic>>> hiitAlternative = {
     'beginner': {
       1: {'work': 30, 'rest': 60, 'rounds': 6, 'intensity': '80%'},
       2: {'work': 45, 'rest': 45, 'rounds': 6, 'intensity': '85%'},
@@ -113,7 +113,7 @@ class ScientificSITData {
   };
 
   /// Tabata 스타일 (초고강도)
-  static Map<String, dynamic> get tabataProtocol => {
+  static const Map<String, dynamic> tabataProtocol = {
     'sprint': 20,
     'rest': 10,
     'rounds': 8,
@@ -124,7 +124,7 @@ class ScientificSITData {
   };
 
   /// 노르웨이 1분 프로토콜
-  static Map<String, dynamic> get norwegianProtocol => {
+  static const Map<String, dynamic> norwegianProtocol = {
     'sprint': 60,
     'rest': 180,
     'rounds': 4,
@@ -133,7 +133,7 @@ class ScientificSITData {
   };
 
   /// 과학적 팁과 혜택
-  static Map<String, String> get scientificBenefits => {
+  static const Map<String, String> scientificBenefits = {
     'fatLoss': '체지방 2.31% 감소 (HIIT보다 40% 더 효과적)',
     'timeEfficiency': '운동 시간 81.46% 단축',
     'vo2maxImprovement': '최대산소섭취량 42% 향상 (2주만에)',
@@ -142,7 +142,7 @@ class ScientificSITData {
   };
 
   /// 주간 포커스
-  static Map<int, String> get weeklyFocus => {
+  static const Map<int, String> weeklyFocus = {
     1: '🎯 기초 적응 - 스프린트 폼 습득',
     2: '⚡ 스피드 구축 - 폭발력 향상',
     3: '🔥 강도 증가 - 젖산 역치 향상',
@@ -152,7 +152,7 @@ class ScientificSITData {
   };
 
   /// 운동 전후 가이드
-  static Map<String, List<String>> get workoutGuide => {
+  static const Map<String, List<String>> workoutGuide = {
     'warmup': [
       '5분 가벼운 조깅',
       '다이나믹 스트레칭 (레그 스윙, 하이 니)',
@@ -174,7 +174,7 @@ class ScientificSITData {
   };
 
   /// GigaChad 동기부여 메시지
-  static List<String> get motivationalQuotes => [
+  static const List<String> motivationalQuotes = [
     "🔥 스프린트는 몸을 만들고, 의지는 영혼을 만든다",
     "⚡ 30초의 고통, 24시간의 연소",
     "💪 느린 자는 빠른 자를 이길 수 없다",
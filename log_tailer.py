@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📜 증분 로그 테일러
+로그 파일마다 (inode, offset) 커서를 저장해 지난 검사 이후 추가된 바이트만 읽고,
+하나로 합친 정규식으로 오류 줄을 찾음 (회전/잘림 감지 시 처음부터 다시 읽음)
+"""
+
+import os
+import re
+import json
+import mmap
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# 기존 5개 패턴(ERROR:, Traceback, Exception:, Failed, TimeoutError) + JSON 로그의 ERROR/CRITICAL 레벨을 한 번에 검색
+ERROR_LINE_PATTERN = re.compile(
+    rb"(?:ERROR:|Traceback|Exception:|Failed|TimeoutError|\"level\":\"(?:ERROR|CRITICAL)\")[^\r\n]*")
+
+CHUNK_SIZE = 1024 * 1024
+# 새로 추가된 분량이 이보다 크면 청크 복사 대신 mmap 위에서 바로 검색
+MMAP_THRESHOLD = 32 * 1024 * 1024
+# 줄바꿈 없이 이보다 길어진 줄은 그대로 처리 (무한정 버퍼링 방지)
+MAX_LINE_BYTES = 4 * CHUNK_SIZE
+# 잘린 뒤 다시 커진 파일을 구분하기 위한 파일 앞부분 해시 길이
+HEAD_BYTES = 256
+
+
+class LogTailer:
+    """로그 파일별 커서 관리 + 새 줄에서 오류 검색"""
+
+    def __init__(self, state_file: str = None, pattern: "re.Pattern" = ERROR_LINE_PATTERN,
+                 chunk_size: int = CHUNK_SIZE, mmap_threshold: int = MMAP_THRESHOLD):
+        if state_file:
+            self.state_file = Path(state_file)
+        else:
+            self.state_file = Path.home() / ".cache" / "app-factory" / "monitoring" / "log_cursors.json"
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+        self.pattern = pattern
+        self.chunk_size = chunk_size
+        self.mmap_threshold = mmap_threshold
+
+        self._lock = threading.Lock()
+        self.cursors: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️ 로그 커서 로드 실패: {e}")
+        return {}
+
+    def save(self):
+        """커서 저장 (원자적 교체) - 사라진 로그 파일의 커서는 정리"""
+        with self._lock:
+            self.cursors = {key: cursor for key, cursor in self.cursors.items() if os.path.exists(key)}
+            tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.cursors, f, indent=2)
+            os.replace(tmp_file, self.state_file)
+
+    @staticmethod
+    def _head_hash(f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(min(length, HEAD_BYTES))).hexdigest()
+
+    def _start_offset(self, f, key: str, stat: os.stat_result) -> int:
+        """이어서 읽을 위치 (회전되면 새 inode, 잘리면 크기 감소/앞부분 변경 → 처음부터)"""
+        cursor = self.cursors.get(key)
+        if not cursor:
+            return 0
+        if cursor["inode"] != [stat.st_dev, stat.st_ino]:
+            return 0
+        if stat.st_size < cursor["offset"]:
+            return 0
+        if cursor.get("head") != self._head_hash(f, cursor["offset"]):
+            return 0
+        return cursor["offset"]
+
+    def _scan_chunks(self, f, offset: int, size: int) -> Tuple[List[bytes], int]:
+        """offset 부터 청크 단위로 읽으며 완성된 줄만 검색 → (매치, 다음 offset)"""
+        matches: List[bytes] = []
+        f.seek(offset)
+        position = offset
+        carry = b""
+
+        while position < size:
+            chunk = f.read(min(self.chunk_size, size - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            data = carry + chunk
+
+            end = data.rfind(b"\n") + 1
+            if end == 0 and len(data) < MAX_LINE_BYTES:
+                carry = data
+                continue
+            if end == 0:
+                end = len(data)
+
+            matches.extend(match.group(0) for match in self.pattern.finditer(data, 0, end))
+            carry = data[end:]
+
+        # 마지막 줄이 아직 쓰는 중이면 다음 검사에서 다시 읽음
+        return matches, position - len(carry)
+
+    def _scan_mmap(self, f, offset: int, size: int) -> Tuple[List[bytes], int]:
+        """큰 구간은 mmap 위에서 복사 없이 검색"""
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            end = mapped.rfind(b"\n", offset, size) + 1
+            if end == 0:
+                return [], offset
+            return [match.group(0) for match in self.pattern.finditer(mapped, offset, end)], end
+
+    def scan(self, log_file: Union[str, Path]) -> List[str]:
+        """지난 검사 이후 추가된 줄에서 패턴에 맞는 부분 (커서는 메모리에서 갱신, save() 로 저장)"""
+        path = Path(log_file)
+        key = str(path.resolve())
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return []
+
+        with open(path, "rb") as f:
+            offset = self._start_offset(f, key, stat)
+            if stat.st_size == offset:
+                return []
+
+            if stat.st_size - offset >= self.mmap_threshold:
+                matches, new_offset = self._scan_mmap(f, offset, stat.st_size)
+            else:
+                matches, new_offset = self._scan_chunks(f, offset, stat.st_size)
+            head = self._head_hash(f, new_offset)
+
+        with self._lock:
+            self.cursors[key] = {"inode": [stat.st_dev, stat.st_ino], "offset": new_offset, "head": head}
+
+        return [match.decode("utf-8", errors="replace") for match in matches]
+
+    def get_cursor(self, log_file: Union[str, Path]) -> Optional[Dict]:
+        return self.cursors.get(str(Path(log_file).resolve()))
@@ -11,12 +11,12 @@
 5. 배포 자동화 (향후)
 """
 
-import asyncio
 import json
 import os
 import time
 from pathlib import Path
 from batch_app_generator import BatchAppGenerator
+from factory_profiler import run_entry_point
 from flutter_code_generator import FlutterCodeGenerator
 
 class MasterAutomation:
@@ -141,4 +141,4 @@ async def main():
         print("실행이 취소되었습니다.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_entry_point(main, "master_automation")
\ No newline at end of file
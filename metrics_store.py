@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📈 모니터링 시계열 저장소
+건강 체크 결과, 오류 보고, 자동 수정, 파이프라인 지표를 SQLite(WAL) 에 저장
+- 메트릭 이름/태그 조합은 정수 ID 로 저장 (행 크기 최소화), (metric, ts) 인덱스
+- 기록은 메모리 버퍼에 모았다가 한 트랜잭션으로 일괄 쓰기
+- 쓰는 시점에 5분/1시간/1일 롤업(count/sum/min/max)을 함께 갱신 → 일간/주간 리포트는 롤업만 조회
+"""
+
+import json
+import time
+import atexit
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 롤업 해상도 (초)
+RESOLUTIONS = {"5m": 300, "1h": 3600, "1d": 86400}
+
+FLUSH_SIZE = 200
+FLUSH_INTERVAL = 5.0
+
+# 원본 데이터/5분 롤업 보관 기간 (1시간/1일 롤업은 계속 보관)
+RAW_RETENTION_DAYS = 14
+FINE_ROLLUP_RETENTION_DAYS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_names (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS tag_sets (
+    id INTEGER PRIMARY KEY,
+    tags TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS samples (
+    metric_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    value REAL NOT NULL,
+    tags_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_samples_metric_ts ON samples (metric_id, ts);
+CREATE INDEX IF NOT EXISTS idx_samples_ts ON samples (ts);
+CREATE TABLE IF NOT EXISTS rollups (
+    metric_id INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    tags_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    sum REAL NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    PRIMARY KEY (metric_id, resolution, bucket, tags_id)
+) WITHOUT ROWID;
+"""
+
+
+def _encode_tags(tags: Optional[Dict]) -> str:
+    return json.dumps({key: str(value) for key, value in (tags or {}).items()},
+                      sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+class MetricsStore:
+    """시계열 기록/조회 (스레드 안전, 연결 하나 공유)"""
+
+    def __init__(self, db_path: str = None, flush_size: int = FLUSH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL):
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            self.db_path = Path.home() / ".cache" / "app-factory" / "monitoring" / "metrics.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._buffer: List[Tuple[str, int, float, str]] = []
+        self._last_flush = time.monotonic()
+        self._metric_ids: Dict[str, int] = {}
+        self._tag_ids: Dict[str, int] = {}
+        self._tag_cache: Dict[int, Dict] = {}
+
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+        atexit.register(self.flush)
+
+    # ----- 기록 -----
+
+    def record(self, metric: str, value: float = 1.0, tags: Optional[Dict] = None, ts: float = None):
+        """측정값 하나 (버퍼에 추가, flush_size/flush_interval 마다 일괄 저장)"""
+        with self._lock:
+            self._buffer.append((metric, int(ts if ts is not None else time.time()), float(value), _encode_tags(tags)))
+            due = len(self._buffer) >= self.flush_size or time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def _metric_id(self, name: str) -> int:
+        if name not in self._metric_ids:
+            self.conn.execute("INSERT OR IGNORE INTO metric_names (name) VALUES (?)", (name,))
+            self._metric_ids[name] = self.conn.execute(
+                "SELECT id FROM metric_names WHERE name = ?", (name,)).fetchone()[0]
+        return self._metric_ids[name]
+
+    def _tags_id(self, tags: str) -> int:
+        if tags not in self._tag_ids:
+            self.conn.execute("INSERT OR IGNORE INTO tag_sets (tags) VALUES (?)", (tags,))
+            self._tag_ids[tags] = self.conn.execute(
+                "SELECT id FROM tag_sets WHERE tags = ?", (tags,)).fetchone()[0]
+        return self._tag_ids[tags]
+
+    def flush(self) -> int:
+        """버퍼를 한 트랜잭션으로 저장 + 롤업 갱신 → 저장한 행 수"""
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if not buffer:
+                return 0
+
+            try:
+                with self.conn:
+                    rows = [(self._metric_id(metric), ts, value, self._tags_id(tags))
+                            for metric, ts, value, tags in buffer]
+                    self.conn.executemany(
+                        "INSERT INTO samples (metric_id, ts, value, tags_id) VALUES (?, ?, ?, ?)", rows)
+
+                    # 버킷별로 먼저 합쳐서 upsert 횟수 최소화
+                    aggregates: Dict[Tuple[int, int, int, int], List[float]] = {}
+                    for metric_id, ts, value, tags_id in rows:
+                        for resolution in RESOLUTIONS.values():
+                            key = (metric_id, resolution, ts - ts % resolution, tags_id)
+                            aggregate = aggregates.get(key)
+                            if aggregate is None:
+                                aggregates[key] = [1, value, value, value]
+                            else:
+                                aggregate[0] += 1
+                                aggregate[1] += value
+                                aggregate[2] = min(aggregate[2], value)
+                                aggregate[3] = max(aggregate[3], value)
+
+                    self.conn.executemany("""
+                        INSERT INTO rollups (metric_id, resolution, bucket, tags_id, count, sum, min, max)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (metric_id, resolution, bucket, tags_id) DO UPDATE SET
+                            count = count + excluded.count,
+                            sum = sum + excluded.sum,
+                            min = MIN(min, excluded.min),
+                            max = MAX(max, excluded.max)
+                    """, [(*key, *aggregate) for key, aggregate in aggregates.items()])
+            except sqlite3.Error as e:
+                # ID 캐시가 롤백된 행을 가리키지 않도록 초기화
+                self._metric_ids.clear()
+                self._tag_ids.clear()
+                print(f"⚠️ 지표 저장 실패 ({len(buffer)}건): {e}")
+                return 0
+
+            return len(rows)
+
+    # ----- 조회 -----
+
+    def _decode_tags(self, tags_id: int) -> Dict:
+        if tags_id not in self._tag_cache:
+            row = self.conn.execute("SELECT tags FROM tag_sets WHERE id = ?", (tags_id,)).fetchone()
+            self._tag_cache[tags_id] = json.loads(row[0]) if row else {}
+        return self._tag_cache[tags_id]
+
+    def _lookup_metric(self, metric: str) -> Optional[int]:
+        row = self.conn.execute("SELECT id FROM metric_names WHERE name = ?", (metric,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _matches(tags: Dict, where: Optional[Dict]) -> bool:
+        return not where or all(tags.get(key) == str(value) for key, value in where.items())
+
+    def query(self, metric: str, start: float, end: float, where: Optional[Dict] = None) -> List[Dict]:
+        """원본 측정값 [start, end)"""
+        self.flush()
+        with self._lock:
+            metric_id = self._lookup_metric(metric)
+            if metric_id is None:
+                return []
+            rows = self.conn.execute(
+                "SELECT ts, value, tags_id FROM samples WHERE metric_id = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                (metric_id, int(start), int(end))).fetchall()
+            results = []
+            for ts, value, tags_id in rows:
+                tags = self._decode_tags(tags_id)
+                if self._matches(tags, where):
+                    results.append({"ts": ts, "value": value, "tags": tags})
+            return results
+
+    def rollup(self, metric: str, resolution: str, start: float, end: float,
+               where: Optional[Dict] = None) -> List[Dict]:
+        """해상도별 버킷 집계 [start, end) (태그 조합은 합산)"""
+        self.flush()
+        seconds = RESOLUTIONS[resolution]
+        with self._lock:
+            metric_id = self._lookup_metric(metric)
+            if metric_id is None:
+                return []
+            rows = self.conn.execute("""
+                SELECT bucket, tags_id, count, sum, min, max FROM rollups
+                WHERE metric_id = ? AND resolution = ? AND bucket >= ? AND bucket < ?
+                ORDER BY bucket
+            """, (metric_id, seconds, int(start) - int(start) % seconds, int(end))).fetchall()
+
+            buckets: Dict[int, Dict] = {}
+            for bucket, tags_id, count, total, low, high in rows:
+                if not self._matches(self._decode_tags(tags_id), where):
+                    continue
+                entry = buckets.setdefault(bucket, {"bucket": bucket, "count": 0, "sum": 0.0,
+                                                    "min": low, "max": high})
+                entry["count"] += count
+                entry["sum"] += total
+                entry["min"] = min(entry["min"], low)
+                entry["max"] = max(entry["max"], high)
+
+        for entry in buckets.values():
+            entry["avg"] = entry["sum"] / entry["count"] if entry["count"] else 0.0
+        return list(buckets.values())
+
+    def summary(self, metric: str, start: float, end: float, by: Optional[str] = None,
+                where: Optional[Dict] = None) -> Dict:
+        """기간 합계 (by 가 있으면 그 태그 값별 count) - 시간 롤업 사용"""
+        self.flush()
+        with self._lock:
+            metric_id = self._lookup_metric(metric)
+            if metric_id is None:
+                return {"count": 0, "sum": 0.0, "by": {}}
+            rows = self.conn.execute("""
+                SELECT tags_id, SUM(count), SUM(sum) FROM rollups
+                WHERE metric_id = ? AND resolution = ? AND bucket >= ? AND bucket < ?
+                GROUP BY tags_id
+            """, (metric_id, RESOLUTIONS["1h"], int(start) - int(start) % 3600, int(end))).fetchall()
+
+            result = {"count": 0, "sum": 0.0, "by": {}}
+            for tags_id, count, total in rows:
+                tags = self._decode_tags(tags_id)
+                if not self._matches(tags, where):
+                    continue
+                result["count"] += count
+                result["sum"] += total
+                if by:
+                    group = tags.get(by, "Unknown")
+                    result["by"][group] = result["by"].get(group, 0) + count
+        return result
+
+    # ----- 관리 -----
+
+    def prune(self, raw_days: int = RAW_RETENTION_DAYS,
+              fine_rollup_days: int = FINE_ROLLUP_RETENTION_DAYS) -> Dict[str, int]:
+        now = int(time.time())
+        with self._lock, self.conn:
+            raw = self.conn.execute("DELETE FROM samples WHERE ts < ?", (now - raw_days * 86400,)).rowcount
+            fine = self.conn.execute("DELETE FROM rollups WHERE resolution = ? AND bucket < ?",
+                                     (RESOLUTIONS["5m"], now - fine_rollup_days * 86400)).rowcount
+        return {"samples": raw, "rollups_5m": fine}
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.conn.close()
+        atexit.unregister(self.flush)
@@ -5,12 +5,57 @@ Mission100의 성공 요소들을 재사용 가능한 모듈로 분해
 """
 
 import os
+import re
+import sys
+import time
 import yaml
 import json
 from pathlib import Path
-from typing import Dict, List, Any
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from typing import Dict, List, Any, Optional, Set
+from dataclasses import dataclass, asdict, fields, replace
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from dart_template_engine import TemplateError, default_engine
+from factory_profiler import run_entry_point
+from generated_output import GeneratedOutput, GenerationSummary
+from generation_graph import GRAPH_NAME, GenerationGraph, RegenerationWatcher, field_hash
+from pub_dependency_planner import PORTFOLIO_DEV_DEPENDENCIES, standard_dependency_lines
+
+# 생성 파일 경로 → 템플릿 (templates/modular/)
+APP_TEMPLATES = {
+    "lib/utils/{exercise_type}_data.dart": "modular/exercise_data.dart.tmpl",
+    "lib/utils/{exercise_type}_theme.dart": "modular/theme.dart.tmpl",
+    "lib/main.dart": "modular/main.dart.tmpl",
+    "pubspec.yaml": "modular/pubspec.yaml.tmpl",
+}
+
+APP_DEPENDENCIES = ["google_mobile_ads", "shared_preferences", "sqflite", "fl_chart"]
+
+# features 에 있으면 프로그레션 표를 Dart 상수 대신 JSON 에셋으로 내보내고 시작 시 한 번 로드
+JSON_PROGRAM_FEATURE = "json_program_asset"
+PROGRAM_ASSET_PATH = "assets/data/{exercise_type}_program.json"
+
+GENERATOR_NAME = "modular_app_factory"
+
+# 앱 설정 파일 (없으면 load_app_configs 의 기본 설정 사용)
+APP_CONFIG_FILE = Path("app_configs.yaml")
+
+# 템플릿 컨텍스트 이름 → 값을 만드는 AppConfig 필드 (의존성 그래프용)
+CONTEXT_FIELDS = {
+    "app_name": ["app_name"],
+    "package_short": ["package_name"],
+    "exercise_type": ["exercise_type"],
+    "class_prefix": ["exercise_type"],
+    "scientific_basis": ["scientific_basis"],
+    "target_goal": ["target_goal"],
+    "theme": ["theme"],
+    "progression": ["exercise_type", "progression_type"],
+    "progression_asset": ["features"],
+}
+
+# 출력 경로를 바꾸는 필드 (바뀌면 앱 전체 재생성 + 이전 파일 정리)
+PATH_FIELDS = {"package_name", "exercise_type"}
 
 @dataclass
 class AppConfig:
@@ -28,10 +73,13 @@ class AppConfig:
 class ModularAppFactory:
     """모듈화된 앱 팩토리 메인 클래스"""
 
-    def __init__(self):
+    def __init__(self, output_dir: Path = None):
         self.modules_dir = Path("modules")
         self.templates_dir = Path("templates")
-        self.output_dir = Path("flutter_apps")
+        self.output_dir = Path(output_dir or "flutter_apps")
+        self.template_engine = default_engine()
+        self.output = GeneratedOutput()
+        self.graph = GenerationGraph(self.output_dir / GRAPH_NAME)
         self._ensure_directories()
 
     def _ensure_directories(self):
@@ -39,42 +87,36 @@ class ModularAppFactory:
         for dir_path in [self.modules_dir, self.templates_dir, self.output_dir]:
             dir_path.mkdir(exist_ok=True)
 
-    def generate_app(self, config: AppConfig) -> bool:
-        """설정 기반 앱 생성"""
+    def generate_app(self, config: AppConfig, only_files: Set[str] = None) -> bool:
+        """설정 기반 앱 생성 (only_files 를 주면 해당 파일만 다시 생성)"""
         try:
             print(f"🚀 {config.app_name} 생성 시작...")
 
-            # 1. 앱 디렉토리 생성
-            app_dir = self._create_app_structure(config)
+            # 1~2. 앱 디렉토리 생성 + 템플릿 렌더링
+            app_dir, files, counts = self._generate_files(config, only_files)
 
-            # 2. 운동 데이터 모듈 생성
-            self._generate_exercise_module(config, app_dir)
+            # 3. 템플릿/설정 필드 → 출력 파일 의존성 기록
+            self.graph.record_app(app_dir.name, GENERATOR_NAME, self._field_hashes(config),
+                                  self._dependency_outputs(config, files), replace=only_files is None)
 
-            # 3. 프로그레션 엔진 설정
-            self._setup_progression_engine(config, app_dir)
-
-            # 4. 테마 시스템 적용
-            self._apply_theme_system(config, app_dir)
-
-            # 5. UI 컴포넌트 조립
-            self._assemble_ui_components(config, app_dir)
-
-            # 6. 수익화 모듈 통합
-            self._integrate_monetization(config, app_dir)
-
-            # 7. 메인 앱 파일 생성
-            self._generate_main_app(config, app_dir)
-
-            # 8. pubspec.yaml 생성
-            self._generate_pubspec(config, app_dir)
-
-            print(f"✅ {config.app_name} 생성 완료!")
+            print(f"✅ {config.app_name} 생성 완료! (작성 {counts['written']}, "
+                  f"변경 없음 {counts['unchanged']}, 삭제 {counts['deleted']})")
             return True
 
         except Exception as e:
             print(f"❌ {config.app_name} 생성 실패: {e}")
             return False
 
+    def _generate_files(self, config: AppConfig, only_files: Set[str] = None):
+        """앱 디렉토리 생성 후 렌더링 결과 반영 → (앱 디렉토리, 파일 내용, 작성/변경 없음/삭제 수)"""
+        app_dir = self._create_app_structure(config)
+
+        # 템플릿 렌더링 (운동 데이터, 테마, 메인 앱, pubspec.yaml)
+        # 내용이 바뀐 파일만 쓰고, 더 이상 생성하지 않는 파일은 삭제
+        files = self.render_app(config, only_files)
+        counts = self.output.sync(app_dir, files, prune=only_files is None)
+        return app_dir, files, counts
+
     def _create_app_structure(self, config: AppConfig) -> Path:
         """Flutter 앱 기본 구조 생성"""
         app_dir = self.output_dir / config.package_name.split('.')[-1]
@@ -91,62 +133,140 @@ class ModularAppFactory:
 
         return app_dir
 
-    def _generate_exercise_module(self, config: AppConfig, app_dir: Path):
-        """운동별 데이터 모듈 생성"""
-
-        exercise_data = self._get_exercise_progression_data(config.exercise_type, config.progression_type)
-
-        module_content = f'''import 'package:flutter/material.dart';
-import '../models/user_profile.dart';
-
-/// {config.app_name} 전용 운동 프로그레션 데이터
-/// 과학적 근거: {config.scientific_basis}
-class {config.exercise_type.title()}Data {{
-
-  /// 레벨별 설명
-  static Map<UserLevel, String> get levelDescriptions => {{
-    UserLevel.rookie: '초보자 - 기본기 습득',
-    UserLevel.rising: '중급자 - 실력 향상',
-    UserLevel.alpha: '상급자 - 고급 기술',
-    UserLevel.giga: '전문가 - 마스터 레벨',
-  }};
-
-  /// 6주 프로그레션 프로그램
-  static Map<UserLevel, Map<int, Map<int, List<int>>>> get progressionPrograms => {{
-{self._format_progression_data(exercise_data)}
-  }};
-
-  /// 레벨별 목표
-  static Map<UserLevel, String> get goals => {{
-    UserLevel.rookie: '{config.target_goal} (초보자)',
-    UserLevel.rising: '{config.target_goal} (중급자)',
-    UserLevel.alpha: '{config.target_goal} (상급자)',
-    UserLevel.giga: '{config.target_goal} (전문가)',
-  }};
-
-  /// 휴식 시간 (초)
-  static Map<UserLevel, int> get restTimeSeconds => {{
-    UserLevel.rookie: 90,
-    UserLevel.rising: 75,
-    UserLevel.alpha: 60,
-    UserLevel.giga: 45,
-  }};
-
-  /// 주간 포커스
-  static Map<int, String> get weeklyFocus => {{
-    1: '기본기 다지기',
-    2: '자세 안정화',
-    3: '볼륨 증가',
-    4: '강도 상승',
-    5: '고강도 적응',
-    6: '최대 성능',
-  }};
-}}
-''';
-
-        exercise_file = app_dir / f"lib/utils/{config.exercise_type}_data.dart"
-        with open(exercise_file, 'w', encoding='utf-8') as f:
-            f.write(module_content)
+    def _template_context(self, config: AppConfig) -> Dict[str, Any]:
+        """템플릿 렌더링 컨텍스트"""
+        return {
+            "app_name": config.app_name,
+            "package_short": config.package_name.split('.')[-1],
+            "exercise_type": config.exercise_type,
+            "class_prefix": config.exercise_type.title(),
+            "scientific_basis": config.scientific_basis,
+            "target_goal": config.target_goal,
+            "theme": config.theme,
+            "progression": self._get_exercise_progression_data(config.exercise_type, config.progression_type),
+            "progression_asset": JSON_PROGRAM_FEATURE in config.features,
+            "dependency_lines": standard_dependency_lines(APP_DEPENDENCIES),
+            "dev_dependencies": PORTFOLIO_DEV_DEPENDENCIES,
+        }
+
+    def _app_templates(self, config: AppConfig) -> Dict[str, str]:
+        """{출력 상대 경로: 템플릿 이름}"""
+        return {relative_path.format(exercise_type=config.exercise_type): template
+                for relative_path, template in APP_TEMPLATES.items()}
+
+    def _output_paths(self, config: AppConfig) -> Set[str]:
+        """설정으로 생성할 출력 파일 경로 (기능에 따라 데이터 에셋 추가)"""
+        paths = set(self._app_templates(config))
+        if JSON_PROGRAM_FEATURE in config.features:
+            paths.add(PROGRAM_ASSET_PATH.format(exercise_type=config.exercise_type))
+        return paths
+
+    def render_app(self, config: AppConfig, only_files: Set[str] = None) -> Dict[str, str]:
+        """앱 파일 내용 렌더링 (디스크에 쓰지 않음) - {앱 기준 상대 경로: 내용}"""
+        context = self._template_context(config)
+        files = {
+            relative_path: self.template_engine.render(template, context)
+            for relative_path, template in self._app_templates(config).items()
+            if only_files is None or relative_path in only_files
+        }
+
+        if context["progression_asset"]:
+            asset_path = PROGRAM_ASSET_PATH.format(exercise_type=config.exercise_type)
+            if only_files is None or asset_path in only_files:
+                files[asset_path] = json.dumps(context["progression"], ensure_ascii=False, separators=(",", ":")) + "\n"
+        return files
+
+    @staticmethod
+    def _field_hashes(config: AppConfig) -> Dict[str, str]:
+        return {f.name: field_hash(getattr(config, f.name)) for f in fields(AppConfig)}
+
+    def _template_hash(self, template: str) -> Optional[str]:
+        """현재 템플릿 해시 (삭제됐으면 None)"""
+        try:
+            return self.template_engine.template_hash(template)
+        except TemplateError:
+            return None
+
+    def _dependency_outputs(self, config: AppConfig, files: Dict[str, str]) -> Dict[str, Dict]:
+        """출력 파일별 사용 템플릿(+ include) 해시와 참조 설정 필드"""
+        outputs = {}
+        app_templates = self._app_templates(config)
+        for relative_path in files:
+            template = app_templates.get(relative_path)
+            if template is None:
+                # 템플릿 없이 설정에서 바로 만드는 데이터 에셋
+                outputs[relative_path] = {"templates": {}, "fields": ["exercise_type", "features", "progression_type"]}
+                continue
+            names = {template} | self.template_engine.dependencies(template)
+            referenced = set()
+            for variable in self.template_engine.variables(template):
+                referenced.update(CONTEXT_FIELDS.get(variable, []))
+            outputs[relative_path] = {
+                "templates": {name: self._template_hash(name) for name in sorted(names)},
+                "fields": sorted(referenced)
+            }
+        return outputs
+
+    def plan_regeneration(self, configs: List[AppConfig]) -> Dict[str, Optional[Set[str]]]:
+        """템플릿/설정 변경으로 다시 생성할 {앱: 파일 집합 (None = 앱 전체)}"""
+        current_hashes = {name: self._template_hash(name) for name in self.graph.template_names()}
+        by_template = self.graph.affected_by_templates(current_hashes, GENERATOR_NAME)
+
+        plan = {}
+        for config in configs:
+            app = config.package_name.split('.')[-1]
+            field_hashes = self._field_hashes(config)
+            if self.graph.changed_fields(app, field_hashes) & PATH_FIELDS:
+                plan[app] = None
+                continue
+            # 출력 파일 구성이 바뀌면(기능 추가/제거로 에셋 생김/사라짐) 앱 전체 재생성 + 이전 파일 정리
+            if self.graph.outputs(app, GENERATOR_NAME) != self._output_paths(config):
+                plan[app] = None
+                continue
+            by_fields = self.graph.affected_by_fields(app, field_hashes, GENERATOR_NAME)
+            if by_fields is None:
+                plan[app] = None
+                continue
+            files = by_fields | by_template.get(app, set())
+            if files:
+                plan[app] = files
+        return plan
+
+    def regenerate_changed(self, configs: List[AppConfig]) -> Dict[str, Optional[Set[str]]]:
+        """영향받는 앱/파일만 다시 생성"""
+        plan = self.plan_regeneration(configs)
+
+        # 다른 생성기(알림 시스템 등)가 만든 파일은 알려주기만 함
+        current_hashes = {name: self._template_hash(name) for name in self.graph.template_names()}
+        for app, files in sorted(self.graph.affected_by_templates(current_hashes).items()):
+            others = {path for path in files
+                      if self.graph.data["apps"][app]["outputs"][path]["generator"] != GENERATOR_NAME}
+            if others:
+                print(f"ℹ️ {app}: 다른 생성기 출력도 템플릿 변경 영향 - {', '.join(sorted(others))}")
+        if not plan:
+            print("✨ 다시 생성할 앱이 없습니다")
+            return plan
+
+        configs_by_app = {config.package_name.split('.')[-1]: config for config in configs}
+        for app, files in sorted(plan.items()):
+            print(f"🔁 {app}: {'전체' if files is None else ', '.join(sorted(files))}")
+            self.generate_app(configs_by_app[app], only_files=files)
+        return plan
+
+    def watch(self, config_file: Path = APP_CONFIG_FILE):
+        """templates/ 와 앱 설정 파일 변경 시 영향받는 앱/파일만 다시 생성"""
+        config_file = Path(config_file).resolve()
+
+        def on_change(changed: Set[Path]):
+            relevant = {path for path in changed if path == config_file or self.templates_dir.resolve() in path.parents}
+            if not relevant:
+                return
+            print(f"\n📂 변경 감지: {', '.join(path.name for path in sorted(relevant))}")
+            self.regenerate_changed(load_app_configs(config_file))
+            self.output.summary.print_summary()
+            self.output.summary = GenerationSummary()
+
+        RegenerationWatcher([self.templates_dir, config_file], on_change).run()
 
     def _get_exercise_progression_data(self, exercise_type: str, progression_type: str) -> Dict:
         """운동 타입에 따른 프로그레션 데이터 생성"""
@@ -218,247 +338,18 @@ class {config.exercise_type.title()}Data {{
 
         return base_data
 
-    def _format_progression_data(self, data: Dict) -> str:
-        """프로그레션 데이터를 Dart 코드 형식으로 포맷"""
-        result = []
-
-        for level, weeks in data.items():
-            result.append(f"    UserLevel.{level}: {{")
-            for week, days in weeks.items():
-                result.append(f"      {week}: {{")
-                for day, sets in days.items():
-                    sets_str = str(sets).replace("'", "")
-                    result.append(f"        {day}: {sets_str},")
-                result.append("      },")
-            result.append("    },")
-
-        return '\n'.join(result)
-
-    def _setup_progression_engine(self, config: AppConfig, app_dir: Path):
-        """프로그레션 엔진 설정"""
-        pass  # 이미 exercise module에서 처리됨
-
-    def _apply_theme_system(self, config: AppConfig, app_dir: Path):
-        """테마 시스템 적용"""
-
-        theme_content = f'''import 'package:flutter/material.dart';
-
-class {config.exercise_type.title()}Theme {{
-  // {config.app_name} 전용 색상 팔레트
-  static const Color primaryColor = Color({config.theme['primary_color_hex']});
-  static const Color secondaryColor = Color({config.theme['secondary_color_hex']});
-  static const Color backgroundColor = Color(0xFF1A1A1A);
-  static const Color surfaceColor = Color(0xFF2A2A2A);
-
-  static ThemeData get themeData => ThemeData(
-    useMaterial3: true,
-    brightness: Brightness.dark,
-    scaffoldBackgroundColor: backgroundColor,
-    primaryColor: primaryColor,
-
-    appBarTheme: AppBarTheme(
-      backgroundColor: surfaceColor,
-      foregroundColor: primaryColor,
-      elevation: 0,
-    ),
-
-    elevatedButtonTheme: ElevatedButtonThemeData(
-      style: ElevatedButton.styleFrom(
-        backgroundColor: primaryColor,
-        foregroundColor: Colors.black,
-        textStyle: TextStyle(fontWeight: FontWeight.bold),
-      ),
-    ),
-
-    cardTheme: CardTheme(
-      color: surfaceColor,
-      elevation: 4,
-      shape: RoundedRectangleBorder(
-        borderRadius: BorderRadius.circular(12),
-      ),
-    ),
-  );
-}}
-''';
-
-        theme_file = app_dir / f"lib/utils/{config.exercise_type}_theme.dart"
-        with open(theme_file, 'w', encoding='utf-8') as f:
-            f.write(theme_content)
-
-    def _assemble_ui_components(self, config: AppConfig, app_dir: Path):
-        """UI 컴포넌트 조립"""
-        pass  # 메인 앱에서 처리
-
-    def _integrate_monetization(self, config: AppConfig, app_dir: Path):
-        """수익화 모듈 통합"""
-        pass  # 표준 AdMob 통합
-
-    def _generate_main_app(self, config: AppConfig, app_dir: Path):
-        """메인 앱 파일 생성"""
-
-        main_content = f'''import 'package:flutter/material.dart';
-import 'package:google_mobile_ads/google_mobile_ads.dart';
-import 'utils/{config.exercise_type}_theme.dart';
-
-void main() async {{
-  WidgetsFlutterBinding.ensureInitialized();
-  await MobileAds.instance.initialize();
-  runApp(const {config.exercise_type.title()}App());
-}}
-
-class {config.exercise_type.title()}App extends StatelessWidget {{
-  const {config.exercise_type.title()}App({{super.key}});
-
-  @override
-  Widget build(BuildContext context) {{
-    return MaterialApp(
-      title: '{config.app_name}',
-      debugShowCheckedModeBanner: false,
-      theme: {config.exercise_type.title()}Theme.themeData,
-      home: const {config.exercise_type.title()}HomeScreen(),
-    );
-  }}
-}}
-
-class {config.exercise_type.title()}HomeScreen extends StatefulWidget {{
-  const {config.exercise_type.title()}HomeScreen({{super.key}});
-
-  @override
-  State<{config.exercise_type.title()}HomeScreen> createState() => _{config.exercise_type.title()}HomeScreenState();
-}}
-
-class _{config.exercise_type.title()}HomeScreenState extends State<{config.exercise_type.title()}HomeScreen> {{
-  int currentWeek = 1;
-  int currentDay = 1;
-
-  @override
-  Widget build(BuildContext context) {{
-    return Scaffold(
-      appBar: AppBar(
-        title: Text('🏋️‍♂️ {config.app_name}'),
-        centerTitle: true,
-      ),
-      body: Padding(
-        padding: const EdgeInsets.all(16.0),
-        child: Column(
-          children: [
-            Card(
-              child: Padding(
-                padding: const EdgeInsets.all(16.0),
-                child: Column(
-                  children: [
-                    Text(
-                      'Week $currentWeek - Day $currentDay',
-                      style: TextStyle(
-                        fontSize: 24,
-                        fontWeight: FontWeight.bold,
-                        color: {config.exercise_type.title()}Theme.primaryColor,
-                      ),
-                    ),
-                    SizedBox(height: 8),
-                    Text(
-                      '{config.target_goal}을 향해!',
-                      style: TextStyle(fontSize: 18),
-                    ),
-                  ],
-                ),
-              ),
-            ),
-
-            SizedBox(height: 20),
-
-            Expanded(
-              child: Card(
-                child: Padding(
-                  padding: const EdgeInsets.all(16.0),
-                  child: Column(
-                    children: [
-                      Text(
-                        '오늘의 {config.exercise_type.title()} 프로그램',
-                        style: TextStyle(
-                          fontSize: 20,
-                          fontWeight: FontWeight.bold,
-                        ),
-                      ),
-                      SizedBox(height: 20),
-                      Expanded(
-                        child: Center(
-                          child: Text(
-                            '준비 중...',
-                            style: TextStyle(fontSize: 18),
-                          ),
-                        ),
-                      ),
-                    ],
-                  ),
-                ),
-              ),
-            ),
-
-            SizedBox(height: 20),
-
-            ElevatedButton(
-              onPressed: () {{
-                // TODO: 운동 시작 로직
-              }},
-              style: ElevatedButton.styleFrom(
-                padding: EdgeInsets.symmetric(horizontal: 48, vertical: 16),
-              ),
-              child: Text(
-                '🔥 운동 시작하기',
-                style: TextStyle(fontSize: 18, fontWeight: FontWeight.bold),
-              ),
-            ),
-          ],
-        ),
-      ),
-    );
-  }}
-}}
-''';
-
-        main_file = app_dir / "lib/main.dart"
-        with open(main_file, 'w', encoding='utf-8') as f:
-            f.write(main_content)
-
-    def _generate_pubspec(self, config: AppConfig, app_dir: Path):
-        """pubspec.yaml 생성"""
-
-        pubspec_content = f'''name: {config.package_name.split('.')[-1]}
-description: {config.app_name} - 6주 프로그레션 챌린지
-
-publish_to: 'none'
-version: 1.0.0+1
-
-environment:
-  sdk: '>=3.0.0 <4.0.0'
-  flutter: ">=3.0.0"
-
-dependencies:
-  flutter:
-    sdk: flutter
-  google_mobile_ads: ^5.3.1
-  shared_preferences: ^2.2.2
-  sqflite: ^2.3.0
-  fl_chart: ^0.66.2
-
-dev_dependencies:
-  flutter_test:
-    sdk: flutter
-  flutter_lints: ^5.0.0
-
-flutter:
-  uses-material-design: true
-  assets:
-    - assets/images/
-''';
-
-        pubspec_file = app_dir / "pubspec.yaml"
-        with open(pubspec_file, 'w', encoding='utf-8') as f:
-            f.write(pubspec_content)
-
-def load_app_configs() -> List[AppConfig]:
-    """앱 설정 파일들 로드"""
+def load_app_configs(config_file: Path = APP_CONFIG_FILE) -> List[AppConfig]:
+    """앱 설정 파일들 로드 (config_file 이 있으면 그 파일, 없으면 기본 설정)"""
+
+    config_file = Path(config_file)
+    if config_file.exists():
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return [AppConfig(**item) for item in yaml.safe_load(f) or []]
+
+    return default_app_configs()
+
+def default_app_configs() -> List[AppConfig]:
+    """기본 앱 설정 (앱 설정 파일이 없을 때 사용)"""
 
     configs = [
         AppConfig(
@@ -524,8 +415,253 @@ def load_app_configs() -> List[AppConfig]:
 
     return configs
 
+def load_manifest_dir(manifest_dir: Path) -> List[AppConfig]:
+    """매니페스트 디렉토리의 *.yaml / *.yml / *.json 앱 설정 로드 (파일당 앱 1개 또는 목록)"""
+    configs = []
+    for path in sorted(Path(manifest_dir).iterdir()):
+        if path.suffix not in (".yaml", ".yml", ".json"):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
+        for item in (data if isinstance(data, list) else [data]):
+            configs.append(AppConfig(**item))
+    return configs
+
+# 벌크 생성 워커 프로세스마다 하나씩 만드는 팩토리
+_bulk_factory: Optional[ModularAppFactory] = None
+
+def _init_bulk_worker(output_dir: Path):
+    global _bulk_factory
+    _bulk_factory = ModularAppFactory(output_dir)
+
+def _bulk_generate(config: AppConfig) -> Dict[str, Any]:
+    """워커에서 앱 하나 생성 (의존성 그래프는 부모 프로세스가 한 번에 기록)"""
+    factory = _bulk_factory
+    try:
+        app_dir, files, counts = factory._generate_files(config)
+        return {
+            "app": app_dir.name,
+            "ok": True,
+            "counts": counts,
+            "fields": factory._field_hashes(config),
+            "outputs": factory._dependency_outputs(config, files)
+        }
+    except Exception as e:
+        return {"app": config.package_name.split('.')[-1], "ok": False, "error": str(e)}
+
+def bulk_generate(configs: List[AppConfig], output_dir: Path = None, workers: int = None,
+                  quiet: bool = False) -> Dict[str, Any]:
+    """대량 앱 생성 - CPU 수만큼 프로세스 풀에서 생성하고 진행 상황 출력
+
+    workers=1 이면 같은 코드 경로를 현재 프로세스에서 순차 실행 (결과 동일)
+    """
+    output_dir = Path(output_dir or "flutter_apps")
+    workers = workers or os.cpu_count() or 1
+
+    app_counts = Counter(config.package_name.split('.')[-1] for config in configs)
+    duplicates = sorted(app for app, count in app_counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"같은 앱 디렉토리로 생성되는 설정이 있습니다: {', '.join(duplicates)}")
+
+    total = len(configs)
+    report_every = max(1, total // 20)
+    results = []
+    start = time.perf_counter()
+
+    def progress(result: Dict[str, Any]):
+        results.append(result)
+        done = len(results)
+        if not result["ok"]:
+            print(f"  ❌ {result['app']}: {result['error']}")
+        if not quiet and (done % report_every == 0 or done == total):
+            elapsed = time.perf_counter() - start
+            print(f"  [{done}/{total}] {done / elapsed if elapsed else 0:.1f} apps/s")
+
+    if workers == 1:
+        _init_bulk_worker(output_dir)
+        for config in configs:
+            progress(_bulk_generate(config))
+    else:
+        # 작은 작업이 많으므로 여러 개씩 묶어서 전달
+        chunksize = max(1, min(32, total // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_bulk_worker,
+                                 initargs=(output_dir,)) as executor:
+            for result in executor.map(_bulk_generate, configs, chunksize=chunksize):
+                progress(result)
+
+    elapsed = time.perf_counter() - start
+
+    # 의존성 그래프는 부모에서 한 번에 기록 (프로세스 간 동시 쓰기 방지)
+    graph = GenerationGraph(output_dir / GRAPH_NAME)
+    for result in results:
+        if result["ok"]:
+            graph.record_app(result["app"], GENERATOR_NAME, result["fields"], result["outputs"], save=False)
+    graph.save()
+
+    succeeded = [result for result in results if result["ok"]]
+    summary = {
+        "apps": total,
+        "succeeded": len(succeeded),
+        "failed": total - len(succeeded),
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "apps_per_second": round(total / elapsed, 1) if elapsed else 0.0,
+        "written": sum(result["counts"]["written"] for result in succeeded),
+        "unchanged": sum(result["counts"]["unchanged"] for result in succeeded),
+        "deleted": sum(result["counts"]["deleted"] for result in succeeded),
+    }
+    if not quiet:
+        print(f"📦 {summary['succeeded']}/{total}개 앱 생성 ({workers} 프로세스, {summary['seconds']}초, "
+              f"{summary['apps_per_second']} apps/s)")
+        print(f"📝 생성 파일: 작성 {summary['written']}개, 변경 없음 {summary['unchanged']}개, "
+              f"삭제 {summary['deleted']}개")
+    return summary
+
+def synthetic_configs(app_count: int) -> List[AppConfig]:
+    """벤치마크용 - 기본 설정을 변형한 app_count 개 설정"""
+    base_configs = load_app_configs()
+    return [
+        replace(base, app_name=f"{base.app_name} {i}", package_name=f"{base.package_name}{i}",
+                target_goal=f"{base.target_goal} #{i}")
+        for i, base in ((i, base_configs[i % len(base_configs)]) for i in range(app_count))
+    ]
+
+def benchmark_bulk(app_counts: List[int] = (10, 100, 1000)) -> List[Dict[str, Any]]:
+    """벌크 생성 벤치마크 - 순차(1 프로세스) vs 프로세스 풀 apps/s"""
+    import tempfile
+
+    rows = []
+    for app_count in app_counts:
+        configs = synthetic_configs(app_count)
+        row = {"apps": app_count}
+        for label, workers in (("sequential", 1), ("parallel", os.cpu_count() or 1)):
+            with tempfile.TemporaryDirectory(prefix="bulk_bench_") as tmp_dir:
+                result = bulk_generate(configs, Path(tmp_dir) / "flutter_apps", workers=workers, quiet=True)
+            row[label] = result["apps_per_second"]
+        rows.append(row)
+
+    print(f"⏱️ 벌크 생성 벤치마크 (CPU {os.cpu_count()}개)")
+    print(f"  {'앱 수':>6} {'순차 apps/s':>12} {'병렬 apps/s':>12}")
+    for row in rows:
+        print(f"  {row['apps']:>6} {row['sequential']:>12} {row['parallel']:>12}")
+    return rows
+
+def parse_progression_table(dart_source: str) -> Dict[str, Dict[str, Dict[str, List[int]]]]:
+    """생성된 Dart 의 progressionPrograms 표 → {레벨: {주: {일: [세트]}}} (키는 문자열)"""
+    block = dart_source.split("progressionPrograms", 1)[-1]
+    table: Dict[str, Dict[str, Dict[str, List[int]]]] = {}
+    level = week = None
+    for line in block.splitlines():
+        if line == "  };":
+            break
+        match = re.match(r"^\s*UserLevel\.(\w+): \{$", line)
+        if match:
+            level = match.group(1)
+            table[level] = {}
+            continue
+        match = re.match(r"^ {6}(\d+): \{$", line)
+        if match and level is not None:
+            week = match.group(1)
+            table[level][week] = {}
+            continue
+        match = re.match(r"^ {8}(\d+): \[([\d, ]*)\],$", line)
+        if match and week is not None:
+            table[level][week][match.group(1)] = [int(v) for v in match.group(2).split(",") if v.strip()]
+    return table
+
+def verify_program_data(configs: List[AppConfig] = None) -> List[str]:
+    """생성된 프로그레션 데이터(Dart 상수 표 또는 JSON 에셋)가 원본 설정 데이터와 같은지 검사"""
+    factory = ModularAppFactory()
+    mismatches = []
+    for config in configs or load_app_configs():
+        expected = json.loads(json.dumps(
+            factory._get_exercise_progression_data(config.exercise_type, config.progression_type)))
+        files = factory.render_app(config)
+
+        asset_path = PROGRAM_ASSET_PATH.format(exercise_type=config.exercise_type)
+        if asset_path in files:
+            actual = json.loads(files[asset_path])
+        else:
+            actual = parse_progression_table(files[f"lib/utils/{config.exercise_type}_data.dart"])
+
+        status = "✅" if actual == expected else "❌"
+        print(f"  {status} {config.app_name}: {sum(len(days) for weeks in actual.values() for days in weeks.values())}일 분량")
+        if actual != expected:
+            mismatches.append(config.app_name)
+    return mismatches
+
+def benchmark_generation(app_count: int = 500) -> Dict[str, float]:
+    """템플릿 렌더링 벤치마크 - 설정을 변형한 app_count 개 앱을 메모리에서 생성"""
+    factory = ModularAppFactory()
+    configs = synthetic_configs(app_count)
+
+    start = time.perf_counter()
+    total_bytes = 0
+    for config in configs:
+        total_bytes += sum(len(content) for content in factory.render_app(config).values())
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "apps": app_count,
+        "seconds": round(elapsed, 3),
+        "apps_per_second": round(app_count / elapsed, 1) if elapsed else 0.0,
+        "ms_per_app": round(elapsed / app_count * 1000, 3),
+        "output_mb": round(total_bytes / 1024 / 1024, 1),
+        "templates_compiled": factory.template_engine.stats["compiled"],
+    }
+
+    print(f"⏱️ {app_count}개 앱 렌더링: {result['seconds']}초 "
+          f"({result['apps_per_second']} apps/s, 앱당 {result['ms_per_app']}ms)")
+    print(f"  출력 {result['output_mb']}MB, 컴파일된 템플릿 {result['templates_compiled']}개")
+    return result
+
+def save_app_configs(configs: List[AppConfig], config_file: Path = APP_CONFIG_FILE):
+    """앱 설정을 YAML 파일로 저장 (감시 모드에서 편집용)"""
+    with open(config_file, 'w', encoding='utf-8') as f:
+        yaml.safe_dump([asdict(config) for config in configs], f, allow_unicode=True, sort_keys=False)
+    print(f"💾 앱 설정 저장: {config_file}")
+
 def main():
     """메인 실행 함수"""
+    if "--bulk" in sys.argv:
+        # python modular_app_factory.py --bulk <매니페스트 디렉토리> [--workers N]
+        manifest_dir = Path(sys.argv[sys.argv.index("--bulk") + 1])
+        workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else None
+        configs = load_manifest_dir(manifest_dir)
+        print(f"🏭 벌크 생성: {manifest_dir} ({len(configs)}개 설정)")
+        summary = bulk_generate(configs, workers=workers)
+        sys.exit(1 if summary["failed"] else 0)
+
+    if "--benchmark-bulk" in sys.argv:
+        benchmark_bulk()
+        return
+
+    if "--benchmark" in sys.argv:
+        index = sys.argv.index("--benchmark")
+        count = int(sys.argv[index + 1]) if len(sys.argv) > index + 1 else 500
+        benchmark_generation(count)
+        return
+
+    if "--verify" in sys.argv:
+        print("🔍 프로그레션 데이터 검증")
+        mismatches = verify_program_data()
+        print("✅ 모든 앱 일치" if not mismatches else f"❌ 불일치: {', '.join(mismatches)}")
+        sys.exit(1 if mismatches else 0)
+
+    if "--export-configs" in sys.argv:
+        save_app_configs(load_app_configs())
+        return
+
+    if "--changed" in sys.argv or "--watch" in sys.argv:
+        # 의존성 그래프 기준으로 영향받는 앱/파일만 다시 생성
+        factory = ModularAppFactory()
+        factory.regenerate_changed(load_app_configs())
+        factory.output.summary.print_summary()
+        if "--watch" in sys.argv:
+            factory.output.summary = GenerationSummary()
+            factory.watch()
+        return
+
     print("🏗️ 모듈화된 앱 팩토리 시작...")
     print("=" * 60)
 
@@ -546,6 +682,7 @@ def main():
     success_count = sum(results)
     print(f"\n" + "=" * 60)
     print(f"✅ {success_count}/{len(configs)}개 앱 생성 완료!")
+    factory.output.summary.print_summary()
 
     if success_count > 0:
         print("\n🔄 다음 단계:")
@@ -554,4 +691,4 @@ def main():
         print("3. flutter run")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_entry_point(main, "modular_app_factory")
\ No newline at end of file
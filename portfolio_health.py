@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🩺 포트폴리오 건강 체크 실행기
+flutter_apps/ 의 앱들을 동시 실행 제한 안에서 병렬로 검사하고 하나의 통합 리포트로 정리
+(전체 검사 시간 ≈ 가장 느린 앱 검사 시간)
+빌드 디렉토리 크기는 Path 객체를 만들지 않는 os.scandir 반복 순회로 계산
+"""
+
+import os
+import time
+import asyncio
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+# 동시에 검사할 앱 수 (flutter 명령 자체는 AsyncCommandRunner 가 종류별로 다시 제한)
+DEFAULT_CONCURRENCY = 4
+
+
+def directory_size(path: Union[str, Path]) -> int:
+    """디렉토리 전체 파일 크기 (심볼릭 링크는 따라가지 않음, 읽을 수 없는 항목은 건너뜀)"""
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def list_app_dirs(apps_root: Union[str, Path] = "flutter_apps") -> List[Path]:
+    """앱 디렉토리 목록 (이름순)"""
+    try:
+        with os.scandir(apps_root) as entries:
+            return sorted(Path(entry.path) for entry in entries if entry.is_dir())
+    except FileNotFoundError:
+        return []
+
+
+class PortfolioHealthRunner:
+    """앱별 검사 함수를 병렬 실행 → 통합 리포트
+
+    check(app_dir) 는 발견한 문제 목록을 반환 (None 이면 검사 함수가 직접 보고한 것으로 보고 빈 목록 취급)
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+
+    async def _run_one(self, semaphore: asyncio.Semaphore, app_dir: Path,
+                       check: Callable[[Path], Awaitable[Optional[List[str]]]]) -> Dict:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                issues = await check(app_dir) or []
+                status = "issues" if issues else "healthy"
+                error = None
+            except Exception as e:
+                issues, status, error = [], "failed", str(e)
+            return {
+                "app": app_dir.name,
+                "status": status,
+                "issues": issues,
+                "error": error,
+                "duration": round(time.perf_counter() - started, 3)
+            }
+
+    async def run(self, app_dirs: List[Path],
+                  check: Callable[[Path], Awaitable[Optional[List[str]]]]) -> Dict:
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(*(self._run_one(semaphore, app_dir, check) for app_dir in app_dirs))
+
+        slowest = max(results, key=lambda result: result["duration"], default=None)
+        return {
+            "apps": len(results),
+            "healthy": sum(1 for result in results if result["status"] == "healthy"),
+            "with_issues": sum(1 for result in results if result["status"] == "issues"),
+            "failed": sum(1 for result in results if result["status"] == "failed"),
+            "duration": round(time.perf_counter() - started, 3),
+            "slowest": {"app": slowest["app"], "duration": slowest["duration"]} if slowest else None,
+            "concurrency": self.concurrency,
+            "results": results
+        }
+
+
+def record_health_report(metrics, report: Dict, source: str):
+    """건강 체크 결과를 시계열 저장소(MetricsStore)에 기록"""
+    for result in report["results"]:
+        metrics.record("health.app_check_seconds", result["duration"],
+                       {"source": source, "app": result["app"], "status": result["status"]})
+    metrics.record("health.sweep_seconds", report["duration"], {"source": source})
+    metrics.record("health.apps_with_issues", report["with_issues"] + report["failed"], {"source": source})
+
+
+def format_health_report(report: Dict) -> str:
+    """문제 있는 앱만 한 줄씩"""
+    lines = []
+    for result in report["results"]:
+        if result["status"] == "issues":
+            lines.append(f"{result['app']}: {'; '.join(result['issues'])}")
+        elif result["status"] == "failed":
+            lines.append(f"{result['app']}: 검사 실패 - {result['error']}")
+    return "\n".join(lines)
+
+
+def print_health_report(report: Dict):
+    print(f"🩺 건강 체크: 앱 {report['apps']}개 - 정상 {report['healthy']}, 문제 {report['with_issues']}, "
+          f"실패 {report['failed']} ({report['duration']:.1f}초, 동시 {report['concurrency']})")
+    if report["slowest"]:
+        print(f"  🐢 가장 느린 앱: {report['slowest']['app']} ({report['slowest']['duration']:.1f}초)")
+    for line in format_health_report(report).splitlines():
+        print(f"  ⚠️ {line}")
@@ -14,6 +14,8 @@ import shutil
 from pathlib import Path
 from datetime import datetime
 
+from flutter_build_orchestrator import FlutterBuildOrchestrator, BuildJob
+
 class PriorityAppLauncher:
     def __init__(self):
         self.priority_apps = {
@@ -46,6 +48,8 @@ class PriorityAppLauncher:
             }
         }
 
+        self.orchestrator = FlutterBuildOrchestrator()
+
     def analyze_mission100_current_status(self):
         """Mission100 현재 상태 분석"""
         print("🔍 Mission100 현재 상태 분석 중...")
@@ -325,36 +329,16 @@ class PriorityAppLauncher:
         """앱 APK 빌드"""
         print(f"  🔨 {app_name} APK 빌드 중...")
 
-        try:
-            # Clean and get dependencies
-            subprocess.run(["flutter", "clean"], cwd=app_path, check=True)
-            subprocess.run(["flutter", "pub", "get"], cwd=app_path, check=True)
-
-            # Build release APK
-            subprocess.run(
-                ["flutter", "build", "apk", "--release"],
-                cwd=app_path,
-                check=True
-            )
+        job = BuildJob(app_name=app_name, app_path=Path(app_path),
+                       output_apk=Path("priority_releases") / f"{app_name}-v1.0.0-release.apk")
+        result = self.orchestrator.build_app(job)
 
-            # APK 파일 복사
-            apk_source = app_path / "build" / "app" / "outputs" / "flutter-apk" / "app-release.apk"
-            if apk_source.exists():
-                output_dir = Path("priority_releases")
-                output_dir.mkdir(exist_ok=True)
+        if result["status"] == "success":
+            print(f"  ✅ APK 빌드 완료: {result['apk_path']}")
+            return True
 
-                apk_dest = output_dir / f"{app_name}-v1.0.0-release.apk"
-                shutil.copy2(apk_source, apk_dest)
-
-                print(f"  ✅ APK 빌드 완료: {apk_dest}")
-                return True
-            else:
-                print(f"  ❌ APK 파일을 찾을 수 없음")
-                return False
-
-        except Exception as e:
-            print(f"  ❌ APK 빌드 실패: {e}")
-            return False
+        print(f"  ❌ APK 빌드 실패: {result.get('error')} (로그: {result['log_file']})")
+        return False
 
     def create_launch_roadmap(self):
         """출시 로드맵 생성"""
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📦 포트폴리오 pub 의존성 플래너
+모든 앱의 pubspec 제약을 모아 하나의 공유 버전 세트를 계산하고,
+pub 캐시를 한 번만 예열한 뒤 앱별로 `flutter pub get --offline` 실행
+공유 버전을 허용하지 않는 제약 때문에 별도 해석이 필요한 앱은 표시
+"""
+
+import re
+import sys
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+# 포트폴리오 표준 의존성 (앱 생성기/병합기가 모두 이 값을 사용)
+PORTFOLIO_DEPENDENCIES = {
+    "cupertino_icons": "^1.0.8",
+    "provider": "^6.1.2",
+    "shared_preferences": "^2.4.10",
+    "google_mobile_ads": "^5.3.1",
+    "sqflite": "^2.3.0",
+    "fl_chart": "^0.66.2",
+    "flutter_local_notifications": "^17.2.4",
+    "permission_handler": "^11.4.0",
+    "timezone": "^0.9.4"
+}
+
+PORTFOLIO_DEV_DEPENDENCIES = {
+    "flutter_lints": "^5.0.0"
+}
+
+WARMUP_DIR = Path.home() / ".cache" / "app-factory" / "pub_warmup"
+
+Version = Tuple[int, int, int]
+
+
+def parse_version(text: str) -> Optional[Version]:
+    """'1.2.3', '1.2.3+4', '1.2.3-dev' → (1, 2, 3) (프리릴리즈/빌드 메타는 무시)"""
+    match = re.match(r"^\s*(\d+)\.(\d+)\.(\d+)", str(text))
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+def format_version(version: Version) -> str:
+    return ".".join(str(part) for part in version)
+
+
+def constraint_bounds(constraint) -> Optional[Tuple[Optional[Version], Optional[Version]]]:
+    """pub 버전 제약을 [하한, 상한) 구간으로 변환 (해석 불가/any면 None)"""
+    if constraint is None:
+        return None
+    text = str(constraint).strip().strip("'\"")
+    if text in ("", "any"):
+        return None
+
+    if text.startswith("^"):
+        low = parse_version(text[1:])
+        if not low:
+            return None
+        if low[0] > 0:
+            high = (low[0] + 1, 0, 0)
+        else:
+            high = (0, low[1] + 1, 0)
+        return low, high
+
+    low, high = None, None
+    ranged = False
+    for op, value in re.findall(r"(>=|<=|>|<)\s*([0-9][^\s<>=]*)", text):
+        ranged = True
+        version = parse_version(value)
+        if op in (">=", ">"):
+            low = version
+        elif op == "<":
+            high = version
+        else:
+            high = (version[0], version[1], version[2] + 1)
+    if ranged:
+        return low, high
+
+    exact = parse_version(text)
+    if exact:
+        return exact, (exact[0], exact[1], exact[2] + 1)
+    return None
+
+
+def allows(constraint, version: Version) -> bool:
+    """제약이 버전을 허용하는지"""
+    bounds = constraint_bounds(constraint)
+    if bounds is None:
+        return True
+    low, high = bounds
+    return (low is None or version >= low) and (high is None or version < high)
+
+
+class PubDependencyPlanner:
+    """포트폴리오 공유 버전 세트 계산 + pub 캐시 예열"""
+
+    def __init__(self, app_dirs: List[Path], max_workers: int = 4):
+        self.app_dirs = [Path(app_dir) for app_dir in app_dirs]
+        self.max_workers = max_workers
+        self.flutter_bin = shutil.which("flutter") or "flutter"
+
+    @staticmethod
+    def _hosted_dependencies(section: Dict) -> Dict[str, str]:
+        """sdk/path/git 의존성을 제외한 호스티드 의존성 제약"""
+        deps = {}
+        for name, spec in (section or {}).items():
+            if isinstance(spec, dict):
+                if "version" in spec and "hosted" in spec:
+                    deps[name] = str(spec["version"])
+                continue
+            deps[name] = "any" if spec is None else str(spec)
+        return deps
+
+    def load_app(self, app_dir: Path) -> Optional[Dict]:
+        """앱의 직접 의존성 제약과 lock 해석 버전"""
+        pubspec_path = app_dir / "pubspec.yaml"
+        if not pubspec_path.exists():
+            return None
+
+        with open(pubspec_path, "r", encoding="utf-8") as f:
+            pubspec = yaml.safe_load(f) or {}
+
+        constraints = self._hosted_dependencies(pubspec.get("dependencies"))
+        constraints.update(self._hosted_dependencies(pubspec.get("dev_dependencies")))
+
+        locked = {}
+        lock_path = app_dir / "pubspec.lock"
+        if lock_path.exists():
+            with open(lock_path, "r", encoding="utf-8") as f:
+                lock = yaml.safe_load(f) or {}
+            for name, entry in (lock.get("packages") or {}).items():
+                if entry.get("source") == "hosted":
+                    locked[name] = entry.get("version")
+
+        return {
+            "app": app_dir.name,
+            "path": str(app_dir),
+            "constraints": constraints,
+            "locked": locked,
+            "overrides": sorted((pubspec.get("dependency_overrides") or {}).keys())
+        }
+
+    def plan(self) -> Dict:
+        """공유 버전 세트 계산
+
+        패키지마다 후보 버전(표준 제약 하한 + 각 앱 lock 버전) 중 가장 많은 앱이 허용하는
+        최신 버전을 고르고, 그 버전을 허용하지 않는 앱은 divergent 로 표시
+        """
+        apps = [app for app in (self.load_app(app_dir) for app_dir in self.app_dirs) if app]
+
+        packages: Dict[str, Dict] = {}
+        for app in apps:
+            for name, constraint in app["constraints"].items():
+                info = packages.setdefault(name, {"constraints": {}, "candidates": set()})
+                info["constraints"][app["app"]] = constraint
+                locked = parse_version(app["locked"].get(name) or "")
+                if locked:
+                    info["candidates"].add(locked)
+
+        standard = {**PORTFOLIO_DEPENDENCIES, **PORTFOLIO_DEV_DEPENDENCIES}
+        for name, constraint in standard.items():
+            if name in packages:
+                bounds = constraint_bounds(constraint)
+                if bounds and bounds[0]:
+                    packages[name]["candidates"].add(bounds[0])
+
+        shared_versions = {}
+        divergent: Dict[str, List[Dict]] = {}
+        lock_drift: Dict[str, List[Dict]] = {}
+        for name, info in sorted(packages.items()):
+            candidates = info["candidates"]
+            if not candidates:
+                # lock 이 없는 경우 제약 하한을 후보로
+                candidates = {bounds[0] for bounds in map(constraint_bounds, info["constraints"].values())
+                              if bounds and bounds[0]}
+            if not candidates:
+                continue
+
+            def support(version):
+                return sum(1 for c in info["constraints"].values() if allows(c, version)), version
+
+            best = max(candidates, key=support)
+            shared_versions[name] = format_version(best)
+
+            for app_name, constraint in info["constraints"].items():
+                if not allows(constraint, best):
+                    divergent.setdefault(app_name, []).append(
+                        {"package": name, "constraint": constraint, "shared": format_version(best)})
+
+            # 제약은 허용하지만 lock 이 다른 버전에 고정된 앱 (pub upgrade 로 맞출 수 있음)
+            for app in apps:
+                locked = app["locked"].get(name)
+                if (locked and name in app["constraints"] and parse_version(locked) != best
+                        and allows(app["constraints"][name], best)):
+                    lock_drift.setdefault(app["app"], []).append(
+                        {"package": name, "locked": locked, "shared": format_version(best)})
+
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "apps": [app["app"] for app in apps],
+            "shared_versions": shared_versions,
+            "divergent_apps": divergent,
+            "lock_drift": lock_drift,
+            "apps_with_overrides": {app["app"]: app["overrides"] for app in apps if app["overrides"]}
+        }
+
+    def write_warmup_project(self, plan: Dict, warmup_dir: Path = WARMUP_DIR) -> Path:
+        """공유 버전 세트를 고정한 예열용 pubspec 작성"""
+        warmup_dir.mkdir(parents=True, exist_ok=True)
+        dev_names = set(PORTFOLIO_DEV_DEPENDENCIES)
+
+        pubspec = {
+            "name": "app_factory_pub_warmup",
+            "publish_to": "none",
+            "environment": {"sdk": ">=3.0.0 <4.0.0"},
+            "dependencies": {"flutter": {"sdk": "flutter"}},
+            "dev_dependencies": {"flutter_test": {"sdk": "flutter"}}
+        }
+        for name, version in plan["shared_versions"].items():
+            section = "dev_dependencies" if name in dev_names else "dependencies"
+            pubspec[section][name] = version
+
+        with open(warmup_dir / "pubspec.yaml", "w", encoding="utf-8") as f:
+            yaml.safe_dump(pubspec, f, sort_keys=False, allow_unicode=True)
+        return warmup_dir
+
+    def warm_cache(self, plan: Dict, timeout: int = 900) -> bool:
+        """예열 프로젝트에서 pub get 1회 (공유 버전이 모두 pub 캐시에 내려받아짐)"""
+        warmup_dir = self.write_warmup_project(plan)
+        print(f"🔥 pub 캐시 예열: {len(plan['shared_versions'])}개 패키지")
+
+        try:
+            result = subprocess.run([self.flutter_bin, "pub", "get"], cwd=warmup_dir,
+                                    capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            print(f"  ⏰ 예열 타임아웃 ({timeout}초)")
+            return False
+
+        if result.returncode != 0:
+            print(f"  ❌ 예열 실패: {result.stderr.strip()[:500]}")
+            return False
+        print("  ✅ pub 캐시 예열 완료")
+        return True
+
+    def _offline_pub_get(self, app_dir: Path, timeout: int) -> Dict:
+        """앱 하나 오프라인 pub get (캐시에 없으면 온라인으로 재시도)"""
+        try:
+            result = subprocess.run([self.flutter_bin, "pub", "get", "--offline"], cwd=app_dir,
+                                    capture_output=True, text=True, timeout=timeout)
+            if result.returncode == 0:
+                return {"app": app_dir.name, "status": "offline"}
+
+            result = subprocess.run([self.flutter_bin, "pub", "get"], cwd=app_dir,
+                                    capture_output=True, text=True, timeout=timeout)
+            status = "online" if result.returncode == 0 else "failed"
+            return {"app": app_dir.name, "status": status,
+                    "error": result.stderr.strip()[:500] if status == "failed" else None}
+        except subprocess.TimeoutExpired:
+            return {"app": app_dir.name, "status": "timeout"}
+
+    def resolve_all(self, plan: Dict = None, timeout: int = 300) -> Dict:
+        """계획 → 캐시 예열 → 앱별 오프라인 pub get"""
+        plan = plan or self.plan()
+        plan["warmed"] = self.warm_cache(plan)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda app_dir: self._offline_pub_get(app_dir, timeout),
+                                        [d for d in self.app_dirs if (d / "pubspec.yaml").exists()]))
+
+        plan["pub_get"] = results
+        for result in results:
+            icon = {"offline": "✅", "online": "🌐"}.get(result["status"], "❌")
+            print(f"  {icon} {result['app']}: {result['status']}")
+        return plan
+
+
+def standard_dependency_lines(names: List[str] = None, indent: str = "  ") -> str:
+    """pubspec 에 넣을 표준 의존성 줄 (이름을 지정하면 해당 패키지만)"""
+    names = names or list(PORTFOLIO_DEPENDENCIES)
+    return "\n".join(f"{indent}{name}: {PORTFOLIO_DEPENDENCIES[name]}" for name in names)
+
+
+def main():
+    """flutter_apps/ 전체 의존성 계획 및 해석"""
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    apps_dir = Path(args[0]) if args else Path("flutter_apps")
+    app_dirs = sorted(d for d in apps_dir.iterdir() if d.is_dir())
+    planner = PubDependencyPlanner(app_dirs)
+
+    print("📦 포트폴리오 pub 의존성 플래너")
+    print("=" * 60)
+
+    plan = planner.plan()
+    print(f"공유 버전 세트: {len(plan['shared_versions'])}개 패키지, {len(plan['apps'])}개 앱")
+
+    for app_name, conflicts in plan["divergent_apps"].items():
+        print(f"  ⚠️ {app_name}: 별도 해석 필요")
+        for conflict in conflicts:
+            print(f"     - {conflict['package']} {conflict['constraint']} (공유 버전 {conflict['shared']})")
+
+    if "--plan-only" not in sys.argv:
+        plan = planner.resolve_all(plan)
+
+    with open("pub_dependency_plan.json", "w", encoding="utf-8") as f:
+        json.dump(plan, f, ensure_ascii=False, indent=2)
+    print("📁 계획 파일: pub_dependency_plan.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,11 @@ App Factory Launcher - 통합 앱 팩토리 실행기
 Claude Pro + Nano Banana로 월 15개 고품질 앱 자동 생성
 """
 
-import asyncio
 import sys
 import argparse
 from datetime import datetime
 from automation.serverless_app_factory import ServerlessAppFactory
+from factory_profiler import run_entry_point
 
 def print_banner():
     """앱 팩토리 배너"""
@@ -180,7 +180,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_entry_point(main, "run_app_factory")
     except KeyboardInterrupt:
         print("\n🛑 App factory interrupted")
     except Exception as e:
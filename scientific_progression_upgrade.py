@@ -19,7 +19,7 @@ import '../models/user_profile.dart';
 class ScientificSquatData {
 
   /// 레벨별 초기 테스트 기준 (1RM 대비 %)
-  static Map<UserLevel, String> get levelDescriptions => {
+  static const Map<UserLevel, String> levelDescriptions = {
     UserLevel.rookie: '초보자 (0-6개월 훈련) - 기본 자세 습득',
     UserLevel.rising: '중급자 (6-12개월 훈련) - 정확한 폼 확립',
     UserLevel.alpha: '상급자 (1-2년 훈련) - 고중량 도전',
@@ -30,7 +30,7 @@ class ScientificSquatData {
   /// Week 1-2: 기본기 다지기 (낮은 강도, 완벽한 폼)
   /// Week 3-4: 볼륨 증가 (중간 강도, 근지구력)
   /// Week 5-6: 고강도 도전 (고강도, 최대 성능)
-  static Map<UserLevel, Map<int, Map<int, SquatWorkout>>> get progressionPrograms => {
+  static const Map<UserLevel, Map<int, Map<int, SquatWorkout>>> progressionPrograms = {
 
     // 초보자: 기본 자세 습득과 점진적 증가 중심
     UserLevel.rookie: {
@@ -170,7 +170,7 @@ class ScientificSquatData {
   };
 
   /// 레벨별 6주 총 목표
-  static Map<UserLevel, int> get sixWeekGoals => {
+  static const Map<UserLevel, int> sixWeekGoals = {
     UserLevel.rookie: 515,   // 초보자 목표
     UserLevel.rising: 665,   // 중급자 목표
     UserLevel.alpha: 815,    // 상급자 목표
@@ -178,7 +178,7 @@ class ScientificSquatData {
   };
 
   /// 과학적 휴식 시간 (근육 회복 최적화)
-  static Map<UserLevel, int> get restTimeSeconds => {
+  static const Map<UserLevel, int> restTimeSeconds = {
     UserLevel.rookie: 90,  // 초보자는 충분한 회복
     UserLevel.rising: 75,  // 중급자 적응력 향상
     UserLevel.alpha: 60,   // 상급자 효율성
@@ -186,7 +186,7 @@ class ScientificSquatData {
   };
 
   /// Elite FTS 원리 기반 주간 강도 패턴
-  static Map<int, String> get weeklyFocus => {
+  static const Map<int, String> weeklyFocus = {
     1: '기본기 다지기 (폼 완성)',
     2: '자세 안정화 (일관성)',
     3: '볼륨 증가 (근지구력)',
@@ -196,7 +196,7 @@ class ScientificSquatData {
   };
 
   /// 운동 과학 기반 팁
-  static Map<int, List<String>> get weeklyTips => {
+  static const Map<int, List<String>> weeklyTips = {
     1: [
       '발은 어깨너비로 벌리고 발끝은 약간 바깥쪽을 향하게',
       '무릎이 발끝을 넘지 않도록 주의',
@@ -281,7 +281,7 @@ import '../models/user_profile.dart';
 class ScientificRunningData {
 
   /// 레벨별 설명 (훈련 경험 기반)
-  static Map<UserLevel, String> get levelDescriptions => {
+  static const Map<UserLevel, String> levelDescriptions = {
     UserLevel.rookie: '초보자 (러닝 경험 없음) - Couch to 5K',
     UserLevel.rising: '초급자 (3-6개월 러닝) - 5K 완주 목표',
     UserLevel.alpha: '중급자 (6-12개월 러닝) - 시간 단축',
@@ -291,7 +291,7 @@ class ScientificRunningData {
   /// 과학적 러닝 프로그레션 (시간 기반 인터벌 훈련)
   /// C25K: 9주 프로그램을 6주로 압축 최적화
   /// Hal Higdon: 중급/고급 프로그램 적용
-  static Map<UserLevel, Map<int, Map<int, RunningWorkout>>> get progressionPrograms => {
+  static const Map<UserLevel, Map<int, Map<int, RunningWorkout>>> progressionPrograms = {
 
     // 초보자: Couch to 5K 기반 (걷기/뛰기 인터벌)
     UserLevel.rookie: {
@@ -547,7 +547,7 @@ class ScientificRunningData {
   };
 
   /// 레벨별 6주 목표
-  static Map<UserLevel, Map<String, dynamic>> get sixWeekGoals => {
+  static const Map<UserLevel, Map<String, dynamic>> sixWeekGoals = {
     UserLevel.rookie: {
       'distance': 5.0,
       'time': Duration(minutes: 30),
@@ -571,7 +571,7 @@ class ScientificRunningData {
   };
 
   /// 과학적 근거 기반 훈련 원리
-  static Map<String, String> get trainingPrinciples => {
+  static const Map<String, String> trainingPrinciples = {
     '점진적 과부하': '매주 10% 이내 증가로 부상 방지',
     '특이성 원리': '목표에 맞는 구체적 훈련',
     '회복의 중요성': '적응과 성장은 휴식 중에 발생',
@@ -580,7 +580,7 @@ class ScientificRunningData {
   };
 
   /// 주간 훈련 포커스
-  static Map<int, String> get weeklyFocus => {
+  static const Map<int, String> weeklyFocus = {
     1: '기본 인터벌 적응 (걷기/뛰기)',
     2: '러닝 시간 연장 (지구력)',
     3: '연속 러닝 개발 (정신력)',
@@ -17,6 +17,9 @@ from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import schedule
 from error_monitoring_system import ErrorMonitoringSystem
+from async_event_bridge import AsyncEventBridge
+from portfolio_health import (PortfolioHealthRunner, directory_size, format_health_report,
+                              list_app_dirs, print_health_report, record_health_report)
 
 class SmartMonitoringSystem:
     def __init__(self):
@@ -32,6 +35,12 @@ class SmartMonitoringSystem:
             "error_logs"
         ]
 
+        # watchdog 스레드 → 이벤트 루프 (경로별 2초 디바운스, 버스트당 한 번 처리)
+        self.event_bridge = AsyncEventBridge(self.handle_error_file)
+
+        # 앱 건강 체크는 병렬 실행 후 한 번에 보고
+        self.health_runner = PortfolioHealthRunner()
+
     class ErrorFileHandler(FileSystemEventHandler):
         def __init__(self, monitoring_system):
             self.monitoring_system = monitoring_system
@@ -44,9 +53,8 @@ class SmartMonitoringSystem:
             if any(keyword in event.src_path.lower() for keyword in
                    ['error', 'fail', 'exception', 'crash', '.log']):
                 print(f"🔍 오류 파일 감지: {event.src_path}")
-                asyncio.create_task(
-                    self.monitoring_system.handle_error_file(event.src_path)
-                )
+                # 옵저버 스레드에서는 루프에 직접 태스크를 만들 수 없음
+                self.monitoring_system.event_bridge.submit(event.src_path)
 
         def on_modified(self, event):
             if event.is_directory:
@@ -83,11 +91,14 @@ class SmartMonitoringSystem:
         while True:
             schedule.run_pending()
             await self.process_error_queue()
+            self.error_monitor.metrics.flush()
             await asyncio.sleep(300)  # 5분마다 스케줄 체크
 
     def setup_file_watchers(self):
         """파일 시스템 감시자 설정"""
 
+        self.event_bridge.start()
+
         self.observer = Observer()
         event_handler = self.ErrorFileHandler(self)
 
@@ -102,9 +113,7 @@ class SmartMonitoringSystem:
         """실시간으로 감지된 오류 파일 처리"""
 
         try:
-            # 파일이 완전히 생성될 때까지 잠시 대기
-            await asyncio.sleep(2)
-
+            # 파일이 완전히 생성될 때까지의 대기는 event_bridge 디바운스로 처리됨
             if not Path(file_path).exists():
                 return
 
@@ -144,7 +153,7 @@ class SmartMonitoringSystem:
 
         # AI 분석
         analysis = await self.error_monitor.analyze_error_with_ai(
-            content, "Critical System Error"
+            content, "Critical System Error", app_name=Path(file_path).parent.name
         )
 
         # 즉시 Slack 알림
@@ -179,13 +188,26 @@ class SmartMonitoringSystem:
         # 유사한 오류들 그룹핑
         grouped_errors = self.group_similar_errors(self.error_queue)
 
+        single_errors = []
         for group_type, errors in grouped_errors.items():
             if len(errors) > 1:
                 # 중복 오류 - 요약해서 하나로 처리
                 await self.handle_grouped_errors(group_type, errors)
             else:
-                # 단일 오류 - 개별 처리
-                await self.handle_single_error(errors[0])
+                single_errors.append(errors[0])
+
+        # 단일 오류 - AI 분석은 묶어서 한 번에, 보고는 개별로
+        if single_errors:
+            analyses = await self.error_monitor.analyze_errors_with_ai([
+                {
+                    'message': error['content'],
+                    'error_type': "Single Error",
+                    'app_name': Path(error['file_path']).parent.name
+                }
+                for error in single_errors
+            ])
+            for error, analysis in zip(single_errors, analyses):
+                await self.handle_single_error(error, analysis)
 
         # 큐 비우기
         self.error_queue.clear()
@@ -232,12 +254,13 @@ class SmartMonitoringSystem:
             auto_fixable=True
         )
 
-    async def handle_single_error(self, error):
-        """단일 오류 처리"""
+    async def handle_single_error(self, error, analysis=None):
+        """단일 오류 처리 (analysis 가 없으면 개별 AI 분석)"""
 
-        analysis = await self.error_monitor.analyze_error_with_ai(
-            error['content'], "Single Error"
-        )
+        if analysis is None:
+            analysis = await self.error_monitor.analyze_error_with_ai(
+                error['content'], "Single Error", app_name=Path(error['file_path']).parent.name
+            )
 
         await self.error_monitor.report_error(
             error_type="Individual Error",
@@ -282,16 +305,28 @@ class SmartMonitoringSystem:
     async def check_flutter_apps_health(self):
         """Flutter 앱들 건강 상태 체크"""
 
-        flutter_apps_dir = Path("flutter_apps")
-        if not flutter_apps_dir.exists():
+        app_dirs = list_app_dirs("flutter_apps")
+        if not app_dirs:
             return
 
-        for app_dir in flutter_apps_dir.iterdir():
-            if app_dir.is_dir():
-                await self.quick_app_health_check(app_dir)
+        report = await self.health_runner.run(app_dirs, self.quick_app_health_check)
+        print_health_report(report)
+        record_health_report(self.error_monitor.metrics, report, "smart_monitor")
+
+        problem_apps = [result["app"] for result in report["results"] if result["status"] != "healthy"]
+        if problem_apps:
+            await self.error_monitor.report_error(
+                error_type="App Health Issue",
+                app_name=problem_apps[0] if len(problem_apps) == 1 else "Multiple Apps",
+                description=format_health_report(report),
+                severity="Low",
+                auto_fixable=True
+            )
+
+        return report
 
     async def quick_app_health_check(self, app_dir):
-        """앱별 빠른 건강 체크"""
+        """앱별 빠른 건강 체크 → 발견한 문제 목록"""
 
         issues = []
 
@@ -302,18 +337,12 @@ class SmartMonitoringSystem:
         # build 폴더 크기 체크 (너무 크면 정리 필요)
         build_dir = app_dir / "build"
         if build_dir.exists():
-            build_size = sum(f.stat().st_size for f in build_dir.rglob('*') if f.is_file())
+            # 파일 수가 많아 이벤트 루프를 막지 않도록 스레드에서 계산
+            build_size = await asyncio.to_thread(directory_size, build_dir)
             if build_size > 500 * 1024 * 1024:  # 500MB 이상
                 issues.append("빌드 캐시 과다 - 정리 필요")
 
-        if issues:
-            await self.error_monitor.report_error(
-                error_type="App Health Issue",
-                app_name=app_dir.name,
-                description="; ".join(issues),
-                severity="Low",
-                auto_fixable=True
-            )
+        return issues
 
     async def check_background_processes(self):
         """백그라운드 프로세스 상태 체크"""
@@ -398,12 +427,14 @@ class SmartMonitoringSystem:
 
         print("📈 주간 리포트 생성 중...")
 
-        # 지난 주 통계 수집
+        # 지난 주 통계 수집 (재시작과 무관하게 시계열 저장소에서 조회)
+        now = datetime.now()
+        stats = self.error_monitor.collect_error_stats((now - timedelta(days=7)).timestamp(), now.timestamp())
         week_stats = {
-            "total_errors": len(self.error_queue) + len(self.critical_errors),
-            "critical_errors": len(self.critical_errors),
-            "auto_fixed": 0,  # 실제로는 성공 로그에서 계산
-            "manual_required": len(self.critical_errors)
+            "total_errors": stats["total_errors"],
+            "critical_errors": stats["by_severity"].get("Critical", 0),
+            "auto_fixed": stats["auto_fixed"],
+            "manual_required": stats["manual_required"]
         }
 
         # Slack 주간 리포트 전송
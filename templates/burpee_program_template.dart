@@ -4,10 +4,10 @@ import 'dart:math';
 class BurpeePrograms {
 
   /// 6주 버피 마스터 프로그램
-  static Map<int, Map<int, BurpeeWorkout>> get sixWeekProgram => {
+  static const Map<int, Map<int, BurpeeWorkout>> sixWeekProgram = {
     1: {
       // Week 1: 버피 기초 마스터
-      1: const BurpeeWorkout(
+      1: BurpeeWorkout(
         sets: [2, 3, 2, 2, 3],
         restSeconds: 120,
         notes: '버피 동작 분해 연습 - 천천히 정확하게',
@@ -17,7 +17,7 @@ class BurpeePrograms {
         variations: ['스텝백 버피', '점프 없는 버피'],
         specialInstructions: '각 동작을 천천히 정확하게 수행',
       ),
-      2: const BurpeeWorkout(
+      2: BurpeeWorkout(
         sets: [3, 4, 3, 3, 4],
         restSeconds: 120,
         notes: '리듬감 익히기 - 일정한 속도 유지',
@@ -27,7 +27,7 @@ class BurpeePrograms {
         variations: ['템포 버피', '카운트 버피'],
         specialInstructions: '1-2-3-4 박자에 맞춰 동작',
       ),
-      3: const BurpeeWorkout(
+      3: BurpeeWorkout(
         sets: [4, 5, 4, 4, 5],
         restSeconds: 110,
         notes: '체력 향상 - 연속 동작 연습',
@@ -40,7 +40,7 @@ class BurpeePrograms {
     },
     2: {
       // Week 2: 강도 증가
-      1: const BurpeeWorkout(
+      1: BurpeeWorkout(
         sets: [5, 7, 5, 5, 6],
         restSeconds: 110,
         notes: '파워 개발 - 폭발적 점프',
@@ -50,7 +50,7 @@ class BurpeePrograms {
         variations: ['하이 점프 버피', '니 터치 버피'],
         specialInstructions: '점프 시 최대한 높이 올라가기',
       ),
-      2: const BurpeeWorkout(
+      2: BurpeeWorkout(
         sets: [6, 8, 6, 6, 7],
         restSeconds: 100,
         notes: '지구력 훈련 - 더 긴 세트',
@@ -60,7 +60,7 @@ class BurpeePrograms {
         variations: ['롱 버피', '마라톤 버피'],
         specialInstructions: '페이스 조절하며 끝까지 완주',
       ),
-      3: const BurpeeWorkout(
+      3: BurpeeWorkout(
         sets: [7, 10, 7, 7, 8],
         restSeconds: 100,
         notes: '스피드 훈련 - 빠른 전환',
@@ -73,7 +73,7 @@ class BurpeePrograms {
     },
     3: {
       // Week 3: 중급 도전
-      1: const BurpeeWorkout(
+      1: BurpeeWorkout(
         sets: [8, 12, 8, 8, 10],
         restSeconds: 90,
         notes: '복합 동작 - 푸쉬업 추가',
@@ -83,7 +83,7 @@ class BurpeePrograms {
         variations: ['푸쉬업 버피', '다이아몬드 버피'],
         specialInstructions: '플랭크 자세에서 완전한 푸쉬업 수행',
       ),
-      2: const BurpeeWorkout(
+      2: BurpeeWorkout(
         sets: [10, 15, 10, 10, 12],
         restSeconds: 90,
         notes: '변형 동작 - 다양한 스타일',
@@ -93,7 +93,7 @@ class BurpeePrograms {
         variations: ['스타 점프 버피', '180도 버피'],
         specialInstructions: '매 세트마다 다른 변형 적용',
       ),
-      3: const BurpeeWorkout(
+      3: BurpeeWorkout(
         sets: [12, 18, 12, 12, 15],
         restSeconds: 85,
         notes: '체력 한계 도전 - 더 높은 강도',
@@ -107,8 +107,8 @@ class BurpeePrograms {
   };
 
   /// 특수 버피 챌린지 프로그램
-  static Map<String, SpecialBurpeeProgram> get specialPrograms => {
-    'burpee_hell': const SpecialBurpeeProgram(
+  static const Map<String, SpecialBurpeeProgram> specialPrograms = {
+    'burpee_hell': SpecialBurpeeProgram(
       name: '버피 지옥 100개',
       description: '한 번에 100개 연속 버피 도전',
       duration: '논스톱 지옥',
@@ -116,7 +116,7 @@ class BurpeePrograms {
       chadLevel: '😈 버피 데몬',
       instructions: '100개를 완료할 때까지 멈추지 마라',
     ),
-    'tabata_burpees': const SpecialBurpeeProgram(
+    'tabata_burpees': SpecialBurpeeProgram(
       name: '타바타 버피 데스',
       description: '20초 올아웃, 10초 휴식 x 8라운드',
       duration: '4분 지옥',
@@ -124,7 +124,7 @@ class BurpeePrograms {
       chadLevel: '🔥 타바타 킬러',
       instructions: '4분간 멈추지 말고 최대 강도로',
     ),
-    'pyramid_burpees': const SpecialBurpeeProgram(
+    'pyramid_burpees': SpecialBurpeeProgram(
       name: '버피 피라미드 클라이밍',
       description: '1-2-3-4-5-4-3-2-1개씩 진행',
       duration: '9라운드 완주',
@@ -135,8 +135,8 @@ class BurpeePrograms {
   };
 
   /// 일일 버피 챌린지
-  static List<DailyBurpeeChallenge> get dailyChallenges => [
-    const DailyBurpeeChallenge(
+  static const List<DailyBurpeeChallenge> dailyChallenges = [
+    DailyBurpeeChallenge(
       name: '💪 퀵 파워 버피',
       description: '15개 버피를 3분 안에',
       targetReps: 15,
@@ -144,7 +144,7 @@ class BurpeePrograms {
       reward: '⚡ 스피드 배지',
       minLevel: 1,
     ),
-    const DailyBurpeeChallenge(
+    DailyBurpeeChallenge(
       name: '🔥 미드나잇 버피',
       description: '30개 버피를 논스톱으로',
       targetReps: 30,
@@ -152,7 +152,7 @@ class BurpeePrograms {
       reward: '🌙 미드나잇 배지',
       minLevel: 2,
     ),
-    const DailyBurpeeChallenge(
+    DailyBurpeeChallenge(
       name: '💥 익스플로시브 버피',
       description: '50개 버피를 8분 안에',
       targetReps: 50,
@@ -160,7 +160,7 @@ class BurpeePrograms {
       reward: '💥 폭발력 배지',
       minLevel: 3,
     ),
-    const DailyBurpeeChallenge(
+    DailyBurpeeChallenge(
       name: '👑 레전드 버피',
       description: '75개 버피를 10분 안에',
       targetReps: 75,
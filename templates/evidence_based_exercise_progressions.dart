@@ -14,10 +14,10 @@ class EvidenceBasedExerciseProgressions {
 
   /// 풀업 진행 프로그램 (연구 기반)
   /// 참고: Dead hang → Negative → Assisted → Full pull-up
-  static Map<int, Map<int, PullUpWorkout>> get scientificPullUpProgram => {
+  static const Map<int, Map<int, PullUpWorkout>> scientificPullUpProgram = {
     1: {
       // Week 1-2: 기초 근력 및 그립 강도 개발
-      1: const PullUpWorkout(
+      1: PullUpWorkout(
         exercises: [
           ExerciseSet(
             name: 'Dead Hang',
@@ -38,7 +38,7 @@ class EvidenceBasedExerciseProgressions {
         difficulty: ExerciseDifficulty.beginner,
         researchNote: 'Dead hang 30초-1분 목표 (Harvard Spaulding Rehabilitation)',
       ),
-      2: const PullUpWorkout(
+      2: PullUpWorkout(
         exercises: [
           ExerciseSet(
             name: 'Dead Hang',
@@ -69,7 +69,7 @@ class EvidenceBasedExerciseProgressions {
     },
     2: {
       // Week 3-4: 보조 풀업에서 독립적 풀업으로
-      1: const PullUpWorkout(
+      1: PullUpWorkout(
         exercises: [
           ExerciseSet(
             name: 'Jumping Pull-ups',
@@ -102,10 +102,10 @@ class EvidenceBasedExerciseProgressions {
 
   /// 런지 진행 프로그램 (8주 연구 기반)
   /// 참고: 8주간 주3회, 10% 체중 부하까지 진행
-  static Map<int, Map<int, LungeWorkout>> get scientificLungeProgram => {
+  static const Map<int, Map<int, LungeWorkout>> scientificLungeProgram = {
     1: {
       // Week 1-2: 기본 런지 패턴 학습 (연구 프로토콜 적용)
-      1: const LungeWorkout(
+      1: LungeWorkout(
         exercises: [
           ExerciseSet(
             name: 'Bodyweight Forward Lunges',
@@ -126,7 +126,7 @@ class EvidenceBasedExerciseProgressions {
         difficulty: ExerciseDifficulty.beginner,
         researchNote: 'OMNI scale 6-8 강도 (PMC: 9925109 - 8주 런지 연구)',
       ),
-      2: const LungeWorkout(
+      2: LungeWorkout(
         exercises: [
           ExerciseSet(
             name: 'Walking Lunges',
@@ -157,7 +157,7 @@ class EvidenceBasedExerciseProgressions {
     },
     2: {
       // Week 3-4: 부하 추가 (연구에서 10% 체중 사용)
-      1: const LungeWorkout(
+      1: LungeWorkout(
         exercises: [
           ExerciseSet(
             name: 'Weighted Forward Lunges',
@@ -183,10 +183,10 @@ class EvidenceBasedExerciseProgressions {
 
   /// 플랭크 진행 프로그램 (근전도 연구 기반)
   /// 참고: Stable → Suspended 진행
-  static Map<int, Map<int, PlankWorkout>> get scientificPlankProgram => {
+  static const Map<int, Map<int, PlankWorkout>> scientificPlankProgram = {
     1: {
       // Week 1-2: 안정 표면에서 기초 플랭크
-      1: const PlankWorkout(
+      1: PlankWorkout(
         exercises: [
           ExerciseSet(
             name: 'Stable Prone Plank',
@@ -207,7 +207,7 @@ class EvidenceBasedExerciseProgressions {
         difficulty: ExerciseDifficulty.beginner,
         researchNote: '30초 미만은 초보자 수준 (Harvard Health Publishing)',
       ),
-      2: const PlankWorkout(
+      2: PlankWorkout(
         exercises: [
           ExerciseSet(
             name: 'Stable Prone Plank',
@@ -231,7 +231,7 @@ class EvidenceBasedExerciseProgressions {
     },
     2: {
       // Week 3-4: 고급 플랭크 변형
-      1: const PlankWorkout(
+      1: PlankWorkout(
         exercises: [
           ExerciseSet(
             name: 'Unilateral Stable Prone Plank',
@@ -257,10 +257,10 @@ class EvidenceBasedExerciseProgressions {
 
   /// 버피 진행 프로그램 (3분 버피 테스트 기반)
   /// 참고: 국제 표준 연구 - 37-66개/3분이 평균
-  static Map<int, Map<int, BurpeeWorkout>> get scientificBurpeeProgram => {
+  static const Map<int, Map<int, BurpeeWorkout>> scientificBurpeeProgram = {
     1: {
       // Week 1: 수정된 버피로 시작 (초보자 권장)
-      1: const BurpeeWorkout(
+      1: BurpeeWorkout(
         exercises: [
           ExerciseSet(
             name: 'Half Burpees',
@@ -281,7 +281,7 @@ class EvidenceBasedExerciseProgressions {
         difficulty: ExerciseDifficulty.beginner,
         researchNote: '초보자는 수정된 버전부터 시작 (ACSM Guidelines)',
       ),
-      2: const BurpeeWorkout(
+      2: BurpeeWorkout(
         exercises: [
           ExerciseSet(
             name: 'Modified Burpees',
@@ -305,7 +305,7 @@ class EvidenceBasedExerciseProgressions {
     },
     2: {
       // Week 2: 2주 진행 프로그램 (연구 기반)
-      1: const BurpeeWorkout(
+      1: BurpeeWorkout(
         exercises: [
           ExerciseSet(
             name: 'Standard Burpees',
@@ -330,23 +330,23 @@ class EvidenceBasedExerciseProgressions {
   };
 
   /// ACSM 가이드라인 기반 훈련 원칙
-  static Map<String, TrainingPrinciple> get acsm_guidelines => {
-    'frequency': const TrainingPrinciple(
+  static const Map<String, TrainingPrinciple> acsm_guidelines = {
+    'frequency': TrainingPrinciple(
       principle: '주 2-3회 저항 훈련',
       evidence: 'ACSM 권장사항 - 근력 발달을 위한 최소 빈도',
       application: '각 운동을 주 2-3회 실시',
     ),
-    'sets_reps': const TrainingPrinciple(
+    'sets_reps': TrainingPrinciple(
       principle: '초보자: 1-2세트, 8-12회',
       evidence: 'ACSM 가이드라인 - 근력과 근비대 동시 발달',
       application: '8-12회 완료 가능한 강도로 설정',
     ),
-    'progression': const TrainingPrinciple(
+    'progression': TrainingPrinciple(
       principle: '점진적 과부하',
       evidence: '반복 횟수와 부하 증가 모두 효과적',
       application: '주당 5-10% 증가 권장',
     ),
-    'rest': const TrainingPrinciple(
+    'rest': TrainingPrinciple(
       principle: '세트 간 휴식 60-120초',
       evidence: '근력 회복과 성장을 위한 최적 시간',
       application: '운동 강도에 따라 조절',
@@ -4,10 +4,10 @@ import 'dart:math';
 class JumpingJackPrograms {
 
   /// 6주 점핑잭 카디오 마스터 프로그램
-  static Map<int, Map<int, JumpingJackWorkout>> get sixWeekProgram => {
+  static const Map<int, Map<int, JumpingJackWorkout>> sixWeekProgram = {
     1: {
       // Week 1: 점핑잭 기초 및 리듬
-      1: const JumpingJackWorkout(
+      1: JumpingJackWorkout(
         sets: [10, 15, 10, 10, 12],
         restSeconds: 60,
         notes: '기본 점핑잭 - 리듬감 익히기',
@@ -17,7 +17,7 @@ class JumpingJackPrograms {
         variations: ['슬로우 잭', '하프 잭'],
         specialInstructions: '발과 팔을 동시에 움직이며 리듬 맞추기',
       ),
-      2: const JumpingJackWorkout(
+      2: JumpingJackWorkout(
         sets: [15, 20, 15, 15, 18],
         restSeconds: 60,
         notes: '스피드 향상 - 빠른 전환',
@@ -27,7 +27,7 @@ class JumpingJackPrograms {
         variations: ['패스트 잭', '퀵 잭'],
         specialInstructions: '동작 전환을 빠르게, 정확성 유지',
       ),
-      3: const JumpingJackWorkout(
+      3: JumpingJackWorkout(
         sets: [20, 25, 20, 20, 22],
         restSeconds: 55,
         notes: '지구력 개발 - 더 긴 세트',
@@ -40,7 +40,7 @@ class JumpingJackPrograms {
     },
     2: {
       // Week 2: 강도 증가 및 변형
-      1: const JumpingJackWorkout(
+      1: JumpingJackWorkout(
         sets: [25, 35, 25, 25, 30],
         restSeconds: 55,
         notes: '크로스 잭 - 팔 교차 동작',
@@ -50,7 +50,7 @@ class JumpingJackPrograms {
         variations: ['크로스 오버', 'X-잭'],
         specialInstructions: '팔을 앞에서 교차하며 진행',
       ),
-      2: const JumpingJackWorkout(
+      2: JumpingJackWorkout(
         sets: [30, 40, 30, 30, 35],
         restSeconds: 50,
         notes: '사이드 잭 - 좌우 이동',
@@ -60,7 +60,7 @@ class JumpingJackPrograms {
         variations: ['래터럴 잭', '사이드 투 사이드'],
         specialInstructions: '좌우로 스텝하며 점핑잭 동작',
       ),
-      3: const JumpingJackWorkout(
+      3: JumpingJackWorkout(
         sets: [35, 45, 35, 35, 40],
         restSeconds: 50,
         notes: '파워 잭 - 높은 점프',
@@ -73,7 +73,7 @@ class JumpingJackPrograms {
     },
     3: {
       // Week 3: 고급 변형 및 콤보
-      1: const JumpingJackWorkout(
+      1: JumpingJackWorkout(
         sets: [40, 55, 40, 40, 50],
         restSeconds: 45,
         notes: '스쿼트 잭 - 하체 강화',
@@ -83,7 +83,7 @@ class JumpingJackPrograms {
         variations: ['스쿼트 점프 잭', '수모 잭'],
         specialInstructions: '스쿼트 자세에서 점핑잭 동작',
       ),
-      2: const JumpingJackWorkout(
+      2: JumpingJackWorkout(
         sets: [45, 60, 45, 45, 55],
         restSeconds: 45,
         notes: '플랭크 잭 - 코어 강화',
@@ -93,7 +93,7 @@ class JumpingJackPrograms {
         variations: ['푸쉬업 잭', '플랭크 점프'],
         specialInstructions: '플랭크 자세에서 다리만 점핑잭',
       ),
-      3: const JumpingJackWorkout(
+      3: JumpingJackWorkout(
         sets: [50, 70, 50, 50, 65],
         restSeconds: 40,
         notes: '스타 점프 - 전신 폭발력',
@@ -107,8 +107,8 @@ class JumpingJackPrograms {
   };
 
   /// 특수 점핑잭 챌린지
-  static Map<String, SpecialJumpingJackProgram> get specialPrograms => {
-    'jack_marathon': const SpecialJumpingJackProgram(
+  static const Map<String, SpecialJumpingJackProgram> specialPrograms = {
+    'jack_marathon': SpecialJumpingJackProgram(
       name: '점핑잭 마라톤 500개',
       description: '한 번에 500개 연속 점핑잭',
       duration: '논스톱 500개',
@@ -116,7 +116,7 @@ class JumpingJackPrograms {
       chadLevel: '🏃‍♂️ 잭 마라토너',
       instructions: '500개를 완료할 때까지 절대 멈추지 마라',
     ),
-    'tabata_jacks': const SpecialJumpingJackProgram(
+    'tabata_jacks': SpecialJumpingJackProgram(
       name: '타바타 점핑잭 익스트림',
       description: '20초 올아웃, 10초 휴식 x 8라운드',
       duration: '4분 지옥',
@@ -124,7 +124,7 @@ class JumpingJackPrograms {
       chadLevel: '🔥 타바타 킬러',
       instructions: '4분간 멈추지 말고 최대 강도로',
     ),
-    'jack_pyramid': const SpecialJumpingJackProgram(
+    'jack_pyramid': SpecialJumpingJackProgram(
       name: '점핑잭 피라미드 타워',
       description: '10-20-30-40-30-20-10개씩 진행',
       duration: '7라운드 완주',
@@ -135,8 +135,8 @@ class JumpingJackPrograms {
   };
 
   /// 일일 점핑잭 챌린지
-  static List<DailyJumpingJackChallenge> get dailyChallenges => [
-    const DailyJumpingJackChallenge(
+  static const List<DailyJumpingJackChallenge> dailyChallenges = [
+    DailyJumpingJackChallenge(
       name: '💪 카디오 킥스타트',
       description: '100개 점핑잭을 5분 안에',
       targetReps: 100,
@@ -144,7 +144,7 @@ class JumpingJackPrograms {
       reward: '🚀 킥스타트 배지',
       minLevel: 1,
     ),
-    const DailyJumpingJackChallenge(
+    DailyJumpingJackChallenge(
       name: '🔥 번 머신',
       description: '200개 점핑잭을 논스톱으로',
       targetReps: 200,
@@ -152,7 +152,7 @@ class JumpingJackPrograms {
       reward: '🔥 번 배지',
       minLevel: 2,
     ),
-    const DailyJumpingJackChallenge(
+    DailyJumpingJackChallenge(
       name: '💥 익스플로시브 카디오',
       description: '300개 점핑잭을 10분 안에',
       targetReps: 300,
@@ -160,7 +160,7 @@ class JumpingJackPrograms {
       reward: '💥 폭발력 배지',
       minLevel: 3,
     ),
-    const DailyJumpingJackChallenge(
+    DailyJumpingJackChallenge(
       name: '👑 카디오 킹',
       description: '500개 점핑잭을 15분 안에',
       targetReps: 500,
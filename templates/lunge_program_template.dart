@@ -4,10 +4,10 @@ import 'dart:math';
 class LungePrograms {
 
   /// 7주 런지 마스터 프로그램
-  static Map<int, Map<int, LungeWorkout>> get sevenWeekProgram => {
+  static const Map<int, Map<int, LungeWorkout>> sevenWeekProgram = {
     1: {
       // Week 1: 런지 기초 및 균형감각
-      1: const LungeWorkout(
+      1: LungeWorkout(
         sets: [8, 12, 8, 8, 10], // 각 다리당
         restSeconds: 75,
         notes: '기본 런지 - 균형감각 익히기',
@@ -18,7 +18,7 @@ class LungePrograms {
         specialInstructions: '무릎이 90도가 되도록, 앞 무릎이 발끝 넘지 않게',
         unit: 'per_leg',
       ),
-      2: const LungeWorkout(
+      2: LungeWorkout(
         sets: [10, 15, 10, 10, 12],
         restSeconds: 75,
         notes: '알터네이팅 런지 - 다리 교대',
@@ -29,7 +29,7 @@ class LungePrograms {
         specialInstructions: '좌우 다리를 번갈아가며 진행',
         unit: 'per_leg',
       ),
-      3: const LungeWorkout(
+      3: LungeWorkout(
         sets: [12, 18, 12, 12, 15],
         restSeconds: 70,
         notes: '워킹 런지 - 앞으로 걸으며',
@@ -43,7 +43,7 @@ class LungePrograms {
     },
     2: {
       // Week 2: 강도 증가 및 변형
-      1: const LungeWorkout(
+      1: LungeWorkout(
         sets: [15, 20, 15, 15, 18],
         restSeconds: 70,
         notes: '리버스 런지 - 뒤로 스텝',
@@ -54,7 +54,7 @@ class LungePrograms {
         specialInstructions: '뒤로 스텝하며 런지, 무릎 보호',
         unit: 'per_leg',
       ),
-      2: const LungeWorkout(
+      2: LungeWorkout(
         sets: [18, 25, 18, 18, 22],
         restSeconds: 65,
         notes: '사이드 런지 - 측면 강화',
@@ -65,7 +65,7 @@ class LungePrograms {
         specialInstructions: '옆으로 크게 스텝, 한쪽 다리로 체중 지지',
         unit: 'per_leg',
       ),
-      3: const LungeWorkout(
+      3: LungeWorkout(
         sets: [20, 30, 20, 20, 25],
         restSeconds: 65,
         notes: '커트시 런지 - 크로스 백',
@@ -79,7 +79,7 @@ class LungePrograms {
     },
     3: {
       // Week 3: 고급 기술 및 플라이오메트릭
-      1: const LungeWorkout(
+      1: LungeWorkout(
         sets: [22, 35, 22, 22, 30],
         restSeconds: 60,
         notes: '점프 런지 - 폭발적 파워',
@@ -90,7 +90,7 @@ class LungePrograms {
         specialInstructions: '런지 자세에서 점프하여 다리 교대',
         unit: 'per_leg',
       ),
-      2: const LungeWorkout(
+      2: LungeWorkout(
         sets: [25, 40, 25, 25, 35],
         restSeconds: 60,
         notes: '불가리안 스플릿 스쿼트',
@@ -101,7 +101,7 @@ class LungePrograms {
         specialInstructions: '뒷발을 의자나 벤치에 올리고 런지',
         unit: 'per_leg',
       ),
-      3: const LungeWorkout(
+      3: LungeWorkout(
         sets: [30, 45, 30, 30, 40],
         restSeconds: 55,
         notes: '360도 런지 - 모든 방향',
@@ -116,8 +116,8 @@ class LungePrograms {
   };
 
   /// 특수 런지 챌린지
-  static Map<String, SpecialLungeProgram> get specialPrograms => {
-    'lunge_century': const SpecialLungeProgram(
+  static const Map<String, SpecialLungeProgram> specialPrograms = {
+    'lunge_century': SpecialLungeProgram(
       name: '런지 센추리 100개',
       description: '각 다리 100개씩 총 200개 런지',
       duration: '200개 완주',
@@ -125,7 +125,7 @@ class LungePrograms {
       chadLevel: '💯 센추리 차드',
       instructions: '각 다리 100개씩, 중간에 멈추지 마라',
     ),
-    'lunge_matrix': const SpecialLungeProgram(
+    'lunge_matrix': SpecialLungeProgram(
       name: '런지 매트릭스 마스터',
       description: '7가지 런지 변형을 각각 20개씩',
       duration: '7변형 x 20개',
@@ -133,7 +133,7 @@ class LungePrograms {
       chadLevel: '🔥 매트릭스 마스터',
       instructions: '기본-리버스-사이드-커트시-점프-불가리안-360도',
     ),
-    'lunge_gauntlet': const SpecialLungeProgram(
+    'lunge_gauntlet': SpecialLungeProgram(
       name: '런지 건틀릿 러쉬',
       description: '10분간 최대한 많은 런지',
       duration: '10분 러쉬',
@@ -144,8 +144,8 @@ class LungePrograms {
   };
 
   /// 일일 런지 챌린지
-  static List<DailyLungeChallenge> get dailyChallenges => [
-    const DailyLungeChallenge(
+  static const List<DailyLungeChallenge> dailyChallenges = [
+    DailyLungeChallenge(
       name: '💪 레그 파워업',
       description: '각 다리 30개씩 총 60개',
       targetReps: 60,
@@ -153,7 +153,7 @@ class LungePrograms {
       reward: '🦵 파워레그 배지',
       minLevel: 1,
     ),
-    const DailyLungeChallenge(
+    DailyLungeChallenge(
       name: '🔥 런지 번',
       description: '점프 런지 50개를 5분 안에',
       targetReps: 50,
@@ -161,7 +161,7 @@ class LungePrograms {
       reward: '🔥 번 배지',
       minLevel: 2,
     ),
-    const DailyLungeChallenge(
+    DailyLungeChallenge(
       name: '💥 익스플로시브 레그',
       description: '100개 런지를 논스톱으로',
       targetReps: 100,
@@ -169,7 +169,7 @@ class LungePrograms {
       reward: '💥 폭발력 배지',
       minLevel: 3,
     ),
-    const DailyLungeChallenge(
+    DailyLungeChallenge(
       name: '👑 런지 킹',
       description: '각 다리 100개씩 총 200개',
       targetReps: 200,
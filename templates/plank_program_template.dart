@@ -4,10 +4,10 @@ import 'dart:math';
 class PlankPrograms {
 
   /// 8주 플랭크 마스터 프로그램 (초 단위)
-  static Map<int, Map<int, PlankWorkout>> get eightWeekProgram => {
+  static const Map<int, Map<int, PlankWorkout>> eightWeekProgram = {
     1: {
       // Week 1: 플랭크 기초 자세
-      1: const PlankWorkout(
+      1: PlankWorkout(
         sets: [15, 20, 15, 15, 18], // 초 단위
         restSeconds: 60,
         notes: '올바른 플랭크 자세 학습 - 몸 일직선',
@@ -18,7 +18,7 @@ class PlankPrograms {
         specialInstructions: '엉덩이 들지 않기, 복부에 힘주기',
         unit: 'seconds',
       ),
-      2: const PlankWorkout(
+      2: PlankWorkout(
         sets: [20, 25, 20, 20, 22],
         restSeconds: 60,
         notes: '코어 안정화 - 호흡 조절',
@@ -29,7 +29,7 @@ class PlankPrograms {
         specialInstructions: '자연스럽게 호흡하며 복부 수축',
         unit: 'seconds',
       ),
-      3: const PlankWorkout(
+      3: PlankWorkout(
         sets: [25, 30, 25, 25, 28],
         restSeconds: 55,
         notes: '지구력 향상 - 더 오래 버티기',
@@ -43,7 +43,7 @@ class PlankPrograms {
     },
     2: {
       // Week 2: 강도 증가
-      1: const PlankWorkout(
+      1: PlankWorkout(
         sets: [30, 40, 30, 30, 35],
         restSeconds: 55,
         notes: '동적 플랭크 - 움직임 추가',
@@ -54,7 +54,7 @@ class PlankPrograms {
         specialInstructions: '플랭크 자세를 유지하며 동작 수행',
         unit: 'seconds',
       ),
-      2: const PlankWorkout(
+      2: PlankWorkout(
         sets: [35, 45, 35, 35, 40],
         restSeconds: 50,
         notes: '사이드 플랭크 도입 - 측면 강화',
@@ -65,7 +65,7 @@ class PlankPrograms {
         specialInstructions: '양쪽 번갈아가며 진행',
         unit: 'seconds',
       ),
-      3: const PlankWorkout(
+      3: PlankWorkout(
         sets: [40, 50, 40, 40, 45],
         restSeconds: 50,
         notes: '플랭크 변형 - 다양한 자세',
@@ -79,7 +79,7 @@ class PlankPrograms {
     },
     3: {
       // Week 3: 고급 플랭크
-      1: const PlankWorkout(
+      1: PlankWorkout(
         sets: [45, 60, 45, 45, 55],
         restSeconds: 45,
         notes: '원 암 플랭크 - 단일 팔 지지',
@@ -90,7 +90,7 @@ class PlankPrograms {
         specialInstructions: '한 팔씩 번갈아가며 들어올리기',
         unit: 'seconds',
       ),
-      2: const PlankWorkout(
+      2: PlankWorkout(
         sets: [50, 70, 50, 50, 60],
         restSeconds: 45,
         notes: '플랭크 잭 - 점프 동작 추가',
@@ -101,7 +101,7 @@ class PlankPrograms {
         specialInstructions: '다리를 벌렸다 모으기 반복',
         unit: 'seconds',
       ),
-      3: const PlankWorkout(
+      3: PlankWorkout(
         sets: [60, 80, 60, 60, 70],
         restSeconds: 40,
         notes: '마운틴 클라이머 플랭크 - 고강도',
@@ -116,8 +116,8 @@ class PlankPrograms {
   };
 
   /// 특수 플랭크 챌린지
-  static Map<String, SpecialPlankProgram> get specialPrograms => {
-    'plank_master': const SpecialPlankProgram(
+  static const Map<String, SpecialPlankProgram> specialPrograms = {
+    'plank_master': SpecialPlankProgram(
       name: '10분 플랭크 마스터',
       description: '10분 연속 플랭크 유지 도전',
       duration: '600초 논스톱',
@@ -125,7 +125,7 @@ class PlankPrograms {
       chadLevel: '🏆 플랭크 신',
       instructions: '10분을 완료할 때까지 절대 포기하지 마라',
     ),
-    'plank_pyramid': const SpecialPlankProgram(
+    'plank_pyramid': SpecialPlankProgram(
       name: '플랭크 피라미드 클라이밍',
       description: '30-60-90-60-30초 피라미드',
       duration: '5라운드 완주',
@@ -133,7 +133,7 @@ class PlankPrograms {
       chadLevel: '⛰️ 피라미드 마스터',
       instructions: '피라미드를 오르락내리락하며 완성',
     ),
-    'iron_plank': const SpecialPlankProgram(
+    'iron_plank': SpecialPlankProgram(
       name: '아이언 플랭크 챌린지',
       description: '5분 연속 플랭크 + 변형 동작',
       duration: '5분 + 변형',
@@ -144,8 +144,8 @@ class PlankPrograms {
   };
 
   /// 일일 플랭크 챌린지
-  static List<DailyPlankChallenge> get dailyChallenges => [
-    const DailyPlankChallenge(
+  static const List<DailyPlankChallenge> dailyChallenges = [
+    DailyPlankChallenge(
       name: '🔥 아이언 코어',
       description: '2분 연속 플랭크 유지',
       targetSeconds: 120,
@@ -153,7 +153,7 @@ class PlankPrograms {
       reward: '🛡️ 아이언 배지',
       minLevel: 1,
     ),
-    const DailyPlankChallenge(
+    DailyPlankChallenge(
       name: '💪 스틸 코어',
       description: '3분 연속 플랭크 유지',
       targetSeconds: 180,
@@ -161,7 +161,7 @@ class PlankPrograms {
       reward: '⚔️ 스틸 배지',
       minLevel: 2,
     ),
-    const DailyPlankChallenge(
+    DailyPlankChallenge(
       name: '🦾 다이아몬드 코어',
       description: '5분 연속 플랭크 유지',
       targetSeconds: 300,
@@ -169,7 +169,7 @@ class PlankPrograms {
       reward: '💎 다이아몬드 배지',
       minLevel: 3,
     ),
-    const DailyPlankChallenge(
+    DailyPlankChallenge(
       name: '👑 레전드 코어',
       description: '8분 연속 플랭크 유지',
       targetSeconds: 480,
@@ -4,10 +4,10 @@ import 'dart:math';
 class PullupPrograms {
 
   /// 8주 풀업 마스터 프로그램
-  static Map<int, Map<int, PullupWorkout>> get eightWeekProgram => {
+  static const Map<int, Map<int, PullupWorkout>> eightWeekProgram = {
     1: {
       // Week 1: 풀업 기초 및 준비 운동
-      1: const PullupWorkout(
+      1: PullupWorkout(
         sets: [1, 2, 1, 1, 2],
         restSeconds: 120,
         notes: '네거티브 풀업 - 천천히 내려오기',
@@ -17,7 +17,7 @@ class PullupPrograms {
         variations: ['어시스트 풀업', '밴드 풀업'],
         specialInstructions: '3-5초에 걸쳐 천천히 내려오기',
       ),
-      2: const PullupWorkout(
+      2: PullupWorkout(
         sets: [2, 3, 2, 2, 3],
         restSeconds: 120,
         notes: '데드 행 - 매달리기 연습',
@@ -28,7 +28,7 @@ class PullupPrograms {
         specialInstructions: '어깨 활성화하며 매달리기',
         unit: 'hangs',
       ),
-      3: const PullupWorkout(
+      3: PullupWorkout(
         sets: [2, 4, 2, 2, 3],
         restSeconds: 110,
         notes: '점프 풀업 - 도움 받아 올라가기',
@@ -41,7 +41,7 @@ class PullupPrograms {
     },
     2: {
       // Week 2: 근력 개발
-      1: const PullupWorkout(
+      1: PullupWorkout(
         sets: [3, 5, 3, 3, 4],
         restSeconds: 110,
         notes: '풀 레인지 풀업 - 완전한 동작',
@@ -51,7 +51,7 @@ class PullupPrograms {
         variations: ['스트릭트 풀업', '킵핑 풀업'],
         specialInstructions: '턱이 바 위로 완전히 올라가기',
       ),
-      2: const PullupWorkout(
+      2: PullupWorkout(
         sets: [4, 6, 4, 4, 5],
         restSeconds: 100,
         notes: '그립 변형 - 다양한 손 위치',
@@ -61,7 +61,7 @@ class PullupPrograms {
         variations: ['와이드 그립', '클로즈 그립'],
         specialInstructions: '매 세트마다 다른 그립 적용',
       ),
-      3: const PullupWorkout(
+      3: PullupWorkout(
         sets: [5, 7, 5, 5, 6],
         restSeconds: 100,
         notes: '레터럴 풀업 - 좌우 이동',
@@ -74,7 +74,7 @@ class PullupPrograms {
     },
     3: {
       // Week 3: 고급 기술
-      1: const PullupWorkout(
+      1: PullupWorkout(
         sets: [6, 9, 6, 6, 8],
         restSeconds: 90,
         notes: '체스트 투 바 - 가슴까지 올리기',
@@ -84,7 +84,7 @@ class PullupPrograms {
         variations: ['C2B', '하이 풀업'],
         specialInstructions: '가슴이 바에 닿을 때까지 올라가기',
       ),
-      2: const PullupWorkout(
+      2: PullupWorkout(
         sets: [7, 10, 7, 7, 9],
         restSeconds: 90,
         notes: '머슬업 준비 - 전환 동작',
@@ -94,7 +94,7 @@ class PullupPrograms {
         variations: ['트랜지션', '키핑 머슬업'],
         specialInstructions: '바 위로 몸 전체 올리기 연습',
       ),
-      3: const PullupWorkout(
+      3: PullupWorkout(
         sets: [8, 12, 8, 8, 10],
         restSeconds: 85,
         notes: '웨이티드 풀업 - 추가 중량',
@@ -108,8 +108,8 @@ class PullupPrograms {
   };
 
   /// 특수 풀업 챌린지
-  static Map<String, SpecialPullupProgram> get specialPrograms => {
-    'pullup_pyramid': const SpecialPullupProgram(
+  static const Map<String, SpecialPullupProgram> specialPrograms = {
+    'pullup_pyramid': SpecialPullupProgram(
       name: '풀업 피라미드 클라이밍',
       description: '1-2-3-4-5-4-3-2-1개씩 진행',
       duration: '9라운드 완주',
@@ -117,7 +117,7 @@ class PullupPrograms {
       chadLevel: '⛰️ 피라미드 마스터',
       instructions: '피라미드를 오르락내리락하며 완성',
     ),
-    'pullup_gauntlet': const SpecialPullupProgram(
+    'pullup_gauntlet': SpecialPullupProgram(
       name: '풀업 건틀릿 런',
       description: '5가지 그립으로 각각 5개씩',
       duration: '5변형 x 5개',
@@ -125,7 +125,7 @@ class PullupPrograms {
       chadLevel: '🏃‍♂️ 건틀릿 러너',
       instructions: '오버핸드→언더핸드→뉴트럴→와이드→클로즈',
     ),
-    'max_pullups': const SpecialPullupProgram(
+    'max_pullups': SpecialPullupProgram(
       name: '맥스 풀업 테스트',
       description: '한 번에 최대한 많은 풀업',
       duration: '1세트 올인',
@@ -136,8 +136,8 @@ class PullupPrograms {
   };
 
   /// 일일 풀업 챌린지
-  static List<DailyPullupChallenge> get dailyChallenges => [
-    const DailyPullupChallenge(
+  static const List<DailyPullupChallenge> dailyChallenges = [
+    DailyPullupChallenge(
       name: '💪 퍼스트 풀업',
       description: '완벽한 폼으로 5개 풀업',
       targetReps: 5,
@@ -145,7 +145,7 @@ class PullupPrograms {
       reward: '🥇 퍼스트 배지',
       minLevel: 1,
     ),
-    const DailyPullupChallenge(
+    DailyPullupChallenge(
       name: '🔥 파워 풀업',
       description: '폭발적으로 10개 풀업',
       targetReps: 10,
@@ -153,7 +153,7 @@ class PullupPrograms {
       reward: '💥 파워 배지',
       minLevel: 2,
     ),
-    const DailyPullupChallenge(
+    DailyPullupChallenge(
       name: '⚡ 스피드 풀업',
       description: '15개 풀업을 3분 안에',
       targetReps: 15,
@@ -161,7 +161,7 @@ class PullupPrograms {
       reward: '⚡ 스피드 배지',
       minLevel: 3,
     ),
-    const DailyPullupChallenge(
+    DailyPullupChallenge(
       name: '👑 레전드 풀업',
       description: '20개 풀업을 논스톱으로',
       targetReps: 20,
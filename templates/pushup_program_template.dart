@@ -4,10 +4,10 @@ import 'dart:math';
 class PushupPrograms {
 
   /// 6주 푸쉬업 마스터 프로그램
-  static Map<int, Map<int, PushupWorkout>> get sixWeekProgram => {
+  static const Map<int, Map<int, PushupWorkout>> sixWeekProgram = {
     1: {
       // Week 1: 푸쉬업 기초 마스터
-      1: const PushupWorkout(
+      1: PushupWorkout(
         sets: [2, 3, 2, 2, 3],
         restSeconds: 90,
         notes: '완벽한 자세에 집중 - 천천히 내려가기',
@@ -17,7 +17,7 @@ class PushupPrograms {
         variations: ['무릎 푸쉬업', '벽 푸쉬업'],
         specialInstructions: '가슴이 바닥에 닿을 때까지 내려가기',
       ),
-      2: const PushupWorkout(
+      2: PushupWorkout(
         sets: [3, 5, 3, 3, 4],
         restSeconds: 90,
         notes: '코어 안정화에 집중 - 몸 일직선',
@@ -27,7 +27,7 @@ class PushupPrograms {
         variations: ['3초 하강', '1초 정지'],
         specialInstructions: '복부에 힘을 주고 일직선 유지',
       ),
-      3: const PushupWorkout(
+      3: PushupWorkout(
         sets: [4, 6, 4, 4, 5],
         restSeconds: 85,
         notes: '강도 증가 - 더 많은 반복',
@@ -40,7 +40,7 @@ class PushupPrograms {
     },
     2: {
       // Week 2: 중급 발전
-      1: const PushupWorkout(
+      1: PushupWorkout(
         sets: [5, 8, 5, 5, 6],
         restSeconds: 85,
         notes: '파워 개발 - 폭발적 상승',
@@ -50,7 +50,7 @@ class PushupPrograms {
         variations: ['클랩 푸쉬업', '익스플로시브 푸쉬업'],
         specialInstructions: '상승 시 폭발적으로 밀어올리기',
       ),
-      2: const PushupWorkout(
+      2: PushupWorkout(
         sets: [6, 10, 6, 6, 8],
         restSeconds: 80,
         notes: '변형 동작 - 다양한 각도',
@@ -60,7 +60,7 @@ class PushupPrograms {
         variations: ['다이아몬드 푸쉬업', '인클라인 푸쉬업'],
         specialInstructions: '매 세트마다 다른 변형 적용',
       ),
-      3: const PushupWorkout(
+      3: PushupWorkout(
         sets: [7, 12, 7, 7, 9],
         restSeconds: 80,
         notes: '지구력 훈련 - 더 긴 세트',
@@ -73,7 +73,7 @@ class PushupPrograms {
     },
     3: {
       // Week 3: 고급 도전
-      1: const PushupWorkout(
+      1: PushupWorkout(
         sets: [8, 15, 8, 8, 12],
         restSeconds: 75,
         notes: '원 암 준비 - 불균형 훈련',
@@ -83,7 +83,7 @@ class PushupPrograms {
         variations: ['아처 푸쉬업', '원 핸드 프렙'],
         specialInstructions: '한쪽에 더 많은 무게 실어서 진행',
       ),
-      2: const PushupWorkout(
+      2: PushupWorkout(
         sets: [10, 18, 10, 10, 15],
         restSeconds: 75,
         notes: '플라이오메트릭 - 점프 동작',
@@ -93,7 +93,7 @@ class PushupPrograms {
         variations: ['클랩 푸쉬업', '스위치 푸쉬업'],
         specialInstructions: '공중에서 손뼉치기 또는 동작 전환',
       ),
-      3: const PushupWorkout(
+      3: PushupWorkout(
         sets: [12, 20, 12, 12, 18],
         restSeconds: 70,
         notes: '극한 도전 - 한계 돌파',
@@ -107,8 +107,8 @@ class PushupPrograms {
   };
 
   /// 특수 푸쉬업 챌린지
-  static Map<String, SpecialPushupProgram> get specialPrograms => {
-    'pushup_century': const SpecialPushupProgram(
+  static const Map<String, SpecialPushupProgram> specialPrograms = {
+    'pushup_century': SpecialPushupProgram(
       name: '100개 푸쉬업 센추리',
       description: '한 번에 100개 연속 푸쉬업 도전',
       duration: '논스톱 100개',
@@ -116,7 +116,7 @@ class PushupPrograms {
       chadLevel: '💯 센추리 차드',
       instructions: '100개를 완료할 때까지 절대 포기하지 마라',
     ),
-    'pushup_ladder': const SpecialPushupProgram(
+    'pushup_ladder': SpecialPushupProgram(
       name: '푸쉬업 사다리 오르기',
       description: '1-2-3-4-5-6-7-8-9-10개씩 진행',
       duration: '10라운드 완주',
@@ -124,7 +124,7 @@ class PushupPrograms {
       chadLevel: '🪜 래더 마스터',
       instructions: '사다리를 한 단계씩 올라가며 완성',
     ),
-    'death_by_pushups': const SpecialPushupProgram(
+    'death_by_pushups': SpecialPushupProgram(
       name: '데스 바이 푸쉬업',
       description: '1분차 1개, 2분차 2개... 실패까지',
       duration: '실패할 때까지',
@@ -135,8 +135,8 @@ class PushupPrograms {
   };
 
   /// 일일 푸쉬업 챌린지
-  static List<DailyPushupChallenge> get dailyChallenges => [
-    const DailyPushupChallenge(
+  static const List<DailyPushupChallenge> dailyChallenges = [
+    DailyPushupChallenge(
       name: '💪 퀵 파워 차드',
       description: '20개 푸쉬업을 2분 안에',
       targetReps: 20,
@@ -144,7 +144,7 @@ class PushupPrograms {
       reward: '⚡ 스피드 배지',
       minLevel: 1,
     ),
-    const DailyPushupChallenge(
+    DailyPushupChallenge(
       name: '🔥 미드나잇 차드',
       description: '50개 푸쉬업을 논스톱으로',
       targetReps: 50,
@@ -152,7 +152,7 @@ class PushupPrograms {
       reward: '🌙 미드나잇 배지',
       minLevel: 2,
     ),
-    const DailyPushupChallenge(
+    DailyPushupChallenge(
       name: '💥 익스플로시브 차드',
       description: '클랩 푸쉬업 10개를 3분 안에',
       targetReps: 10,
@@ -160,7 +160,7 @@ class PushupPrograms {
       reward: '💥 폭발력 배지',
       minLevel: 3,
     ),
-    const DailyPushupChallenge(
+    DailyPushupChallenge(
       name: '👑 레전드 차드',
       description: '100개 푸쉬업을 10분 안에',
       targetReps: 100,
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 명령 실행기 테스트
+STREAM_LIMIT 을 넘는 긴 출력 줄, 취소 시 프로세스 그룹 종료 후 회수
+"""
+
+import os
+import sys
+import asyncio
+
+import pytest
+
+from async_command_runner import STREAM_LIMIT, AsyncCommandRunner
+
+
+@pytest.fixture
+def runner(tmp_path):
+    return AsyncCommandRunner(log_dir=str(tmp_path / "command_logs"))
+
+
+def test_line_longer_than_stream_limit(runner):
+    script = f"import sys; sys.stdout.write('x' * {STREAM_LIMIT * 3} + '\\nend\\n' + 'y' * {STREAM_LIMIT * 2})"
+    result = runner.run_sync([sys.executable, "-c", script], timeout=60)
+
+    assert result.ok
+    assert result.stdout == "x" * (STREAM_LIMIT * 3) + "\nend\n" + "y" * (STREAM_LIMIT * 2)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="프로세스 그룹/좀비 확인은 POSIX 전용")
+def test_cancel_kills_and_reaps_process(runner, tmp_path):
+    pid_file = tmp_path / "child.pid"
+    script = f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); time.sleep(60)"
+
+    async def cancel_running():
+        task = asyncio.ensure_future(runner.run([sys.executable, "-c", script], timeout=120))
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_running())
+
+    # 회수됐으면 pid 가 더 이상 존재하지 않음 (좀비면 kill(pid, 0) 이 성공)
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flutter 병렬 빌드 오케스트레이터 테스트
+PATH 맨 앞에 가짜 flutter 실행 파일을 두고 실제 Flutter SDK 없이 검증
+- 워커 풀 병렬 실행, 타임아웃 시 프로세스 그룹 전체 종료, 앱별 로그, JSON 빌드 리포트, SDK 별 빌드 캐시
+"""
+
+import os
+import sys
+import json
+import time
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from flutter_build_cache import FlutterBuildCache
+from flutter_build_orchestrator import RELEASE_APK, BuildJob, FlutterBuildOrchestrator
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="가짜 flutter 는 shebang 스크립트 (POSIX 전용)")
+
+FAKE_FLUTTER = textwrap.dedent("""\
+    #!{python}
+    # 가짜 flutter: pub get / build 흉내, 시작·종료 시각을 이벤트 파일에 기록
+    import os, sys, json, time, subprocess
+    from pathlib import Path
+
+    app = Path.cwd().name
+    step = sys.argv[1]
+    if step == "--version":
+        print(json.dumps({{"frameworkVersion": "0.0.0-fake"}}))
+        sys.exit(0)
+    events = os.environ["FAKE_FLUTTER_EVENTS"]
+
+    def record(kind):
+        with open(events, "a") as f:
+            f.write(json.dumps({{"app": app, "step": step, "kind": kind, "time": time.time()}}) + "\\n")
+
+    record("start")
+    print(f"fake flutter {{' '.join(sys.argv[1:])}} in {{app}}", flush=True)
+
+    if step == "build" and app == os.environ.get("FAKE_FLUTTER_HANG_APP"):
+        # Gradle 데몬처럼 자식 프로세스를 남기고 멈춤
+        child = subprocess.Popen(["sleep", "60"])
+        Path(os.environ["FAKE_FLUTTER_CHILD_PID"]).write_text(str(child.pid))
+        time.sleep(60)
+
+    if step == "build":
+        time.sleep(float(os.environ.get("FAKE_FLUTTER_BUILD_SECONDS", "0")))
+        apk = Path("{apk}")
+        apk.parent.mkdir(parents=True, exist_ok=True)
+        apk.write_bytes(b"0" * 1024)
+
+    record("end")
+""")
+
+
+@pytest.fixture
+def fake_flutter(tmp_path, monkeypatch):
+    """PATH 맨 앞에 가짜 flutter 설치 → 이벤트 파일 경로"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    flutter = bin_dir / "flutter"
+    flutter.write_text(FAKE_FLUTTER.format(python=sys.executable, apk=RELEASE_APK.as_posix()))
+    flutter.chmod(0o755)
+
+    events = tmp_path / "events.jsonl"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_FLUTTER_EVENTS", str(events))
+    monkeypatch.setenv("FAKE_FLUTTER_CHILD_PID", str(tmp_path / "child.pid"))
+    return events
+
+
+def make_jobs(tmp_path: Path, count: int):
+    jobs = []
+    for index in range(count):
+        app_dir = tmp_path / "flutter_apps" / f"app_{index}"
+        app_dir.mkdir(parents=True)
+        (app_dir / "pubspec.yaml").write_text(f"name: app_{index}\n")
+        jobs.append(BuildJob(app_name=app_dir.name, app_path=app_dir))
+    return jobs
+
+
+def make_orchestrator(tmp_path: Path, **kwargs) -> FlutterBuildOrchestrator:
+    return FlutterBuildOrchestrator(log_dir=str(tmp_path / "build_logs"),
+                                    report_path=str(tmp_path / "build_report.json"),
+                                    use_cache=False, **kwargs)
+
+
+def load_events(events: Path):
+    return [json.loads(line) for line in events.read_text().splitlines()]
+
+
+def max_concurrent_builds(events) -> int:
+    """build 단계가 동시에 실행된 최대 개수"""
+    timeline = sorted((event["time"], 1 if event["kind"] == "start" else -1)
+                      for event in events if event["step"] == "build")
+    running = peak = 0
+    for _, delta in timeline:
+        running += delta
+        peak = max(peak, running)
+    return peak
+
+
+def test_uses_fake_flutter_from_path(tmp_path, fake_flutter):
+    orchestrator = make_orchestrator(tmp_path, max_workers=1)
+    assert orchestrator.flutter_bin == str(tmp_path / "bin" / "flutter")
+
+
+def test_worker_pool_runs_builds_in_parallel(tmp_path, fake_flutter, monkeypatch):
+    monkeypatch.setenv("FAKE_FLUTTER_BUILD_SECONDS", "0.5")
+    jobs = make_jobs(tmp_path, 4)
+
+    report = make_orchestrator(tmp_path, max_workers=4, pub_get_concurrency=4).build_all(jobs)
+
+    assert report["successful"] == 4
+    assert max_concurrent_builds(load_events(fake_flutter)) >= 2
+    # 순차였다면 최소 2초
+    assert report["wall_time"] < report["total_build_time"]
+
+
+def test_worker_pool_respects_max_workers(tmp_path, fake_flutter, monkeypatch):
+    monkeypatch.setenv("FAKE_FLUTTER_BUILD_SECONDS", "0.2")
+    jobs = make_jobs(tmp_path, 3)
+
+    report = make_orchestrator(tmp_path, max_workers=1).build_all(jobs)
+
+    assert report["successful"] == 3
+    assert max_concurrent_builds(load_events(fake_flutter)) == 1
+
+
+def test_timeout_kills_whole_process_group(tmp_path, fake_flutter, monkeypatch):
+    monkeypatch.setenv("FAKE_FLUTTER_HANG_APP", "app_0")
+    job = make_jobs(tmp_path, 1)[0]
+    orchestrator = make_orchestrator(tmp_path, max_workers=1, build_timeout=2)
+
+    started = time.time()
+    result = orchestrator.build_app(job)
+
+    assert result["status"] == "timeout"
+    assert result["error"] == "build timeout"
+    assert [step["status"] for step in result["steps"]] == ["success", "timeout"]
+    assert time.time() - started < 30
+
+    # 가짜 flutter 가 띄운 자식(sleep 60)까지 종료되어야 함
+    child_pid = int((tmp_path / "child.pid").read_text())
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.1)
+    else:
+        os.kill(child_pid, 9)
+        pytest.fail("타임아웃 후에도 flutter 자식 프로세스가 살아 있음")
+
+    assert "타임아웃" in Path(result["log_file"]).read_text(encoding="utf-8")
+
+
+def test_writes_per_app_log(tmp_path, fake_flutter):
+    jobs = make_jobs(tmp_path, 2)
+
+    report = make_orchestrator(tmp_path, max_workers=2).build_all(jobs)
+
+    for job, result in zip(jobs, report["results"]):
+        log_file = tmp_path / "build_logs" / f"{job.app_name}.log"
+        assert result["log_file"] == str(log_file)
+        log = log_file.read_text(encoding="utf-8")
+        assert "$ flutter pub get" in log
+        assert "$ flutter build apk --release" in log
+        assert f"fake flutter build apk --release in {job.app_name}" in log
+        # 다른 앱 출력이 섞이지 않음
+        other = jobs[1 - jobs.index(job)].app_name
+        assert other not in log
+
+
+def test_build_report_shape(tmp_path, fake_flutter, monkeypatch):
+    monkeypatch.setenv("FAKE_FLUTTER_HANG_APP", "app_2")
+    jobs = make_jobs(tmp_path, 3)
+    jobs.append(BuildJob(app_name="missing", app_path=tmp_path / "flutter_apps" / "missing"))
+
+    returned = make_orchestrator(tmp_path, max_workers=4, build_timeout=2).build_all(jobs)
+    report = json.loads((tmp_path / "build_report.json").read_text(encoding="utf-8"))
+
+    assert report == json.loads(json.dumps(returned, ensure_ascii=False))
+    assert set(report) == {"started_at", "finished_at", "workers", "total", "successful", "failed",
+                           "timed_out", "wall_time", "total_build_time", "cache_hits", "cache_stats", "results"}
+    assert (report["workers"], report["total"], report["successful"], report["failed"], report["timed_out"]) == \
+        (4, 4, 2, 1, 1)
+    assert report["cache_hits"] == 0 and report["cache_stats"] is None
+
+    by_app = {result["app"]: result for result in report["results"]}
+    assert [result["app"] for result in report["results"]] == ["app_0", "app_1", "app_2", "missing"]
+
+    built = by_app["app_0"]
+    assert built["status"] == "success"
+    assert built["apk_path"] == str(jobs[0].app_path / RELEASE_APK)
+    assert built["apk_size_mb"] == 0.0
+    assert [step["step"] for step in built["steps"]] == ["pub_get", "build"]
+    for step in built["steps"]:
+        assert set(step) == {"step", "status", "returncode", "duration"}
+        assert step["returncode"] == 0
+
+    assert by_app["app_2"]["status"] == "timeout"
+    assert by_app["app_2"]["steps"][-1]["returncode"] is None
+    assert by_app["missing"]["error"] == "app path not found"
+
+
+def test_build_cache_keyed_by_flutter_sdk_version(tmp_path, fake_flutter):
+    # 가짜 SDK 루트 = tmp_path (bin/flutter 의 상위), 버전 파일로 flutter upgrade 흉내
+    job = make_jobs(tmp_path, 1)[0]
+    version_file = tmp_path / "version"
+    version_file.write_text("3.22.0\n")
+
+    def build():
+        cache = FlutterBuildCache(cache_dir=str(tmp_path / "build_cache"))
+        orchestrator = FlutterBuildOrchestrator(log_dir=str(tmp_path / "build_logs"), report_path=None,
+                                                max_workers=1, build_cache=cache)
+        return orchestrator.build_app(job)
+
+    first = build()
+    assert first["status"] == "success" and not first["cached"]
+    assert build()["cached"]
+
+    version_file.write_text("3.24.0\n")
+    upgraded = build()
+    assert not upgraded["cached"]
+    assert upgraded["fingerprint"] != first["fingerprint"]
+
+    # 버전 파일이 없으면 flutter --version --machine 으로 식별
+    version_file.unlink()
+    assert FlutterBuildCache(cache_dir=str(tmp_path / "build_cache")).toolchain_identity("flutter")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로그레션 데이터 골든 파일 테스트
+기본 설정 앱마다 렌더링한 progressionPrograms 표(Dart 상수)와 JSON 에셋을
+golden/progression/<앱>.json 과 비교 - 원본 데이터나 템플릿이 잘못 바뀌면 실패
+(의도적으로 프로그램을 바꿀 때만 골든 파일도 함께 수정)
+"""
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from modular_app_factory import (JSON_PROGRAM_FEATURE, PROGRAM_ASSET_PATH, ModularAppFactory,
+                                 default_app_configs, parse_progression_table)
+
+GOLDEN_DIR = Path(__file__).resolve().parent / "golden" / "progression"
+
+# app_configs.yaml 유무와 관계없이 기본 설정 사용
+DEFAULT_CONFIGS = default_app_configs()
+
+
+def package_short(config) -> str:
+    return config.package_name.split('.')[-1]
+
+
+def load_golden(config):
+    return json.loads((GOLDEN_DIR / f"{package_short(config)}.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def factory(tmp_path, monkeypatch):
+    # 팩토리가 만드는 modules/, templates/, 출력 디렉토리는 임시 디렉토리에 (템플릿은 저장소 templates/ 로 대체 조회)
+    monkeypatch.chdir(tmp_path)
+    return ModularAppFactory(output_dir=tmp_path / "flutter_apps")
+
+
+def test_golden_files_cover_default_apps():
+    assert sorted(path.stem for path in GOLDEN_DIR.glob("*.json")) == \
+        sorted(package_short(config) for config in DEFAULT_CONFIGS)
+
+
+@pytest.mark.parametrize("config", DEFAULT_CONFIGS, ids=package_short)
+def test_dart_progression_table_matches_golden(factory, config):
+    assert JSON_PROGRAM_FEATURE not in config.features
+    files = factory.render_app(config)
+
+    dart_source = files[f"lib/utils/{config.exercise_type}_data.dart"]
+    assert parse_progression_table(dart_source) == load_golden(config)
+    assert PROGRAM_ASSET_PATH.format(exercise_type=config.exercise_type) not in files
+
+
+@pytest.mark.parametrize("config", DEFAULT_CONFIGS, ids=package_short)
+def test_json_program_asset_matches_golden(factory, config):
+    config = replace(config, features=config.features + [JSON_PROGRAM_FEATURE])
+    files = factory.render_app(config)
+
+    asset = files[PROGRAM_ASSET_PATH.format(exercise_type=config.exercise_type)]
+    assert json.loads(asset) == load_golden(config)
+    # JSON 에셋 모드에서는 Dart 쪽에 표를 두지 않음
+    assert parse_progression_table(files[f"lib/utils/{config.exercise_type}_data.dart"]) == {}
+
+
+def test_toggling_json_asset_regenerates_whole_app(factory, tmp_path):
+    config = DEFAULT_CONFIGS[0]
+    asset = tmp_path / "flutter_apps" / package_short(config) / \
+        PROGRAM_ASSET_PATH.format(exercise_type=config.exercise_type)
+    assert factory.generate_app(config)
+
+    # 기능 추가 → 출력 파일 구성이 바뀌므로 앱 전체 재생성 (에셋 생성)
+    with_asset = replace(config, features=config.features + [JSON_PROGRAM_FEATURE])
+    assert factory.regenerate_changed([with_asset]) == {package_short(config): None}
+    assert json.loads(asset.read_text(encoding="utf-8")) == load_golden(config)
+
+    # 기능 제거 → 에셋 삭제, 그래프에서도 제거
+    assert factory.regenerate_changed([config]) == {package_short(config): None}
+    assert not asset.exists()
+    assert factory.graph.outputs(package_short(config)) == factory._output_paths(config)
+    assert factory.plan_regeneration([config]) == {}